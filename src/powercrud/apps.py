@@ -1,3 +1,5 @@
+from collections.abc import Iterable, Iterator
+
 from django.apps import AppConfig
 
 from powercrud.logging import get_logger
@@ -5,13 +7,104 @@ from powercrud.logging import get_logger
 log = get_logger(__name__)
 
 
+def iter_powercrud_view_classes() -> Iterator[type]:
+    """Yield every imported PowerCRUD view class once, parents first."""
+    from powercrud.mixins import PowerCRUDMixin
+
+    seen = set()
+    pending = list(PowerCRUDMixin.__subclasses__())
+    while pending:
+        view_class = pending.pop(0)
+        if view_class in seen:
+            continue
+        seen.add(view_class)
+        yield view_class
+        pending.extend(view_class.__subclasses__())
+
+
+def connect_view_receivers(view_classes: Iterable[type] | None = None) -> None:
+    """
+    Connect the model signal receivers each view's configuration relies on.
+
+    Cache invalidation must not depend on which views happened to serve a
+    request in this process, so ``PowerCRUDMixin.__init_subclass__()`` runs
+    this for every view class as it is defined.
+    """
+    from powercrud.filter_options import watch_view_filter_models
+    from powercrud.list_snapshots import watch_view_snapshot_models
+    from powercrud.search import register_view_search_backend
+
+    if view_classes is None:
+        view_classes = iter_powercrud_view_classes()
+    for view_class in view_classes:
+        watch_view_filter_models(view_class)
+        watch_view_snapshot_models(view_class)
+        register_view_search_backend(view_class)
+
+
+def get_powercrud_model_receivers() -> frozenset:
+    """Return the model signal receivers ``connect_view_receivers()`` connects."""
+    from powercrud import filter_options, list_snapshots, search
+
+    return frozenset(
+        {
+            filter_options._invalidate_on_change,
+            list_snapshots._invalidate_on_change,
+            search._sync_saved_instance,
+            search._sync_deleted_instance,
+        }
+    )
+
+
+def has_foreign_save_receivers(model) -> bool:
+    """
+    Return whether ``model`` has ``pre_save``/``post_save`` receivers of its own.
+
+    PowerCRUD's receivers are left out, so the answer does not depend on which
+    views are loaded; ``handle_queryset_update()`` does their work instead.
+    """
+    from django.db.models.signals import post_save, pre_save
+
+    own_receivers = get_powercrud_model_receivers()
+    for signal in (pre_save, post_save):
+        sync_receivers, async_receivers = signal._live_receivers(model)
+        if any(
+            receiver not in own_receivers
+            for receiver in (*sync_receivers, *async_receivers)
+        ):
+            return True
+    return False
+
+
+def handle_queryset_update(model, pks: Iterable, using: str) -> None:
+    """
+    Do what PowerCRUD's ``post_save`` receivers do for rows written by ``update()``.
+
+    Drops ``model``'s cached option indexes and list snapshots, and refreshes
+    the search index entries of the rows in ``pks``. ``pks`` may be empty when
+    ``model`` has no registered search backend.
+    """
+    from powercrud.filter_options import invalidate_option_index
+    from powercrud.list_snapshots import invalidate_list_snapshots
+    from powercrud.search import get_registered_search_backends
+
+    invalidate_option_index(model)
+    invalidate_list_snapshots(model)
+    backends = get_registered_search_backends(model)
+    if not backends:
+        return
+    for instance in (
+        model._base_manager.using(using).filter(pk__in=list(pks)).iterator()
+    ):
+        for backend in backends:
+            backend.sync_instance(instance, using)
+
+
 class powercrudConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "powercrud"
     verbose_name = "powercrud"
 
-    # def ready(self):
-    #         # Example: ensure cleanup interval is reasonable
-    #         interval = get_powercrud_setting('CLEANUP_SCHEDULE_INTERVAL')
-    #         if interval < 60:
-    #             raise ImproperlyConfigured("CLEANUP_SCHEDULE_INTERVAL must be >= 60 seconds")
+    def ready(self):
+        """Connect receivers for views defined before the registry was ready."""
+        connect_view_receivers()
@@ -1,6 +1,7 @@
+import hashlib
 import time
 import uuid
-from typing import Dict, Set, Any, Callable, Optional, Hashable
+from typing import Dict, Set, Any, Callable, Iterable, Optional, Hashable
 from datetime import timedelta
 import importlib
 import json
@@ -51,7 +52,7 @@ class AsyncManager:
     Task 3 Launch Pattern:
         The launch_async_task() method implements atomic task launching:
         1. Generate unique task_key (UUID)
-        2. Reserve object locks (if conflict_ids provided)
+        2. Reserve object locks (if conflict_ids or conflict_selections provided)
         3. Initialize progress tracking
         4. Enqueue task with completion hook and task_key
         5. Register in active tasks (without re-locking)
@@ -116,7 +117,9 @@ class AsyncManager:
         self.active_prefix = "powercrud:async:active_tasks"
         self.conflict_prefix = "powercrud:async:conflict:"
         self.conflict_model_prefix = "powercrud:conflict:model:"  # For per-object locks
+        self.conflict_selection_prefix = "powercrud:conflict:selections:"  # Per model
         self.progress_prefix = "powercrud:async:progress:"
+        self.checkpoint_prefix = "powercrud:async:checkpoint:"
 
         # leave async validation to calling methods
         # self.async_enabled = get_powercrud_setting('ASYNC_ENABLED')
@@ -328,6 +331,8 @@ class AsyncManager:
         *args,  # args for the function to be called
         # optional keyword with conflict ids (not part of django-q2.async_task)
         conflict_ids: Optional[Dict[str, Set[Hashable]]] = None,
+        # optional keyword with predicate selection payloads to lock by hash
+        conflict_selections: Optional[Dict[str, Dict[str, Any]]] = None,
         # optional metadata for lifecycle events
         user=None,
         affected_objects=None,
@@ -357,6 +362,9 @@ class AsyncManager:
             *args: Positional arguments for the callable.
             conflict_ids: Optional mapping of model names to object ID sets for
                 atomic reservation prior to enqueueing.
+            conflict_selections: Optional mapping of model names to predicate
+                selection payloads, locked by ``add_conflict_selections()``
+                without resolving their rows.
             user: Optional user metadata for lifecycle events.
             affected_objects: Optional affected objects metadata for lifecycle events.
             task_key: Optional explicit task identifier to reuse instead of generating one.
@@ -403,6 +411,16 @@ class AsyncManager:
                 raise Exception(
                     "Cannot launch task - conflicts detected with existing operations"
                 )
+        if conflict_selections:
+            if not self.add_conflict_selections(
+                task_name, conflict_selections, user_id=getattr(user, "id", None)
+            ):
+                log.error(f"Selection reservation failed for task {task_name}")
+                if conflict_ids:
+                    self.remove_conflict_ids(task_name)
+                raise Exception(
+                    "Cannot launch task - conflicts detected with existing operations"
+                )
 
         # Phase 3: Initialize progress tracking
         self.create_progress_key(task_name)
@@ -466,7 +484,7 @@ class AsyncManager:
         except Exception as e:
             # Phase 4 failed - rollback reservations and progress
             log.error(f"Failed to enqueue task_name {task_name}: {e}")
-            if conflict_ids:
+            if conflict_ids or conflict_selections:
                 self.remove_conflict_ids(task_name)
             self.remove_progress_key(task_name)
             raise Exception(f"Failed to enqueue async task: {e}")
@@ -778,6 +796,7 @@ class AsyncManager:
 
         # remove_active_task also clears conflicts & progress keys
         self.remove_active_task(task_name)
+        self.remove_checkpoint(task_name)
 
         dashboard_removed = self.cleanup_dashboard_data(task_name) or 0
 
@@ -858,7 +877,8 @@ class AsyncManager:
     def check_conflict(self, object_data: dict[str, list[Hashable]]) -> set[Hashable]:
         """Check if objects are currently locked by other tasks.
 
-        Performs direct per-object lock key lookups (no task scanning).
+        Reads the per-object lock keys of each model with one ``get_many``
+        call (no task scanning).
 
         Args:
             object_data: Dict mapping model names to lists of object IDs.
@@ -870,12 +890,7 @@ class AsyncManager:
         conflicts = set()
 
         for model_name, obj_ids in object_data.items():
-            for obj_id in obj_ids:
-                lock_key = f"{self.conflict_model_prefix}{model_name}:{obj_id}"
-                locked_task_name = self.cache.get(lock_key)
-
-                if locked_task_name is not None:
-                    conflicts.add(obj_id)
+            conflicts.update(self.get_lock_task_names(model_name, obj_ids))
 
         if conflicts:
             log.warning(f"Conflict detected with IDs {conflicts}")
@@ -884,6 +899,133 @@ class AsyncManager:
 
         return conflicts
 
+    def get_lock_task_names(
+        self, model_name: str, obj_ids: Iterable[Hashable]
+    ) -> dict[Hashable, str]:
+        """Return the task holding each locked object in one cache round trip.
+
+        Args:
+            model_name: Model label such as 'myapp.Book'.
+            obj_ids: Object IDs to look up.
+
+        Returns:
+            dict: Maps each locked object ID (as passed in) to its task name.
+            Unlocked IDs are omitted.
+        """
+        ids_by_key = {
+            f"{self.conflict_model_prefix}{model_name}:{obj_id}": obj_id
+            for obj_id in obj_ids
+        }
+        if not ids_by_key:
+            return {}
+        found = self.cache.get_many(list(ids_by_key))
+        return {
+            ids_by_key[lock_key]: task_name
+            for lock_key, task_name in found.items()
+            if task_name is not None
+        }
+
+    def get_locked_ids(self, task_name: str, model_name: str) -> set[str]:
+        """Return the IDs of ``model_name`` objects locked by a task.
+
+        The IDs are read from the task's tracking set, so they come back as
+        strings whatever type was locked.
+
+        Args:
+            task_name: The task identifier.
+            model_name: Model label such as 'myapp.Book'.
+
+        Returns:
+            set: Locked object IDs, empty when the task holds no locks.
+        """
+        prefix = f"{self.conflict_model_prefix}{model_name}:"
+        tracking_set = self.cache.get(f"{self.conflict_prefix}{task_name}", set())
+        return {
+            lock_key[len(prefix) :]
+            for lock_key in tracking_set or ()
+            if lock_key.startswith(prefix)
+        }
+
+    def get_selection_lock_id(self, selection: dict[str, Any]) -> str:
+        """Return the lock ID that stands in for a predicate selection.
+
+        The ID is a hash of the selection payload, so a predicate selection is
+        locked as one key instead of one key per matching row.
+
+        Args:
+            selection: Payload from ``SelectionMixin.get_selection_payload()``.
+
+        Returns:
+            str: Lock ID of the form ``"selection:<sha256>"``.
+        """
+        digest = hashlib.sha256(
+            json.dumps(selection, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"selection:{digest}"
+
+    def add_conflict_selections(
+        self,
+        task_name: str,
+        conflict_selections: dict[str, dict[str, Any]],
+        user_id: Optional[int] = None,
+    ) -> bool:
+        """Reserve predicate selections for a task.
+
+        Each selection is locked under ``get_selection_lock_id()`` through
+        ``add_conflict_ids()``, so it is released with the task's other locks.
+        The payload is also recorded in a per-model index that
+        ``get_active_selections()`` reads for overlap checks.
+
+        Args:
+            task_name: Unique identifier task.name for the task requesting locks.
+            conflict_selections: Dict mapping model names to selection payloads.
+            user_id: Optional id of the user whose queryset scopes the selection.
+
+        Returns:
+            bool: True if every selection was locked; False if any conflicts.
+        """
+        lock_ids = {
+            model_name: {self.get_selection_lock_id(selection)}
+            for model_name, selection in conflict_selections.items()
+        }
+        if not self.add_conflict_ids(task_name, lock_ids):
+            return False
+
+        for model_name, selection in conflict_selections.items():
+            index_key = f"{self.conflict_selection_prefix}{model_name}"
+            active = dict(self.cache.get(index_key) or {})
+            active[task_name] = {"selection": selection, "user_id": user_id}
+            self.cache.set(index_key, active, self.conflict_ttl)
+        return True
+
+    def get_active_selections(self, model_name: str) -> dict[str, dict[str, Any]]:
+        """Return the predicate selections currently locked on a model.
+
+        Index entries whose lock has expired or been released are skipped.
+
+        Args:
+            model_name: Model label such as 'myapp.Book'.
+
+        Returns:
+            dict: Maps task names to ``{"selection": ..., "user_id": ...}``.
+        """
+        active = self.cache.get(f"{self.conflict_selection_prefix}{model_name}") or {}
+        if not active:
+            return {}
+        lock_keys = {
+            task_name: (
+                f"{self.conflict_model_prefix}{model_name}:"
+                f"{self.get_selection_lock_id(entry['selection'])}"
+            )
+            for task_name, entry in active.items()
+        }
+        holders = self.cache.get_many(list(lock_keys.values()))
+        return {
+            task_name: entry
+            for task_name, entry in active.items()
+            if holders.get(lock_keys[task_name]) == task_name
+        }
+
     def remove_conflict_ids(
         self, task_name: str, conflict_ids: Optional[dict[Hashable]] = None
     ):
@@ -905,10 +1047,26 @@ class AsyncManager:
         # Remove all per-object locks tracked by this task
         for lock_key in tracking_set:
             self.cache.delete(lock_key)
+            model_name, _, selection_hash = lock_key[
+                len(self.conflict_model_prefix) :
+            ].partition(":selection:")
+            if selection_hash:
+                self._remove_active_selection(task_name, model_name)
 
         # Remove the tracking set itself
         self.cache.delete(tracking_key)
 
+    def _remove_active_selection(self, task_name: str, model_name: str) -> None:
+        """Drop a task's entry from a model's predicate selection index."""
+        index_key = f"{self.conflict_selection_prefix}{model_name}"
+        active = dict(self.cache.get(index_key) or {})
+        if active.pop(task_name, None) is None:
+            return
+        if active:
+            self.cache.set(index_key, active, self.conflict_ttl)
+        else:
+            self.cache.delete(index_key)
+
     # =============================================================================
     # Progress Tracking Functions
     # =============================================================================
@@ -1003,6 +1161,47 @@ class AsyncManager:
             except Exception as e:
                 log.warning(f"Failed to clear expired progress for {task_name}: {e}")
 
+    # =============================================================================
+    # Chunk Checkpoints
+    # =============================================================================
+    def set_checkpoint(self, task_name: str, last_pk: Any) -> None:
+        """Record the last primary key committed by a chunked bulk task.
+
+        The checkpoint lives as long as the task's conflict locks, so a
+        restarted worker running the same task can skip committed chunks.
+
+        Args:
+            task_name: The task identifier.
+            last_pk: Primary key of the last row in the committed chunk.
+        """
+        if not task_name:
+            raise ValueError("task_name cannot be empty")
+        checkpoint_key = f"{self.checkpoint_prefix}{task_name}"
+        try:
+            self.cache.set(checkpoint_key, last_pk, self.conflict_ttl)
+            log.debug(f"Checkpointed {task_name} at pk {last_pk}")
+        except Exception as e:
+            log.warning(f"Failed to set checkpoint for {task_name}: {e}")
+
+    def get_checkpoint(self, task_name: str) -> Any:
+        """Return the last committed primary key for a task, or None."""
+        if not task_name:
+            raise ValueError("task_name cannot be empty")
+        try:
+            return self.cache.get(f"{self.checkpoint_prefix}{task_name}", None)
+        except Exception as e:
+            log.warning(f"Failed to get checkpoint for {task_name}: {e}")
+            return None
+
+    def remove_checkpoint(self, task_name: str) -> None:
+        """Remove the chunk checkpoint for a task (idempotent)."""
+        if not task_name:
+            return
+        try:
+            self.cache.delete(f"{self.checkpoint_prefix}{task_name}")
+        except Exception as e:
+            log.warning(f"Failed to remove checkpoint for {task_name}: {e}")
+
     # =============================================================================
     # Dashboard Integration
     # =============================================================================
@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional
 
 from django.db import models
+from django.utils.module_loading import import_string
 
 from powercrud.logging import get_logger
 
@@ -32,6 +33,16 @@ class BulkUpdateExecutionContext:
         user_id: Optional initiating user primary key.
         task_name: Optional async task identifier.
         manager_class_path: Optional async manager class path for async workers.
+        bulk_full_clean: Whether the view runs ``full_clean()`` per object.
+        bulk_update_strategy: The view's ``bulk_update_strategy`` setting.
+        bulk_chunk_size: Rows committed per transaction, or None for one
+            transaction.
+        resume_after: Last primary key committed by an earlier run of the same
+            async task, if any.
+        checkpoint_callback: Optional callable that async workers use to record
+            each committed chunk's last primary key.
+        view_class_path: Optional import path of the view class that started
+            the operation, so its bulk update overrides apply in workers.
     """
 
     mode: str
@@ -40,6 +51,12 @@ class BulkUpdateExecutionContext:
     user_id: int | None = None
     task_name: str | None = None
     manager_class_path: str | None = None
+    bulk_full_clean: bool = True
+    bulk_update_strategy: str = "auto"
+    bulk_chunk_size: int | None = None
+    resume_after: Any = None
+    checkpoint_callback: Callable[[Any], None] | None = None
+    view_class_path: str | None = None
 
 
 class BulkUpdatePersistenceBackend:
@@ -86,7 +103,7 @@ class DefaultBulkUpdatePersistenceBackend(BulkUpdatePersistenceBackend):
         context: BulkUpdateExecutionContext,
         progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> Dict[str, Any]:
-        """Run the built-in bulk update implementation unchanged.
+        """Run the built-in bulk update implementation.
 
         Args:
             queryset: Objects selected for the update.
@@ -99,18 +116,47 @@ class DefaultBulkUpdatePersistenceBackend(BulkUpdatePersistenceBackend):
         Returns:
             Dict matching PowerCRUD's standard bulk result contract.
         """
-        del context
-        from powercrud.mixins.bulk_mixin import BulkMixin
-
-        mixin = BulkMixin()
+        mixin = self.get_bulk_update_mixin(context)
+        mixin.bulk_full_clean = context.bulk_full_clean
+        mixin.bulk_update_strategy = context.bulk_update_strategy
+        mixin.bulk_chunk_size = context.bulk_chunk_size
         return mixin._perform_bulk_update(
             queryset,
             bulk_fields=bulk_fields,
             fields_to_update=fields_to_update,
             field_data=field_data,
             progress_callback=progress_callback,
+            resume_after=context.resume_after,
+            checkpoint_callback=context.checkpoint_callback,
         )
 
+    def get_bulk_update_mixin(self, context: BulkUpdateExecutionContext):
+        """Return the object whose bulk update methods run the operation.
+
+        This is an instance of the view named by ``context.view_class_path``,
+        so overrides such as ``get_bulk_update_strategy()`` apply, or a plain
+        ``BulkMixin`` when the view class is unknown or cannot be imported.
+        """
+        from powercrud.mixins.bulk_mixin import BulkMixin
+
+        if context.view_class_path:
+            try:
+                view_class = import_string(context.view_class_path)
+            except ImportError as exc:
+                log.warning(
+                    "Cannot import view '%s' for bulk update: %s",
+                    context.view_class_path,
+                    exc,
+                )
+            else:
+                if isinstance(view_class, type) and issubclass(view_class, BulkMixin):
+                    return view_class()
+                log.warning(
+                    "View '%s' is not a BulkMixin subclass; using BulkMixin",
+                    context.view_class_path,
+                )
+        return BulkMixin()
+
 
 def resolve_bulk_update_persistence_backend(
     backend_path: str | None,
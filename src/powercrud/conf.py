@@ -12,7 +12,12 @@ DEFAULTS = {
     "CACHE_NAME": "default",
     "QCLUSTER_PROBE_TIMEOUT_MS": 300,
     "BULK_MAX_SELECTED_RECORDS": 1000,
+    "BULK_SELECTION_STORE": "session",
+    "BULK_SELECTION_TTL": 86400,
     "FILTER_FAVOURITE_USER_RESOLVER": None,
+    "FILTER_DROPDOWN_SORT_KEYS": None,
+    "FILTER_OPTION_INDEX_TTL": 300,
+    "FRONTEND_CAPABILITIES": None,
     "POWERCRUD_CSS_FRAMEWORK": "daisyUI",  # this is for the rendering of powercrud forms
     "TAILWIND_SAFELIST_JSON_LOC": ".",  # location of the safelist json file for tailwind tree shaker
 }
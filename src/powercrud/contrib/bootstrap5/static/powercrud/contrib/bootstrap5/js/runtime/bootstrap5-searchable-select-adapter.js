@@ -1,4 +1,9 @@
 import { INLINE_ROW_SELECTOR, NATIVE_STYLE_ATTR, NATIVE_TABINDEX_ATTR } from '../../../../../../../../static/powercrud/js/runtime/selectors.js';
+import {
+    bindRemoteOptionDependencies,
+    getRemoteOptionSettings,
+    withRemoteOptionPlugins,
+} from '../../../../../../../../static/powercrud/js/runtime/remote-options.js';
 
 /** Adapt the shared searchable-select lifecycle to Bootstrap-compatible Tom Select markup. */
 export function createBootstrap5SearchableSelectAdapter({ global, documentObject, warnMissingDependency }) {
@@ -343,10 +348,16 @@ export function createBootstrap5SearchableSelectAdapter({ global, documentObject
         if (!select.closest('[data-powercrud-modal]')) {
             settings.dropdownParent = 'body';
         }
+        Object.assign(settings, getRemoteOptionSettings(select, { global }));
+        const plugins = withRemoteOptionPlugins(select, settings.plugins);
+        if (plugins) {
+            settings.plugins = plugins;
+        }
         const instance = create(select, settings);
         if (!instance) {
             return;
         }
+        bindRemoteOptionDependencies(instance, select);
         normalise(instance);
         normaliseFilterFavourites(select);
         if (isInlineSelect) {
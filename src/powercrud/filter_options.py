@@ -0,0 +1,241 @@
+"""Cached ordering for filter dropdown options.
+
+Related models without a usable database sort key used to be ordered by
+``__str__`` in Python on every request, which loaded the whole related table
+and then sent one ``CASE WHEN`` branch per row back to the database. The option
+index built here does that work once per related queryset and keeps the
+ordered ``(value, label)`` pairs in Django's cache until the related model
+changes or the TTL expires.
+
+``FilteringMixin.get_filter_queryset_for_field()`` still returns a queryset
+ordered by ``__str__``. Its ``CASE WHEN`` ordering is built from the cached
+index rather than a fresh table scan, and the dropdown itself is listed
+straight from the index without sending that ordering to the database.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.db.models import Case, IntegerField, Value, When
+from django.db.models.signals import post_delete, post_save
+from django.forms.models import ModelChoiceIterator, ModelChoiceIteratorValue
+
+from powercrud.conf import get_powercrud_setting
+
+OPTION_INDEX_CACHE_PREFIX = "powercrud:filter-option-index"
+
+# Related models whose save/delete signals already invalidate their index.
+_WATCHED_MODELS: set[type] = set()
+
+
+class LabelOrder(Case):
+    """``CASE WHEN`` ordering that marks a queryset as ordered by ``__str__``."""
+
+
+def get_filter_dropdown_sort_key(model) -> tuple[str, ...] | None:
+    """
+    Return the declared database sort key for ``model``'s dropdown options.
+
+    Keys come from ``POWERCRUD_SETTINGS["FILTER_DROPDOWN_SORT_KEYS"]``, a dict
+    of ``"app_label.ModelName"`` to one ``order_by()`` expression or a list of
+    them.
+    """
+    sort_keys = get_powercrud_setting("FILTER_DROPDOWN_SORT_KEYS") or {}
+    sort_key = sort_keys.get(model._meta.label, sort_keys.get(model._meta.label_lower))
+    if not sort_key:
+        return None
+    if isinstance(sort_key, str):
+        return (sort_key,)
+    return tuple(sort_key)
+
+
+def get_option_index_ttl() -> int:
+    """Return how long, in seconds, a cached option index stays valid."""
+    return int(get_powercrud_setting("FILTER_OPTION_INDEX_TTL"))
+
+
+def _get_version_key(model) -> str:
+    """Return the cache key holding ``model``'s current index version."""
+    return f"{OPTION_INDEX_CACHE_PREFIX}:version:{model._meta.label_lower}"
+
+
+def invalidate_option_index(model) -> None:
+    """Drop every cached option index built from ``model``'s rows."""
+    cache.set(_get_version_key(model), uuid4().hex, None)
+
+
+def _invalidate_on_change(sender, **kwargs) -> None:
+    """Invalidate the sender's option index after a save or delete."""
+    invalidate_option_index(sender)
+
+
+def _watch_model(model) -> None:
+    """Invalidate ``model``'s option index when one of its rows changes."""
+    if model in _WATCHED_MODELS:
+        return
+    dispatch_uid = f"{OPTION_INDEX_CACHE_PREFIX}:{model._meta.label_lower}"
+    post_save.connect(
+        _invalidate_on_change, sender=model, weak=False, dispatch_uid=dispatch_uid
+    )
+    post_delete.connect(
+        _invalidate_on_change, sender=model, weak=False, dispatch_uid=dispatch_uid
+    )
+    _WATCHED_MODELS.add(model)
+
+
+def watch_view_filter_models(view_class) -> None:
+    """
+    Invalidate option indexes for the related models ``view_class`` filters on.
+
+    Called for every PowerCRUD view when the app loads, so writes made before
+    any dropdown is rendered in this process still reach the shared cache.
+    """
+    model = getattr(view_class, "model", None)
+    if model is None:
+        return
+    for field_name in getattr(view_class, "filterset_fields", None) or ():
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            continue
+        if field.is_relation and field.related_model is not None:
+            _watch_model(field.related_model)
+
+
+def get_option_index_cache_key(queryset, label_from_instance) -> str | None:
+    """
+    Return the cache key for ``queryset``'s ordered options.
+
+    The key combines the related model's index version, the queryset SQL, and
+    the label function, so scoped dropdowns and custom labels never share an
+    index. Returns ``None`` when the queryset cannot match any row.
+    """
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    model = queryset.model
+    version = cache.get_or_set(_get_version_key(model), uuid4().hex, None)
+    label_function = getattr(label_from_instance, "__func__", label_from_instance)
+    digest = hashlib.sha256(
+        repr(
+            (
+                queryset.db,
+                sql,
+                params,
+                label_function.__module__,
+                label_function.__qualname__,
+            )
+        ).encode()
+    ).hexdigest()
+    return f"{OPTION_INDEX_CACHE_PREFIX}:{model._meta.label_lower}:{version}:{digest}"
+
+
+def is_label_ordered(queryset) -> bool:
+    """Return whether ``queryset`` was ordered by ``order_by_label()``."""
+    return any(isinstance(order, LabelOrder) for order in queryset.query.order_by)
+
+
+def _get_index(queryset, prepare_value, label_from_instance) -> list[tuple[Any, str]]:
+    """Return the cached ``(value, label)`` pairs of ``queryset``."""
+    _watch_model(queryset.model)
+    cache_key = get_option_index_cache_key(queryset, label_from_instance)
+    if cache_key is None:
+        return []
+    index = cache.get(cache_key)
+    if index is None:
+        index = sorted(
+            (
+                (prepare_value(obj), str(label_from_instance(obj)))
+                for obj in queryset.iterator()
+            ),
+            key=lambda option: option[1].lower(),
+        )
+        cache.set(cache_key, index, get_option_index_ttl())
+    return index
+
+
+def get_option_index(field) -> list[tuple[Any, str]]:
+    """
+    Return ``field``'s options as ``(value, label)`` pairs ordered by label.
+
+    Labels are compared case-insensitively, matching the previous in-request
+    ``__str__`` ordering.
+    """
+    queryset = field.queryset
+    if is_label_ordered(queryset):
+        queryset = queryset.order_by()
+    return _get_index(queryset, field.prepare_value, field.label_from_instance)
+
+
+def order_by_label(queryset):
+    """
+    Return ``queryset`` ordered case-insensitively by ``__str__``.
+
+    The primary-key order comes from the cached index, so the related table is
+    only read when the index is rebuilt. Returns an empty queryset when there
+    are no rows.
+    """
+    pks = [pk for pk, _label in _get_index(queryset, lambda obj: obj.pk, str)]
+    if not pks:
+        return queryset.none()
+    return queryset.filter(pk__in=pks).order_by(
+        LabelOrder(
+            *[When(pk=pk, then=Value(position)) for position, pk in enumerate(pks)],
+            output_field=IntegerField(),
+        )
+    )
+
+
+class OptionIndexModelChoiceIterator(ModelChoiceIterator):
+    """
+    Choice iterator that lists unordered querysets through the option index.
+
+    Querysets ordered by ``order_by_label()`` are listed from the index too.
+    Querysets with any other ``order_by()`` or a model ``Meta.ordering`` keep
+    their database order. Indexed choices carry no model instance.
+    """
+
+    def _uses_option_index(self) -> bool:
+        """Return whether choices come from the cached option index."""
+        return not self.queryset.ordered or is_label_ordered(self.queryset)
+
+    def __iter__(self):
+        if not self._uses_option_index():
+            yield from super().__iter__()
+            return
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for value, label in get_option_index(self.field):
+            yield (ModelChoiceIteratorValue(value, None), label)
+
+    def __len__(self):
+        if not self._uses_option_index():
+            return super().__len__()
+        return len(get_option_index(self.field)) + (
+            1 if self.field.empty_label is not None else 0
+        )
+
+    def __bool__(self):
+        if not self._uses_option_index():
+            return super().__bool__()
+        return self.field.empty_label is not None or bool(get_option_index(self.field))
+
+
+__all__ = [
+    "LabelOrder",
+    "OptionIndexModelChoiceIterator",
+    "get_filter_dropdown_sort_key",
+    "get_option_index",
+    "get_option_index_cache_key",
+    "get_option_index_ttl",
+    "invalidate_option_index",
+    "is_label_ordered",
+    "order_by_label",
+    "watch_view_filter_models",
+]
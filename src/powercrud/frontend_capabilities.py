@@ -0,0 +1,58 @@
+"""
+Runtime capabilities of the frontend that renders PowerCRUD pages.
+
+Some server-side behaviour only works with a runtime that knows about it.
+Remote relation options, for example, strip unselected ``<option>`` elements
+and rely on the runtime to fetch them again. The packaged Vite bundle can lag
+behind the runtime sources, so those features check for the capability first.
+
+By default the capabilities are detected from the packaged bundle. Projects
+that load the runtime sources directly, or build their own bundle, can list
+them in ``POWERCRUD_SETTINGS["FRONTEND_CAPABILITIES"]`` instead.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+from powercrud.conf import get_powercrud_setting
+
+REMOTE_RELATION_OPTIONS = "remote-relation-options"
+
+# A string each capability's runtime code carries into the built bundle.
+CAPABILITY_MARKERS = {
+    REMOTE_RELATION_OPTIONS: "data-powercrud-options-url",
+}
+
+PACKAGED_BUNDLE_DIR = Path(__file__).resolve().parent / "assets" / "django_assets"
+
+
+@lru_cache(maxsize=1)
+def get_packaged_bundle_capabilities() -> frozenset[str]:
+    """Return the capabilities whose markers appear in the packaged bundle."""
+    bundle = "".join(
+        path.read_text(encoding="utf-8", errors="ignore")
+        for path in sorted(PACKAGED_BUNDLE_DIR.glob("*.js"))
+    )
+    return frozenset(
+        capability
+        for capability, marker in CAPABILITY_MARKERS.items()
+        if marker in bundle
+    )
+
+
+def frontend_supports(capability: str) -> bool:
+    """Return whether the frontend runtime supports ``capability``."""
+    configured = get_powercrud_setting("FRONTEND_CAPABILITIES")
+    if configured is not None:
+        return capability in configured
+    return capability in get_packaged_bundle_capabilities()
+
+
+__all__ = [
+    "CAPABILITY_MARKERS",
+    "REMOTE_RELATION_OPTIONS",
+    "frontend_supports",
+    "get_packaged_bundle_capabilities",
+]
@@ -0,0 +1,324 @@
+"""Index advice for the list queries PowerCRUD views run.
+
+PowerCRUD knows which columns each list view sorts on, filters on, and pages
+by. ``advise_view()`` builds a representative query for each of them, asks the
+database for its plan with ``QuerySet.explain()``, and suggests indexes where
+the plan shows a sequential scan or an in-memory sort of the view's table.
+"""
+
+from __future__ import annotations
+
+import datetime
+import re
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import FieldDoesNotExist, FieldError
+from django.db import connections, models
+from django.http import HttpRequest
+from django.utils import timezone
+from neapolitan.views import Role
+
+from powercrud.logging import get_logger
+from powercrud.mixins.config_mixin import resolve_config
+
+log = get_logger(__name__)
+
+# Rows fetched per representative query when a view does not paginate.
+DEFAULT_PAGE_SIZE = 25
+
+# Plan lines that mean a full read of a table, keyed by database vendor.
+_SEQUENTIAL_SCAN_PATTERNS = {
+    "sqlite": re.compile(r"\bSCAN (?:TABLE )?\"?(\w+)\"?(?![\w\"]| USING)"),
+    "postgresql": re.compile(r"Seq Scan on \"?(\w+)\"?"),
+}
+# Plan lines that mean rows are sorted after they are read.
+_SORT_PATTERNS = {
+    "sqlite": re.compile(r"USE TEMP B-TREE FOR (?:RIGHT PART OF )?ORDER BY"),
+    "postgresql": re.compile(r"^\s*(?:->\s*)?(?:Incremental )?Sort\b", re.MULTILINE),
+}
+
+
+@dataclass(frozen=True)
+class IndexSuggestion:
+    """One index that would serve a list query without a scan or sort."""
+
+    model: type
+    fields: tuple[str, ...]
+    reason: str
+
+    def build_index(self) -> models.Index:
+        """Return a named ``models.Index`` for this suggestion."""
+        index = models.Index(fields=list(self.fields))
+        index.set_name_with_model(self.model)
+        return index
+
+
+@dataclass
+class QueryAdvice:
+    """Plan findings for one representative list query."""
+
+    label: str
+    kind: str
+    plan: str
+    sequential_scans: list[str] = field(default_factory=list)
+    sorts_rows: bool = False
+    notes: list[str] = field(default_factory=list)
+    suggestions: list[IndexSuggestion] = field(default_factory=list)
+
+    @property
+    def needs_index(self) -> bool:
+        """
+        Return whether the plan does more work than one page needs.
+
+        Sorted pages are a problem when the rows are sorted after reading; a
+        scan in index or ``pk`` order stops at the page limit. Filtered pages
+        are a problem when the table is scanned to find matches.
+        """
+        if self.kind == "filter":
+            return bool(self.sequential_scans)
+        return self.sorts_rows
+
+
+@dataclass
+class ViewIndexAdvice:
+    """Index advice for every representative query of one view."""
+
+    view_class: type
+    model: type
+    queries: list[QueryAdvice] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def suggestions(self) -> list[IndexSuggestion]:
+        """Return the distinct suggestions across this view's queries."""
+        unique = {}
+        for query in self.queries:
+            for suggestion in query.suggestions:
+                unique.setdefault((suggestion.model, suggestion.fields), suggestion)
+        return list(unique.values())
+
+
+def _build_list_view(view_class):
+    """Return ``view_class`` set up for an anonymous list request."""
+    request = HttpRequest()
+    request.method = "GET"
+    request.user = AnonymousUser()
+    request.session = {}
+    request.htmx = False
+    view = view_class(role=Role.LIST)
+    view.setup(request)
+    return view
+
+
+def _existing_index_prefixes(model) -> set[tuple[str, ...]]:
+    """Return the field tuples of ``model``'s existing indexes."""
+    meta = model._meta
+    prefixes = {(meta.pk.name,)}
+    for model_field in meta.concrete_fields:
+        if model_field.db_index or model_field.unique:
+            prefixes.add((model_field.name,))
+    for index in meta.indexes:
+        if index.fields:
+            prefixes.add(tuple(name.lstrip("-") for name in index.fields))
+    for constraint in meta.constraints:
+        constraint_fields = getattr(constraint, "fields", ())
+        if constraint_fields and getattr(constraint, "condition", None) is None:
+            prefixes.add(tuple(constraint_fields))
+    for unique_together in meta.unique_together:
+        prefixes.add(tuple(unique_together))
+    return prefixes
+
+
+def _has_index(model, field_name: str) -> bool:
+    """
+    Return whether an existing index already leads with ``field_name``.
+
+    Such an index narrows the rows to sort or filter, so a second index on the
+    same leading column is rarely worth its write cost.
+    """
+    return any(
+        existing[0] == field_name for existing in _existing_index_prefixes(model)
+    )
+
+
+def _local_field(model, path: str):
+    """Return the concrete local field for ``path``, or ``None`` for lookups."""
+    if "__" in path:
+        return None
+    try:
+        model_field = model._meta.get_field(path)
+    except FieldDoesNotExist:
+        return None
+    if not getattr(model_field, "concrete", False) or model_field.many_to_many:
+        return None
+    return model_field
+
+
+def _sample_value(queryset, model_field) -> Any:
+    """Return a value of ``model_field`` to filter on, preferring real data."""
+    name = model_field.attname
+    value = (
+        queryset.order_by()
+        .exclude(**{f"{name}__isnull": True})
+        .values_list(name, flat=True)
+        .first()
+    )
+    if value is not None:
+        return value
+    if isinstance(model_field, models.BooleanField):
+        return True
+    if isinstance(model_field, models.DateTimeField):
+        return timezone.now()
+    if isinstance(model_field, models.DateField):
+        return datetime.date.today()
+    if isinstance(model_field, models.TimeField):
+        return datetime.time()
+    if isinstance(model_field, models.DecimalField):
+        return Decimal(0)
+    if isinstance(model_field, (models.CharField, models.TextField)):
+        return ""
+    return 0
+
+
+def explain_query(queryset, label: str, using: str, kind: str = "sort") -> QueryAdvice:
+    """
+    Return the plan of ``queryset`` and what it reveals about the view table.
+
+    ``kind`` is ``"sort"`` for pages read in an order or ``"filter"`` for pages
+    read through a filter, and decides what ``QueryAdvice.needs_index`` checks.
+    """
+    queryset = queryset.using(using)
+    plan = queryset.explain()
+    vendor = connections[using].vendor
+    table = queryset.model._meta.db_table
+    scan_pattern = _SEQUENTIAL_SCAN_PATTERNS.get(vendor)
+    sort_pattern = _SORT_PATTERNS.get(vendor)
+    advice = QueryAdvice(label=label, kind=kind, plan=plan)
+    if scan_pattern is None:
+        advice.notes.append(f"Plans from {vendor} are reported but not analysed.")
+        return advice
+    advice.sequential_scans = sorted(
+        {match for match in scan_pattern.findall(plan) if match == table}
+    )
+    advice.sorts_rows = bool(sort_pattern.search(plan))
+    return advice
+
+
+def _advise_sort(view, queryset, column: str, using: str) -> QueryAdvice | None:
+    """Return plan advice for the list sorted by ``column``."""
+    expression = view.resolve_sort_expression(column, queryset=queryset)
+    if not expression:
+        return None
+    page_size = resolve_config(view).paginate_by or DEFAULT_PAGE_SIZE
+    try:
+        advice = explain_query(
+            queryset.order_by(expression, "pk")[:page_size],
+            f"sort={column}",
+            using,
+        )
+    except FieldError:
+        return None
+    if not advice.needs_index:
+        return advice
+
+    model = queryset.model
+    local_field = _local_field(model, expression)
+    if local_field is not None and local_field.primary_key:
+        return advice
+    if local_field is None:
+        advice.notes.append(
+            f"Sorting on {expression} reads another table; an index here cannot "
+            "avoid the sort. Consider column_sort_fields_override."
+        )
+        return advice
+    fields = (local_field.name, model._meta.pk.name)
+    if not _has_index(model, local_field.name):
+        advice.suggestions.append(
+            IndexSuggestion(model, fields, f"list sorted by {column}")
+        )
+    return advice
+
+
+def _advise_filter(view, queryset, field_name: str, using: str) -> QueryAdvice | None:
+    """Return plan advice for the list filtered on ``field_name``."""
+    model = queryset.model
+    local_field = _local_field(model, field_name)
+    if local_field is None:
+        return None
+    if isinstance(local_field, (models.CharField, models.TextField)) and not (
+        getattr(local_field, "choices", None)
+    ):
+        filtered = queryset.filter(**{f"{field_name}__icontains": "a"})
+    else:
+        filtered = queryset.filter(
+            **{local_field.attname: _sample_value(queryset, local_field)}
+        )
+    page_size = resolve_config(view).paginate_by or DEFAULT_PAGE_SIZE
+    advice = explain_query(
+        filtered.order_by("pk")[:page_size],
+        f"filter={field_name}",
+        using,
+        kind="filter",
+    )
+    if not advice.needs_index:
+        return advice
+    if isinstance(local_field, (models.CharField, models.TextField)) and not (
+        getattr(local_field, "choices", None)
+    ):
+        advice.notes.append(
+            f"Substring filters on {field_name} cannot use a B-tree index. "
+            "Add it to list_search_fields to search through an index."
+        )
+        return advice
+    fields = (local_field.name, model._meta.pk.name)
+    if not _has_index(model, local_field.name):
+        advice.suggestions.append(
+            IndexSuggestion(model, fields, f"list filtered on {field_name}")
+        )
+    return advice
+
+
+def advise_view(view_class, using: str = "default") -> ViewIndexAdvice:
+    """
+    Explain the representative list queries of ``view_class``.
+
+    The queries cover the default ``pk`` ordering, a sort on each list column,
+    and a filter on each ``filterset_fields`` entry, each limited to one page.
+    """
+    result = ViewIndexAdvice(view_class=view_class, model=view_class.model)
+    try:
+        view = _build_list_view(view_class)
+        queryset = view.get_queryset().order_by()
+        page_size = resolve_config(view).paginate_by or DEFAULT_PAGE_SIZE
+        result.queries.append(
+            explain_query(queryset.order_by("pk")[:page_size], "default", using)
+        )
+        config = resolve_config(view)
+        properties = set(config.properties or ())
+        for column in config.fields or ():
+            if column in properties:
+                continue
+            advice = _advise_sort(view, queryset, column, using)
+            if advice is not None:
+                result.queries.append(advice)
+        for field_name in getattr(view, "filterset_fields", None) or ():
+            advice = _advise_filter(view, queryset, field_name, using)
+            if advice is not None:
+                result.queries.append(advice)
+    except Exception as exc:
+        # One misconfigured view should not stop the advice for the others.
+        log.warning(f"Index advice for {view_class.__name__} failed: {exc}")
+        result.error = str(exc) or exc.__class__.__name__
+    return result
+
+
+__all__ = [
+    "IndexSuggestion",
+    "QueryAdvice",
+    "ViewIndexAdvice",
+    "advise_view",
+    "explain_query",
+]
@@ -0,0 +1,106 @@
+"""Cached ordered primary-key lists for snapshot list pagination.
+
+Views with expensive annotations, filters, or sorts normally re-run the whole
+query on every page change just to read a different ``OFFSET`` window. In
+snapshot mode the first request stores the ordered primary keys for the current
+filter and sort state, and later pages only fetch their own rows by primary
+key. Snapshots expire after a TTL and when the view's model, or another
+watched model, sends ``post_save`` or ``post_delete``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from uuid import uuid4
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+
+LIST_SNAPSHOT_CACHE_PREFIX = "powercrud:list-snapshot"
+
+# Models whose save/delete signals already invalidate list snapshots.
+_WATCHED_MODELS: set[type] = set()
+
+
+def resolve_snapshot_models(models: Iterable[str | type] | None) -> list[type]:
+    """Return model classes for ``"app_label.ModelName"`` labels or classes."""
+    resolved = []
+    for model in models or ():
+        resolved.append(apps.get_model(model) if isinstance(model, str) else model)
+    return resolved
+
+
+def get_snapshot_watch_models(
+    model, watch_models: Iterable[str | type] | None = None
+) -> list[type]:
+    """Return ``model`` followed by the other ``watch_models``, without repeats."""
+    resolved = [model] if model is not None else []
+    for watched in resolve_snapshot_models(watch_models):
+        if watched not in resolved:
+            resolved.append(watched)
+    return resolved
+
+
+def _get_version_key(model) -> str:
+    """Return the cache key holding ``model``'s current snapshot version."""
+    return f"{LIST_SNAPSHOT_CACHE_PREFIX}:version:{model._meta.label_lower}"
+
+
+def invalidate_list_snapshots(model) -> None:
+    """Drop every cached list snapshot that watches ``model``."""
+    cache.set(_get_version_key(model), uuid4().hex, None)
+
+
+def _invalidate_on_change(sender, **kwargs) -> None:
+    """Invalidate snapshots watching the sender after a save or delete."""
+    invalidate_list_snapshots(sender)
+
+
+def watch_model(model) -> None:
+    """Invalidate snapshots that watch ``model`` when one of its rows changes."""
+    if model in _WATCHED_MODELS:
+        return
+    dispatch_uid = f"{LIST_SNAPSHOT_CACHE_PREFIX}:{model._meta.label_lower}"
+    post_save.connect(
+        _invalidate_on_change, sender=model, weak=False, dispatch_uid=dispatch_uid
+    )
+    post_delete.connect(
+        _invalidate_on_change, sender=model, weak=False, dispatch_uid=dispatch_uid
+    )
+    _WATCHED_MODELS.add(model)
+
+
+def watch_view_snapshot_models(view_class) -> None:
+    """
+    Watch the models whose changes drop ``view_class``'s list snapshots.
+
+    Called for every PowerCRUD view with ``list_snapshot`` when the app loads,
+    so writes made before this process serves the list still drop snapshots.
+    """
+    if not getattr(view_class, "list_snapshot", False):
+        return
+    for model in get_snapshot_watch_models(
+        getattr(view_class, "model", None),
+        getattr(view_class, "list_snapshot_watch_models", None),
+    ):
+        watch_model(model)
+
+
+def get_snapshot_version(models: Iterable[type]) -> tuple[str, ...]:
+    """Return the current snapshot versions of ``models``, watching each one."""
+    versions = []
+    for model in models:
+        watch_model(model)
+        versions.append(cache.get_or_set(_get_version_key(model), uuid4().hex, None))
+    return tuple(versions)
+
+
+__all__ = [
+    "get_snapshot_version",
+    "get_snapshot_watch_models",
+    "invalidate_list_snapshots",
+    "resolve_snapshot_models",
+    "watch_model",
+    "watch_view_snapshot_models",
+]
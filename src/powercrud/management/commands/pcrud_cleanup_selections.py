@@ -0,0 +1,53 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from powercrud.conf import get_powercrud_setting
+from powercrud.selection_store import cleanup_expired_selections
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete database-stored bulk selections that have not changed for "
+        "longer than BULK_SELECTION_TTL."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ttl",
+            type=int,
+            default=None,
+            help=(
+                "Age in seconds after which an unchanged selection expires. "
+                "Defaults to POWERCRUD_SETTINGS['BULK_SELECTION_TTL']."
+            ),
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Output cleanup summary as JSON instead of human-readable text.",
+        )
+
+    def handle(self, *args, **options):
+        ttl = options["ttl"]
+        if ttl is None:
+            ttl = get_powercrud_setting("BULK_SELECTION_TTL")
+        if not ttl:
+            self.stdout.write(
+                self.style.WARNING(
+                    "BULK_SELECTION_TTL is not set; stored selections never expire."
+                )
+            )
+            return
+
+        deleted = cleanup_expired_selections(ttl)
+
+        if options["json"]:
+            self.stdout.write(json.dumps({"deleted_entries": deleted, "ttl": ttl}))
+            return
+        if deleted:
+            self.stdout.write(
+                self.style.SUCCESS(f"Deleted {deleted} expired selection entries.")
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("No expired selections were found."))
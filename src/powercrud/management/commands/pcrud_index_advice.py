@@ -0,0 +1,241 @@
+import json
+import os
+import site
+import sysconfig
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.db.migrations.loader import MigrationLoader
+from django.utils.module_loading import import_string
+
+from powercrud.index_advice import advise_view
+from powercrud.management.discovery import iter_routed_powercrud_views
+
+
+class Command(BaseCommand):
+    help = (
+        "Explain the list queries of PowerCRUD views and suggest indexes for "
+        "sorts and filters that scan or sort the whole table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "views",
+            nargs="*",
+            help=(
+                "Dotted paths of the views to inspect. Defaults to every routed "
+                "PowerCRUD view."
+            ),
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to explain the queries on.",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print the findings as JSON.",
+        )
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Include the full query plan of every inspected query.",
+        )
+        parser.add_argument(
+            "--emit-meta",
+            action="store_true",
+            help=(
+                "Print the Meta.indexes entries to add for the suggested "
+                "indexes, for makemigrations to pick up."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["views"]:
+            try:
+                view_classes = [import_string(path) for path in options["views"]]
+            except ImportError as exc:
+                raise CommandError(str(exc)) from exc
+        else:
+            view_classes = list(iter_routed_powercrud_views())
+        view_classes = [
+            view_class
+            for view_class in view_classes
+            if getattr(view_class, "model", None) is not None
+        ]
+        if not view_classes:
+            self.stdout.write(self.style.WARNING("No PowerCRUD views were found."))
+            return
+
+        results = [
+            advise_view(view_class, using=options["database"])
+            for view_class in view_classes
+        ]
+        if options["json"]:
+            self.stdout.write(
+                json.dumps(
+                    [
+                        self._as_dict(result, options["verbose_plans"])
+                        for result in results
+                    ],
+                    indent=2,
+                )
+            )
+        else:
+            for result in results:
+                self._write_result(result, options["verbose_plans"])
+
+        if options["emit_meta"]:
+            self._emit_meta_indexes(results, options)
+
+    def _as_dict(self, result, verbose_plans):
+        """Return one view's findings as JSON-serialisable data."""
+        queries = []
+        for query in result.queries:
+            entry = {
+                "query": query.label,
+                "needs_index": query.needs_index,
+                "sequential_scans": query.sequential_scans,
+                "sorts_rows": query.sorts_rows,
+                "notes": query.notes,
+            }
+            if verbose_plans:
+                entry["plan"] = query.plan
+            queries.append(entry)
+        return {
+            "view": f"{result.view_class.__module__}.{result.view_class.__qualname__}",
+            "model": result.model._meta.label,
+            "error": result.error,
+            "queries": queries,
+            "suggestions": [
+                {
+                    "model": suggestion.model._meta.label,
+                    "fields": list(suggestion.fields),
+                    "name": suggestion.build_index().name,
+                    "reason": suggestion.reason,
+                }
+                for suggestion in result.suggestions
+            ],
+        }
+
+    def _write_result(self, result, verbose_plans):
+        """Write one view's findings as readable text."""
+        self.stdout.write(
+            self.style.MIGRATE_HEADING(
+                f"{result.view_class.__qualname__} ({result.model._meta.label})"
+            )
+        )
+        if result.error:
+            self.stdout.write(self.style.ERROR(f"  Could not explain: {result.error}"))
+            return
+        for query in result.queries:
+            problems = []
+            if query.needs_index and query.sequential_scans:
+                problems.append("sequential scan")
+            if query.needs_index and query.sorts_rows:
+                problems.append("sorts rows")
+            status = ", ".join(problems) or "ok"
+            self.stdout.write(f"  {query.label}: {status}")
+            for note in query.notes:
+                self.stdout.write(f"    note: {note}")
+            if verbose_plans:
+                for line in query.plan.splitlines():
+                    self.stdout.write(f"    | {line}")
+        for suggestion in result.suggestions:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"  suggest: Index(fields={list(suggestion.fields)!r}) "
+                    f"for {suggestion.reason}"
+                )
+            )
+        if not result.suggestions:
+            self.stdout.write("  No index suggestions.")
+
+    def _emit_meta_indexes(self, results, options):
+        """Print the ``Meta.indexes`` entries each project model is missing."""
+        by_model = {}
+        for result in results:
+            for suggestion in result.suggestions:
+                by_model.setdefault(suggestion.model, {}).setdefault(
+                    suggestion.fields, suggestion
+                )
+
+        connection = connections[options["database"]]
+        state = MigrationLoader(connection, ignore_no_migrations=True).project_state()
+        emitted = False
+        for model, suggestions in sorted(
+            by_model.items(), key=lambda item: item[0]._meta.label
+        ):
+            if not _is_project_app(model._meta.app_config):
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Skipped {model._meta.label}: the app is not part of "
+                        "this project."
+                    )
+                )
+                continue
+            existing = _existing_index_names(model, state, connection)
+            indexes = [
+                index
+                for index in (
+                    suggestion.build_index() for suggestion in suggestions.values()
+                )
+                if index.name not in existing
+            ]
+            if not indexes:
+                continue
+            emitted = True
+            self.stdout.write(
+                self.style.MIGRATE_HEADING(
+                    f"{model._meta.label}: add to {model.__name__}.Meta.indexes"
+                )
+            )
+            for index in indexes:
+                self.stdout.write(
+                    f"    models.Index(fields={index.fields!r}, name={index.name!r}),"
+                )
+        if emitted:
+            self.stdout.write("Then run makemigrations to create the migration.")
+        else:
+            self.stdout.write("No Meta.indexes changes needed.")
+
+
+def _is_project_app(app_config) -> bool:
+    """
+    Return whether ``app_config`` belongs to the project rather than a package.
+
+    Indexes for Django's own apps or installed packages cannot be added to
+    their models' ``Meta``, so they are reported but never emitted.
+    """
+    app_path = os.path.realpath(app_config.path)
+    package_roots = {
+        os.path.realpath(path)
+        for path in (
+            *site.getsitepackages(),
+            site.getusersitepackages(),
+            sysconfig.get_paths()["purelib"],
+            sysconfig.get_paths()["platlib"],
+            os.path.dirname(django.__file__),
+        )
+    }
+    return not any(
+        os.path.commonpath([app_path, root]) == root for root in package_roots
+    )
+
+
+def _existing_index_names(model, state, connection) -> set[str]:
+    """Return the index names ``model`` already has anywhere."""
+    names = {index.name for index in model._meta.indexes}
+    model_state = state.models.get((model._meta.app_label, model._meta.model_name))
+    if model_state is not None:
+        names.update(index.name for index in model_state.options.get("indexes", []))
+    try:
+        with connection.cursor() as cursor:
+            names.update(
+                connection.introspection.get_constraints(cursor, model._meta.db_table)
+            )
+    except DatabaseError:
+        pass
+    return names
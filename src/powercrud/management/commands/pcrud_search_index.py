@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.module_loading import import_string
+
+from powercrud.management.discovery import iter_routed_powercrud_views
+from powercrud.search import get_list_search_backend
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the list search indexes used by PowerCRUD views that set "
+        "list_search_fields."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "views",
+            nargs="*",
+            help=(
+                "Dotted paths of the views to index. Defaults to every routed "
+                "view with list_search_fields."
+            ),
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to build the indexes on.",
+        )
+
+    def handle(self, *args, **options):
+        if options["views"]:
+            try:
+                view_classes = [import_string(path) for path in options["views"]]
+            except ImportError as exc:
+                raise CommandError(str(exc)) from exc
+        else:
+            view_classes = list(iter_routed_powercrud_views())
+
+        backends = {}
+        for view_class in view_classes:
+            fields = getattr(view_class, "list_search_fields", None)
+            model = getattr(view_class, "model", None)
+            if not fields or model is None:
+                continue
+            backend = get_list_search_backend(
+                model,
+                fields,
+                getattr(view_class, "list_search_backend", None),
+            )
+            backends.setdefault(id(backend), backend)
+
+        if not backends:
+            self.stdout.write(
+                self.style.WARNING("No views with list_search_fields were found.")
+            )
+            return
+
+        for backend in backends.values():
+            rows = backend.build_index(using=options["database"])
+            indexed = "" if rows is None else f" ({rows} rows)"
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Built {backend.name} index for {backend.model._meta.label}: "
+                    f"{', '.join(backend.fields)}{indexed}"
+                )
+            )
@@ -0,0 +1,34 @@
+"""Discovery of the PowerCRUD views routed by the project's URLconf."""
+
+from __future__ import annotations
+
+from typing import Iterator
+
+from django.urls import URLPattern, URLResolver, get_resolver
+
+
+def _iter_patterns(patterns) -> Iterator[type]:
+    """Yield the class-based views routed by ``patterns``, recursively."""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _iter_patterns(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            view_class = getattr(pattern.callback, "view_class", None)
+            if view_class is not None:
+                yield view_class
+
+
+def iter_routed_powercrud_views(urlconf=None) -> Iterator[type]:
+    """
+    Yield each routed PowerCRUD view class once, in URLconf order.
+
+    Every role of a view shares one class, so classes are de-duplicated.
+    """
+    from powercrud.mixins import PowerCRUDMixin
+
+    seen = set()
+    for view_class in _iter_patterns(get_resolver(urlconf).url_patterns):
+        if view_class in seen or not issubclass(view_class, PowerCRUDMixin):
+            continue
+        seen.add(view_class)
+        yield view_class
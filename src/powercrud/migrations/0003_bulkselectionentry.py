@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("powercrud", "0002_delete_bulktask"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BulkSelectionEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("owner_key", models.CharField(max_length=255)),
+                ("storage_key", models.CharField(max_length=255)),
+                ("object_id", models.CharField(max_length=255)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("owner_key", "storage_key", "object_id"),
+                        name="uniq_powercrud_bulk_selection_entry",
+                    )
+                ],
+            },
+        ),
+    ]
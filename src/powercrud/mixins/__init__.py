@@ -1,3 +1,7 @@
+from django.apps import apps as django_apps
+
+from powercrud.apps import connect_view_receivers
+
 from .htmx_mixin import HtmxMixin
 from .delete_mixin import DeleteMixin
 from .bulk_mixin import BulkEditRole, BulkMixin
@@ -5,7 +9,9 @@ from .core_mixin import CoreMixin
 from .favourites_mixin import FavouritesMixin
 from .row_action_state_mixin import RowActionStateMixin
 from .cell_tooltip_mixin import CellTooltipMixin
+from .relation_options_mixin import RelationOptionsMixin
 from .list_options_mixin import ListOptionsMixin
+from .query_planning_mixin import ListQueryPlan, QueryPlanningMixin
 from .filtering_mixin import (
     FilteringMixin,
     AllValuesModelMultipleChoiceFilter,
@@ -27,10 +33,12 @@ class PowerCRUDMixin(
     TableMixin,
     BulkMixin,
     CellTooltipMixin,
+    RelationOptionsMixin,
     RowActionStateMixin,
     ListOptionsMixin,
     FavouritesMixin,
     FilteringMixin,
+    QueryPlanningMixin,
     CoreMixin,
     UrlMixin,
 ):
@@ -39,7 +47,15 @@ class PowerCRUDMixin(
     The order of inheritance is important for Method Resolution Order (MRO).
     """
 
-    pass
+    def __init_subclass__(cls, **kwargs):
+        """Connect the model signal receivers the new view's configuration uses.
+
+        Views defined before the app registry is ready are connected by
+        ``powercrudConfig.ready()`` instead.
+        """
+        super().__init_subclass__(**kwargs)
+        if django_apps.ready:
+            connect_view_receivers([cls])
 
 
 def __getattr__(name: str):
@@ -67,8 +83,11 @@ __all__ = [
     "DeleteMixin",
     "FavouritesMixin",
     "CellTooltipMixin",
+    "RelationOptionsMixin",
     "RowActionStateMixin",
     "ListOptionsMixin",
+    "ListQueryPlan",
+    "QueryPlanningMixin",
     "AsyncMixin",
     "PowerCRUDAsyncMixin",
 ]
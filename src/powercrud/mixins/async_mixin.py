@@ -8,6 +8,7 @@ from django.shortcuts import render
 from django.urls import reverse
 
 from ..async_manager import AsyncManager
+from ..selection_store import resolve_selection_queryset
 from powercrud.logging import get_logger
 from .config_mixin import get_template_candidates, get_template_name, resolve_config
 
@@ -227,12 +228,58 @@ class AsyncMixin:
             normalized_ids = [str(pk) for pk in selected_ids]
             conflict_data = {model_name: normalized_ids}
             conflicts = async_manager.check_conflict(conflict_data)
-            return len(conflicts) > 0
+            if conflicts:
+                return True
+
+            # Predicate jobs lock their selection, not their rows.
+            return any(
+                resolve_selection_queryset(entry["selection"], entry["user_id"])
+                .filter(pk__in=normalized_ids)
+                .exists()
+                for entry in async_manager.get_active_selections(model_name).values()
+            )
 
         except Exception as e:
             log.error(f"Error checking conflicts: {e}")
             return False
 
+    def _check_for_selection_conflicts(self, selection, user_id=None):
+        """
+        Check whether a predicate selection overlaps rows another task holds.
+
+        Other predicate jobs are compared through a ``pk`` subquery and
+        id-locked jobs through their locked ids, so the selection's own ids are
+        never read.
+        """
+        if not self.get_bulk_async_enabled():
+            return False
+
+        try:
+            async_manager = self.get_async_manager()
+            model_name = f"{self.model._meta.app_label}.{self.model._meta.model_name}"
+            queryset = resolve_selection_queryset(selection, user_id)
+
+            for entry in async_manager.get_active_selections(model_name).values():
+                locked = resolve_selection_queryset(
+                    entry["selection"], entry["user_id"]
+                )
+                if queryset.filter(pk__in=locked.values("pk")).exists():
+                    return True
+
+            for task_name in async_manager.get_active_tasks():
+                locked_ids = [
+                    pk
+                    for pk in async_manager.get_locked_ids(task_name, model_name)
+                    if not pk.startswith("selection:")
+                ]
+                if locked_ids and queryset.filter(pk__in=locked_ids).exists():
+                    return True
+            return False
+
+        except Exception as e:
+            log.error(f"Error checking selection conflicts: {e}")
+            return False
+
     def _check_single_record_conflict(self, pk):
         """Check if a single record is involved in any bulk operation"""
         if pk is None:
@@ -278,7 +325,9 @@ class AsyncMixin:
         # Fallback: simple HTTP response
         return HttpResponse(conflict_message, status=409)
 
-    def _render_bulk_conflict_response(self, request, selected_ids, delete_selected):
+    def _render_bulk_conflict_response(
+        self, request, selected_ids, delete_selected, selected_count=None
+    ):
         """Render conflict response for bulk operations"""
         component_context_getter = getattr(
             self, "get_bulk_form_component_context", None
@@ -289,7 +338,9 @@ class AsyncMixin:
         context = {
             "conflict_detected": True,
             "conflict_message": f"Another bulk operation is already running on {self.model._meta.verbose_name_plural}. Please try again later.",
-            "selected_count": len(selected_ids),
+            "selected_count": len(selected_ids)
+            if selected_count is None
+            else selected_count,
             "model_name_plural": self.model._meta.verbose_name_plural,
             **component_context,
         }
@@ -363,8 +414,17 @@ class AsyncMixin:
         bulk_fields,
         fields_to_update,
         field_data,
+        selection=None,
+        selected_count=None,
     ):
-        """Handle async bulk operations using new AsyncManager system"""
+        """
+        Handle async bulk operations using new AsyncManager system.
+
+        When ``selection`` holds a predicate payload, workers receive it in
+        place of the id list and rebuild the queryset themselves. The payload
+        is locked as a whole, so ``selected_ids`` may be empty and
+        ``selected_count`` gives the size of the selection instead.
+        """
         # log.debug("running _handle_async_bulk_operation with new AsyncManager")
 
         # ✅ Check authentication if required
@@ -377,12 +437,18 @@ class AsyncMixin:
                 )
             user = None  # Handle anonymous user
 
+        if selected_count is None:
+            selected_count = len(selected_ids)
+        user_id = user.id if user else None
+
         # ✅ Check for conflicts using new system
-        if self.get_conflict_checking_enabled() and self._check_for_conflicts(
-            selected_ids
+        if self.get_conflict_checking_enabled() and (
+            self._check_for_selection_conflicts(selection, user_id)
+            if selection
+            else self._check_for_conflicts(selected_ids)
         ):
             return self._render_bulk_conflict_response(
-                request, selected_ids, delete_selected
+                request, selected_ids, delete_selected, selected_count=selected_count
             )
 
         # Initialize AsyncManager
@@ -394,11 +460,20 @@ class AsyncMixin:
 
         # Prepare conflict_ids for new system
         model_name = f"{self.model._meta.app_label}.{self.model._meta.model_name}"
-        conflict_ids = {model_name: set(map(int, selected_ids))}
+        if selection:
+            conflict_ids = None
+            conflict_selections = {model_name: selection}
+        else:
+            conflict_ids = {model_name: set(map(int, selected_ids))}
+            conflict_selections = None
 
         # Prepare task arguments
         model_path = f"{self.model._meta.app_label}.{self.model.__name__}"
-        user_id = user.id if user else None
+        task_ids = [] if selection else selected_ids
+        task_kwargs = {"selection": selection} if selection else {}
+        # Only predicate launches pass the count, keeping older overrides of
+        # the queue callbacks working.
+        queue_kwargs = {"selected_count": selected_count} if selection else {}
 
         # Generate task_name BEFORE calling launch_async_task
         task_name = async_manager.generate_task_name()
@@ -406,31 +481,34 @@ class AsyncMixin:
         try:
             if delete_selected:
                 log.info(
-                    f"Launching async bulk delete task for {len(selected_ids)} records"
+                    f"Launching async bulk delete task for {selected_count} records"
                 )
                 # Launch delete task using new AsyncManager
                 async_manager.launch_async_task(
                     "powercrud.tasks.bulk_delete_task",  # positional arg 1
                     model_path,  # positional arg 2
-                    selected_ids,  # positional arg 3
+                    task_ids,  # positional arg 3
                     user_id,  # positional arg 4
                     task_name,  # positional arg 5 - THIS IS THE KEY!
                     # django-q2 specific params as kwargs
                     conflict_ids=conflict_ids,
+                    conflict_selections=conflict_selections,
                     user=user,
-                    affected_objects=f"{len(selected_ids)} {self.model._meta.verbose_name_plural}",
+                    affected_objects=f"{selected_count} {self.model._meta.verbose_name_plural}",
                     manager_class=self.get_async_manager_class_path(),
                     manager_config=self.get_async_manager_config(),
+                    bulk_chunk_size=getattr(self, "bulk_chunk_size", None),
+                    **task_kwargs,
                 )
             else:
                 log.info(
-                    f"Launching async bulk update task for {len(selected_ids)} records"
+                    f"Launching async bulk update task for {selected_count} records"
                 )
                 # Launch update task using new AsyncManager
                 async_manager.launch_async_task(
                     "powercrud.tasks.bulk_update_task",  # positional arg 1
                     model_path,  # positional arg 2
-                    selected_ids,  # positional arg 3
+                    task_ids,  # positional arg 3
                     user_id,  # positional arg 4
                     bulk_fields,  # positional arg 5
                     fields_to_update,  # positional arg 6
@@ -438,8 +516,9 @@ class AsyncMixin:
                     task_name,  # positional arg 8 - THIS IS THE KEY!
                     # django-q2 specific params as kwargs
                     conflict_ids=conflict_ids,
+                    conflict_selections=conflict_selections,
                     user=user,
-                    affected_objects=f"{len(selected_ids)} {self.model._meta.verbose_name_plural}",
+                    affected_objects=f"{selected_count} {self.model._meta.verbose_name_plural}",
                     manager_class=self.get_async_manager_class_path(),
                     manager_config=self.get_async_manager_config(),
                     bulk_update_persistence_backend_path=(
@@ -456,16 +535,35 @@ class AsyncMixin:
                             None,
                         )
                     ),
+                    bulk_full_clean=getattr(self, "bulk_full_clean", True),
+                    bulk_update_strategy=getattr(
+                        self, "bulk_update_strategy", "auto"
+                    ),
+                    bulk_chunk_size=getattr(self, "bulk_chunk_size", None),
+                    view_class_path=(
+                        self.get_bulk_update_view_class_path()
+                        if hasattr(self, "get_bulk_update_view_class_path")
+                        else None
+                    ),
+                    **task_kwargs,
                 )
             # Success - return response with task_key for progress polling
-            return self.async_queue_success(request, task_name, selected_ids)
+            return self.async_queue_success(
+                request, task_name, selected_ids, **queue_kwargs
+            )
 
         except Exception as e:
             log.error(f"Failed to launch async task: {e}")
-            return self.async_queue_failure(request, error=e, selected_ids=selected_ids)
+            return self.async_queue_failure(
+                request, error=e, selected_ids=selected_ids, **queue_kwargs
+            )
 
     def async_queue_success(
-        self, request, task_name: str, selected_ids: List[int]
+        self,
+        request,
+        task_name: str,
+        selected_ids: List[int],
+        selected_count: int | None = None,
     ):  # pragma: no cover
         """
         Processes successful async task queueing using new AsyncManager system.
@@ -473,6 +571,8 @@ class AsyncMixin:
 
         Can be overridden to customize or extend success handling.
         """
+        if selected_count is None:
+            selected_count = len(selected_ids)
         self.clear_selection_from_session(request)
 
         # Return async success response with task_name for progress polling
@@ -495,7 +595,7 @@ class AsyncMixin:
             template,
             context={
                 "task_name": task_name,
-                "selected_count": len(selected_ids),
+                "selected_count": selected_count,
                 "model_name_plural": self.model._meta.verbose_name_plural,
                 "progress_url": progress_url,
                 **component_context,
@@ -507,19 +607,25 @@ class AsyncMixin:
             {
                 "bulkEditQueued": True,
                 "taskName": task_name,
-                "message": f"Processing {len(selected_ids)} records in background.",
+                "message": f"Processing {selected_count} records in background.",
             }
         )
         return response
 
     def async_queue_failure(
-        self, request, error: Exception, selected_ids: List[int]
+        self,
+        request,
+        error: Exception,
+        selected_ids: List[int],
+        selected_count: int | None = None,
     ):  # pragma: no cover
         """
         Handles failure during async task queueing using new AsyncManager system.
 
         Can be overridden to customize or extend failure handling.
         """
+        if selected_count is None:
+            selected_count = len(selected_ids)
         # ✅ Log the error
         log.error(f"Async task queueing failed: {str(error)}", exc_info=True)
 
@@ -538,7 +644,7 @@ class AsyncMixin:
             request,
             f"{template_errors}#bulk_edit_error",
             context={
-                "error": f"Failed to queue background task for {len(selected_ids)} {self.model._meta.verbose_name_plural}:\n\n{str(error)}",
+                "error": f"Failed to queue background task for {selected_count} {self.model._meta.verbose_name_plural}:\n\n{str(error)}",
                 **component_context,
             },
         )
@@ -7,6 +7,7 @@ from powercrud.logging import get_logger
 from powercrud.template_packs import WidgetPolicyContext, get_template_pack_server_adapter
 from powercrud.widget_policy import apply_widget_presentation, get_model_widget_kind
 from ..config_mixin import resolve_config
+from ..relation_options_mixin import REMOTE_OPTIONS_URL_ATTR
 
 log = get_logger(__name__)
 
@@ -164,9 +165,15 @@ class MetadataMixin:
                 is_relation = field.is_relation
                 is_m2m = field_type == "ManyToManyField"
 
-                # For related fields, get all possible related objects
+                # For related fields, get all possible related objects, unless
+                # a searchable select fetches them from the options endpoint.
                 bulk_choices = None
-                if is_relation and hasattr(field, "related_model"):
+                options_url = self._get_bulk_remote_options_url(
+                    field_name=field_name, field=field
+                )
+                if options_url:
+                    bulk_choices = []
+                elif is_relation and hasattr(field, "related_model"):
                     # Use the related model's objects manager directly
                     bulk_choices = self.get_bulk_choices_for_field(
                         field_name=field_name, field=field
@@ -184,12 +191,17 @@ class MetadataMixin:
                     "choices": getattr(
                         field, "choices", None
                     ),  # Add choices for fields with choices
+                    "options_url": options_url,
                 }
                 info["control"] = self._build_bulk_value_control(
                     field_name=field_name,
                     field=field,
                     info=info,
                 )
+                if options_url:
+                    info["control"].field.widget.attrs[REMOTE_OPTIONS_URL_ATTR] = (
+                        options_url
+                    )
                 # Preserve this focused-template context flag for applications
                 # that still render their own bulk partial. Pack templates use
                 # the policy-owned BoundField above instead.
@@ -207,6 +219,19 @@ class MetadataMixin:
 
         return field_info
 
+    def _get_bulk_remote_options_url(
+        self, *, field_name: str, field: models.Field
+    ) -> str | None:
+        """Return the options endpoint URL when a bulk FK select loads remotely."""
+        uses_remote = getattr(self, "uses_remote_relation_options", None)
+        if not callable(uses_remote) or not uses_remote(field_name):
+            return None
+        if field.get_internal_type() not in {"ForeignKey", "OneToOneField"}:
+            return None
+        if not self._is_bulk_searchable_select(field_name=field_name, field=field):
+            return None
+        return self.get_relation_options_url(field_name, "bulk")
+
     def _is_bulk_searchable_select(
         self, *, field_name: str, field: models.Field
     ) -> bool:
@@ -1,9 +1,15 @@
 from typing import Any, Callable, Dict, List, Optional
 
 from django.db import models, transaction
-from django.core.exceptions import ValidationError, ObjectDoesNotExist
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ObjectDoesNotExist,
+    ValidationError,
+)
 
+from powercrud.apps import handle_queryset_update, has_foreign_save_receivers
 from powercrud.logging import get_logger
+from powercrud.search import get_registered_search_backends
 from powercrud.bulk_persistence import (
     BulkUpdateExecutionContext,
     resolve_bulk_update_persistence_backend,
@@ -78,8 +84,24 @@ class OperationMixin:
             user_id=user_id,
             task_name=task_name,
             manager_class_path=manager_class_path,
+            bulk_full_clean=bool(getattr(self, "bulk_full_clean", True)),
+            bulk_update_strategy=getattr(self, "bulk_update_strategy", "auto"),
+            bulk_chunk_size=getattr(self, "bulk_chunk_size", None),
+            view_class_path=self.get_bulk_update_view_class_path(),
         )
 
+    def get_bulk_update_view_class_path(self) -> str | None:
+        """Return the import path of this view class, if it can be imported.
+
+        Bulk update persistence backends use it to rebuild the view, so its
+        overrides apply outside the request. Classes defined inside functions
+        or other classes have no import path and return None.
+        """
+        view_class = type(self)
+        if "." in view_class.__qualname__:
+            return None
+        return f"{view_class.__module__}.{view_class.__qualname__}"
+
     def persist_bulk_update(
         self,
         *,
@@ -290,22 +312,134 @@ class OperationMixin:
             )
         )
 
+    def get_bulk_chunk_size(self) -> Optional[int]:
+        """Return the rows committed per transaction, or None for one transaction."""
+        chunk_size = getattr(self, "bulk_chunk_size", None)
+        return int(chunk_size) if chunk_size else None
+
+    def _perform_chunked_bulk_operation(
+        self,
+        queryset: models.QuerySet,
+        operation: Callable[..., Dict[str, Any]],
+        chunk_size: int,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        resume_after: Any = None,
+        checkpoint_callback: Optional[Callable[[Any], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run a bulk operation over ``queryset`` in primary-key ordered chunks.
+
+        Each chunk runs ``operation(chunk_queryset, progress_callback)`` in its
+        own transaction, so a failing chunk rolls back only its own rows and
+        later chunks still run. After each successful chunk,
+        ``checkpoint_callback`` gets the chunk's last primary key. Passing it
+        back as ``resume_after`` skips every row up to and including that key,
+        so the checkpoint stops advancing at the first failed chunk.
+
+        Args:
+            queryset: QuerySet of selected objects.
+            operation: Single-transaction operation to run per chunk.
+            chunk_size: Maximum number of rows per chunk.
+            progress_callback: Optional callable for progress updates.
+            resume_after: Optional primary key of the last committed row.
+            checkpoint_callback: Optional callable receiving each chunk's last
+                primary key while every chunk so far has committed.
+
+        Returns:
+            Dict with the standard result keys plus ``chunks``: one entry per
+            chunk with ``first_pk``, ``last_pk``, ``success``,
+            ``success_records``, and ``errors``; and ``failed_ranges``: the
+            ``(first_pk, last_pk)`` of each chunk that was rolled back.
+        """
+        pending = queryset.order_by("pk")
+        if resume_after is not None:
+            pending = pending.filter(pk__gt=resume_after)
+        total = pending.count()
+        done = 0
+        last_pk = resume_after
+        chunks = []
+        all_committed = True
+
+        while True:
+            remaining = pending if last_pk is None else pending.filter(pk__gt=last_pk)
+            pks = list(remaining.values_list("pk", flat=True)[:chunk_size])
+            if not pks:
+                break
+
+            def chunk_progress(current, chunk_total, offset=done):
+                if progress_callback:
+                    progress_callback(offset + current, total)
+
+            result = operation(queryset.filter(pk__in=pks), chunk_progress)
+            done += len(pks)
+            last_pk = pks[-1]
+            chunks.append(
+                {
+                    "first_pk": pks[0],
+                    "last_pk": last_pk,
+                    "success": bool(result.get("success")),
+                    "success_records": result.get("success_records", 0),
+                    "errors": result.get("errors", []),
+                }
+            )
+            all_committed = all_committed and chunks[-1]["success"]
+            if checkpoint_callback and all_committed:
+                checkpoint_callback(last_pk)
+
+        return {
+            "success": all(chunk["success"] for chunk in chunks),
+            "success_records": sum(chunk["success_records"] for chunk in chunks),
+            "errors": [error for chunk in chunks for error in chunk["errors"]],
+            "chunks": chunks,
+            "failed_ranges": [
+                (chunk["first_pk"], chunk["last_pk"])
+                for chunk in chunks
+                if not chunk["success"]
+            ],
+        }
+
     def _perform_bulk_delete(
         self,
         queryset: models.QuerySet,
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        resume_after: Any = None,
+        checkpoint_callback: Optional[Callable[[Any], None]] = None,
     ) -> Dict[str, Any]:
         """
         Perform bulk delete with graceful handling of missing records.
 
+        With ``bulk_chunk_size`` set, rows are deleted and committed in chunks;
+        see ``_perform_chunked_bulk_operation()``.
+
         Args:
             queryset: QuerySet of objects to delete.
             progress_callback: Optional callable for progress updates,
                                called as progress_callback(current, total).
+            resume_after: Optional last committed primary key to resume after.
+            checkpoint_callback: Optional callable receiving each committed
+                chunk's last primary key.
 
         Returns:
             Dict with success status, deleted count, and errors.
         """
+        chunk_size = self.get_bulk_chunk_size()
+        if chunk_size:
+            return self._perform_chunked_bulk_operation(
+                queryset,
+                self._perform_atomic_bulk_delete,
+                chunk_size,
+                progress_callback=progress_callback,
+                resume_after=resume_after,
+                checkpoint_callback=checkpoint_callback,
+            )
+        return self._perform_atomic_bulk_delete(queryset, progress_callback)
+
+    def _perform_atomic_bulk_delete(
+        self,
+        queryset: models.QuerySet,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """Delete every object in ``queryset`` inside one transaction."""
         total = queryset.count()
         current = 0
         deleted_count = 0
@@ -342,6 +476,184 @@ class OperationMixin:
             "errors": errors,
         }
 
+    def get_bulk_update_strategy(
+        self, queryset: models.QuerySet, field_data: List[Dict[str, Any]]
+    ) -> str:
+        """
+        Return how ``_perform_bulk_update()`` should write the selected rows.
+
+        ``"update"`` applies the values with one ``queryset.update()``;
+        ``"save"`` loads, validates, and saves each object. With
+        ``bulk_update_strategy = "auto"``, ``"update"`` is used only when
+        ``bulk_full_clean`` is off. ``"update"`` always falls back to
+        ``"save"`` when per-object code could run; see
+        ``_supports_set_based_bulk_update()``.
+
+        Args:
+            queryset: QuerySet of objects to update.
+            field_data: Normalized bulk field payload built from the request.
+
+        Returns:
+            str: ``"update"`` or ``"save"``.
+        """
+        strategy = getattr(self, "bulk_update_strategy", "auto") or "auto"
+        if strategy == "save":
+            return "save"
+        if not self._supports_set_based_bulk_update(queryset, field_data):
+            return "save"
+        if strategy == "update":
+            return "update"
+        return "save" if getattr(self, "bulk_full_clean", True) else "update"
+
+    def _supports_set_based_bulk_update(
+        self, queryset: models.QuerySet, field_data: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Return whether one ``UPDATE`` statement matches saving each object.
+
+        That needs a real queryset, scalar or foreign-key fields only, and a
+        model without a custom ``save()`` or ``pre_save``/``post_save``
+        receivers, since ``queryset.update()`` skips both. PowerCRUD's own
+        receivers do not count: ``_perform_set_based_bulk_update()`` runs
+        their work itself.
+        """
+        model = getattr(queryset, "model", None)
+        if not callable(getattr(queryset, "update", None)) or model is None:
+            return False
+        if model.save is not models.Model.save:
+            return False
+        if has_foreign_save_receivers(model):
+            return False
+        for field_dict in field_data:
+            if field_dict["info"].get("is_m2m"):
+                return False
+            try:
+                field = model._meta.get_field(field_dict["field"])
+            except FieldDoesNotExist:
+                return False
+            if not getattr(field, "concrete", False) or field.many_to_many:
+                return False
+        return True
+
+    def _coerce_bulk_update_value(self, value: Any, info: Dict[str, Any]) -> Any:
+        """Convert a submitted bulk-edit value to the value written to the field."""
+        if info.get("type") == "BooleanField":
+            if value == "true":
+                value = True
+            elif value == "false":
+                value = False
+            elif value in (None, "", "null"):
+                value = None
+        elif value == "null" and info.get("choices") and not info.get("is_relation"):
+            if info.get("null"):
+                value = None
+            elif info.get("blank"):
+                value = ""
+        return value
+
+    def _resolve_bulk_related_value(self, value: Any, info: Dict[str, Any]) -> Any:
+        """
+        Return the related instance for a submitted foreign-key value.
+
+        Raises:
+            ValidationError: If the related object cannot be loaded.
+        """
+        if value == "null" or value == "" or value is None:
+            return None
+        try:
+            return info["field"].related_model.objects.get(pk=int(value))
+        except Exception as e:
+            raise ValidationError(
+                f"Invalid value for {info['verbose_name']}: {str(e)}"
+            )
+
+    def _get_bulk_update_errors(self, error: Exception) -> List[Any]:
+        """Convert an exception from a bulk update into result-contract errors."""
+        if not isinstance(error, ValidationError):
+            return [("general", [str(error)])]
+        if hasattr(error, "message_dict"):
+            # This is a dictionary of field names to error messages
+            return list(error.message_dict.items())
+        if hasattr(error, "messages"):
+            return [("general", error.messages)]
+        return [("general", [str(error)])]
+
+    def _perform_set_based_bulk_update(
+        self,
+        queryset: models.QuerySet,
+        field_data: List[Dict[str, Any]],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Apply a bulk update with a single ``queryset.update()``.
+
+        Every selected row gets the same values, so they are converted, and
+        related instances loaded, once. With ``bulk_full_clean`` on, each value
+        runs its field's ``clean()`` once in place of per-object
+        ``full_clean()``. ``auto_now`` fields are set as ``save()`` would, and
+        ``handle_queryset_update()`` then drops cached option indexes and list
+        snapshots and re-syncs the search index for the updated rows.
+
+        Args:
+            queryset: QuerySet of objects to update.
+            field_data: Normalized bulk field payload built from the request.
+            progress_callback: Optional callable for progress updates.
+
+        Returns:
+            Dict with success status, updated count, and errors.
+        """
+        model = queryset.model
+        try:
+            values = {}
+            for field_dict in field_data:
+                info = field_dict["info"]
+                field = model._meta.get_field(field_dict["field"])
+                value = self._coerce_bulk_update_value(field_dict["value"], info)
+                if info.get("is_relation"):
+                    value = self._resolve_bulk_related_value(value, info)
+                elif getattr(self, "bulk_full_clean", True):
+                    try:
+                        value = field.clean(value, None)
+                    except ValidationError as e:
+                        raise ValidationError({field.name: e.messages})
+                values[field.name] = value
+
+            auto_now_fields = [
+                field
+                for field in model._meta.concrete_fields
+                if getattr(field, "auto_now", False) and field.name not in values
+            ]
+            if auto_now_fields:
+                instance = model()
+                for field in auto_now_fields:
+                    values[field.name] = field.pre_save(instance, add=False)
+
+            using = queryset.db
+            with transaction.atomic(using=using):
+                pks = ()
+                if get_registered_search_backends(model):
+                    # Capture the rows first: the update may change the
+                    # fields that selected them.
+                    pks = list(queryset.values_list("pk", flat=True))
+                    queryset = model._base_manager.using(using).filter(pk__in=pks)
+                updated_count = queryset.update(**values)
+                handle_queryset_update(model, pks, using)
+        except Exception as e:
+            log.error(f"Error during set-based bulk update: {e}")
+            return {
+                "success": False,
+                "success_records": 0,
+                "errors": self._get_bulk_update_errors(e),
+            }
+
+        if progress_callback:
+            progress_callback(updated_count, updated_count)
+        return {
+            "success": True,
+            "success_records": updated_count,
+            "errors": [],
+        }
+
     def _perform_bulk_update(
         self,
         queryset: models.QuerySet,
@@ -349,25 +661,30 @@ class OperationMixin:
         fields_to_update: List[str],
         field_data: List[Dict[str, Any]],
         progress_callback: Optional[Callable[[int, int], None]] = None,
+        resume_after: Any = None,
+        checkpoint_callback: Optional[Callable[[Any], None]] = None,
     ) -> Dict[str, Any]:
         """
         Perform bulk update with progress reporting and atomic transactions.
 
+        Delegates to ``_perform_set_based_bulk_update()`` when
+        ``get_bulk_update_strategy()`` returns ``"update"``. With
+        ``bulk_chunk_size`` set, rows are updated and committed in chunks; see
+        ``_perform_chunked_bulk_operation()``.
+
         Args:
             queryset: QuerySet of objects to update.
             bulk_fields: List of fields allowed for bulk update.
             fields_to_update: List of fields actually being updated.
             field_data: List of dicts containing field data and metadata.
             progress_callback: Optional callable for progress updates.
+            resume_after: Optional last committed primary key to resume after.
+            checkpoint_callback: Optional callable receiving each committed
+                chunk's last primary key.
 
         Returns:
             Dict with success status, updated count, and errors.
         """
-        total = queryset.count()
-        current = 0
-        errors = []
-        updated_count = 0
-
         try:
             self._validate_bulk_update_fields(
                 bulk_fields=bulk_fields,
@@ -380,6 +697,35 @@ class OperationMixin:
                 "errors": [("general", list(getattr(e, "messages", [str(e)])))],
             }
 
+        if self.get_bulk_update_strategy(queryset, field_data) == "update":
+            operation = self._perform_set_based_bulk_update
+        else:
+            operation = self._perform_saved_bulk_update
+
+        chunk_size = self.get_bulk_chunk_size()
+        if chunk_size:
+            return self._perform_chunked_bulk_operation(
+                queryset,
+                lambda chunk, callback: operation(chunk, field_data, callback),
+                chunk_size,
+                progress_callback=progress_callback,
+                resume_after=resume_after,
+                checkpoint_callback=checkpoint_callback,
+            )
+        return operation(queryset, field_data, progress_callback)
+
+    def _perform_saved_bulk_update(
+        self,
+        queryset: models.QuerySet,
+        field_data: List[Dict[str, Any]],
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """Update, validate, and save each object inside one transaction."""
+        total = queryset.count()
+        current = 0
+        errors = []
+        updated_count = 0
+
         # Bulk update - collect all changes first, then apply in transaction
         updates_to_apply = []
 
@@ -396,22 +742,7 @@ class OperationMixin:
                 m2m_values = field_dict.get("m2m_values", [])
 
                 # Process value based on field type
-                if info.get("type") == "BooleanField":
-                    if value == "true":
-                        value = True
-                    elif value == "false":
-                        value = False
-                    elif value in (None, "", "null"):
-                        value = None
-                elif (
-                    value == "null"
-                    and info.get("choices")
-                    and not info.get("is_relation")
-                ):
-                    if info.get("null"):
-                        value = None
-                    elif info.get("blank"):
-                        value = ""
+                value = self._coerce_bulk_update_value(value, info)
 
                 # Store the change to apply later
                 obj_changes["changes"][field] = {
@@ -427,6 +758,9 @@ class OperationMixin:
         error_occurred = False
         error_message = None
 
+        # Related instances are the same for every object; load each once.
+        related_values = {}
+
         try:
             with transaction.atomic():
                 for update in updates_to_apply:
@@ -454,22 +788,11 @@ class OperationMixin:
                                 m2m_manager.set(m2m_values)
                         elif info.get("is_relation"):
                             # Handle relation fields
-                            if value == "null" or value == "" or value is None:
-                                setattr(obj, field, None)
-                            else:
-                                try:
-                                    # Get the related model
-                                    related_model = info["field"].related_model
-
-                                    # Fetch the actual instance
-                                    instance = related_model.objects.get(pk=int(value))
-
-                                    # Set the field to the instance
-                                    setattr(obj, field, instance)
-                                except Exception as e:
-                                    raise ValidationError(
-                                        f"Invalid value for {info['verbose_name']}: {str(e)}"
-                                    )
+                            if field not in related_values:
+                                related_values[field] = (
+                                    self._resolve_bulk_related_value(value, info)
+                                )
+                            setattr(obj, field, related_values[field])
                         else:
                             # Handle regular fields
                             setattr(obj, field, value)
@@ -494,21 +817,7 @@ class OperationMixin:
             )
 
             # Directly add the error to our list
-            if isinstance(e, ValidationError):
-                # Handle different ValidationError formats
-                if hasattr(e, "message_dict"):
-                    # This is a dictionary of field names to error messages
-                    for field, messages in e.message_dict.items():
-                        errors.append((field, messages))
-                elif hasattr(e, "messages"):
-                    # This is a list of error messages
-                    errors.append(("general", e.messages))
-                else:
-                    # Fallback
-                    errors.append(("general", [str(e)]))
-            else:
-                # For other exceptions, just add the error message
-                errors.append(("general", [str(e)]))
+            errors.extend(self._get_bulk_update_errors(e))
 
         # Force an error if we caught an exception but didn't add any specific errors
         if error_occurred and not errors:
@@ -73,6 +73,7 @@ class BulkActions(enum.Enum):
     CLEAR_SELECTION = "clear-selection"
     TOGGLE_ALL_SELECTION = "toggle-all-selection"
     SELECT_ALL_MATCHING = "select-all-matching"
+    APPLY_SELECTION = "apply-selection"
 
     def handlers(self) -> Dict[str, str]:
         """
@@ -90,6 +91,8 @@ class BulkActions(enum.Enum):
                 return {"post": "toggle_all_selection_view"}
             case BulkActions.SELECT_ALL_MATCHING:
                 return {"post": "select_all_matching_view"}
+            case BulkActions.APPLY_SELECTION:
+                return {"post": "apply_selection_view"}
 
     def extra_initkwargs(self) -> Dict[str, str]:
         """
@@ -107,6 +110,8 @@ class BulkActions(enum.Enum):
                 return {"template_name_suffix": "_toggle_all_selection"}
             case BulkActions.SELECT_ALL_MATCHING:
                 return {"template_name_suffix": "_select_all_matching"}
+            case BulkActions.APPLY_SELECTION:
+                return {"template_name_suffix": "_apply_selection"}
 
     @property
     def url_name_component(self) -> str:
@@ -138,6 +143,8 @@ class BulkActions(enum.Enum):
                 return f"{view_cls.url_base}/toggle-all-selection/"
             case BulkActions.SELECT_ALL_MATCHING:
                 return f"{view_cls.url_base}/select-all-matching/"
+            case BulkActions.APPLY_SELECTION:
+                return f"{view_cls.url_base}/apply-selection/"
 
     def get_url(self, view_cls: type[View]):
         """
@@ -1,18 +1,29 @@
+import copy
 import json
-from typing import List, Any
+from typing import Any, Iterable, List
 
-from django.http import HttpRequest, HttpResponse, HttpResponseBadRequest
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.db.models import Max, Q
+from django.http import HttpRequest, HttpResponse, HttpResponseBadRequest, QueryDict
 from django.shortcuts import render
 
 from powercrud.conf import get_powercrud_setting
 from powercrud.logging import get_logger
+from powercrud.selection_store import (
+    SelectionPredicate,
+    SelectionStore,
+    encode_selection,
+    get_selection_store_class,
+    selection_sort_key,
+)
 from ..config_mixin import get_template_name, resolve_config
 
 log = get_logger(__name__)
 
 
 class SelectionMixin:
-    """Mixin for managing bulk selection state, providing session-based persistence and HTMX handlers."""
+    """Mixin for managing bulk selection state, providing pluggable persistence and HTMX handlers."""
 
     def get_bulk_max_selected_records(self) -> int:
         """
@@ -29,7 +40,7 @@ class SelectionMixin:
         Return the storage key for the bulk selection.
 
         Returns:
-            str: The unique key used to store selection data in the session.
+            str: The unique key used to store selection data in the selection store.
         """
         return f"powercrud_bulk_{self.model.__name__.lower()}_{self.get_bulk_selection_key_suffix()}"
 
@@ -44,9 +55,39 @@ class SelectionMixin:
         """
         return ""
 
+    def get_selection_store_class(self) -> type[SelectionStore]:
+        """
+        Return the store class that persists bulk selections.
+
+        Defaults to ``POWERCRUD_SETTINGS["BULK_SELECTION_STORE"]``: ``"session"``,
+        ``"cache"``, ``"database"``, or a dotted path to a ``SelectionStore``.
+        """
+        return get_selection_store_class()
+
+    def get_selection_store(self, request: HttpRequest) -> SelectionStore:
+        """
+        Return the selection store for the current model and request.
+
+        The store is kept on the request, so the selection is decoded once no
+        matter how many templates and mixins read it.
+        """
+        storage_key = self.get_storage_key()
+        stores = getattr(request, "_powercrud_selection_stores", None)
+        if stores is None:
+            stores = {}
+            request._powercrud_selection_stores = stores
+        store = stores.get(storage_key)
+        if store is None:
+            store = self.get_selection_store_class()(request, storage_key)
+            stores[storage_key] = store
+        return store
+
     def get_selected_ids_from_session(self, request: HttpRequest) -> List[str]:
         """
-        Get selected IDs for the current model from the Django session.
+        Get selected IDs for the current model from the selection store.
+
+        Predicate selections are resolved with one ``values_list`` query per
+        request.
 
         Args:
             request: The HTTP request object.
@@ -54,34 +95,225 @@ class SelectionMixin:
         Returns:
             List[str]: A list of selected object IDs.
         """
-        session_key = self.get_storage_key()
-        selected_ids = request.session.get("powercrud_selections", {}).get(
-            session_key, []
+        store = self.get_selection_store(request)
+        if not store.predicates:
+            return store.get_ids()
+        return sorted(self._get_resolved_selection(store), key=selection_sort_key)
+
+    def get_bulk_select_all_predicate_enabled(self) -> bool:
+        """Return whether "select all matching" stores a filter predicate."""
+        return bool(resolve_config(self).bulk_select_all_predicate)
+
+    def selection_has_predicates(self, request: HttpRequest) -> bool:
+        """Return whether the current selection includes a filter predicate."""
+        return bool(self.get_selection_store(request).predicates)
+
+    def get_selection_filter_params(self, request: HttpRequest) -> dict[str, list[str]]:
+        """
+        Return the non-empty filter parameters of ``request``.
+
+        Only fields of the view's filterset count, so paging, sorting, and
+        other list state never change a predicate.
+        """
+        get_filterset = getattr(self, "get_filterset", None)
+        filterset = get_filterset(self.get_queryset()) if callable(get_filterset) else None
+        if filterset is None:
+            return {}
+        params = {}
+        for name in filterset.form.fields:
+            values = [value for value in request.GET.getlist(name) if value.strip()]
+            if values:
+                params[name] = values
+        return params
+
+    def build_selection_predicate(
+        self, request: HttpRequest, queryset: models.QuerySet
+    ) -> SelectionPredicate:
+        """
+        Return the predicate for selecting every record in ``queryset``.
+
+        Integer primary keys are capped at the current maximum so records
+        created later do not join the selection.
+        """
+        max_pk = None
+        if isinstance(self.model._meta.pk, models.IntegerField):
+            max_pk = queryset.order_by().aggregate(max_pk=Max("pk"))["max_pk"]
+        return SelectionPredicate.from_params(
+            self.get_selection_filter_params(request), max_pk=max_pk
+        )
+
+    def get_predicate_queryset(self, predicate: SelectionPredicate) -> models.QuerySet:
+        """Return the records ``predicate`` matches, before any exclusions."""
+        request = copy.copy(self.request)
+        query = QueryDict(mutable=True)
+        for name, values in predicate.filters:
+            query.setlist(name, list(values))
+        request.GET = query
+        original_request = self.request
+        self.request = request
+        try:
+            queryset = self.get_filtered_selection_queryset()
+        finally:
+            self.request = original_request
+        if predicate.max_pk is not None:
+            queryset = queryset.filter(pk__lte=predicate.max_pk)
+        return queryset.order_by()
+
+    def build_selection_queryset(
+        self,
+        ids: Iterable[Any],
+        predicates: Iterable[SelectionPredicate],
+        excluded: Iterable[Any] = (),
+    ) -> models.QuerySet:
+        """
+        Return the selected records as one queryset.
+
+        Explicit ids join each predicate's queryset as subqueries, so large
+        predicate selections never become ``pk IN (...)`` lists.
+        """
+        condition = Q(pk__in=list(ids))
+        for predicate in predicates:
+            condition |= Q(pk__in=self.get_predicate_queryset(predicate).values("pk"))
+        queryset = self.model._default_manager.filter(condition)
+        excluded = list(excluded)
+        if excluded:
+            queryset = queryset.exclude(pk__in=excluded)
+        return queryset
+
+    def get_selected_queryset(self, request: HttpRequest) -> models.QuerySet:
+        """Return the current selection as a queryset."""
+        store = self.get_selection_store(request)
+        return self.build_selection_queryset(
+            store.ids, store.predicates, store.excluded
+        )
+
+    def get_selection_lookup(self, request: HttpRequest) -> Any:
+        """
+        Return a value for ``pk__in`` lookups against the current selection.
+
+        That is the id list for explicit selections and a ``pk`` subquery for
+        predicate selections.
+        """
+        if self.selection_has_predicates(request):
+            return self.get_selected_queryset(request).values("pk")
+        return self.get_selected_ids_from_session(request)
+
+    def get_selection_payload(self, request: HttpRequest) -> dict[str, Any]:
+        """
+        Return a compact description of the selection for async workers.
+
+        ``powercrud.selection_store.resolve_selection_queryset()`` turns it
+        back into a queryset.
+        """
+        store = self.get_selection_store(request)
+        view_class = type(self)
+        return {
+            "view": f"{view_class.__module__}.{view_class.__qualname__}",
+            "ids": encode_selection(store.ids),
+            "p": [predicate.to_payload() for predicate in store.predicates],
+            "x": encode_selection(store.excluded),
+        }
+
+    def _get_resolved_selection(self, store: SelectionStore) -> set[str]:
+        """Return every selected id, resolving predicates once per store."""
+        if store.resolved_ids is None:
+            queryset = self.build_selection_queryset(
+                store.ids, store.predicates, store.excluded
+            )
+            store.resolved_ids = {
+                str(pk) for pk in queryset.values_list("pk", flat=True)
+            }
+        return store.resolved_ids
+
+    def get_selected_count(self, request: HttpRequest) -> int:
+        """
+        Return how many records are selected.
+
+        Predicate selections are counted with one ``COUNT`` query per request
+        instead of reading every matching id.
+        """
+        store = self.get_selection_store(request)
+        if not store.predicates:
+            return store.count()
+        if store.resolved_ids is not None:
+            return len(store.resolved_ids)
+        if store.resolved_count is None:
+            store.resolved_count = self.get_selected_queryset(request).count()
+        return store.resolved_count
+
+    def get_selected_ids_among(
+        self, request: HttpRequest, object_ids: Iterable[Any]
+    ) -> set[str]:
+        """
+        Return which of ``object_ids`` are selected.
+
+        List pages and row toggles only need to know about the rows they show,
+        so predicate selections are checked for ``object_ids`` alone.
+        """
+        ids = {str(object_id) for object_id in object_ids}
+        store = self.get_selection_store(request)
+        if not store.predicates:
+            return ids & store.ids
+        if store.resolved_ids is not None:
+            return ids & store.resolved_ids
+        if not ids:
+            return set()
+        queryset = self.get_selected_queryset(request).filter(pk__in=list(ids))
+        return {str(pk) for pk in queryset.values_list("pk", flat=True)}
+
+    def _match_selection_predicates(
+        self, store: SelectionStore, object_ids: set[str]
+    ) -> set[str]:
+        """Return which of ``object_ids`` any stored predicate matches."""
+        if not store.predicates or not object_ids:
+            return set()
+        queryset = self.build_selection_queryset([], store.predicates).filter(
+            pk__in=list(object_ids)
         )
-        return selected_ids
+        return {str(pk) for pk in queryset.values_list("pk", flat=True)}
+
+    def set_selected(
+        self, request: HttpRequest, object_ids: Iterable[Any], selected: bool
+    ) -> None:
+        """
+        Select or deselect ``object_ids``.
+
+        Ids a predicate matches are deselected by excluding them; every other
+        id is added to or removed from the explicit ids.
+        """
+        store = self.get_selection_store(request)
+        ids = {str(object_id) for object_id in object_ids}
+        matched = self._match_selection_predicates(store, ids)
+        if selected:
+            store.unexclude(ids)
+            store.add(ids - matched)
+        else:
+            store.remove(ids)
+            store.exclude(matched)
 
     def save_selected_ids_to_session(
         self, request: HttpRequest, ids: List[Any]
     ) -> None:
         """
-        Save selected IDs for the current model to the Django session.
+        Replace the selected IDs for the current model in the selection store.
 
         Args:
             request: The HTTP request object.
             ids: A list of object IDs to save.
         """
-        session_key = self.get_storage_key()
-        if "powercrud_selections" not in request.session:
-            request.session["powercrud_selections"] = {}
-        request.session["powercrud_selections"][session_key] = list(map(str, ids))
-        request.session.modified = True
+        self.get_selection_store(request).replace(ids)
 
     def get_selection_status_context(
         self,
         request: HttpRequest,
-        selected_ids: List[Any],
+        selected_ids: List[Any] | None = None,
     ) -> dict[str, Any]:
-        """Return context for the selection status toolbar partial."""
+        """
+        Return context for the selection status toolbar partial.
+
+        Without ``selected_ids`` the toolbar only counts the selection, so
+        predicate selections are never read id by id.
+        """
         enable_bulk_edit_getter = getattr(self, "get_bulk_edit_enabled", None)
         enable_bulk_edit = (
             enable_bulk_edit_getter() if callable(enable_bulk_edit_getter) else False
@@ -99,9 +331,18 @@ class SelectionMixin:
         if callable(safe_reverse) and callable(get_prefix):
             list_view_url = safe_reverse(f"{get_prefix()}-list") or ""
 
+        if selected_ids is None:
+            selected_count = self.get_selected_count(request)
+            selected_ids = (
+                []
+                if self.selection_has_predicates(request)
+                else self.get_selected_ids_from_session(request)
+            )
+        else:
+            selected_count = len(selected_ids)
         context = {
             "selected_ids": selected_ids,
-            "selected_count": len(selected_ids),
+            "selected_count": selected_count,
             "enable_bulk_edit": enable_bulk_edit,
             "enable_selection_controls": enable_selection_controls,
             "list_view_url": list_view_url,
@@ -123,7 +364,7 @@ class SelectionMixin:
         self, request: HttpRequest, obj_id: Any
     ) -> List[str]:
         """
-        Toggle an individual object's selection state in the Django session.
+        Toggle an individual object's selection state in the selection store.
 
         Args:
             request: The HTTP request object.
@@ -132,14 +373,17 @@ class SelectionMixin:
         Returns:
             List[str]: The updated list of selected object IDs.
         """
-        selected_ids = self.get_selected_ids_from_session(request)
-        obj_id_str = str(obj_id)
-        if obj_id_str in selected_ids:
-            selected_ids.remove(obj_id_str)
-        else:
-            selected_ids.append(obj_id_str)
-        self.save_selected_ids_to_session(request, selected_ids)
-        return selected_ids
+        self._toggle_selection(request, obj_id)
+        return self.get_selected_ids_from_session(request)
+
+    def _toggle_selection(self, request: HttpRequest, obj_id: Any) -> None:
+        """Toggle ``obj_id`` without reading the rest of the selection."""
+        store = self.get_selection_store(request)
+        if not store.predicates:
+            store.toggle(obj_id)
+            return
+        is_selected = bool(self.get_selected_ids_among(request, [obj_id]))
+        self.set_selected(request, [obj_id], not is_selected)
 
     def toggle_selection_view(
         self, request: HttpRequest, *args: Any, **kwargs: Any
@@ -164,8 +408,8 @@ class SelectionMixin:
         if not object_id:
             return HttpResponseBadRequest("Object ID not provided.")
 
-        selected_ids = self.toggle_selection_in_session(request, object_id)
-        context = self.get_selection_status_context(request, selected_ids)
+        self._toggle_selection(request, object_id)
+        context = self.get_selection_status_context(request)
         response = render(
             request,
             get_template_name(
@@ -178,16 +422,12 @@ class SelectionMixin:
 
     def clear_selection_from_session(self, request: HttpRequest) -> None:
         """
-        Clear all selections for the current model from the Django session.
+        Clear all selections for the current model from the selection store.
 
         Args:
             request: The HTTP request object.
         """
-        session_key = self.get_storage_key()
-        if "powercrud_selections" in request.session:
-            if session_key in request.session["powercrud_selections"]:
-                del request.session["powercrud_selections"][session_key]
-                request.session.modified = True
+        self.get_selection_store(request).clear()
 
     def clear_selection_view(
         self, request: HttpRequest, *args: Any, **kwargs: Any
@@ -229,7 +469,7 @@ class SelectionMixin:
         action: str | None = None,
     ) -> List[str]:
         """
-        Update the selection state of all provided object IDs in the Django session.
+        Update the selection state of all provided object IDs in the selection store.
 
         If an explicit action is supplied, add or remove the provided IDs.
         Otherwise, preserve the legacy toggle-all behaviour used by the page-level
@@ -243,26 +483,26 @@ class SelectionMixin:
         Returns:
             List[str]: The updated list of selected object IDs.
         """
-        current_selected_ids = set(self.get_selected_ids_from_session(request))
-        object_ids_set = set(map(str, object_ids))
+        self._toggle_all_selection(request, object_ids, action)
+        return self.get_selected_ids_from_session(request)
 
-        if action == "add":
-            new_selected_ids = current_selected_ids.union(object_ids_set)
-        elif action == "remove":
-            new_selected_ids = current_selected_ids - object_ids_set
-        else:
-            # Check if all current page objects are already selected
-            all_on_page_selected = object_ids_set.issubset(current_selected_ids)
+    def _toggle_all_selection(
+        self,
+        request: HttpRequest,
+        object_ids: List[Any],
+        action: str | None = None,
+    ) -> None:
+        """Apply a page-level toggle without reading the rest of the selection."""
+        object_ids_set = set(map(str, object_ids))
 
-            if all_on_page_selected:
-                # Deselect all objects on the current page
-                new_selected_ids = current_selected_ids - object_ids_set
-            else:
-                # Select all objects on the current page
-                new_selected_ids = current_selected_ids.union(object_ids_set)
+        if action is None:
+            # Deselect the page when every object on it is already selected,
+            # otherwise select the whole page.
+            selected = self.get_selected_ids_among(request, object_ids_set)
+            action = "remove" if object_ids_set <= selected else "add"
 
-        self.save_selected_ids_to_session(request, list(new_selected_ids))
-        return list(new_selected_ids)
+        if action in ("add", "remove"):
+            self.set_selected(request, object_ids_set, action == "add")
 
     def toggle_all_selection_view(
         self, request: HttpRequest, *args: Any, **kwargs: Any
@@ -283,21 +523,121 @@ class SelectionMixin:
                 "Only HTMX requests are supported for this operation."
             )
 
-        # Get object_ids from the request body (sent by HTMX). Prefer repeated
-        # values, but also accept a CSV fallback for JS-triggered batch requests.
-        object_ids = request.POST.getlist("object_ids")
+        try:
+            object_ids = self._get_posted_pks(request, "object_ids")
+        except ValidationError:
+            return HttpResponseBadRequest("Invalid object ID.")
+        action = request.POST.get("action") or None
+        self._toggle_all_selection(request, object_ids, action=action)
+        context = self.get_selection_status_context(request)
+
+        response = render(
+            request,
+            get_template_name(
+                resolve_config(self), "object_list.html#bulk_selection_status"
+            ),
+            context,
+        )
+        response["HX-Trigger"] = json.dumps({"refreshTable": True})
+        return response
+
+    def _get_posted_ids(self, request: HttpRequest, name: str) -> List[str]:
+        """
+        Return the ids posted as ``name``.
+
+        Repeated values win, with a ``<name>_csv`` fallback for batch requests
+        sent from the runtime JS.
+        """
+        object_ids = request.POST.getlist(name)
         if not object_ids:
-            csv_ids = request.POST.get("object_ids_csv", "")
+            csv_ids = request.POST.get(f"{name}_csv", "")
             object_ids = [obj_id for obj_id in csv_ids.split(",") if obj_id]
+        return object_ids
 
-        # Ensure IDs are integers
-        object_ids = [int(obj_id) for obj_id in object_ids]
-        action = request.POST.get("action") or None
-        selected_ids = self.toggle_all_selection_in_session(
-            request, object_ids, action=action
-        )
-        context = self.get_selection_status_context(request, selected_ids)
+    def _get_posted_pks(self, request: HttpRequest, name: str) -> List[str]:
+        """
+        Return the ids posted as ``name``, checked against the model's pk field.
+
+        Ids stay strings, normalized through the pk field's ``to_python()``, so
+        integer, UUID, and string primary keys are all accepted.
+
+        Raises:
+            ValidationError: If an id is not a valid primary key value.
+        """
+        pk_field = self.model._meta.pk
+        return [
+            str(pk_field.to_python(obj_id))
+            for obj_id in self._get_posted_ids(request, name)
+        ]
+
+    def apply_selection_changes(
+        self,
+        request: HttpRequest,
+        added: Iterable[Any],
+        removed: Iterable[Any],
+    ) -> List[str]:
+        """
+        Select ``added`` and deselect ``removed`` in one store update.
+
+        Args:
+            request: The HTTP request object.
+            added: Object IDs to select.
+            removed: Object IDs to deselect.
+
+        Returns:
+            List[str]: The updated list of selected object IDs.
+        """
+        self._apply_selection_changes(request, added, removed)
+        return self.get_selected_ids_from_session(request)
+
+    def _apply_selection_changes(
+        self,
+        request: HttpRequest,
+        added: Iterable[Any],
+        removed: Iterable[Any],
+    ) -> None:
+        """Apply queued selection changes without reading the selection back."""
+        store = self.get_selection_store(request)
+        if store.predicates:
+            self.set_selected(request, added, True)
+            self.set_selected(request, removed, False)
+        else:
+            store.apply(added, removed)
 
+    def apply_selection_view(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponse:
+        """
+        Apply a batch of queued row-selection changes via an HTMX request.
+
+        The runtime JS collects checkbox clicks and posts them together as
+        ``add`` and ``remove`` ids, so a burst of clicks costs one request.
+
+        Args:
+            request: The HTTP request object.
+            *args: Variable positional arguments.
+            **kwargs: Variable keyword arguments.
+
+        Returns:
+            HttpResponse: Renders the bulk selection status partial.
+        """
+        if not (hasattr(request, "htmx") and request.htmx):
+            return HttpResponseBadRequest(
+                "Only HTMX requests are supported for this operation."
+            )
+
+        try:
+            added = set(self._get_posted_pks(request, "add"))
+            removed = set(self._get_posted_pks(request, "remove"))
+        except ValidationError:
+            return HttpResponseBadRequest("Invalid object ID.")
+        if added & removed:
+            return HttpResponseBadRequest(
+                "An object cannot be both added to and removed from the selection."
+            )
+
+        self._apply_selection_changes(request, added, removed)
+        context = self.get_selection_status_context(request)
         response = render(
             request,
             get_template_name(
@@ -324,18 +664,8 @@ class SelectionMixin:
         """
         Add all provided matching IDs to the persisted selection, preserving any prior selection.
         """
-        selected_ids = self.get_selected_ids_from_session(request)
-        selected_id_set = set(selected_ids)
-
-        for object_id in matching_ids:
-            object_id_str = str(object_id)
-            if object_id_str in selected_id_set:
-                continue
-            selected_ids.append(object_id_str)
-            selected_id_set.add(object_id_str)
-
-        self.save_selected_ids_to_session(request, selected_ids)
-        return selected_ids
+        self.set_selected(request, matching_ids, True)
+        return self.get_selected_ids_from_session(request)
 
     def get_selectable_matching_ids(
         self, request: HttpRequest, queryset: Any
@@ -343,23 +673,50 @@ class SelectionMixin:
         """
         Return the next matching queryset IDs that can fit within the configured selection cap.
         """
-        current_selected_ids = self.get_selected_ids_from_session(request)
-        current_selected_id_set = set(current_selected_ids)
+        store = self.get_selection_store(request)
+        selected = (
+            self._get_resolved_selection(store) if store.predicates else store.ids
+        )
         remaining_capacity = max(
-            0, self.get_bulk_max_selected_records() - len(current_selected_ids)
+            0, self.get_bulk_max_selected_records() - len(selected)
         )
         if remaining_capacity == 0:
             return []
 
         selectable_ids: List[Any] = []
         for object_id in queryset.values_list("pk", flat=True):
-            if str(object_id) in current_selected_id_set:
+            if str(object_id) in selected:
                 continue
             selectable_ids.append(object_id)
             if len(selectable_ids) >= remaining_capacity:
                 break
         return selectable_ids
 
+    def select_all_matching_predicate(
+        self, request: HttpRequest, queryset: models.QuerySet
+    ) -> List[str]:
+        """
+        Select every record in ``queryset`` by storing its filter predicate.
+
+        Records deselected earlier that the new predicate matches are selected
+        again. The selection cap does not apply to predicate selections.
+        """
+        self._select_all_matching_predicate(request, queryset)
+        return self.get_selected_ids_from_session(request)
+
+    def _select_all_matching_predicate(
+        self, request: HttpRequest, queryset: models.QuerySet
+    ) -> None:
+        """Store the predicate for ``queryset`` without reading the selection."""
+        store = self.get_selection_store(request)
+        store.add_predicate(self.build_selection_predicate(request, queryset))
+        if store.excluded:
+            store.unexclude(
+                queryset.filter(pk__in=list(store.excluded)).values_list(
+                    "pk", flat=True
+                )
+            )
+
     def select_all_matching_view(
         self, request: HttpRequest, *args: Any, **kwargs: Any
     ) -> HttpResponse:
@@ -372,11 +729,17 @@ class SelectionMixin:
             )
 
         queryset = self.get_filtered_selection_queryset()
-        selectable_ids = self.get_selectable_matching_ids(request, queryset)
-        if selectable_ids:
-            selected_ids = self.select_all_matching_in_session(request, selectable_ids)
+        if self.get_bulk_select_all_predicate_enabled():
+            self._select_all_matching_predicate(request, queryset)
+            selected_ids = None
         else:
-            selected_ids = self.get_selected_ids_from_session(request)
+            selectable_ids = self.get_selectable_matching_ids(request, queryset)
+            if selectable_ids:
+                selected_ids = self.select_all_matching_in_session(
+                    request, selectable_ids
+                )
+            else:
+                selected_ids = self.get_selected_ids_from_session(request)
 
         context = self.get_selection_status_context(request, selected_ids)
         response = render(
@@ -8,6 +8,7 @@ from django.db import models
 
 from powercrud.conf import get_powercrud_setting
 from powercrud.logging import get_logger
+from powercrud.selection_store import selection_sort_key
 from ..config_mixin import get_template_name, resolve_config
 
 log = get_logger(__name__)
@@ -44,32 +45,36 @@ class ViewMixin:
         """
         filtered_queryset = kwargs.pop("filtered_queryset", None)
         context = super().get_context_data(**kwargs)
-        selection_controls_getter = getattr(self, "get_selection_controls_enabled", None)
-        bulk_edit_getter = getattr(self, "get_bulk_edit_enabled", None)
-        enable_selection_controls = (
-            selection_controls_getter()
-            if callable(selection_controls_getter)
-            else bulk_edit_getter()
-            if callable(bulk_edit_getter)
-            else False
-        )
-        selected_ids = (
-            self.get_selected_ids_from_session(self.request)
-            if enable_selection_controls
-            else []
-        )
+        enable_selection_controls = self._get_enable_selection_controls()
+        if enable_selection_controls and self.selection_has_predicates(self.request):
+            # A predicate can match far more records than one page shows, so
+            # only this page's rows are resolved and the rest are counted.
+            selected_ids = sorted(
+                self.get_selected_ids_among(
+                    self.request,
+                    [obj.pk for obj in context.get("object_list") or ()],
+                ),
+                key=selection_sort_key,
+            )
+            selected_count = self.get_selected_count(self.request)
+        else:
+            selected_ids = (
+                self.get_selected_ids_from_session(self.request)
+                if enable_selection_controls
+                else []
+            )
+            selected_count = len(selected_ids)
         context["enable_selection_controls"] = enable_selection_controls
         context["enable_bulk_update"] = self.get_bulk_update_enabled()
         context["selected_ids"] = selected_ids
-        context["selected_count"] = len(selected_ids)
+        context["selected_count"] = selected_count
         # Determine if all items on the current page are selected
         # This requires object_list to be available in context
         if "object_list" in context:
             current_page_ids = set(str(obj.pk) for obj in context["object_list"])
-            all_selected_on_page = current_page_ids.issubset(set(selected_ids))
-            some_selected_on_page = bool(
-                current_page_ids.intersection(set(selected_ids))
-            )
+            selected_id_set = set(selected_ids)
+            all_selected_on_page = current_page_ids.issubset(selected_id_set)
+            some_selected_on_page = bool(current_page_ids & selected_id_set)
             context["all_selected"] = all_selected_on_page and len(current_page_ids) > 0
             context["some_selected"] = (
                 some_selected_on_page and not all_selected_on_page
@@ -97,19 +102,32 @@ class ViewMixin:
                 "BULK_MAX_SELECTED_RECORDS", 1000
             )
 
-        if filtered_queryset is not None and bulk_meta_enabled and selected_ids:
+        if filtered_queryset is not None and bulk_meta_enabled and selected_count:
             filtered_total = context.get("record_count_total")
-            if filtered_total is None:
-                filtered_total = filtered_queryset.count()
-            filtered_selected_count = (
-                filtered_queryset.filter(pk__in=selected_ids).count()
-                if selected_ids
-                else 0
-            )
+            list_counts_getter = getattr(self, "get_list_counts", None)
+            if callable(list_counts_getter):
+                list_counts = list_counts_getter(
+                    filtered_queryset,
+                    selected_ids=self._get_list_count_selection(selected_ids),
+                )
+                if filtered_total is None or context.get("record_count_is_estimate"):
+                    filtered_total = list_counts.total
+                filtered_selected_count = list_counts.selected or 0
+            else:
+                if filtered_total is None or context.get("record_count_is_estimate"):
+                    filtered_total = filtered_queryset.count()
+                filtered_selected_count = filtered_queryset.filter(
+                    pk__in=self._get_list_count_selection(selected_ids)
+                ).count()
             additional_filtered_count = max(0, filtered_total - filtered_selected_count)
-            remaining_capacity = max(
-                0, context["bulk_max_selected_records"] - len(selected_ids)
-            )
+            if self.get_bulk_select_all_predicate_enabled():
+                # Predicate selections store the filter, not the ids, so the
+                # id cap does not apply to select-all-matching.
+                remaining_capacity = additional_filtered_count
+            else:
+                remaining_capacity = max(
+                    0, context["bulk_max_selected_records"] - selected_count
+                )
             action_count = min(additional_filtered_count, remaining_capacity)
 
             context["select_all_matching_count"] = filtered_total
@@ -139,6 +157,38 @@ class ViewMixin:
                 )
         return context
 
+    def _get_enable_selection_controls(self) -> bool:
+        """Return whether list rows render selection checkboxes."""
+        selection_controls_getter = getattr(self, "get_selection_controls_enabled", None)
+        bulk_edit_getter = getattr(self, "get_bulk_edit_enabled", None)
+        return bool(
+            selection_controls_getter()
+            if callable(selection_controls_getter)
+            else bulk_edit_getter()
+            if callable(bulk_edit_getter)
+            else False
+        )
+
+    def get_list_count_selected_ids(self) -> Any:
+        """
+        Return the selected ids the bulk-selection row counts against the list.
+
+        ``CoreMixin.get_list_counts()`` counts these alongside the filtered
+        total, so the select-all-matching row needs no extra count queries.
+        Predicate selections return a ``pk`` subquery instead of a list.
+        """
+        if not self._get_enable_selection_controls():
+            return []
+        if resolve_config(self).show_bulk_selection_meta is False:
+            return []
+        return self.get_selection_lookup(self.request)
+
+    def _get_list_count_selection(self, selected_ids: List[str]) -> Any:
+        """Return a subquery for predicate selections, else ``selected_ids``."""
+        if self.selection_has_predicates(self.request):
+            return self.get_selection_lookup(self.request)
+        return selected_ids
+
     def get_bulk_form_component_context(self) -> Dict[str, Any]:
         """Return model-first focused candidates for bulk form rendering."""
         focused_paths_getter = getattr(
@@ -222,6 +272,7 @@ class ViewMixin:
 
         # Get selected IDs from the request
         selected_ids = []
+        selection_queryset = None
         try:
             selected_ids = request.POST.getlist(
                 "selected_ids[]"
@@ -229,9 +280,15 @@ class ViewMixin:
 
             if not selected_ids:
                 # If no IDs provided via POST/GET, try to get from session first
-                selected_ids = self.get_selected_ids_from_session(request)
+                if self.selection_has_predicates(request):
+                    # Predicate selections are rebuilt from their filters and
+                    # counted; their ids are never read.
+                    selection_queryset = self.get_selected_queryset(request)
+                    selected_count = self.get_selected_count(request)
+                else:
+                    selected_ids = self.get_selected_ids_from_session(request)
 
-                if not selected_ids:
+                if not selected_ids and selection_queryset is None:
                     # If still no IDs, try to get from JSON body
                     try:
                         if request.body and request.content_type == "application/json":
@@ -259,15 +316,21 @@ class ViewMixin:
                 f"An unexpected error occurred: {e}",
             )
 
+        if selection_queryset is None:
+            selected_count = len(selected_ids)
+
         # If still no IDs, return an error
-        if not selected_ids:
+        if not selected_count:
             return self._render_bulk_edit_error(
                 request,
                 template_errors,
                 "No items selected for bulk edit.",
             )
         # Get the queryset of selected objects
-        queryset = self.model.objects.filter(pk__in=selected_ids)
+        if selection_queryset is not None:
+            queryset = selection_queryset
+        else:
+            queryset = self.model.objects.filter(pk__in=selected_ids)
 
         # Get bulk fields (fields that can be bulk edited)
         bulk_fields = cfg.bulk_fields or []
@@ -285,15 +348,25 @@ class ViewMixin:
         if not enable_bulk_update and not enable_bulk_delete:
             return self._handle_bulk_permission_denied(request, "bulk")
 
+        selection = (
+            self.get_selection_payload(request)
+            if selection_queryset is not None
+            else None
+        )
+
         # Check for conflicts before showing the form
-        if self.get_conflict_checking_enabled() and self._check_for_conflicts(
-            selected_ids
+        if self.get_conflict_checking_enabled() and (
+            self._check_for_selection_conflicts(
+                selection, getattr(request.user, "id", None)
+            )
+            if selection
+            else self._check_for_conflicts(selected_ids)
         ):
             # Show conflict message instead of form
             context = {
                 "conflict_detected": True,
                 "conflict_message": f"Another bulk operation is already running on {self.model._meta.verbose_name_plural}. Please try again later.",
-                "selected_count": len(selected_ids),
+                "selected_count": selected_count,
                 "model_name_plural": self.model._meta.verbose_name_plural,
                 **self.get_bulk_form_component_context(),
             }
@@ -303,14 +376,22 @@ class ViewMixin:
         if request.method == "POST" and "bulk_submit" in request.POST:
             # If logic gets too large, move to a helper method
             return self.bulk_edit_process_post(
-                request, queryset, bulk_fields, selected_ids
+                request,
+                queryset,
+                bulk_fields,
+                selected_ids,
+                selection=selection,
+                selected_count=selected_count,
             )
         # Prepare context for the form
         context = {
-            "selected_ids": [
+            # Predicate selections post no ids; the submit re-reads the store.
+            "selected_ids": []
+            if selection_queryset is not None
+            else [
                 str(pk) for pk in queryset.values_list("pk", flat=True)
             ],  # Ensure selected_ids in context reflect the actual queryset
-            "selected_count": len(selected_ids),
+            "selected_count": selected_count,
             "bulk_fields": bulk_fields if enable_bulk_update else [],
             "enable_bulk_update": enable_bulk_update,
             "enable_bulk_delete": enable_bulk_delete,
@@ -339,6 +420,8 @@ class ViewMixin:
         queryset: models.QuerySet,
         bulk_fields: List[str],
         selected_ids: Optional[List[str]] = None,
+        selection: Optional[Dict[str, Any]] = None,
+        selected_count: Optional[int] = None,
     ) -> HttpResponse:
         """
         Process the POST logic for bulk editing. Handles deletion and updates with atomicity.
@@ -351,11 +434,18 @@ class ViewMixin:
             queryset: QuerySet of objects to process.
             bulk_fields: List of fields available for bulk editing.
             selected_ids: List of selected IDs (optional, defaults to None).
+            selection: Predicate selection payload from
+                ``get_selection_payload()``; async workers rebuild the
+                queryset from it instead of receiving ``selected_ids``.
+            selected_count: Size of the selection (optional, defaults to
+                ``len(selected_ids)``); predicate selections pass no ids.
 
         Returns:
             HttpResponse: Success response or error form rendering.
         """
         self.request = request
+        if selected_count is None:
+            selected_count = len(selected_ids or [])
         cfg = resolve_config(self)
         field_info = self._get_bulk_field_info(bulk_fields)
         template_errors = get_template_name(cfg, "partial/bulk_edit_errors.html")
@@ -409,7 +499,7 @@ class ViewMixin:
         # log.debug(f"Processing bulk edit for {len(selected_ids)} selected records")
         if delete_selected:
             # check if should process asynchronously
-            if self.should_process_async(len(selected_ids)):
+            if self.should_process_async(selected_count):
                 # log.debug(
                 #     f"Processing bulk delete asynchronously for {len(selected_ids)} records."
                 # )
@@ -420,6 +510,8 @@ class ViewMixin:
                     bulk_fields,
                     fields_to_update,
                     field_data=[],
+                    selection=selection,
+                    selected_count=selected_count,
                 )
 
             # Synchronous processing
@@ -499,7 +591,7 @@ class ViewMixin:
 
         # Bulk Update Logic
         # Check whether async processing required
-        if self.should_process_async(len(selected_ids)):
+        if self.should_process_async(selected_count):
             # log.debug(
             #     f"Processing bulk update asynchronously for {len(selected_ids)} records."
             # )
@@ -510,6 +602,8 @@ class ViewMixin:
                 bulk_fields,
                 fields_to_update,
                 field_data,
+                selection=selection,
+                selected_count=selected_count,
             )
         result = self.persist_bulk_update(
             queryset=queryset,
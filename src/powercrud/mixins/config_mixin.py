@@ -1,9 +1,14 @@
-from types import SimpleNamespace
+from dataclasses import dataclass
+import logging
+from threading import Lock
+from types import MappingProxyType, SimpleNamespace
 import warnings
 
 from django.conf import settings
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.core.signals import setting_changed
 from django.db import models
+from django.dispatch import receiver
 from django.http import HttpResponseForbidden
 from django.db.models.fields.reverse_related import ManyToOneRel
 from typing import Any, Callable
@@ -193,6 +198,8 @@ class ConfigMixin:
     bulk_full_clean: bool = (
         True  # If True, run full_clean() on each object during bulk edit
     )
+    bulk_update_strategy: str = "auto"  # "auto", "save", or "update"
+    bulk_chunk_size: int | None = None  # commit bulk operations per chunk of rows
 
     # async processing parameters
     bulk_async: bool = False
@@ -246,14 +253,29 @@ class ConfigMixin:
     row_actions_column_sticky: bool = True
     extra_actions_dropdown_open_upward_bottom_rows: int = 3
     show_record_count: bool = False
+    record_count_strategy: str = "exact"
+    record_count_cache_timeout: int = 60
     show_bulk_selection_meta: bool = True
+    bulk_select_all_predicate: bool = False
     extra_button_selection_controls_disabled: bool = False
 
     # filtering options
     default_filterset_fields: list[str] | None = None
     m2m_filter_and_logic = False
+    m2m_filter_and_strategy: str = "joins"
     dropdown_sort_options: dict = {}
     filter_null_fields_exclude: list[str] = []
+    list_search_fields: list[str] | None = None
+    list_search_backend: str = "auto"
+
+    # remote relation options
+    remote_relation_options: bool | list[str] = False
+    relation_options_page_size: int = 20
+
+    # list query planning
+    auto_related_lookups: bool = True
+    list_column_projection: bool = False
+    property_field_dependencies: dict[str, list[str]] | None = None
 
     # async manager configuration
     async_manager_class = None
@@ -264,12 +286,21 @@ class ConfigMixin:
     paginate_by: int | None = DEFAULT_PAGINATE_BY
     page_size_options: list[int] | None = None
     page_size_all_enabled: bool = True
+    page_size_all_streaming: bool = False
+    page_size_all_stream_chunk_size: int = 500
+    pagination_mode: str = "offset"
+    list_snapshot: bool = False
+    list_snapshot_timeout: int = 300
+    list_snapshot_max_rows: int = 50_000
+    list_snapshot_watch_models: list[str] | None = None
 
     EXTRA_CONFIG_FIELDS = {
         "form_class",
         "bulk_fields",
         "bulk_delete",
         "bulk_full_clean",
+        "bulk_update_strategy",
+        "bulk_chunk_size",
         "bulk_async",
         "bulk_async_conflict_checking",
         "bulk_min_async_records",
@@ -282,6 +313,11 @@ class ConfigMixin:
         "dropdown_sort_options",
         "filter_null_fields_exclude",
         "default_filterset_fields",
+        "list_search_fields",
+        "list_search_backend",
+        "auto_related_lookups",
+        "list_column_projection",
+        "property_field_dependencies",
         "table_classes",
         "action_button_classes",
         "extra_button_classes",
@@ -291,9 +327,13 @@ class ConfigMixin:
         "row_actions_column_sticky",
         "extra_actions_dropdown_open_upward_bottom_rows",
         "show_record_count",
+        "record_count_strategy",
+        "record_count_cache_timeout",
         "show_bulk_selection_meta",
+        "bulk_select_all_predicate",
         "extra_button_selection_controls_disabled",
         "m2m_filter_and_logic",
+        "m2m_filter_and_strategy",
         "inline_preserve_required_fields",
         "async_manager_class",
         "async_manager_class_path",
@@ -301,6 +341,15 @@ class ConfigMixin:
         "paginate_by",
         "page_size_options",
         "page_size_all_enabled",
+        "page_size_all_streaming",
+        "page_size_all_stream_chunk_size",
+        "pagination_mode",
+        "list_snapshot",
+        "list_snapshot_timeout",
+        "list_snapshot_max_rows",
+        "list_snapshot_watch_models",
+        "remote_relation_options",
+        "relation_options_page_size",
         "extra_buttons",
         "extra_actions",
     }
@@ -361,11 +410,57 @@ class ConfigMixin:
     def _check_for_conflicts(self, selected_ids=None) -> bool:
         return False
 
+    def _check_for_selection_conflicts(self, selection, user_id=None) -> bool:
+        return False
+
     def _check_single_record_conflict(self, pk) -> bool:
         return False
 
     def __init__(self, *args, **kwargs):  # pragma: no cover
         super().__init__(*args, **kwargs)
+        view_cls = type(self)
+        overrides = dict(self.__dict__)
+        compiled = get_compiled_view_config(view_cls, overrides)
+        if compiled is None:
+            self._compile_view_config(overrides)
+        else:
+            _replay_config_warnings(compiled.recorded_warnings)
+            compiled.apply(self)
+        # The raw as_view() initkwargs, for caches keyed by instance config.
+        self.__dict__["_view_initkwargs"] = overrides
+
+        if self.bulk_async and not self.get_bulk_async_enabled():
+            log.warning(
+                "bulk_async is enabled but backend '%s' is not available",
+                self.get_bulk_async_backend(),
+            )
+
+    def _compile_view_config(self, overrides: dict[str, Any]) -> "CompiledViewConfig":
+        """
+        Run the full configuration pipeline once and cache the resolved state.
+
+        Warnings raised while resolving are recorded with the compiled artifact
+        so later instances of the same view class surface them exactly as the
+        first instance did.
+        """
+        caught: list[warnings.WarningMessage] = []
+        try:
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                self._resolve_configuration()
+        finally:
+            _replay_config_warnings(caught)
+        return store_compiled_view_config(
+            type(self),
+            overrides,
+            values=self.__dict__,
+            recorded_warnings=caught,
+        )
+
+    def _resolve_configuration(self) -> None:
+        """
+        Validate class and instance config, then run every ``_configure_*`` pass.
+        """
         self._validated_config = None
         class_config = resolve_class_config(type(self))
         self._powerfield_config_active = bool(
@@ -417,6 +512,7 @@ class ConfigMixin:
         self._warn_unsupported_presentation_options()
         self._configure_fields()
         self._configure_properties()
+        self._configure_property_field_dependencies()
         self._configure_default_list_fields()
         self._configure_detail_fields()
         self._configure_detail_properties()
@@ -439,23 +535,69 @@ class ConfigMixin:
                 f"Invalid configuration in class '{class_name}': {str(e)}"
             ) from e
 
-        if self.bulk_async and not self.get_bulk_async_enabled():
-            log.warning(
-                "bulk_async is enabled but backend '%s' is not available",
-                self.get_bulk_async_backend(),
-            )
 
     def config(self):
         """
         Return the validated configuration namespace for this instance.
 
-        Each call rebuilds the namespace to capture any attribute overrides that
-        may have happened after `__init__` (for example, in lightweight test
-        harnesses that mutate attributes directly). Behavioural mixins should
-        treat the returned object as read-only and rely on helpers such as
-        `resolve_config(self)` when they need a configuration view.
+        The namespace is memoized per instance. Assigning any configuration
+        attribute (for example in lightweight test harnesses that mutate
+        attributes directly) bumps a version counter, and Django's
+        ``setting_changed`` signal bumps a process-wide generation, so the next
+        call rebuilds. Behavioural mixins should treat the returned object as
+        read-only and rely on helpers such as `resolve_config(self)` when they
+        need a configuration view.
+        """
+        state = self.__dict__
+        cache_key = (state.get("_config_version", 0), _CONFIG_GENERATION[0])
+        cached = state.get("_config_namespace_cache")
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        namespace = self._build_config_namespace()
+        state["_config_namespace_cache"] = (cache_key, namespace)
+        state["_config_namespace_build_count"] = (
+            state.get("_config_namespace_build_count", 0) + 1
+        )
+        return namespace
+
+    def get_config_namespace_build_count(self) -> int:
         """
-        return self._build_config_namespace()
+        Return how many times this instance rebuilt its config namespace.
+
+        View instances live for one request, so this is the per-request
+        rebuild count. It is logged at DEBUG level after each dispatch.
+        """
+        return int(self.__dict__.get("_config_namespace_build_count", 0))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Invalidate the memoized config namespace when config is assigned."""
+        super().__setattr__(name, value)
+        if name in _CONFIG_NAMESPACE_ATTRS:
+            self.__dict__["_config_version"] = (
+                self.__dict__.get("_config_version", 0) + 1
+            )
+
+    def __delattr__(self, name: str) -> None:
+        """Invalidate the memoized config namespace when config is removed."""
+        super().__delattr__(name)
+        if name in _CONFIG_NAMESPACE_ATTRS:
+            self.__dict__["_config_version"] = (
+                self.__dict__.get("_config_version", 0) + 1
+            )
+
+    def dispatch(self, request, *args, **kwargs):
+        """Dispatch the request, then log config namespace rebuilds for profiling."""
+        response = super().dispatch(request, *args, **kwargs)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                "%s rebuilt its config namespace %s time(s) for %s %s",
+                type(self).__name__,
+                self.get_config_namespace_build_count(),
+                request.method,
+                request.path,
+            )
+        return response
 
     def has_power_permission(self, permission: str, request: Any, obj: Any = None) -> bool:
         """
@@ -759,6 +901,37 @@ class ConfigMixin:
         else:
             raise TypeError("properties_exclude must be a list")
 
+    def _configure_property_field_dependencies(self) -> None:
+        """
+        Validate declared model-field dependencies for computed properties.
+
+        Each dependency is a model field name or a lookup path whose first
+        segment is a model field, so column projection and related-lookup
+        planning can load what a property reads.
+        """
+        if self.property_field_dependencies is None:
+            self.property_field_dependencies = {}
+            return
+
+        all_properties = set(self._get_all_properties())
+        normalized: dict[str, list[str]] = {}
+        for prop, dependencies in self.property_field_dependencies.items():
+            if prop not in all_properties:
+                raise ValueError(
+                    "property_field_dependencies keys must be properties of "
+                    f"{self.model.__name__}: {prop}"
+                )
+            for dependency in dependencies:
+                try:
+                    self.model._meta.get_field(dependency.split("__", 1)[0])
+                except FieldDoesNotExist as exc:
+                    raise ValueError(
+                        f"property_field_dependencies for {prop} references unknown "
+                        f"field {dependency} on {self.model.__name__}"
+                    ) from exc
+            normalized[prop] = self._dedupe_preserving_first(dependencies)
+        self.property_field_dependencies = normalized
+
     def _configure_default_list_fields(self):
         """
         Validate the opt-in default visible list-column subset.
@@ -2121,6 +2294,32 @@ class ConfigMixin:
         return self._inline_edit_fields_configured(value)
 
 
+# Attribute names whose assignment invalidates a memoized ``config()`` namespace.
+_CONFIG_NAMESPACE_ATTRS = frozenset(
+    set(PowerCRUDMixinValidator.model_fields.keys())
+    | ConfigMixin.EXTRA_CONFIG_FIELDS
+    | {
+        "inline_edit_enabled",
+        "_legacy_inline_edit_enabled_present",
+        "_legacy_inline_edit_enabled_value",
+    }
+)
+
+# Process-wide namespace generation, bumped by ``setting_changed`` because the
+# namespace also depends on settings such as the template pack and crispy.
+_CONFIG_GENERATION = [0]
+
+# Per-instance bookkeeping that must never be copied into compiled config.
+_INSTANCE_ONLY_CONFIG_ATTRS = frozenset(
+    {
+        "_config_version",
+        "_config_namespace_cache",
+        "_config_namespace_build_count",
+        "_view_initkwargs",
+    }
+)
+
+
 class _ConfigShim:
     """
     Fallback config namespace for tests or mixins that do not have ConfigMixin
@@ -2341,6 +2540,7 @@ class _ConfigShim:
             "field_queryset_dependencies",
             "field_labels",
             "link_fields",
+            "property_field_dependencies",
         }:
             return self._raw(name, {}) or {}
         return self._raw(name)
@@ -2518,8 +2718,189 @@ def resolve_class_config(view_cls):
     return SimpleNamespace(**config)
 
 
+
+# ----------------------------------------------------------------------
+# Compiled per-class configuration
+# ----------------------------------------------------------------------
+# ``ConfigMixin.__init__`` runs pydantic validation plus every ``_configure_*``
+# pass. Neapolitan builds one view instance per request, so the resolved state
+# is compiled once per view class (and per distinct set of ``as_view()``
+# initkwargs) and replayed onto later instances as a cheap attribute overlay.
+
+_MISSING = object()
+_COMPILED_CONFIG_CACHE: dict[tuple[type, tuple[str, ...]], "CompiledViewConfig"] = {}
+_COMPILED_CONFIG_LOCK = Lock()
+_COMPILED_CONFIG_SOURCE_ATTRS = ("model", "queryset", "get_queryset")
+
+
+_CLONED_CONTAINER_TYPES = (list, dict, set)
+
+
+def _clone_config_value(value: Any) -> Any:
+    """Return a recursive copy of list, dict, and set config containers."""
+    if isinstance(value, list):
+        return [
+            _clone_config_value(item)
+            if isinstance(item, _CLONED_CONTAINER_TYPES)
+            else item
+            for item in value
+        ]
+    if isinstance(value, dict):
+        return {
+            key: _clone_config_value(item)
+            if isinstance(item, _CLONED_CONTAINER_TYPES)
+            else item
+            for key, item in value.items()
+        }
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def _config_source_matches(cached: tuple[Any, ...], current: tuple[Any, ...]) -> bool:
+    """Return whether two compile sources reference the same declarations."""
+    if len(cached) != len(current):
+        return False
+    for cached_value, current_value in zip(cached, current):
+        if cached_value is current_value:
+            continue
+        try:
+            if cached_value != current_value:
+                return False
+        except Exception:
+            return False
+    return True
+
+
+def _compiled_config_source(
+    view_cls: type,
+    overrides: dict[str, Any],
+) -> tuple[Any, ...]:
+    """
+    Return the declarations a compiled view config was resolved from.
+
+    Class attributes are captured by reference, so replacing a class attribute
+    (for example with ``monkeypatch.setattr``) invalidates the compiled entry.
+    Mutating a class-level list or dict in place is not detected; call
+    ``clear_compiled_config_cache()`` after doing that.
+    """
+    class_values = tuple(
+        getattr(view_cls, name, _MISSING)
+        for name in sorted(_get_config_field_names())
+    )
+    related_values = tuple(
+        getattr(view_cls, name, _MISSING) for name in _COMPILED_CONFIG_SOURCE_ATTRS
+    )
+    override_values = tuple(overrides[name] for name in sorted(overrides))
+    return class_values + related_values + override_values
+
+
+@dataclass(frozen=True)
+class CompiledViewConfig:
+    """
+    Immutable resolved configuration for one view class and initkwargs set.
+
+    ``values`` holds the instance attributes produced by the configuration
+    pipeline. Mutable containers are cloned on the way in and again on every
+    ``apply()``, so instances can never mutate the shared artifact.
+    """
+
+    view_cls: type
+    source: tuple[Any, ...]
+    values: MappingProxyType
+    recorded_warnings: tuple[warnings.WarningMessage, ...] = ()
+
+    def apply(self, instance: Any) -> None:
+        """Overlay the compiled attributes onto a freshly built view instance."""
+        instance.__dict__.update(
+            {
+                name: _clone_config_value(value)
+                if isinstance(value, _CLONED_CONTAINER_TYPES)
+                else value
+                for name, value in self.values.items()
+            }
+        )
+
+
+def get_compiled_view_config(
+    view_cls: type,
+    overrides: dict[str, Any] | None = None,
+) -> CompiledViewConfig | None:
+    """
+    Return the cached compiled config for a view class when still current.
+
+    Args:
+        view_cls: The PowerCRUD view class being instantiated.
+        overrides: Instance attributes present before configuration, usually
+            the ``as_view()`` initkwargs.
+    """
+    overrides = overrides or {}
+    key = (view_cls, tuple(sorted(overrides)))
+    compiled = _COMPILED_CONFIG_CACHE.get(key)
+    if compiled is None:
+        return None
+    if not _config_source_matches(
+        compiled.source,
+        _compiled_config_source(view_cls, overrides),
+    ):
+        return None
+    return compiled
+
+
+def store_compiled_view_config(
+    view_cls: type,
+    overrides: dict[str, Any],
+    *,
+    values: dict[str, Any],
+    recorded_warnings: list[warnings.WarningMessage] | None = None,
+) -> CompiledViewConfig:
+    """Freeze and cache the resolved attribute state for a view class."""
+    compiled = CompiledViewConfig(
+        view_cls=view_cls,
+        source=_compiled_config_source(view_cls, overrides),
+        values=MappingProxyType(
+            {
+                name: _clone_config_value(value)
+                for name, value in values.items()
+                if name not in _INSTANCE_ONLY_CONFIG_ATTRS
+            }
+        ),
+        recorded_warnings=tuple(recorded_warnings or ()),
+    )
+    with _COMPILED_CONFIG_LOCK:
+        _COMPILED_CONFIG_CACHE[(view_cls, tuple(sorted(overrides)))] = compiled
+    return compiled
+
+
+def clear_compiled_config_cache(view_cls: type | None = None) -> None:
+    """
+    Drop compiled view configuration, for one class or for every class.
+    """
+    with _COMPILED_CONFIG_LOCK:
+        if view_cls is None:
+            _COMPILED_CONFIG_CACHE.clear()
+            return
+        for key in [key for key in _COMPILED_CONFIG_CACHE if key[0] is view_cls]:
+            del _COMPILED_CONFIG_CACHE[key]
+
+
+def _replay_config_warnings(recorded: Any) -> None:
+    """Re-emit warnings captured while compiling a view configuration."""
+    for warning in recorded:
+        warnings.warn(warning.message, warning.category, stacklevel=4)
+
+
+@receiver(setting_changed)
+def _clear_compiled_config_on_setting_changed(**kwargs) -> None:
+    """Recompile view configuration after settings change (mostly in tests)."""
+    _CONFIG_GENERATION[0] += 1
+    clear_compiled_config_cache()
+
 __all__ = [
+    "CompiledViewConfig",
     "ConfigMixin",
+    "clear_compiled_config_cache",
+    "get_compiled_view_config",
     "has_lazy_list_cell_tooltip_state",
     "has_lazy_row_action_state",
     "has_selection_aware_extra_buttons",
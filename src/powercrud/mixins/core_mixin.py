@@ -1,10 +1,51 @@
+import hashlib
+import json
+from dataclasses import dataclass
 from typing import Any
+from urllib.parse import urlencode
 
-from django.core.exceptions import FieldDoesNotExist
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist
+from django.db import DatabaseError, connections
+from django.db.models import Count, Q, QuerySet
 from django.http import Http404
 
+from powercrud.logging import get_logger
+from powercrud.query_params import build_navigation_querydict
+
 from .config_mixin import ConfigMixin
 
+log = get_logger(__name__)
+
+# Planner estimates are unreliable for small results, which are cheap to count.
+ESTIMATED_RECORD_COUNT_EXACT_BELOW = 1000
+
+
+@dataclass(frozen=True)
+class RecordCount:
+    """
+    Record total for a filtered list, and how it was obtained.
+
+    ``total`` is ``None`` under the ``has_more`` strategy, where no count runs.
+    """
+
+    total: int | None
+    strategy: str = "exact"
+    is_estimate: bool = False
+
+
+@dataclass(frozen=True)
+class ListCounts:
+    """
+    Counts for one filtered list, computed in a single aggregate query.
+
+    ``selected`` is how many of the selected ids are in the filtered list, or
+    ``None`` when no selection was counted.
+    """
+
+    total: int
+    selected: int | None = None
+
 
 class CoreMixin(ConfigMixin):
     """
@@ -165,9 +206,14 @@ class CoreMixin(ConfigMixin):
         """
         Get the queryset for the view, applying sorting if specified.
         Always includes a secondary sort by primary key for stable pagination.
+        Detail views also join the relations rendered by ``detail_fields``.
         """
         queryset = super().get_queryset()
-        return self._apply_queryset_sorting(queryset)
+        queryset = self._apply_queryset_sorting(queryset)
+        detail_queryset_planner = getattr(self, "plan_detail_queryset", None)
+        if callable(detail_queryset_planner):
+            queryset = detail_queryset_planner(queryset)
+        return queryset
 
     def get_show_record_count(self) -> bool:
         """
@@ -199,6 +245,56 @@ class CoreMixin(ConfigMixin):
 
         return False
 
+    def get_list_counts(
+        self,
+        queryset: Any,
+        selected_ids: list[Any] | None = None,
+    ) -> ListCounts:
+        """
+        Return the filtered total and selected-in-filter count in one query.
+
+        Runs ``aggregate(Count("pk"), Count("pk", filter=Q(pk__in=...)))``
+        so pagination, the record-count line, emptiness checks, and the bulk
+        selection row share one round trip. ``selected_ids`` defaults to
+        ``get_list_count_selected_ids()`` when the view provides it. Results
+        are memoized for the queryset and selection.
+        """
+        if selected_ids is None:
+            selected_ids_getter = getattr(self, "get_list_count_selected_ids", None)
+            selected_ids = (
+                selected_ids_getter() if callable(selected_ids_getter) else []
+            )
+        if isinstance(selected_ids, QuerySet):
+            # A pk subquery from a predicate selection; compare it by SQL.
+            selection_key = str(selected_ids.query)
+        else:
+            selection_key = tuple(str(pk) for pk in selected_ids or ())
+        memo = getattr(self, "_list_counts_memo", None)
+        if memo is not None and memo[0] is queryset and memo[1] == selection_key:
+            return memo[2]
+
+        query = getattr(queryset, "query", None)
+        if not callable(getattr(queryset, "aggregate", None)) or getattr(
+            query, "combinator", None
+        ):
+            total = self.get_queryset_record_count(queryset)
+            selected = (
+                queryset.filter(pk__in=selected_ids).count() if selection_key else None
+            )
+            list_counts = ListCounts(total, selected)
+        else:
+            aggregates = {"total": Count("pk")}
+            if selection_key:
+                aggregates["selected"] = Count("pk", filter=Q(pk__in=selected_ids))
+            result = queryset.order_by().aggregate(**aggregates)
+            list_counts = ListCounts(
+                int(result["total"] or 0),
+                int(result["selected"] or 0) if selection_key else None,
+            )
+
+        self._list_counts_memo = (queryset, selection_key, list_counts)
+        return list_counts
+
     def get_queryset_record_count(
         self, queryset: Any, paginator: Any | None = None
     ) -> int:
@@ -218,6 +314,125 @@ class CoreMixin(ConfigMixin):
 
         return len(queryset)
 
+    def get_record_count_strategy(self) -> str:
+        """
+        Return how list record totals are counted.
+
+        ``exact`` runs ``COUNT(*)``; ``cached`` reuses an exact count for
+        ``record_count_cache_timeout`` seconds; ``estimated`` reads the
+        database planner's row estimate; ``has_more`` skips counting and only
+        checks for a next page.
+        """
+        return getattr(self.config(), "record_count_strategy", None) or "exact"
+
+    def get_record_count(
+        self, queryset: Any, paginator: Any | None = None
+    ) -> RecordCount:
+        """
+        Return the record total for ``queryset`` under the configured strategy.
+
+        The result is memoized for the queryset so the paginator and the
+        record-count line share one count.
+        """
+        memo = getattr(self, "_record_count_memo", None)
+        if memo is not None and memo[0] is queryset:
+            return memo[1]
+
+        strategy = self.get_record_count_strategy()
+        if strategy == "has_more" and paginator is not None:
+            record_count = RecordCount(None, strategy)
+        elif strategy == "cached":
+            record_count = RecordCount(
+                self.get_cached_queryset_record_count(queryset), strategy
+            )
+        elif strategy == "estimated":
+            estimate = self.estimate_queryset_record_count(queryset)
+            if estimate is None or estimate < ESTIMATED_RECORD_COUNT_EXACT_BELOW:
+                record_count = RecordCount(
+                    self.get_queryset_record_count(queryset), strategy
+                )
+            else:
+                record_count = RecordCount(estimate, strategy, is_estimate=True)
+        elif callable(getattr(queryset, "aggregate", None)):
+            record_count = RecordCount(self.get_list_counts(queryset).total, "exact")
+        else:
+            record_count = RecordCount(
+                self.get_queryset_record_count(queryset, paginator), "exact"
+            )
+
+        self._record_count_memo = (queryset, record_count)
+        return record_count
+
+    def get_record_count_cache_key(self, queryset: Any) -> str | None:
+        """
+        Return the cache key for ``queryset``'s count, or ``None`` if uncacheable.
+
+        The key hashes the normalised filter state from the request together
+        with the SQL of the unordered queryset, so per-user queryset scoping in
+        ``get_queryset()`` never shares a count.
+        """
+        request = getattr(self, "request", None)
+        query = build_navigation_querydict(
+            getattr(request, "GET", {}),
+            exclude={"page", "cursor", "page_size", "sort"},
+        )
+        filter_state = urlencode(sorted(query.lists()), doseq=True)
+        try:
+            sql, params = queryset.order_by().query.get_compiler(queryset.db).as_sql()
+        except (AttributeError, EmptyResultSet):
+            return None
+        digest = hashlib.sha256(repr((filter_state, sql, params)).encode()).hexdigest()
+        return f"powercrud:record-count:{queryset.model._meta.label_lower}:{digest}"
+
+    def get_cached_queryset_record_count(self, queryset: Any) -> int:
+        """Return an exact count, reused from the cache for the configured TTL."""
+        cache_key = self.get_record_count_cache_key(queryset)
+        if cache_key is None:
+            return self.get_queryset_record_count(queryset)
+        total = cache.get(cache_key)
+        if total is None:
+            total = self.get_queryset_record_count(queryset)
+            timeout = getattr(self.config(), "record_count_cache_timeout", None) or 60
+            cache.set(cache_key, total, timeout)
+        return int(total)
+
+    def estimate_queryset_record_count(self, queryset: Any) -> int | None:
+        """
+        Return the database planner's row estimate for ``queryset``.
+
+        Uses ``EXPLAIN (FORMAT JSON)`` on PostgreSQL. Returns ``None`` on other
+        databases or when the estimate is unavailable, so callers count exactly.
+        """
+        db_alias = getattr(queryset, "db", None)
+        if db_alias is None or connections[db_alias].vendor != "postgresql":
+            return None
+        try:
+            sql, params = queryset.order_by().query.get_compiler(db_alias).as_sql()
+            with connections[db_alias].cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except EmptyResultSet:
+            return 0
+        except (DatabaseError, KeyError, IndexError, TypeError, ValueError) as exc:
+            log.debug(f"Record count estimate unavailable: {exc}")
+            return None
+
+    def is_list_empty(self, queryset: Any) -> bool:
+        """
+        Return whether the filtered list has no rows.
+
+        Exact counting needs the total anyway, so the shared aggregate answers
+        this too; other strategies keep the cheaper ``exists()`` query.
+        """
+        if self.get_record_count_strategy() == "exact" and callable(
+            getattr(queryset, "aggregate", None)
+        ):
+            return self.get_list_counts(queryset).total == 0
+        return not queryset.exists()
+
     def get_record_count_context(
         self,
         queryset: Any,
@@ -228,20 +443,26 @@ class CoreMixin(ConfigMixin):
         """
         Build context for the optional record-count status line shown above the table.
         """
-        total = self.get_queryset_record_count(queryset, paginator=paginator)
+        record_count = self.get_record_count(queryset, paginator=paginator)
+        total = record_count.total
 
-        if page_obj is not None and total > 0:
+        if page_obj is not None and (total is None or total > 0):
             start = page_obj.start_index()
             end = page_obj.end_index()
         else:
             start = 0
             end = 0
+        if total is None and page_obj is not None and not page_obj.has_next():
+            # The last page of a has-more list knows the exact total.
+            total = end
 
         return {
             "show_record_count": self.get_show_record_count(),
             "record_count_total": total,
             "record_count_start": start,
             "record_count_end": end,
+            "record_count_strategy": record_count.strategy,
+            "record_count_is_estimate": record_count.is_estimate,
             "record_count_has_active_filters": self.has_active_filters(filterset),
         }
 
@@ -263,9 +484,6 @@ class CoreMixin(ConfigMixin):
             queryset = filterset.qs
         queryset = self._apply_queryset_sorting(queryset)
 
-        if not self.allow_empty and not queryset.exists():
-            raise Http404
-
         list_column_state = None
         list_options_url = None
         list_column_state_builder = getattr(self, "build_list_column_state", None)
@@ -280,10 +498,24 @@ class CoreMixin(ConfigMixin):
                 if callable(endpoint_name_getter):
                     list_options_url = self.safe_reverse(endpoint_name_getter())
 
+        list_queryset_planner = getattr(self, "plan_list_queryset", None)
+        if callable(list_queryset_planner):
+            queryset = list_queryset_planner(
+                queryset,
+                list_column_state=list_column_state,
+            )
+
+        if not self.allow_empty and self.is_list_empty(queryset):
+            raise Http404
+
         paginate_by = self.get_paginate_by()
         if paginate_by is None:
             # Unpaginated response
-            self.object_list = queryset
+            list_stream = None
+            list_stream_getter = getattr(self, "get_list_stream", None)
+            if callable(list_stream_getter):
+                list_stream = list_stream_getter(queryset)
+            self.object_list = list_stream.first_rows if list_stream else queryset
             record_count_context = self.get_record_count_context(
                 queryset=queryset,
                 filterset=filterset,
@@ -299,8 +531,15 @@ class CoreMixin(ConfigMixin):
                 request=request,
                 list_column_state=list_column_state,
                 list_options_url=list_options_url,
+                list_stream=list_stream,
                 **record_count_context,
             )
+            if list_stream is not None and list_stream.marker:
+                return self.stream_list_response(
+                    self.render_to_response(context),
+                    list_stream,
+                    context,
+                )
         else:
             # Paginated response
             page = self.paginate_queryset(queryset, paginate_by)
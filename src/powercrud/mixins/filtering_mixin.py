@@ -1,6 +1,9 @@
 from django import forms
 from collections import OrderedDict
+from typing import Any
+
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django_filters.constants import EMPTY_VALUES
 from django_filters import (
     FilterSet,
     CharFilter,
@@ -13,13 +16,22 @@ from django_filters import (
     TimeFilter,
     ModelMultipleChoiceFilter,
 )
-from django.db import models
+from django.core.signals import setting_changed
+from django.db import connections, models
+from django.dispatch import receiver
 from django.utils.text import capfirst
 
+from powercrud.filter_options import (
+    OptionIndexModelChoiceIterator,
+    get_filter_dropdown_sort_key,
+    order_by_label,
+)
 from powercrud.logging import get_logger
+from powercrud.search import get_list_search_backend
 from powercrud.template_packs import (
     WidgetKind,
     WidgetPolicyContext,
+    get_selected_template_pack,
     get_template_pack_server_adapter,
 )
 from powercrud.widget_policy import (
@@ -33,22 +45,154 @@ from .form_mixin import is_boolean_like_select_field
 log = get_logger(__name__)
 
 NULL_FILTER_SENTINEL = "__powercrud_empty__"
+LIST_SEARCH_QUERY_PARAM = "search"
+
+# Generated FilterSet classes, keyed by FilteringMixin.get_filterset_class_cache_key().
+# Oldest entries are evicted once the cache holds this many classes.
+_GENERATED_FILTERSET_CLASSES: dict[tuple[Any, ...], type[FilterSet]] = {}
+_GENERATED_FILTERSET_CLASSES_MAX_SIZE = 256
+
+
+def _freeze_cache_key_value(value: Any) -> Any:
+    """Return a hashable stand-in for a config value used in a cache key."""
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                (
+                    (repr(key), _freeze_cache_key_value(item))
+                    for key, item in value.items()
+                ),
+                key=lambda pair: pair[0],
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_cache_key_value(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+    return value
+
+
+def clear_generated_filterset_cache() -> None:
+    """Forget every cached auto-generated FilterSet class."""
+    _GENERATED_FILTERSET_CLASSES.clear()
+
+
+@receiver(setting_changed)
+def _clear_generated_filtersets_on_setting_changed(**kwargs) -> None:
+    """Rebuild generated filtersets after settings such as the template pack change."""
+    clear_generated_filterset_cache()
+
+
+class OptionIndexModelChoiceField(forms.ModelChoiceField):
+    """ModelChoiceField that lists unordered querysets through the option index."""
+
+    iterator = OptionIndexModelChoiceIterator
+
+
+class OptionIndexModelMultipleChoiceField(forms.ModelMultipleChoiceField):
+    """ModelMultipleChoiceField that lists unordered querysets through the option index."""
+
+    iterator = OptionIndexModelChoiceIterator
+
+
+class OptionIndexModelChoiceFilter(ModelChoiceFilter):
+    """ModelChoiceFilter whose dropdown options come from the option index."""
+
+    field_class = OptionIndexModelChoiceField
 
 
-class AllValuesModelMultipleChoiceFilter(ModelMultipleChoiceFilter):
-    """Custom filter that requires ALL selected values to match (AND logic)"""
+class OptionIndexModelMultipleChoiceFilter(ModelMultipleChoiceFilter):
+    """ModelMultipleChoiceFilter whose options come from the option index."""
+
+    field_class = OptionIndexModelMultipleChoiceField
+
+
+class AllValuesModelMultipleChoiceFilter(OptionIndexModelMultipleChoiceFilter):
+    """
+    Custom filter that requires ALL selected values to match (AND logic).
+
+    ``strategy`` picks the query shape: ``"joins"`` (the default) chains one
+    ``filter()`` per value, ``"grouped"`` uses one grouped subquery, and
+    ``"auto"`` keeps chained joins on SQLite or for at most
+    ``max_chained_joins`` values. ``"grouped"`` and ``"auto"`` are opt-in
+    until they have been benchmarked on more than SQLite.
+    """
+
+    strategy = "joins"
+    max_chained_joins = 2
+
+    def __init__(self, *args, strategy: str | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if strategy is not None:
+            self.strategy = strategy
 
     def filter(self, qs, value):
         if not value:
             return qs
 
-        # For each value, filter for items that have that value in the M2M field
-        for val in value:
-            qs = qs.filter(**{f"{self.field_name}": val})
-        return qs
+        selected = {getattr(val, "pk", val) for val in value}
+        if len(selected) == 1:
+            return qs.filter(**{self.field_name: selected.pop()})
+        if self.get_strategy(qs, selected) == "joins":
+            for val in selected:
+                qs = qs.filter(**{self.field_name: val})
+            return qs
+        return qs.filter(pk__in=self.get_matching_pks(qs.model, selected))
+
+    def get_strategy(self, qs, selected: set[Any]) -> str:
+        """Return ``"joins"`` or ``"grouped"`` for filtering ``qs`` by ``selected``."""
+        if self.strategy != "auto":
+            return self.strategy
+        if (
+            connections[qs.db].vendor == "sqlite"
+            or len(selected) <= self.max_chained_joins
+        ):
+            return "joins"
+        return "grouped"
+
+    def get_matching_pks(self, model, selected: set[Any]) -> models.QuerySet:
+        """
+        Return a subquery of ``model`` pks related to every value in ``selected``.
+
+        Chaining one ``filter()`` per value adds one M2M join per value. This
+        groups the matching relation rows once and keeps the groups whose
+        ``COUNT(DISTINCT value)`` equals the number of selected values. Direct
+        many-to-many fields read the through table alone; lookup paths group
+        the model's own rows.
+        """
+        try:
+            model_field = model._meta.get_field(self.field_name)
+        except FieldDoesNotExist:
+            model_field = None
+
+        if isinstance(model_field, models.ManyToManyField):
+            through = model_field.remote_field.through
+            source = model_field.m2m_field_name()
+            target = model_field.m2m_reverse_field_name()
+            return (
+                through._default_manager.filter(**{f"{target}__in": selected})
+                .values(source)
+                .annotate(_powercrud_matched=models.Count(target, distinct=True))
+                .filter(_powercrud_matched=len(selected))
+                .values(source)
+            )
+
+        return (
+            model._default_manager.filter(**{f"{self.field_name}__in": selected})
+            .values("pk")
+            .annotate(
+                _powercrud_matched=models.Count(self.field_name, distinct=True)
+            )
+            .filter(_powercrud_matched=len(selected))
+            .values("pk")
+        )
 
 
-class NullableModelChoiceField(forms.ModelChoiceField):
+class NullableModelChoiceField(OptionIndexModelChoiceField):
     """ModelChoiceField variant that accepts a sentinel for null-only filtering."""
 
     def __init__(
@@ -115,6 +259,37 @@ class NullableModelChoiceFilter(ModelChoiceFilter):
         return super().filter(qs, value)
 
 
+class ListSearchFilter(CharFilter):
+    """
+    Text filter answered by a list search backend.
+
+    Without ``search_fields`` the filter searches every field the backend
+    indexes, which makes it a quick-search box; with ``search_fields`` it
+    searches only those columns, as generated text filters do. ``backend`` is
+    a backend name, a dotted path, or ``"auto"``.
+    """
+
+    def __init__(
+        self,
+        *args,
+        index_fields: list[str] | tuple[str, ...],
+        search_fields: list[str] | tuple[str, ...] | None = None,
+        backend: str | None = "auto",
+        **kwargs,
+    ):
+        self.index_fields = tuple(index_fields)
+        self.search_fields = tuple(search_fields) if search_fields else None
+        self.backend = backend
+        super().__init__(*args, **kwargs)
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        backend = get_list_search_backend(qs.model, self.index_fields, self.backend)
+        qs = backend.search(qs, value, self.search_fields)
+        return qs.distinct() if self.distinct else qs
+
+
 class HTMXFilterSetMixin:
     """
     Mixin that adds HTMX attributes to filter forms for dynamic updates.
@@ -234,10 +409,10 @@ class FilteringMixin:
         """
         Apply HTMX widget attributes to custom filtersets when supported.
 
-        Auto-generated filtersets already wire this up during construction. This
-        helper preserves the same reactive filtering ergonomics for custom
-        `filterset_class` implementations that expose `setup_htmx_attrs()`,
-        typically by subclassing `HTMXFilterSetMixin`.
+        Auto-generated filtersets are cached per view class, so this runs for
+        them on every request too. Custom `filterset_class` implementations get
+        the same reactive filtering ergonomics when they expose
+        `setup_htmx_attrs()`, typically by subclassing `HTMXFilterSetMixin`.
         """
         if filterset is None:
             return
@@ -341,27 +516,19 @@ class FilteringMixin:
             sort_field = sort_options[field_name]  # Can be "name" or "-name"
             return queryset.order_by(sort_field)
 
+        # Sort keys declared for the related model in POWERCRUD_SETTINGS
+        sort_key = get_filter_dropdown_sort_key(model_field.related_model)
+        if sort_key:
+            return queryset.order_by(*sort_key)
+
         # If no specified sort field but model has common name fields, use that
         for field in ["name", "title", "label", "display_name"]:
             if field in model_fields:
                 return queryset.order_by(field)
 
-        # Only if really necessary, fall back to string representation sorting
-        sorted_objects = sorted(list(queryset), key=lambda x: str(x).lower())
-        pk_list = [obj.pk for obj in sorted_objects]
-
-        if not pk_list:  # Empty list case
-            return queryset.none()
-
-        # Return ordered queryset
-        from django.db.models import Case, When, Value, IntegerField
-
-        preserved_order = Case(
-            *[When(pk=pk, then=Value(i)) for i, pk in enumerate(pk_list)],
-            output_field=IntegerField(),
-        )
-
-        return queryset.filter(pk__in=pk_list).order_by(preserved_order)
+        # Only if really necessary, fall back to string representation sorting,
+        # read from the cached option index rather than the related table.
+        return order_by_label(queryset)
 
     def get_null_filter_field_name(self, field_name: str) -> str:
         """Return the companion null-filter name for a base filter field."""
@@ -403,7 +570,8 @@ class FilteringMixin:
                 f"{', '.join(effective_names)}"
             )
 
-        default_names = set(declared_defaults)
+        # The quick-search box stays visible alongside the declared defaults.
+        default_names = set(declared_defaults) | {LIST_SEARCH_QUERY_PARAM}
         return [name for name in effective_names if name in default_names]
 
     def get_active_filter_names(self, filterset: FilterSet | None) -> list[str]:
@@ -583,6 +751,300 @@ class FilteringMixin:
             ),
         )
 
+    def get_filterset_class_cache_key(self, filterset_fields, queryset=None):
+        """
+        Return the cache key for this view's generated FilterSet class.
+
+        The generated class depends on the view class, the configured filter
+        fields, the selected template pack, and the view options that change
+        which filters are built. ``as_view()`` initkwargs are part of the key,
+        so two routes of one view class with different options get their own
+        class. Annotation filters take their field type from the queryset, so
+        their output-field signature is part of the key. Return ``None`` from
+        an override to rebuild the class on every request.
+        """
+        config = resolve_config(self)
+        return (
+            type(self),
+            self.model,
+            tuple(filterset_fields),
+            get_selected_template_pack().identity,
+            bool(config.m2m_filter_and_logic),
+            config.m2m_filter_and_strategy,
+            tuple(sorted(config.filter_null_fields_exclude or ())),
+            tuple(config.list_search_fields or ()),
+            config.list_search_backend,
+            self._get_filterset_annotation_signature(filterset_fields, queryset),
+            _freeze_cache_key_value(self.__dict__.get("_view_initkwargs", {})),
+        )
+
+    def _get_filterset_annotation_signature(
+        self, filterset_fields, queryset
+    ) -> tuple[tuple[Any, ...], ...]:
+        """Return the output-field type and choices of each annotation filter."""
+        signature = []
+        for field_name in filterset_fields:
+            try:
+                self.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                _, output_field, _ = self._resolve_generated_filter_field(
+                    field_name, queryset
+                )
+                signature.append(
+                    (
+                        field_name,
+                        type(output_field),
+                        repr(getattr(output_field, "choices", None)),
+                    )
+                )
+        return tuple(signature)
+
+    def get_generated_filterset_class(self, filterset_fields, queryset=None):
+        """
+        Return the generated FilterSet class, building it once per cache key.
+
+        Widgets and filter types are shared by every request. Related-model
+        option querysets and HTMX attributes are request state, so
+        `get_filterset()` applies them to each filterset instance.
+        """
+        cache_key = self.get_filterset_class_cache_key(filterset_fields, queryset)
+        if cache_key is not None:
+            cached = _GENERATED_FILTERSET_CLASSES.get(cache_key)
+            if cached is not None:
+                return cached
+        filterset_class = self._build_generated_filterset_class(
+            filterset_fields, queryset
+        )
+        if cache_key is not None:
+            if (
+                len(_GENERATED_FILTERSET_CLASSES)
+                >= _GENERATED_FILTERSET_CLASSES_MAX_SIZE
+            ):
+                _GENERATED_FILTERSET_CLASSES.pop(
+                    next(iter(_GENERATED_FILTERSET_CLASSES))
+                )
+            _GENERATED_FILTERSET_CLASSES[cache_key] = filterset_class
+        return filterset_class
+
+    def _refresh_generated_filter_querysets(self, filterset: FilterSet) -> None:
+        """Give a generated filterset this request's related-model option querysets."""
+        relation_filter_fields = getattr(
+            filterset, "_powercrud_relation_filter_fields", {}
+        )
+        for field_name, model_field in relation_filter_fields.items():
+            filterset.filters[field_name].queryset = (
+                self.get_filter_queryset_for_field(field_name, model_field)
+            )
+
+    def _build_generated_filterset_class(self, filterset_fields, queryset=None):
+        """Build a FilterSet class from ``filterset_fields``."""
+        declared_filters = {}
+        filter_form_order = []
+        relation_filter_fields = {}
+        config = resolve_config(self)
+        list_search_fields = list(config.list_search_fields or [])
+        list_search_backend = config.list_search_backend
+
+        if list_search_fields:
+            search_attrs = dict(
+                self._get_filter_widget_presentation(
+                    field_name=LIST_SEARCH_QUERY_PARAM,
+                    kind="text",
+                    is_relation=False,
+                ).attrs
+            )
+            search_attrs.setdefault("placeholder", "Search")
+            declared_filters[LIST_SEARCH_QUERY_PARAM] = ListSearchFilter(
+                index_fields=list_search_fields,
+                backend=list_search_backend,
+                label="Search",
+                widget=forms.TextInput(attrs=search_attrs),
+            )
+            filter_form_order.append(LIST_SEARCH_QUERY_PARAM)
+
+        for field_name in filterset_fields:
+            model_field, field_to_check, is_annotation = (
+                self._resolve_generated_filter_field(field_name, queryset)
+            )
+
+            field_presentation = self._get_filter_widget_presentation(
+                field_name=field_name,
+                kind=get_model_widget_kind(field_to_check),
+                is_relation=bool(getattr(field_to_check, "is_relation", False)),
+            )
+            field_attrs = dict(field_presentation.attrs)
+
+            if is_annotation and isinstance(
+                field_to_check,
+                (
+                    models.ManyToManyField,
+                    models.ForeignKey,
+                    models.OneToOneField,
+                ),
+            ):
+                raise ValueError(
+                    f"filterset_fields entry {field_name} is a queryset "
+                    "annotation with a relation output_field, which PowerCRUD "
+                    "cannot generate as an automatic filter."
+                )
+            elif isinstance(field_to_check, models.ManyToManyField):
+                filter_kwargs = {
+                    "queryset": model_field.related_model._default_manager.all(),
+                    "widget": forms.SelectMultiple(attrs=field_attrs),
+                }
+                if resolve_config(self).m2m_filter_and_logic:
+                    declared_filters[field_name] = AllValuesModelMultipleChoiceFilter(
+                        strategy=resolve_config(self).m2m_filter_and_strategy,
+                        **filter_kwargs,
+                    )
+                else:
+                    declared_filters[field_name] = OptionIndexModelMultipleChoiceFilter(
+                        **filter_kwargs
+                    )
+                relation_filter_fields[field_name] = model_field
+            elif self._field_has_choices(field_to_check):
+                declared_filters[field_name] = ChoiceFilter(
+                    choices=field_to_check.choices,
+                    label=self._get_filter_label(model_field or field_name),
+                    widget=forms.Select(attrs=field_attrs),
+                )
+            elif (
+                isinstance(field_to_check, (models.CharField, models.TextField))
+                and not is_annotation
+                and field_name in list_search_fields
+            ):
+                declared_filters[field_name] = ListSearchFilter(
+                    index_fields=list_search_fields,
+                    search_fields=[field_name],
+                    backend=list_search_backend,
+                    label=self._get_filter_label(model_field or field_name),
+                    widget=forms.TextInput(attrs=field_attrs),
+                )
+            elif isinstance(field_to_check, (models.CharField, models.TextField)):
+                declared_filters[field_name] = CharFilter(
+                    lookup_expr="icontains",
+                    label=self._get_filter_label(model_field or field_name),
+                    widget=forms.TextInput(attrs=field_attrs),
+                )
+            elif isinstance(field_to_check, models.DateTimeField):
+                declared_filters[field_name] = DateTimeFilter(
+                    label=self._get_filter_label(model_field or field_name),
+                    widget=forms.DateTimeInput(attrs=field_attrs),
+                )
+            elif isinstance(field_to_check, models.DateField):
+                if "type" not in field_attrs:
+                    field_attrs["type"] = "date"
+                declared_filters[field_name] = DateFilter(
+                    label=self._get_filter_label(model_field or field_name),
+                    widget=forms.DateInput(attrs=field_attrs)
+                )
+            elif isinstance(
+                field_to_check,
+                (models.IntegerField, models.DecimalField, models.FloatField),
+            ):
+                if "step" not in field_attrs:
+                    field_attrs["step"] = "any"
+                declared_filters[field_name] = NumberFilter(
+                    label=self._get_filter_label(model_field or field_name),
+                    widget=forms.NumberInput(attrs=field_attrs)
+                )
+            elif isinstance(field_to_check, models.BooleanField):
+                declared_filters[field_name] = BooleanFilter(
+                    label=self._get_filter_label(model_field or field_name),
+                    widget=forms.Select(
+                        attrs=field_attrs,
+                        choices=(
+                            (None, "---------"),
+                            (True, True),
+                            (False, False),
+                        ),
+                    )
+                )
+            elif isinstance(field_to_check, (models.ForeignKey, models.OneToOneField)):
+                filter_class = (
+                    NullableModelChoiceFilter
+                    if self._field_supports_auto_null_filter(
+                        field_name, field_to_check
+                    )
+                    and self._field_uses_merged_null_relation_filter(field_to_check)
+                    else OptionIndexModelChoiceFilter
+                )
+                declared_filters[field_name] = filter_class(
+                    queryset=model_field.related_model._default_manager.all(),
+                    label=self._get_filter_label(model_field),
+                    widget=forms.Select(attrs=field_attrs),
+                )
+                relation_filter_fields[field_name] = model_field
+            elif isinstance(field_to_check, models.TimeField):
+                if "type" not in field_attrs:
+                    field_attrs["type"] = "time"
+                declared_filters[field_name] = TimeFilter(
+                    label=self._get_filter_label(model_field or field_name),
+                    widget=forms.TimeInput(attrs=field_attrs)
+                )
+            else:
+                declared_filters[field_name] = CharFilter(
+                    lookup_expr="icontains",
+                    label=self._get_filter_label(model_field or field_name),
+                    widget=forms.TextInput(attrs=field_attrs),
+                )
+            filter_form_order.append(field_name)
+
+            if not is_annotation and self._field_supports_auto_null_filter(
+                field_name, field_to_check
+            ) and self._field_uses_companion_null_filter(field_to_check):
+                null_field_name = self.get_null_filter_field_name(field_name)
+                null_attrs = dict(
+                    self._get_filter_widget_presentation(
+                        field_name=null_field_name,
+                        kind="select",
+                        is_relation=False,
+                    ).attrs
+                )
+                declared_filters[null_field_name] = (
+                    self._build_companion_null_filter(
+                        field_name,
+                        model_field,
+                        null_attrs,
+                    )
+                )
+                filter_form_order.append(null_field_name)
+
+        class Meta:
+            """FilterSet metadata for the dynamically generated class."""
+
+            model = self.model
+            fields = []
+
+        def __init__(filterset_self, *args, **kwargs):
+            """Initialize the FilterSet with filters in configured order."""
+            FilterSet.__init__(filterset_self, *args, **kwargs)
+            ordered_filters = OrderedDict()
+            for filter_name in filter_form_order:
+                if filter_name in filterset_self.filters:
+                    ordered_filters[filter_name] = filterset_self.filters[
+                        filter_name
+                    ]
+            for filter_name, filter_value in filterset_self.filters.items():
+                if filter_name not in ordered_filters:
+                    ordered_filters[filter_name] = filter_value
+            filterset_self.filters = ordered_filters
+
+        return type(
+            f"{self.model.__name__}DynamicFilterSet",
+            (HTMXFilterSetMixin, FilterSet),
+            {
+                "__doc__": (
+                    "Dynamically generated FilterSet for PowerCRUD auto-filters."
+                ),
+                "__module__": self.__class__.__module__,
+                "Meta": Meta,
+                "__init__": __init__,
+                "_powercrud_relation_filter_fields": relation_filter_fields,
+                **declared_filters,
+            },
+        )
+
     def get_filterset(self, queryset=None):  # pragma: no cover
         """
         Create a dynamic FilterSet class based on provided parameters:
@@ -609,6 +1071,7 @@ class FilteringMixin:
                 if k
                 not in (
                     "page",
+                    "cursor",
                     "sort",
                     "page_size",
                     self.get_visible_filters_query_param(),
@@ -624,179 +1087,8 @@ class FilteringMixin:
                 setattr(self, "_reset_pagination", True)
 
         if filterset_class is None and filterset_fields is not None:
-            use_htmx = self.get_use_htmx()
-            declared_filters = {}
-            filter_form_order = []
-
-            for field_name in filterset_fields:
-                model_field, field_to_check, is_annotation = (
-                    self._resolve_generated_filter_field(field_name, queryset)
-                )
-
-                field_presentation = self._get_filter_widget_presentation(
-                    field_name=field_name,
-                    kind=get_model_widget_kind(field_to_check),
-                    is_relation=bool(getattr(field_to_check, "is_relation", False)),
-                )
-                field_attrs = dict(field_presentation.attrs)
-
-                if is_annotation and isinstance(
-                    field_to_check,
-                    (
-                        models.ManyToManyField,
-                        models.ForeignKey,
-                        models.OneToOneField,
-                    ),
-                ):
-                    raise ValueError(
-                        f"filterset_fields entry {field_name} is a queryset "
-                        "annotation with a relation output_field, which PowerCRUD "
-                        "cannot generate as an automatic filter."
-                    )
-                elif isinstance(field_to_check, models.ManyToManyField):
-                    filter_class = (
-                        AllValuesModelMultipleChoiceFilter
-                        if resolve_config(self).m2m_filter_and_logic
-                        else ModelMultipleChoiceFilter
-                    )
-                    declared_filters[field_name] = filter_class(
-                        queryset=self.get_filter_queryset_for_field(
-                            field_name, model_field
-                        ),
-                        widget=forms.SelectMultiple(attrs=field_attrs),
-                    )
-                elif self._field_has_choices(field_to_check):
-                    declared_filters[field_name] = ChoiceFilter(
-                        choices=field_to_check.choices,
-                        label=self._get_filter_label(model_field or field_name),
-                        widget=forms.Select(attrs=field_attrs),
-                    )
-                elif isinstance(field_to_check, (models.CharField, models.TextField)):
-                    declared_filters[field_name] = CharFilter(
-                        lookup_expr="icontains",
-                        label=self._get_filter_label(model_field or field_name),
-                        widget=forms.TextInput(attrs=field_attrs),
-                    )
-                elif isinstance(field_to_check, models.DateTimeField):
-                    declared_filters[field_name] = DateTimeFilter(
-                        label=self._get_filter_label(model_field or field_name),
-                        widget=forms.DateTimeInput(attrs=field_attrs),
-                    )
-                elif isinstance(field_to_check, models.DateField):
-                    if "type" not in field_attrs:
-                        field_attrs["type"] = "date"
-                    declared_filters[field_name] = DateFilter(
-                        label=self._get_filter_label(model_field or field_name),
-                        widget=forms.DateInput(attrs=field_attrs)
-                    )
-                elif isinstance(
-                    field_to_check,
-                    (models.IntegerField, models.DecimalField, models.FloatField),
-                ):
-                    if "step" not in field_attrs:
-                        field_attrs["step"] = "any"
-                    declared_filters[field_name] = NumberFilter(
-                        label=self._get_filter_label(model_field or field_name),
-                        widget=forms.NumberInput(attrs=field_attrs)
-                    )
-                elif isinstance(field_to_check, models.BooleanField):
-                    declared_filters[field_name] = BooleanFilter(
-                        label=self._get_filter_label(model_field or field_name),
-                        widget=forms.Select(
-                            attrs=field_attrs,
-                            choices=(
-                                (None, "---------"),
-                                (True, True),
-                                (False, False),
-                            ),
-                        )
-                    )
-                elif isinstance(field_to_check, (models.ForeignKey, models.OneToOneField)):
-                    filter_class = (
-                        NullableModelChoiceFilter
-                        if self._field_supports_auto_null_filter(
-                            field_name, field_to_check
-                        )
-                        and self._field_uses_merged_null_relation_filter(field_to_check)
-                        else ModelChoiceFilter
-                    )
-                    declared_filters[field_name] = filter_class(
-                        queryset=self.get_filter_queryset_for_field(
-                            field_name, model_field
-                        ),
-                        label=self._get_filter_label(model_field),
-                        widget=forms.Select(attrs=field_attrs),
-                    )
-                elif isinstance(field_to_check, models.TimeField):
-                    if "type" not in field_attrs:
-                        field_attrs["type"] = "time"
-                    declared_filters[field_name] = TimeFilter(
-                        label=self._get_filter_label(model_field or field_name),
-                        widget=forms.TimeInput(attrs=field_attrs)
-                    )
-                else:
-                    declared_filters[field_name] = CharFilter(
-                        lookup_expr="icontains",
-                        label=self._get_filter_label(model_field or field_name),
-                        widget=forms.TextInput(attrs=field_attrs),
-                    )
-                filter_form_order.append(field_name)
-
-                if not is_annotation and self._field_supports_auto_null_filter(
-                    field_name, field_to_check
-                ) and self._field_uses_companion_null_filter(field_to_check):
-                    null_field_name = self.get_null_filter_field_name(field_name)
-                    null_attrs = dict(
-                        self._get_filter_widget_presentation(
-                            field_name=null_field_name,
-                            kind="select",
-                            is_relation=False,
-                        ).attrs
-                    )
-                    declared_filters[null_field_name] = (
-                        self._build_companion_null_filter(
-                            field_name,
-                            model_field,
-                            null_attrs,
-                        )
-                    )
-                    filter_form_order.append(null_field_name)
-
-            class Meta:
-                """FilterSet metadata for the dynamically generated class."""
-
-                model = self.model
-                fields = []
-
-            def __init__(filterset_self, *args, **kwargs):
-                """Initialize the FilterSet and set up HTMX attributes if needed."""
-                FilterSet.__init__(filterset_self, *args, **kwargs)
-                ordered_filters = OrderedDict()
-                for filter_name in filter_form_order:
-                    if filter_name in filterset_self.filters:
-                        ordered_filters[filter_name] = filterset_self.filters[
-                            filter_name
-                        ]
-                for filter_name, filter_value in filterset_self.filters.items():
-                    if filter_name not in ordered_filters:
-                        ordered_filters[filter_name] = filter_value
-                filterset_self.filters = ordered_filters
-                filterset_self.form.order_fields(list(ordered_filters.keys()))
-                if use_htmx:
-                    filterset_self.setup_htmx_attrs()
-
-            filterset_class = type(
-                f"{self.model.__name__}DynamicFilterSet",
-                (HTMXFilterSetMixin, FilterSet),
-                {
-                    "__doc__": (
-                        "Dynamically generated FilterSet for PowerCRUD auto-filters."
-                    ),
-                    "__module__": self.__class__.__module__,
-                    "Meta": Meta,
-                    "__init__": __init__,
-                    **declared_filters,
-                },
+            filterset_class = self.get_generated_filterset_class(
+                filterset_fields, queryset
             )
 
         if filterset_class is None:
@@ -810,5 +1102,11 @@ class FilteringMixin:
         if using_custom_filterset_class:
             self._apply_custom_filterset_htmx_attrs(filterset)
             self._apply_custom_filterset_framework_attrs(filterset)
+        else:
+            self._refresh_generated_filter_querysets(filterset)
+            self._apply_custom_filterset_htmx_attrs(filterset)
         self._apply_filter_searchable_select_attrs(filterset)
+        apply_remote_options = getattr(self, "apply_remote_relation_options", None)
+        if callable(apply_remote_options):
+            apply_remote_options(filterset.form, surface="filter")
         return filterset
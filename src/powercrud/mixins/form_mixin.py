@@ -542,7 +542,12 @@ class FormMixin:
                 value = getattr(instance, instance_fk_attr, None)
                 if not self._dependency_value_is_empty(value):
                     return value
-            if hasattr(instance, field_name):
+            try:
+                has_field_attr = hasattr(instance, field_name)
+            except ValueError:
+                # Unsaved instances cannot read many-to-many relations yet.
+                has_field_attr = False
+            if has_field_attr:
                 attr = getattr(instance, field_name)
                 if hasattr(attr, "all"):
                     values = list(attr.values_list("pk", flat=True))
@@ -654,7 +659,11 @@ class FormMixin:
         if not inline:
             form = self._apply_disabled_form_fields(form)
         form = self._apply_field_queryset_dependencies(form)
-        return self._apply_form_widget_policy(form, inline=inline)
+        form = self._apply_form_widget_policy(form, inline=inline)
+        apply_remote_options = getattr(self, "apply_remote_relation_options", None)
+        if callable(apply_remote_options):
+            form = apply_remote_options(form, surface="form")
+        return form
 
     def get_context_data(self, **kwargs):
         """
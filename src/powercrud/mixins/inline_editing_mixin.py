@@ -421,7 +421,7 @@ class InlineEditingMixin:
             "inline_cancel_url": self._get_inline_row_url(obj),
             "enable_bulk_edit": self.get_bulk_edit_enabled(),
             "enable_selection_controls": enable_selection_controls,
-            "selected_ids": self._get_selected_ids(),
+            "selected_ids": self._get_row_selected_ids(obj),
             "list_view_url": self._get_list_url(),
             "action_button_classes": self.get_action_button_classes(),
             "row_actions_column_position": self.get_row_actions_column_position(),
@@ -529,7 +529,7 @@ class InlineEditingMixin:
             "inline_edit": self.get_inline_context(),
             "enable_bulk_edit": self.get_bulk_edit_enabled(),
             "enable_selection_controls": enable_selection_controls,
-            "selected_ids": self._get_selected_ids(),
+            "selected_ids": self._get_row_selected_ids(obj),
             "list_view_url": self._get_list_url(),
             "has_row_actions": row_payload.get("has_actions", False),
             "row_actions_column_position": self.get_row_actions_column_position(),
@@ -780,6 +780,10 @@ class InlineEditingMixin:
         if pk in (None, ""):
             return False
 
+        resolved = getattr(obj, "_inline_lock_metadata", None)
+        if resolved is not None:
+            return bool(resolved)
+
         conflict_enabled = getattr(self, "get_conflict_checking_enabled", None)
         if not callable(conflict_enabled) or not conflict_enabled():
             return False
@@ -808,7 +812,7 @@ class InlineEditingMixin:
                 "use_htmx": self.get_use_htmx(),
                 "original_target": self.get_original_target(),
                 "htmx_target": self.get_htmx_target(),
-                "selected_ids": self._get_selected_ids(),
+                "selected_ids": self._get_row_selected_ids(obj),
                 "filtered_queryset": queryset if list_column_state is not None else None,
                 "list_column_state": list_column_state,
             },
@@ -821,6 +825,12 @@ class InlineEditingMixin:
         endpoint = self.get_inline_row_endpoint_name()
         return self.safe_reverse(endpoint, kwargs={"pk": obj.pk})
 
+    def _get_row_selected_ids(self, obj):
+        # An inline row only needs to know whether its own object is selected.
+        if hasattr(self, "get_selected_ids_among") and self.request:
+            return list(self.get_selected_ids_among(self.request, [obj.pk]))
+        return self._get_selected_ids()
+
     def _get_selected_ids(self):
         if hasattr(self, "get_selected_ids_from_session") and self.request:
             ids = self.get_selected_ids_from_session(self.request)
@@ -985,35 +995,102 @@ class InlineEditingMixin:
         """
         return self._get_inline_lock_metadata(obj)
 
-    def _get_inline_lock_metadata(self, obj) -> dict[str, Any]:
-        metadata: dict[str, Any] = {}
-        if not obj or not getattr(self, "model", None):
-            return metadata
+    def resolve_inline_lock_states(self, objects) -> dict[Any, dict[str, Any]]:
+        """
+        Resolve lock metadata for a whole list page and attach it to the rows.
+
+        Reads every row's lock key with one ``cache.get_many`` call and loads
+        the matching dashboard records with one ``task_name__in`` query. Each
+        row gets an ``_inline_lock_metadata`` dict (empty when unlocked) that
+        ``is_inline_row_locked()`` and ``get_inline_lock_details()`` reuse.
+        Returns the metadata keyed by pk, or an empty dict when conflict
+        checking is off or the manager cannot batch lookups.
+        """
+        objects = [
+            obj for obj in objects if getattr(obj, "pk", None) not in (None, "")
+        ]
+        if not objects or not getattr(self, "model", None):
+            return {}
 
+        conflict_enabled = getattr(self, "get_conflict_checking_enabled", None)
+        if not callable(conflict_enabled) or not conflict_enabled():
+            return {}
+
+        manager = self._get_inline_lock_manager()
+        get_task_names = getattr(manager, "get_lock_task_names", None)
+        if not callable(get_task_names):
+            return {}
+
+        model_label = f"{self.model._meta.app_label}.{self.model._meta.model_name}"
+        try:
+            task_names = get_task_names(model_label, [obj.pk for obj in objects])
+        except Exception:
+            log.exception("Could not resolve inline lock state for %s.", model_label)
+            return {}
+
+        records = self._lookup_async_records(manager, task_names.values())
+        states: dict[Any, dict[str, Any]] = {}
+        for obj in objects:
+            task_name = task_names.get(obj.pk)
+            metadata: dict[str, Any] = {}
+            if task_name:
+                metadata = self._build_inline_lock_metadata(
+                    manager,
+                    task_name,
+                    f"{manager.conflict_model_prefix}{model_label}:{obj.pk}",
+                    records.get(str(task_name)),
+                )
+            setattr(obj, "_inline_lock_metadata", metadata)
+            states[obj.pk] = metadata
+        return states
+
+    def _get_inline_lock_manager(self) -> Optional[Any]:
+        """Return the async manager used for lock lookups, if it has a cache."""
         get_manager = getattr(self, "get_async_manager", None)
         if not callable(get_manager):
-            return metadata
+            return None
 
         try:
             manager = get_manager()
         except Exception:
+            return None
+
+        if not getattr(manager, "cache", None) or not getattr(
+            manager, "conflict_model_prefix", None
+        ):
+            return None
+        return manager
+
+    def _get_inline_lock_metadata(self, obj) -> dict[str, Any]:
+        metadata: dict[str, Any] = {}
+        if not obj or not getattr(self, "model", None):
             return metadata
 
-        cache = getattr(manager, "cache", None)
-        prefix = getattr(manager, "conflict_model_prefix", None)
-        if not cache or not prefix:
+        resolved = getattr(obj, "_inline_lock_metadata", None)
+        if resolved is not None:
+            return resolved
+
+        manager = self._get_inline_lock_manager()
+        if manager is None:
             return metadata
 
         model_label = f"{self.model._meta.app_label}.{self.model._meta.model_name}"
-        lock_key = f"{prefix}{model_label}:{obj.pk}"
-        task_name = cache.get(lock_key)
+        lock_key = f"{manager.conflict_model_prefix}{model_label}:{obj.pk}"
+        task_name = manager.cache.get(lock_key)
         if not task_name:
             return metadata
 
-        metadata["task"] = str(task_name)
-        metadata["lock_key"] = lock_key
+        return self._build_inline_lock_metadata(
+            manager,
+            task_name,
+            lock_key,
+            self._lookup_async_record(manager, task_name),
+        )
 
-        record = self._lookup_async_record(manager, task_name)
+    def _build_inline_lock_metadata(
+        self, manager, task_name: str, lock_key: str, record: Optional[Any]
+    ) -> dict[str, Any]:
+        metadata: dict[str, Any] = {"task": str(task_name), "lock_key": lock_key}
         if record is not None:
             metadata["user"] = self._extract_record_field(
                 manager, record, "user", "user_label"
@@ -1049,6 +1126,24 @@ class InlineEditingMixin:
         except Exception:
             return None
 
+    def _lookup_async_records(self, manager, task_names) -> dict[str, Any]:
+        """Return dashboard records for ``task_names`` keyed by task name."""
+        task_names = {str(task_name) for task_name in task_names if task_name}
+        record_model = getattr(manager, "_record_model", None)
+        field_getter = getattr(manager, "_field", None)
+        if not task_names or not record_model or not callable(field_getter):
+            return {}
+
+        task_field = field_getter("task_name", "task_name")
+        if not task_field:
+            return {}
+
+        try:
+            records = record_model.objects.filter(**{f"{task_field}__in": task_names})
+            return {str(getattr(record, task_field)): record for record in records}
+        except Exception:
+            return {}
+
     def _extract_record_field(self, manager, record, logical_name: str, default: str):
         field_getter = getattr(manager, "_field", None)
         field_name = (
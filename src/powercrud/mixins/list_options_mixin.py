@@ -353,6 +353,7 @@ class ListOptionsMixin:
                 "list_columns_action",
                 "list_view_url",
                 "page",
+                "cursor",
             }:
                 continue
             for value in values:
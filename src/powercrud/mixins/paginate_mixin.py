@@ -1,4 +1,250 @@
+from __future__ import annotations
+
+import hashlib
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from functools import cached_property
+from itertools import islice
+from typing import Any, Iterator
+from urllib.parse import urlencode
+
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, FieldDoesNotExist, ValidationError
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db import connections
+from django.db.models import Q
+from django.http import Http404, StreamingHttpResponse
+from django.utils.safestring import SafeString, mark_safe
+
+from powercrud.list_snapshots import get_snapshot_version, get_snapshot_watch_models
+from powercrud.query_params import build_navigation_querydict
+from powercrud.templatetags import powercrud as powercrud_tags
+
 from .config_mixin import resolve_config
+from .core_mixin import RecordCount
+
+KEYSET_CURSOR_QUERY_PARAM = "cursor"
+_KEYSET_CURSOR_SALT = "powercrud.keyset-cursor"
+# Cached in place of a snapshot for lists longer than list_snapshot_max_rows.
+_LIST_SNAPSHOT_TOO_LARGE = "too-large"
+
+
+@dataclass
+class ListStream:
+    """
+    Rows of an unpaginated list that are rendered after the first chunk.
+
+    ``first_rows`` render with the page. The remaining rows are read from
+    ``rows`` (a ``queryset.iterator()``) in ``chunk_size`` batches and spliced
+    in at ``marker``, which the table shell emits after its rows. An empty
+    marker means the first chunk already held every row.
+    """
+
+    first_rows: list[Any]
+    rows: Iterator[Any]
+    chunk_size: int
+    marker: SafeString | str = ""
+    has_row_actions: bool | None = None
+
+    def iter_chunks(self) -> Iterator[list[Any]]:
+        """Yield the remaining rows in ``chunk_size`` lists."""
+        while chunk := list(islice(self.rows, self.chunk_size)):
+            yield chunk
+
+    def share_has_row_actions(self, has_row_actions: bool) -> bool:
+        """Keep the row-actions column decision of the first chunk for all chunks."""
+        if self.has_row_actions is None:
+            self.has_row_actions = has_row_actions
+        return self.has_row_actions
+
+
+@dataclass(frozen=True)
+class KeysetOrdering:
+    """The ``(sort_path, pk)`` ordering a keyset page seeks on."""
+
+    sort_path: str | None
+    sort_field: Any
+    pk_field: Any
+    descending: bool
+
+
+class RecordCountPage(Page):
+    """Page whose start and end indexes follow the rows it actually holds."""
+
+    #: Whether a row exists after this page, when read ahead by the paginator.
+    has_more_rows: bool | None = None
+
+    def has_next(self) -> bool:
+        if self.has_more_rows is not None:
+            return self.has_more_rows
+        return super().has_next()
+
+    def start_index(self) -> int:
+        if not len(self):
+            return 0
+        return (self.number - 1) * self.paginator.per_page + 1
+
+    def end_index(self) -> int:
+        start = self.start_index()
+        return start + len(self) - 1 if start else 0
+
+
+class RecordCountPaginator(Paginator):
+    """
+    Paginator whose ``count`` comes from the view's record-count strategy.
+
+    Cached and estimated totals can lag behind the real row count, so with
+    ``allow_pages_past_count`` pages are sliced from the queryset without
+    clamping to ``count``. Page numbers past the counted last page are still
+    served, and ``has_next()`` comes from reading one row past the page.
+    """
+
+    def __init__(
+        self,
+        object_list,
+        per_page,
+        *,
+        count_getter,
+        allow_pages_past_count: bool = False,
+        **kwargs,
+    ):
+        super().__init__(object_list, per_page, **kwargs)
+        self._count_getter = count_getter
+        self.allow_pages_past_count = allow_pages_past_count
+
+    @cached_property
+    def count(self) -> int:
+        return int(self._count_getter() or 0)
+
+    def validate_number(self, number):
+        if not self.allow_pages_past_count:
+            return super().validate_number(number)
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger("That page number is not an integer")
+        if number < 1:
+            raise EmptyPage("That page number is less than 1")
+        return number
+
+    def page(self, number):
+        if not self.allow_pages_past_count:
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage("That page contains no results")
+        page = self._get_page(rows[: self.per_page], number, self)
+        page.has_more_rows = len(rows) > self.per_page
+        return page
+
+    def _get_page(self, *args, **kwargs):
+        return RecordCountPage(*args, **kwargs)
+
+
+class SequentialPaginator:
+    """
+    Paginator facade for pages navigated only by Previous and Next links.
+
+    Only ``count`` and ``per_page`` are provided. ``count`` uses
+    ``count_getter`` when given, otherwise a ``COUNT`` query the first time
+    it is read.
+    """
+
+    def __init__(self, queryset, per_page: int, count_getter=None):
+        self.queryset = queryset
+        self.per_page = per_page
+        self._count_getter = count_getter
+
+    @cached_property
+    def count(self) -> int | None:
+        if self._count_getter is not None:
+            return self._count_getter()
+        return self.queryset.count()
+
+
+class SequentialPage(Sequence):
+    """
+    One page of a list navigated by Previous and Next links only.
+
+    Mirrors the parts of Django's ``Page`` that list templates and record
+    counts use. Navigation is through ``next_query_string`` and
+    ``previous_query_string``.
+    """
+
+    is_sequential = True
+    is_keyset = False
+    pagination_mode = ""
+    number = None
+
+    def __init__(
+        self,
+        object_list: list[Any],
+        paginator: SequentialPaginator,
+        *,
+        offset: int,
+        has_next: bool,
+        has_previous: bool,
+        next_query_string: str = "",
+        previous_query_string: str = "",
+    ):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.offset = offset
+        self._has_next = has_next
+        self._has_previous = has_previous
+        self.next_query_string = next_query_string
+        self.previous_query_string = previous_query_string
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} at offset {self.offset}>"
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        return self._has_next or self._has_previous
+
+    def start_index(self) -> int:
+        return self.offset + 1 if self.object_list else 0
+
+    def end_index(self) -> int:
+        return self.offset + len(self.object_list)
+
+
+class KeysetPage(SequentialPage):
+    """A keyset page; its links carry an opaque ``cursor`` parameter."""
+
+    is_keyset = True
+    pagination_mode = "keyset"
+
+
+class HasMorePage(SequentialPage):
+    """
+    An offset page fetched without counting the list.
+
+    ``page_size + 1`` rows are read so the extra row tells whether a next page
+    exists.
+    """
+
+    pagination_mode = "has_more"
+
+    def __init__(self, *args, number: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.number = number
 
 
 class PaginateMixin:
@@ -76,6 +322,7 @@ class PaginateMixin:
             modified_GET = self.request.GET.copy()
             # Set page to 1
             modified_GET["page"] = "1"
+            modified_GET.pop(KEYSET_CURSOR_QUERY_PARAM, None)
             # Replace with our modified version temporarily
             self.request.GET = modified_GET
             # Clean up flag
@@ -83,8 +330,502 @@ class PaginateMixin:
 
         # Call parent implementation
         try:
+            if self.get_pagination_mode() == "keyset":
+                keyset_page = self.paginate_queryset_keyset(queryset, page_size)
+                if keyset_page is not None:
+                    return keyset_page
+            if self.get_list_snapshot_enabled():
+                snapshot_page = self.paginate_queryset_snapshot(queryset, page_size)
+                if snapshot_page is not None:
+                    return snapshot_page
+            if self._get_record_count_strategy() == "has_more":
+                return self.paginate_queryset_has_more(queryset, page_size)
             return super().paginate_queryset(queryset, page_size)
         finally:
             # Restore original GET if we modified it
             if original_GET is not None:
                 self.request.GET = original_GET
+
+    def _get_record_count_strategy(self) -> str:
+        """Return the view's record-count strategy, defaulting to ``exact``."""
+        getter = getattr(self, "get_record_count_strategy", None)
+        return getter() if callable(getter) else "exact"
+
+    def _get_record_count_getter(self, queryset):
+        """
+        Return a callable for a paginator's ``count``, or ``None``.
+
+        The paginator is routed through ``get_record_count()`` so the page,
+        the record-count line, and the bulk selection row share one count.
+        """
+        record_count_getter = getattr(self, "get_record_count", None)
+        if not callable(record_count_getter) or not hasattr(queryset, "query"):
+            return None
+        return lambda: record_count_getter(queryset).total
+
+    def get_paginator(self, queryset, page_size):
+        """Return a paginator whose count follows the record-count strategy."""
+        count_getter = self._get_record_count_getter(queryset)
+        if count_getter is None:
+            return super().get_paginator(queryset, page_size)
+        return RecordCountPaginator(
+            queryset,
+            page_size,
+            count_getter=count_getter,
+            allow_pages_past_count=self._get_record_count_strategy() != "exact",
+        )
+
+    def paginate_queryset_has_more(self, queryset, page_size: int) -> HasMorePage:
+        """
+        Return the requested offset page without counting the list.
+
+        Reads ``page_size + 1`` rows; the extra row only signals a next page.
+        """
+        page_number = self.request.GET.get(getattr(self, "page_kwarg", "page"), 1)
+        try:
+            page_number = max(int(page_number), 1)
+        except (TypeError, ValueError):
+            raise Http404("Page is not an integer.")
+        offset = (page_number - 1) * page_size
+        rows = list(queryset[offset : offset + page_size + 1])
+        if not rows and page_number > 1:
+            raise Http404(f"Invalid page ({page_number}): That page contains no results")
+        has_next = len(rows) > page_size
+
+        def page_query_string(number: int) -> str:
+            query = build_navigation_querydict(
+                self.request.GET,
+                exclude={"page", KEYSET_CURSOR_QUERY_PARAM},
+            )
+            if number > 1:
+                query["page"] = str(number)
+            return urlencode(list(query.lists()), doseq=True)
+
+        return HasMorePage(
+            rows[:page_size],
+            SequentialPaginator(queryset, page_size, lambda: None),
+            number=page_number,
+            offset=offset,
+            has_next=has_next,
+            has_previous=page_number > 1,
+            next_query_string=page_query_string(page_number + 1) if has_next else "",
+            previous_query_string=(
+                page_query_string(page_number - 1) if page_number > 1 else ""
+            ),
+        )
+
+    def get_list_snapshot_enabled(self) -> bool:
+        """Return whether offset pages are served from a cached pk snapshot."""
+        return bool(getattr(resolve_config(self), "list_snapshot", False))
+
+    def get_list_snapshot_cache_key(self, queryset) -> tuple[str, tuple] | None:
+        """
+        Return ``(cache_key, directions)`` for ``queryset``'s snapshot, or ``None``.
+
+        The key hashes the normalised filter state, the unordered queryset SQL,
+        the sort fields without their direction, and the versions of the
+        view's model and ``list_snapshot_watch_models``. ``directions`` records which sort terms
+        are descending, so a request that flips every direction can reuse the
+        snapshot reversed. Expression orderings cannot be reversed and get
+        ``directions`` of ``None``.
+        """
+        order_by = tuple(getattr(getattr(queryset, "query", None), "order_by", ()))
+        if not order_by:
+            return None
+        if all(isinstance(term, str) for term in order_by):
+            sort_terms = tuple(term.lstrip("-") for term in order_by)
+            directions = tuple(term.startswith("-") for term in order_by)
+        else:
+            sort_terms = tuple(repr(term) for term in order_by)
+            directions = None
+
+        query = build_navigation_querydict(
+            self.request.GET,
+            exclude={"page", KEYSET_CURSOR_QUERY_PARAM, "page_size", "sort"},
+        )
+        filter_state = urlencode(sorted(query.lists()), doseq=True)
+        try:
+            sql, params = queryset.order_by().query.get_compiler(queryset.db).as_sql()
+        except EmptyResultSet:
+            return None
+        cfg = resolve_config(self)
+        versions = get_snapshot_version(
+            get_snapshot_watch_models(
+                self.model, getattr(cfg, "list_snapshot_watch_models", None)
+            )
+        )
+        digest = hashlib.sha256(
+            repr((filter_state, sql, params, sort_terms, versions)).encode()
+        ).hexdigest()
+        cache_key = (
+            f"powercrud:list-snapshot:{queryset.model._meta.label_lower}:{digest}"
+        )
+        return cache_key, directions
+
+    def get_list_snapshot_pks(self, queryset) -> list[Any] | None:
+        """
+        Return ``queryset``'s primary keys in display order, or ``None``.
+
+        The first request for a filter and sort state reads the ordered pks
+        and caches them for ``list_snapshot_timeout`` seconds. Lists longer
+        than ``list_snapshot_max_rows`` are not snapshotted; that is cached
+        too, so later requests skip reading their pks.
+        """
+        snapshot_key = self.get_list_snapshot_cache_key(queryset)
+        if snapshot_key is None:
+            return None
+        cache_key, directions = snapshot_key
+        cached = cache.get(cache_key)
+        if cached == _LIST_SNAPSHOT_TOO_LARGE:
+            return None
+        if cached is not None:
+            cached_directions, pks = cached
+            if cached_directions == directions:
+                return pks
+            if directions is not None and cached_directions == tuple(
+                not descending for descending in directions
+            ):
+                return pks[::-1]
+
+        cfg = resolve_config(self)
+        max_rows = int(getattr(cfg, "list_snapshot_max_rows", None) or 50_000)
+        timeout = int(getattr(cfg, "list_snapshot_timeout", None) or 300)
+        pks = list(queryset.values_list("pk", flat=True)[: max_rows + 1])
+        if len(pks) > max_rows:
+            cache.set(cache_key, _LIST_SNAPSHOT_TOO_LARGE, timeout)
+            return None
+        cache.set(cache_key, (directions, pks), timeout)
+        return pks
+
+    def paginate_queryset_snapshot(self, queryset, page_size: int) -> Page | None:
+        """
+        Return the requested offset page sliced from the list snapshot.
+
+        Only the page's rows are fetched, with ``pk__in`` on the filtered
+        queryset so annotations and related lookups still apply. Rows deleted
+        since the snapshot was taken drop out of their page. Returns ``None``
+        when no snapshot is available so normal pagination runs.
+        """
+        if not hasattr(queryset, "query"):
+            return None
+        pks = self.get_list_snapshot_pks(queryset)
+        if pks is None:
+            return None
+
+        page = super().paginate_queryset(pks, page_size)
+        page_pks = list(page.object_list)
+        rows = {
+            obj.pk: obj for obj in queryset.order_by().filter(pk__in=page_pks)
+        }
+        page.object_list = [rows[pk] for pk in page_pks if pk in rows]
+        record_count_getter = getattr(self, "get_record_count_strategy", None)
+        if callable(record_count_getter):
+            # The snapshot already knows the total, so skip the COUNT query.
+            self._record_count_memo = (
+                queryset,
+                RecordCount(len(pks), record_count_getter()),
+            )
+        return page
+
+    def get_pagination_mode(self) -> str:
+        """Return ``"keyset"`` or ``"offset"`` for paginated list requests."""
+        return getattr(resolve_config(self), "pagination_mode", None) or "offset"
+
+    def get_keyset_ordering(self, queryset) -> KeysetOrdering | None:
+        """
+        Return the seek ordering for ``queryset``, or ``None`` to use offsets.
+
+        Keyset pagination needs the ``(sort, pk)`` ordering applied by
+        ``_apply_queryset_sorting()`` and a sort key that cannot be NULL.
+        Annotations, relation-valued sorts, and nullable fields (including
+        nullable relations along the path) fall back to offset pagination.
+        """
+        model = getattr(self, "model", None)
+        order_by = list(getattr(getattr(queryset, "query", None), "order_by", ()))
+        if model is None or not order_by or order_by[-1] not in {"pk", "-pk"}:
+            return None
+        if not all(isinstance(expression, str) for expression in order_by):
+            return None
+        descending = order_by[-1] == "-pk"
+        pk_field = model._meta.pk
+        if len(order_by) == 1:
+            return KeysetOrdering(None, pk_field, pk_field, descending)
+        if len(order_by) != 2 or order_by[0].startswith("-") != descending:
+            return None
+
+        sort_path = order_by[0].lstrip("-")
+        if sort_path in getattr(queryset.query, "annotations", {}):
+            return None
+        field = None
+        current_model = model
+        for part in sort_path.split("__"):
+            if current_model is None:
+                return None
+            try:
+                field = current_model._meta.get_field(part)
+            except FieldDoesNotExist:
+                return None
+            if getattr(field, "null", True) or getattr(field, "many_to_many", False):
+                return None
+            current_model = getattr(field, "related_model", None)
+        if field is None or field.is_relation or not getattr(field, "concrete", False):
+            return None
+        return KeysetOrdering(sort_path, field, pk_field, descending)
+
+    def paginate_queryset_keyset(self, queryset, page_size: int) -> KeysetPage | None:
+        """
+        Return the keyset page selected by the request ``cursor``.
+
+        Seeks past the cursor row with ``WHERE (sort, pk) > (value, pk)``
+        instead of ``OFFSET``, so deep pages cost the same as the first page.
+        Returns ``None`` when the ordering does not support keyset paging.
+        Missing, tampered, or stale cursors start again from the first page.
+        """
+        ordering = self.get_keyset_ordering(queryset)
+        if ordering is None:
+            return None
+
+        query_key = self._get_keyset_query_key()
+        cursor = self._decode_keyset_cursor(
+            self.request.GET.get(KEYSET_CURSOR_QUERY_PARAM, ""),
+            ordering,
+            query_key,
+        )
+
+        if cursor is None:
+            rows = list(queryset[: page_size + 1])
+            has_next = len(rows) > page_size
+            rows = rows[:page_size]
+            has_previous = False
+            offset = 0
+        elif cursor["direction"] == "next":
+            seek = self._build_keyset_filter(ordering, cursor, reverse=False)
+            rows = list(queryset.filter(seek)[: page_size + 1])
+            has_next = len(rows) > page_size
+            rows = rows[:page_size]
+            has_previous = True
+            offset = cursor["offset"]
+        else:
+            seek = self._build_keyset_filter(ordering, cursor, reverse=True)
+            rows = list(queryset.reverse().filter(seek)[: page_size + 1])
+            has_previous = len(rows) > page_size
+            rows = rows[:page_size][::-1]
+            has_next = True
+            offset = max(cursor["offset"] - len(rows), 0) if has_previous else 0
+
+        next_query_string = ""
+        previous_query_string = ""
+        if has_next and rows:
+            next_query_string = self._build_keyset_query_string(
+                self._encode_keyset_cursor(
+                    ordering, rows[-1], "next", offset + len(rows), query_key
+                )
+            )
+        if has_previous:
+            previous_query_string = self._build_keyset_query_string(
+                self._encode_keyset_cursor(
+                    ordering, rows[0], "previous", offset, query_key
+                )
+                if rows
+                else None
+            )
+
+        return KeysetPage(
+            rows,
+            SequentialPaginator(
+                queryset, page_size, self._get_record_count_getter(queryset)
+            ),
+            offset=offset,
+            has_next=has_next,
+            has_previous=has_previous,
+            next_query_string=next_query_string,
+            previous_query_string=previous_query_string,
+        )
+
+    def _get_keyset_query_key(self) -> str:
+        """
+        Return a short hash of the filter and sort parameters.
+
+        Cursors embed this key, so a cursor from before a filter or sort change
+        is ignored rather than seeking into a different result set.
+        """
+        query = build_navigation_querydict(
+            self.request.GET,
+            exclude={"page", "page_size", KEYSET_CURSOR_QUERY_PARAM},
+        )
+        encoded = urlencode(sorted(query.lists()), doseq=True)
+        return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+    def _build_keyset_query_string(self, cursor: str | None) -> str:
+        """Return the current navigation query string with ``cursor`` set."""
+        query = build_navigation_querydict(
+            self.request.GET,
+            exclude={"page", KEYSET_CURSOR_QUERY_PARAM},
+        )
+        if cursor:
+            query[KEYSET_CURSOR_QUERY_PARAM] = cursor
+        return urlencode(list(query.lists()), doseq=True)
+
+    @staticmethod
+    def _get_keyset_row_value(obj, path: str | None) -> Any:
+        """Read the ``__``-separated ``path`` (or the pk) from a row object."""
+        if path is None:
+            return obj.pk
+        value = obj
+        for part in path.split("__"):
+            value = getattr(value, part)
+        return value
+
+    @staticmethod
+    def _serialize_keyset_value(value: Any) -> Any:
+        """Return a JSON-safe form of a seek value that ``to_python()`` accepts."""
+        if value is None or isinstance(value, (bool, int, float, str)):
+            return value
+        if isinstance(value, (date, datetime, time)):
+            return value.isoformat()
+        return str(value)
+
+    def _encode_keyset_cursor(
+        self,
+        ordering: KeysetOrdering,
+        obj,
+        direction: str,
+        offset: int,
+        query_key: str,
+    ) -> str:
+        """Return a signed, opaque cursor for seeking from ``obj``."""
+        payload = {
+            "d": "n" if direction == "next" else "p",
+            "o": offset,
+            "q": query_key,
+            "v": self._serialize_keyset_value(
+                self._get_keyset_row_value(obj, ordering.sort_path)
+            ),
+            "k": self._serialize_keyset_value(obj.pk),
+        }
+        return signing.dumps(payload, salt=_KEYSET_CURSOR_SALT, compress=True)
+
+    def _decode_keyset_cursor(
+        self,
+        cursor: str,
+        ordering: KeysetOrdering,
+        query_key: str,
+    ) -> dict[str, Any] | None:
+        """Return the decoded cursor, or ``None`` when it is missing or invalid."""
+        if not cursor:
+            return None
+        try:
+            payload = signing.loads(cursor, salt=_KEYSET_CURSOR_SALT)
+            if payload.get("q") != query_key or payload.get("d") not in {"n", "p"}:
+                return None
+            offset = int(payload["o"])
+            return {
+                "direction": "next" if payload["d"] == "n" else "previous",
+                "offset": max(offset, 0),
+                "value": ordering.sort_field.to_python(payload["v"]),
+                "pk": ordering.pk_field.to_python(payload["k"]),
+            }
+        except (signing.BadSignature, ValidationError, KeyError, TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _build_keyset_filter(
+        ordering: KeysetOrdering,
+        cursor: dict[str, Any],
+        *,
+        reverse: bool,
+    ) -> Q:
+        """
+        Return the seek predicate for rows after (or before) the cursor row.
+
+        ``(sort, pk) > (value, pk)`` is written as ``sort >= value AND (sort >
+        value OR pk > pk)`` so the leading range condition can use an index on
+        the sort column.
+        """
+        lookup = "lt" if ordering.descending != reverse else "gt"
+        if ordering.sort_path is None:
+            return Q(**{f"pk__{lookup}": cursor["pk"]})
+        sort_path = ordering.sort_path
+        return Q(**{f"{sort_path}__{lookup}e": cursor["value"]}) & (
+            Q(**{f"{sort_path}__{lookup}": cursor["value"]})
+            | Q(**{f"pk__{lookup}": cursor["pk"]})
+        )
+
+    def get_list_stream_chunk_size(self) -> int | None:
+        """
+        Return the chunk size for streamed unpaginated lists, or ``None``.
+
+        Streaming is opt-in through ``page_size_all_streaming``.
+        """
+        cfg = resolve_config(self)
+        if not getattr(cfg, "page_size_all_streaming", False):
+            return None
+        return getattr(cfg, "page_size_all_stream_chunk_size", None) or 500
+
+    def get_list_stream(self, queryset) -> ListStream | None:
+        """
+        Start streaming ``queryset`` when unpaginated streaming is enabled.
+
+        Reads the first chunk from ``queryset.iterator(chunk_size=...)`` so the
+        page renders with real rows. Returns ``None`` when streaming is off or
+        ``queryset`` cannot be iterated in chunks.
+
+        Also returns ``None`` inside a transaction, e.g. with
+        ``ATOMIC_REQUESTS``: the response is consumed after the view returns,
+        and the transaction's commit would close the cursor mid-stream.
+        """
+        chunk_size = self.get_list_stream_chunk_size()
+        if not chunk_size or not hasattr(queryset, "iterator"):
+            return None
+        if connections[queryset.db].in_atomic_block:
+            return None
+        rows = queryset.iterator(chunk_size=chunk_size)
+        first_rows = list(islice(rows, chunk_size))
+        stream = ListStream(first_rows=first_rows, rows=rows, chunk_size=chunk_size)
+        if len(first_rows) == chunk_size:
+            stream.marker = mark_safe(
+                f"<!--powercrud-list-stream-{uuid.uuid4().hex}-->"
+            )
+        return stream
+
+    def stream_list_response(self, response, list_stream: ListStream, context):
+        """
+        Turn a rendered list response into a ``StreamingHttpResponse``.
+
+        The page (or HTMX fragment) up to the stream marker is sent first, then
+        each remaining chunk as table rows, then the rest of the page. Table
+        shells without the marker fall back to rendering every row at once.
+        """
+        if not list_stream.marker or getattr(response, "streaming", False):
+            return response
+        if callable(getattr(response, "render", None)):
+            response.render()
+        content = response.content.decode(response.charset)
+        if list_stream.marker not in content:
+            all_rows = [*list_stream.first_rows, *list_stream.rows]
+            for key, value in list(context.items()):
+                if value is list_stream.first_rows:
+                    context[key] = all_rows
+            context["list_stream"] = None
+            self.object_list = all_rows
+            return self.render_to_response(context)
+
+        head, tail = content.split(list_stream.marker, 1)
+
+        def stream_content():
+            yield head
+            for chunk in list_stream.iter_chunks():
+                yield powercrud_tags.render_object_list_rows(context, chunk, self)
+            yield tail
+
+        streaming_response = StreamingHttpResponse(
+            stream_content(),
+            status=response.status_code,
+            content_type=response["Content-Type"],
+        )
+        for header, value in response.items():
+            if header.lower() not in {"content-type", "content-length"}:
+                streaming_response[header] = value
+        for cookie in response.cookies.values():
+            streaming_response.cookies[cookie.key] = cookie
+        return streaming_response
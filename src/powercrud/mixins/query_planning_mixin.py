@@ -0,0 +1,301 @@
+"""Related-object query planning for PowerCRUD list and detail querysets."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.query import ModelIterable
+from neapolitan.views import Role
+
+from .config_mixin import resolve_config
+
+
+@dataclass(frozen=True)
+class ListQueryPlan:
+    """Related lookups and column projection to apply to a list or detail queryset."""
+
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[str, ...] = ()
+    only: tuple[str, ...] = ()
+
+    def is_empty(self) -> bool:
+        """Return True when the plan would leave the queryset unchanged."""
+        return not (self.select_related or self.prefetch_related or self.only)
+
+
+class QueryPlanningMixin:
+    """
+    Apply ``select_related``/``prefetch_related`` for the columns being rendered.
+
+    List cells render forward relations with ``str(obj.<fk>)`` and many-to-many
+    columns with ``obj.<m2m>.all()``. Without related lookups each of those costs
+    one query per row. The planner inspects the active list columns,
+    ``link_fields``, detail fields, and relation sort expressions, then joins or
+    prefetches exactly those relations.
+
+    Set ``auto_related_lookups = False`` to opt out, or override
+    ``get_list_query_plan()`` / ``get_detail_query_plan()`` to supply a plan.
+
+    With ``list_column_projection = True`` the list queryset also loads only
+    the concrete columns the table needs. Properties declare what they read
+    through ``property_field_dependencies``.
+    """
+
+    def get_auto_related_lookups_enabled(self) -> bool:
+        """Return whether related lookups should be planned automatically."""
+        return getattr(resolve_config(self), "auto_related_lookups", True) is not False
+
+    def get_list_column_projection_enabled(self) -> bool:
+        """Return whether list querysets should load only the rendered columns."""
+        return bool(getattr(resolve_config(self), "list_column_projection", False))
+
+    def get_property_field_dependencies(self) -> dict[str, list[str]]:
+        """Return the declared model-field dependencies keyed by property name."""
+        return getattr(resolve_config(self), "property_field_dependencies", {}) or {}
+
+    def get_list_query_plan(
+        self,
+        queryset: Any,
+        active_columns: Iterable[str],
+    ) -> ListQueryPlan:
+        """
+        Return the related lookups needed to render ``active_columns``.
+
+        Override this hook to replace the automatic plan for a view.
+        """
+        active_columns = list(active_columns)
+        select_related: list[str] = []
+        prefetch_related: list[str] = []
+        property_dependencies = self.get_property_field_dependencies()
+
+        for column_name in active_columns:
+            self._plan_related_field(column_name, select_related, prefetch_related)
+            for dependency in property_dependencies.get(column_name, ()):
+                self._plan_related_field(
+                    dependency.split("__", 1)[0], select_related, prefetch_related
+                )
+                relation_path = self._get_single_valued_relation_path(dependency)
+                if relation_path and relation_path not in select_related:
+                    select_related.append(relation_path)
+
+        link_fields = getattr(resolve_config(self), "link_fields", {}) or {}
+        for column_name in active_columns:
+            link_config = link_fields.get(column_name)
+            pk_attr = (
+                link_config.get("pk_attr") if isinstance(link_config, dict) else None
+            )
+            if isinstance(pk_attr, str) and pk_attr.strip():
+                self._plan_related_field(
+                    pk_attr.strip(), select_related, prefetch_related
+                )
+
+        for expression in getattr(getattr(queryset, "query", None), "order_by", ()):
+            if not isinstance(expression, str):
+                continue
+            relation_path = self._get_single_valued_relation_path(
+                expression.lstrip("-")
+            )
+            if relation_path and relation_path not in select_related:
+                select_related.append(relation_path)
+
+        only: tuple[str, ...] = ()
+        if self.get_list_column_projection_enabled():
+            only = (
+                self.get_list_projection_fields(
+                    queryset,
+                    active_columns,
+                    select_related=select_related,
+                )
+                or ()
+            )
+
+        return ListQueryPlan(
+            select_related=tuple(select_related),
+            prefetch_related=tuple(prefetch_related),
+            only=only,
+        )
+
+    def get_list_projection_fields(
+        self,
+        queryset: Any,
+        active_columns: Iterable[str],
+        select_related: Iterable[str] = (),
+    ) -> tuple[str, ...] | None:
+        """
+        Return the concrete fields a projected list queryset must load.
+
+        The projection covers the primary key, active field columns, declared
+        property dependencies, ``link_fields`` ``pk_attr`` values, sort keys,
+        and the relations being joined. Returns ``None`` when an active property
+        has no declared dependencies, because projecting would then trigger a
+        deferred-field query per row.
+        """
+        model = getattr(self, "model", None)
+        if model is None:
+            return None
+        cfg = resolve_config(self)
+        properties = set(getattr(cfg, "properties", []) or [])
+        property_dependencies = self.get_property_field_dependencies()
+        link_fields = getattr(cfg, "link_fields", {}) or {}
+        projected: list[str] = [model._meta.pk.name]
+
+        def project(name: str) -> None:
+            try:
+                field = model._meta.get_field(name.split("__", 1)[0])
+            except FieldDoesNotExist:
+                return
+            if (
+                getattr(field, "concrete", False)
+                and not getattr(field, "many_to_many", False)
+                and field.name not in projected
+            ):
+                projected.append(field.name)
+
+        for column_name in active_columns:
+            if column_name in properties:
+                if column_name not in property_dependencies:
+                    return None
+                for dependency in property_dependencies[column_name]:
+                    project(dependency)
+                continue
+            project(column_name)
+            link_config = link_fields.get(column_name)
+            if isinstance(link_config, dict) and isinstance(
+                link_config.get("pk_attr"), str
+            ):
+                project(link_config["pk_attr"].strip())
+
+        for expression in getattr(getattr(queryset, "query", None), "order_by", ()):
+            if isinstance(expression, str):
+                project(expression.lstrip("-"))
+        for relation_path in select_related:
+            project(relation_path)
+
+        return tuple(projected)
+
+    def get_detail_query_plan(self, queryset: Any) -> ListQueryPlan:
+        """
+        Return the related lookups needed to render the configured detail fields.
+
+        Override this hook to replace the automatic plan for detail views.
+        """
+        select_related: list[str] = []
+        detail_fields = getattr(resolve_config(self), "detail_fields", []) or []
+        for field_name in detail_fields:
+            # Detail pages render many-to-many managers as text, so only
+            # single-valued relations need joining.
+            self._plan_related_field(field_name, select_related, [])
+        return ListQueryPlan(select_related=tuple(select_related))
+
+    def apply_list_query_plan(self, queryset: Any, plan: ListQueryPlan) -> Any:
+        """Apply ``plan`` to ``queryset`` when the queryset supports it."""
+        if plan.is_empty() or not self._queryset_supports_related_lookups(queryset):
+            return queryset
+        if plan.select_related:
+            queryset = queryset.select_related(*plan.select_related)
+        deferred_names, _ = queryset.query.deferred_loading
+        if plan.only and not deferred_names:
+            # Respect an explicit only()/defer() from the view's get_queryset().
+            queryset = queryset.only(*plan.only)
+        if plan.prefetch_related:
+            existing = set(getattr(queryset, "_prefetch_related_lookups", ()) or ())
+            missing = [name for name in plan.prefetch_related if name not in existing]
+            if missing:
+                queryset = queryset.prefetch_related(*missing)
+        return queryset
+
+    def plan_list_queryset(
+        self,
+        queryset: Any,
+        list_column_state: Any | None = None,
+    ) -> Any:
+        """Plan and apply related lookups for the final list queryset."""
+        if not self.get_auto_related_lookups_enabled():
+            return queryset
+        if list_column_state is not None:
+            active_columns = list(getattr(list_column_state, "active_columns", ()))
+        else:
+            cfg = resolve_config(self)
+            active_columns = [
+                *(getattr(cfg, "fields", []) or []),
+                *(getattr(cfg, "properties", []) or []),
+            ]
+        plan = self.get_list_query_plan(queryset, active_columns)
+        return self.apply_list_query_plan(queryset, plan)
+
+    def plan_detail_queryset(self, queryset: Any) -> Any:
+        """Join detail-field relations when resolving the object for a detail view."""
+        if (
+            getattr(self, "role", None) != Role.DETAIL
+            or not self.get_auto_related_lookups_enabled()
+        ):
+            return queryset
+        return self.apply_list_query_plan(
+            queryset,
+            self.get_detail_query_plan(queryset),
+        )
+
+    def _plan_related_field(
+        self,
+        field_name: str,
+        select_related: list[str],
+        prefetch_related: list[str],
+    ) -> None:
+        """Add ``field_name`` to the matching lookup list when it is a relation."""
+        model = getattr(self, "model", None)
+        if model is None:
+            return
+        try:
+            field = model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return
+        if not getattr(field, "is_relation", False) or field.name != field_name:
+            # ``get_field()`` also resolves attnames such as ``author_id``,
+            # which read the stored key without touching the relation.
+            return
+        if field.many_to_many:
+            if field_name not in prefetch_related:
+                prefetch_related.append(field_name)
+            return
+        if field.many_to_one or field.one_to_one:
+            if field_name not in select_related:
+                select_related.append(field_name)
+
+    def _get_single_valued_relation_path(self, expression: str) -> str | None:
+        """
+        Return the leading forward/one-to-one relation path of a lookup expression.
+
+        ``author__name`` resolves to ``author``; expressions that do not start
+        with a single-valued relation resolve to ``None``.
+        """
+        model = getattr(self, "model", None)
+        if model is None or "__" not in expression:
+            return None
+        relation_parts: list[str] = []
+        for part in expression.split("__")[:-1]:
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                break
+            if not (
+                getattr(field, "is_relation", False)
+                and (field.many_to_one or field.one_to_one)
+            ):
+                break
+            relation_parts.append(part)
+            model = field.related_model
+        return "__".join(relation_parts) or None
+
+    @staticmethod
+    def _queryset_supports_related_lookups(queryset: Any) -> bool:
+        """Return whether ``queryset`` yields model instances and allows joins."""
+        query = getattr(queryset, "query", None)
+        if query is None or not hasattr(queryset, "select_related"):
+            return False
+        if getattr(query, "combinator", None):
+            return False
+        if query.is_sliced:
+            return False
+        return getattr(queryset, "_iterable_class", None) is ModelIterable
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+from functools import reduce
+from operator import or_
+from typing import Any
+from urllib.parse import urlencode
+
+from django import forms
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+from django.http import HttpResponseNotAllowed, JsonResponse
+
+from powercrud.filter_options import get_option_index, is_label_ordered
+from powercrud.frontend_capabilities import REMOTE_RELATION_OPTIONS, frontend_supports
+from powercrud.logging import get_logger
+
+from .config_mixin import resolve_config
+
+log = get_logger(__name__)
+
+RELATION_OPTION_SURFACES = ("filter", "form", "bulk")
+RELATION_OPTION_LABEL_FIELDS = ("name", "title", "label", "display_name")
+REMOTE_OPTIONS_URL_ATTR = "data-powercrud-options-url"
+REMOTE_OPTIONS_DEPENDS_ON_ATTR = "data-powercrud-options-depends-on"
+SEARCHABLE_WIDGET_ATTRS = (
+    "data-powercrud-searchable-select",
+    "data-powercrud-searchable-multiselect",
+)
+
+
+class RelationOptionsMixin:
+    """
+    Serve paginated relation options for searchable selects.
+
+    When `remote_relation_options` is enabled, searchable FK and M2M selects in
+    filters, forms, and the bulk-edit modal render only their selected values
+    and fetch the rest from the `relation-options` endpoint as the user types.
+    """
+
+    relation_options_action: str | None = None
+
+    def get_relation_options_endpoint_name(self) -> str | None:
+        """Return the URL name that serves remote relation options."""
+        return f"{self.get_prefix()}-relation-options"
+
+    def uses_remote_relation_options(self, field_name: str) -> bool:
+        """
+        Return whether ``field_name`` loads its options from the endpoint.
+
+        Always ``False`` when the frontend runtime cannot fetch remote options,
+        so selects keep every option instead of only the selected ones.
+        """
+        if not frontend_supports(REMOTE_RELATION_OPTIONS):
+            return False
+        setting = resolve_config(self).remote_relation_options
+        if isinstance(setting, (list, tuple, set)):
+            return field_name in setting
+        return bool(setting)
+
+    def get_relation_options_page_size(self) -> int:
+        """Return how many options one endpoint page holds."""
+        return int(resolve_config(self).relation_options_page_size)
+
+    def get_relation_options_url(
+        self,
+        field_name: str,
+        surface: str,
+    ) -> str | None:
+        """Return the options endpoint URL for one field on one surface."""
+        endpoint_name = self.get_relation_options_endpoint_name()
+        if not endpoint_name:
+            return None
+        url = self.safe_reverse(endpoint_name, kwargs={"field_name": field_name})
+        if url is None:
+            return None
+        return f"{url}?{urlencode({'surface': surface})}"
+
+    def list(self, request, *args, **kwargs):
+        """Route relation option requests before normal list rendering."""
+        if getattr(self, "relation_options_action", None) == "options":
+            return self.handle_relation_options_request(request, *args, **kwargs)
+        return super().list(request, *args, **kwargs)
+
+    def post(self, request, *args, **kwargs):
+        """Reject mutation-style requests to the relation options endpoint."""
+        if getattr(self, "relation_options_action", None) == "options":
+            return HttpResponseNotAllowed(["GET"])
+        return super().post(request, *args, **kwargs)
+
+    def handle_relation_options_request(self, request, *args, **kwargs):
+        """
+        Return one page of options for a remote relation select.
+
+        Query parameters:
+            surface: ``filter``, ``form``, or ``bulk``; defaults to ``form``.
+            q: Optional search term matched against the option labels.
+            page: 1-based page number.
+            Any other parameter is read as a parent value for
+            `field_queryset_dependencies` on the ``form`` surface.
+        """
+        if request.method != "GET":
+            return HttpResponseNotAllowed(["GET"])
+
+        self.request = request
+        self.kwargs = kwargs
+        field_name = kwargs.get("field_name")
+        surface = request.GET.get("surface") or "form"
+        if surface not in RELATION_OPTION_SURFACES or not (
+            self.uses_remote_relation_options(field_name)
+        ):
+            return JsonResponse(
+                {"error": "Remote options are not configured for this field."},
+                status=404,
+            )
+
+        field = self.get_relation_options_field(field_name, surface)
+        if field is None:
+            return JsonResponse(
+                {"error": "Remote options are not available for this field."},
+                status=404,
+            )
+
+        try:
+            page_number = max(1, int(request.GET.get("page") or 1))
+        except ValueError:
+            page_number = 1
+        term = (request.GET.get("q") or "").strip()
+        results, has_more = self.get_relation_option_page(
+            field_name, field, term=term, page_number=page_number
+        )
+        return JsonResponse(
+            {"results": results, "page": page_number, "has_more": has_more}
+        )
+
+    def get_relation_options_field(
+        self, field_name: str, surface: str
+    ) -> forms.ModelChoiceField | None:
+        """
+        Return the form field whose queryset backs ``field_name`` on ``surface``.
+
+        Filters reuse the generated filterset, so `filter_queryset_options` and
+        `dropdown_sort_options` apply. Forms bind the request parameters so
+        `field_queryset_dependencies` can scope by parent values. Bulk edit uses
+        `get_bulk_choices_for_field()`, and only for editable `bulk_fields`.
+        """
+        if surface == "filter":
+            get_filterset = getattr(self, "get_filterset", None)
+            filterset = (
+                get_filterset(self.get_queryset()) if callable(get_filterset) else None
+            )
+            form = getattr(filterset, "form", None)
+            field = form.fields.get(field_name) if form is not None else None
+        elif surface == "bulk":
+            field = None
+            get_choices = getattr(self, "get_bulk_choices_for_field", None)
+            bulk_update_getter = getattr(self, "get_bulk_update_enabled", None)
+            bulk_update_enabled = callable(bulk_update_getter) and bulk_update_getter()
+            try:
+                model_field = self.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                model_field = None
+            if (
+                callable(get_choices)
+                and model_field is not None
+                and bulk_update_enabled
+                and field_name in resolve_config(self).bulk_fields
+            ):
+                queryset = get_choices(field_name=field_name, field=model_field)
+                if queryset is not None:
+                    field = forms.ModelChoiceField(queryset=queryset, required=False)
+        else:
+            form = self.get_form_class()(data=self.request.GET)
+            apply_dependencies = getattr(
+                self, "_apply_field_queryset_dependencies", None
+            )
+            if callable(apply_dependencies):
+                form = apply_dependencies(form)
+            field = form.fields.get(field_name)
+
+        if not isinstance(field, forms.ModelChoiceField):
+            return None
+        return field
+
+    def get_relation_option_search_fields(
+        self, field_name: str, related_model
+    ) -> list[str]:
+        """
+        Return the related-model fields matched against the search term.
+
+        Defaults to the first of ``name``, ``title``, ``label``, or
+        ``display_name``, or else every concrete text field.
+        """
+        field_names = {field.name for field in related_model._meta.concrete_fields}
+        for candidate in RELATION_OPTION_LABEL_FIELDS:
+            if candidate in field_names:
+                return [candidate]
+        return [
+            field.name
+            for field in related_model._meta.concrete_fields
+            if isinstance(field, (models.CharField, models.TextField))
+        ]
+
+    def get_relation_option_page(
+        self,
+        field_name: str,
+        field: forms.ModelChoiceField,
+        *,
+        term: str = "",
+        page_number: int = 1,
+    ) -> tuple[list[dict[str, str]], bool]:
+        """
+        Return ``([{"value", "label"}, ...], has_more)`` for one page.
+
+        Ordered querysets are searched and sliced in the database. Unordered and
+        ``__str__``-ordered querysets are listed through the cached option index
+        so the pages follow the same order as a fully rendered dropdown.
+        """
+        page_size = self.get_relation_options_page_size()
+        start = (page_number - 1) * page_size
+        queryset = field.queryset
+
+        if not queryset.ordered or is_label_ordered(queryset):
+            options = get_option_index(field)
+            if term:
+                needle = term.lower()
+                options = [option for option in options if needle in option[1].lower()]
+            page = options[start : start + page_size + 1]
+        else:
+            if term:
+                search_fields = self.get_relation_option_search_fields(
+                    field_name, queryset.model
+                )
+                if not search_fields:
+                    return [], False
+                queryset = queryset.filter(
+                    reduce(
+                        or_,
+                        (
+                            models.Q(**{f"{name}__icontains": term})
+                            for name in search_fields
+                        ),
+                    )
+                )
+            page = [
+                (field.prepare_value(obj), field.label_from_instance(obj))
+                for obj in queryset[start : start + page_size + 1]
+            ]
+
+        results = [
+            {"value": str(value), "label": str(label)}
+            for value, label in page[:page_size]
+        ]
+        return results, len(page) > page_size
+
+    def apply_remote_relation_options(
+        self, form: forms.BaseForm | None, *, surface: str
+    ) -> forms.BaseForm | None:
+        """
+        Limit remote relation selects on ``form`` to their selected options.
+
+        Only selects the searchable-select adapter enhances are switched to
+        remote loading; native selects keep every option.
+        """
+        if form is None:
+            return form
+        dependencies = {}
+        if surface == "form":
+            dependency_getter = getattr(self, "get_field_queryset_dependencies", None)
+            if callable(dependency_getter):
+                dependencies = dependency_getter(
+                    available_fields=set(form.fields.keys()),
+                    warn_on_unavailable=False,
+                )
+
+        for field_name, field in form.fields.items():
+            if not isinstance(field, forms.ModelChoiceField):
+                continue
+            if not self.uses_remote_relation_options(field_name):
+                continue
+            widget_attrs = field.widget.attrs
+            if not any(
+                widget_attrs.get(attr) == "true" for attr in SEARCHABLE_WIDGET_ATTRS
+            ):
+                continue
+            url = self.get_relation_options_url(field_name, surface)
+            if url is None:
+                continue
+
+            field.widget.choices = self._get_selected_relation_choices(
+                form, field_name, field
+            )
+            widget_attrs[REMOTE_OPTIONS_URL_ATTR] = url
+            depends_on = (dependencies.get(field_name) or {}).get("depends_on") or []
+            if depends_on:
+                widget_attrs[REMOTE_OPTIONS_DEPENDS_ON_ATTR] = ",".join(depends_on)
+        return form
+
+    def _get_selected_relation_choices(
+        self, form: forms.BaseForm, field_name: str, field: forms.ModelChoiceField
+    ) -> list[tuple[Any, str]]:
+        """Return the blank choice, any null sentinel, and the selected options."""
+        choices: list[tuple[Any, str]] = []
+        if field.empty_label is not None:
+            choices.append(("", field.empty_label))
+        null_value = getattr(field, "null_value", None)
+        if null_value is not None:
+            choices.append((null_value, field.null_label))
+
+        value = form[field_name].value()
+        values = value if isinstance(value, (list, tuple)) else [value]
+        values = [
+            item
+            for item in values
+            if item not in ("", None) and (null_value is None or item != null_value)
+        ]
+        if not values:
+            return choices
+
+        key = field.to_field_name or "pk"
+        try:
+            selected = list(field.queryset.filter(**{f"{key}__in": values}))
+        except (TypeError, ValueError, ValidationError):
+            return choices
+        choices.extend(
+            (field.prepare_value(obj), field.label_from_instance(obj))
+            for obj in selected
+        )
+        return choices
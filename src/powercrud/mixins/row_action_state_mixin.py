@@ -5,12 +5,15 @@ from typing import Any
 from django.http import HttpResponseNotAllowed, JsonResponse
 from neapolitan.views import Role
 
+from powercrud.logging import get_logger
 from powercrud.row_actions import (
     is_lazy_row_action_state_action,
     is_row_actions_dropdown_mode,
     resolve_extra_action_runtime_state,
 )
 
+log = get_logger(__name__)
+
 
 class RowActionStateMixin:
     """Serve lazy row-action state for dropdown extra actions."""
@@ -49,11 +52,15 @@ class RowActionStateMixin:
         lock_reason = getattr(obj, "_blocked_reason", None)
         lock_label = getattr(obj, "_blocked_label", None)
 
+        batched_states = self._get_batched_extra_action_states(obj, request)
+
         actions: dict[str, dict[str, Any]] = {}
         for index, action in enumerate(getattr(self, "extra_actions", []) or []):
             if not is_lazy_row_action_state_action(action):
                 continue
-            state = resolve_extra_action_runtime_state(
+            state = batched_states.get(
+                str(index)
+            ) or resolve_extra_action_runtime_state(
                 view=self,
                 object=obj,
                 action=action,
@@ -62,13 +69,56 @@ class RowActionStateMixin:
                 lock_label=lock_label,
             )
             actions[str(index)] = {
-                "hidden": bool(state["hidden"]),
-                "disabled": bool(state["disabled"]),
+                "hidden": bool(state.get("hidden")),
+                "disabled": bool(state.get("disabled")),
                 "reason": state.get("reason") or None,
             }
 
         return JsonResponse({"actions": actions})
 
+    def get_extra_action_states(
+        self, objects, request
+    ) -> dict[Any, dict[int, dict[str, Any]]] | None:
+        """
+        Return extra-action state for a whole list page.
+
+        The list renderer calls this once per page. Return a dict keyed by pk
+        whose values map an ``extra_actions`` index to
+        ``{"hidden": bool, "disabled": bool, "reason": str | None}``. Actions
+        missing from the result fall back to their per-row ``permission``,
+        ``hidden_if``, and ``disabled_if`` hooks, so returning ``None`` keeps
+        the per-row behaviour.
+        """
+        return None
+
+    def _get_batched_extra_action_states(
+        self, obj: Any, request
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Return batched extra-action state for one row keyed by ``str(index)``.
+
+        Like list rendering, a hook that raises or returns something other than
+        a dict is logged and ignored, so the per-row hooks decide instead.
+        """
+        try:
+            states = self.get_extra_action_states([obj], request)
+        except Exception:
+            log.warning(
+                "get_extra_action_states() failed; using per-row hooks.",
+                exc_info=True,
+            )
+            return {}
+        if not isinstance(states, dict):
+            return {}
+        row_states = states.get(obj.pk) or states.get(str(obj.pk)) or {}
+        if not isinstance(row_states, dict):
+            return {}
+        return {
+            str(index): state
+            for index, state in row_states.items()
+            if isinstance(state, dict)
+        }
+
     def get_row_action_states_url(self, obj: Any) -> str | None:
         """Return the lazy row-action state endpoint URL for one object."""
         endpoint_name = self.get_row_action_states_endpoint_name()
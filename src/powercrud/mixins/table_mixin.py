@@ -165,6 +165,20 @@ class TableMixin:
         """
         return None
 
+    def get_row_permission_states(self, objects, request) -> dict[Any, dict] | None:
+        """
+        Return row permission and row-state values for a whole list page.
+
+        The list renderer calls this once per page with the rows being rendered.
+        Return a dict keyed by pk whose values may contain any of
+        ``detail_permission``, ``update_permission``, ``delete_permission``,
+        ``can_update``, ``update_disabled_reason``, ``can_delete``,
+        ``delete_disabled_reason``, ``can_inline_edit``, and ``inline_locked``.
+        Missing rows or keys fall back to the per-row hooks, so returning
+        ``None`` keeps the per-row behaviour.
+        """
+        return None
+
     def get_view_title(self) -> str:
         """
         Return the visible heading for the list page.
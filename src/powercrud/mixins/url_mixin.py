@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from django.urls import path, reverse, NoReverseMatch
 from django.utils.decorators import classonlymethod
 from django.core.exceptions import ImproperlyConfigured
@@ -20,6 +22,14 @@ from .config_mixin import (
 
 log = get_logger(__name__)
 
+# Placeholder row values used to reverse a URL pattern once per request. They
+# are valid for Django's int/uuid converters (and str/slug/path) and unlikely
+# to appear anywhere else in a URL.
+_REVERSE_TEMPLATE_SENTINELS = {
+    int: 918273645546372819,
+    UUID: UUID("5e47f1e1-5e47-4f1e-8e47-f1e15e47f1e1"),
+}
+
 
 class UrlMixin:
     """
@@ -128,11 +138,76 @@ class UrlMixin:
         Returns:
             str or None: The reversed URL if successful, None otherwise.
         """
+        template_key = self._get_reverse_template_key(viewname, kwargs)
+        if template_key is not None:
+            url_template = self._get_reverse_template(template_key, kwargs)
+            if url_template is not None:
+                prefix, suffix = url_template
+                return f"{prefix}{kwargs[template_key[1]]}{suffix}"
         try:
             return reverse(viewname, kwargs=kwargs)
         except NoReverseMatch:
             return None
 
+    @staticmethod
+    def _get_reverse_template_key(viewname, kwargs) -> tuple | None:
+        """
+        Return the per-request URL template key for a row-level reverse.
+
+        Only reverses with exactly one non-negative integer or UUID kwarg (the
+        row pk) and string values for the rest qualify. Everything else is
+        reversed normally.
+        """
+        if not isinstance(viewname, str) or not kwargs:
+            return None
+        row_kwarg = None
+        fixed_kwargs = []
+        for name, value in kwargs.items():
+            if (type(value) is int and value >= 0) or type(value) is UUID:
+                if row_kwarg is not None:
+                    return None
+                row_kwarg = name
+            elif isinstance(value, str):
+                fixed_kwargs.append((name, value))
+            else:
+                return None
+        if row_kwarg is None:
+            return None
+        return (
+            viewname,
+            row_kwarg,
+            type(kwargs[row_kwarg]),
+            tuple(sorted(fixed_kwargs)),
+        )
+
+    def _get_reverse_template(self, template_key, kwargs) -> tuple[str, str] | None:
+        """
+        Return the ``(prefix, suffix)`` around the row value for ``template_key``.
+
+        The pattern is reversed once per view instance (so once per request)
+        with a sentinel row value, then checked against a real reverse of
+        ``kwargs``. Patterns whose converters rewrite the value, or that reject
+        the sentinel, are cached as ``None`` and keep using ``reverse()``.
+        """
+        templates = self.__dict__.setdefault("_reverse_templates", {})
+        if template_key in templates:
+            return templates[template_key]
+
+        viewname, row_kwarg, value_type, _ = template_key
+        sentinel = _REVERSE_TEMPLATE_SENTINELS[value_type]
+        url_template = None
+        try:
+            sentinel_url = reverse(viewname, kwargs={**kwargs, row_kwarg: sentinel})
+            real_url = reverse(viewname, kwargs=kwargs)
+        except NoReverseMatch:
+            sentinel_url = real_url = None
+        if sentinel_url and sentinel_url.count(str(sentinel)) == 1:
+            prefix, suffix = sentinel_url.split(str(sentinel))
+            if real_url == f"{prefix}{kwargs[row_kwarg]}{suffix}":
+                url_template = (prefix, suffix)
+        templates[template_key] = url_template
+        return url_template
+
     def get_inline_row_endpoint_name(self) -> str | None:
         """
         Name of the URL that serves inline row form rendering/saving.
@@ -302,6 +377,7 @@ class UrlMixin:
             urls.append(BulkActions.CLEAR_SELECTION.get_url(cls))
             urls.append(BulkActions.TOGGLE_ALL_SELECTION.get_url(cls))
             urls.append(BulkActions.SELECT_ALL_MATCHING.get_url(cls))
+            urls.append(BulkActions.APPLY_SELECTION.get_url(cls))
 
         # Inline editing endpoints
         if cls.has_inline_editing_urls():
@@ -332,6 +408,15 @@ class UrlMixin:
                 )
             )
 
+        if getattr(cfg, "remote_relation_options", False):
+            urls.append(
+                path(
+                    f"{cls.url_base}/relation-options/<str:field_name>/",
+                    cls.as_view(role=Role.LIST, relation_options_action="options"),
+                    name=f"{cls.url_base}-relation-options",
+                )
+            )
+
         if has_lazy_row_action_state(getattr(cfg, "extra_actions", [])):
             lookup_kwarg = getattr(cls, "lookup_url_kwarg", None) or getattr(
                 cls, "lookup_field", "pk"
@@ -638,8 +723,15 @@ class UrlMixin:
         # if selection controls are enabled then pass selected_ids
         request = kwargs.get("request")
         if request and enable_selection_controls:
-            selected_ids = self.get_selected_ids_from_session(request)
-            kwargs["selected_ids"] = selected_ids
-            kwargs["selected_count"] = len(selected_ids)
+            has_predicates = getattr(self, "selection_has_predicates", None)
+            if callable(has_predicates) and has_predicates(request):
+                # Predicate selections are counted, not read id by id; the
+                # bulk ViewMixin adds the selected ids of the rendered page.
+                kwargs["selected_ids"] = []
+                kwargs["selected_count"] = self.get_selected_count(request)
+            else:
+                selected_ids = self.get_selected_ids_from_session(request)
+                kwargs["selected_ids"] = selected_ids
+                kwargs["selected_count"] = len(selected_ids)
 
         return kwargs
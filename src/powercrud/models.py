@@ -1 +1,27 @@
 """Database models for core PowerCRUD state."""
+
+from django.db import models
+
+
+class BulkSelectionEntry(models.Model):
+    """One selected record in a database-backed bulk selection."""
+
+    owner_key = models.CharField(max_length=255)
+    storage_key = models.CharField(max_length=255)
+    object_id = models.CharField(max_length=255)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Bulk-selection entry metadata."""
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=("owner_key", "storage_key", "object_id"),
+                name="uniq_powercrud_bulk_selection_entry",
+            )
+        ]
+
+    def __str__(self) -> str:
+        """Return a readable label for Django admin and debugging."""
+
+        return f"{self.storage_key}: {self.object_id} ({self.owner_key})"
@@ -0,0 +1,433 @@
+"""Pluggable list search backends for quick search and text filters.
+
+Generated text filters used to run ``icontains`` on one column, which forces a
+sequential scan, and lists had no cross-column search at all. A
+``ListSearchBackend`` answers both from an index when the database has one:
+
+- ``sqlite_fts5`` keeps an FTS5 virtual table in sync through model signals
+- ``postgres`` uses a ``tsvector`` match plus ``pg_trgm`` indexes for substrings
+- ``icontains`` is the unindexed fallback, and the previous behaviour
+
+Indexes are built with ``manage.py pcrud_search_index``. Backends for every
+view with ``list_search_fields`` are registered when the app loads, so their
+sync receivers are connected before the first search in a process.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from functools import reduce
+from operator import or_
+from typing import Any
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections, models, router, transaction
+from django.db.backends.utils import truncate_name
+from django.db.models.expressions import RawSQL
+from django.db.models.signals import post_delete, post_save
+from django.utils.module_loading import import_string
+
+SEARCH_SIGNAL_PREFIX = "powercrud:list-search"
+_SEARCH_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# Backends in use, keyed by (backend class, model, fields).
+_SEARCH_BACKENDS: dict[tuple[Any, ...], ListSearchBackend] = {}
+# Models whose save/delete signals already keep their search indexes in sync.
+_WATCHED_MODELS: set[type] = set()
+
+
+class ListSearchBackend:
+    """
+    Base class for list search backends.
+
+    A backend searches ``fields`` of ``model``. Subclasses implement
+    ``filter_queryset()`` and, when they keep their own index, ``is_ready()``,
+    ``build_index()``, ``sync_instance()``, and ``remove_instance()``.
+    """
+
+    name = "base"
+
+    def __init__(self, model, fields: Iterable[str]):
+        self.model = model
+        self.fields = tuple(fields)
+        for field_name in self.fields:
+            field = model._meta.get_field(field_name)
+            if not isinstance(field, (models.CharField, models.TextField)):
+                raise ImproperlyConfigured(
+                    f"list_search_fields entry {field_name} on "
+                    f"{model._meta.label} must be a CharField or TextField."
+                )
+
+    def search(self, queryset, term: str, fields: Iterable[str] | None = None):
+        """
+        Return ``queryset`` narrowed to rows matching ``term``.
+
+        ``fields`` limits the match to some of the backend's fields, as used by
+        per-column text filters. Backends whose index is missing fall back to
+        ``icontains``.
+        """
+        term = (term or "").strip()
+        if not term:
+            return queryset
+        fields = tuple(fields or self.fields)
+        if not self.is_ready(queryset.db):
+            return IcontainsSearchBackend.filter_icontains(queryset, term, fields)
+        return self.filter_queryset(queryset, term, fields)
+
+    def filter_queryset(self, queryset, term: str, fields: tuple[str, ...]):
+        """Return ``queryset`` filtered by ``term`` on ``fields``."""
+        raise NotImplementedError
+
+    def is_ready(self, using: str) -> bool:
+        """Return whether this backend can search on database ``using``."""
+        return True
+
+    def build_index(self, using: str | None = None) -> int | None:
+        """(Re)build the search index and return the rows indexed, if known."""
+        return None
+
+    def sync_instance(self, instance, using: str) -> None:
+        """Update the index entry for a saved ``instance``."""
+
+    def remove_instance(self, instance, using: str) -> None:
+        """Drop the index entry for a deleted ``instance``."""
+
+
+class IcontainsSearchBackend(ListSearchBackend):
+    """Unindexed ``icontains`` search, matching the whole term on any field."""
+
+    name = "icontains"
+
+    @staticmethod
+    def filter_icontains(queryset, term: str, fields: tuple[str, ...]):
+        """Return rows where any of ``fields`` contains ``term``."""
+        return queryset.filter(
+            reduce(or_, (models.Q(**{f"{name}__icontains": term}) for name in fields))
+        )
+
+    def filter_queryset(self, queryset, term: str, fields: tuple[str, ...]):
+        return self.filter_icontains(queryset, term, fields)
+
+
+class SQLiteFTS5SearchBackend(ListSearchBackend):
+    """
+    SQLite FTS5 search over a ``powercrud_fts_<table>`` virtual table.
+
+    Each search token is matched as a prefix, and every token must match.
+    The FTS rowid is the model's integer primary key. Until the table is built
+    with ``build_index()``, searches fall back to ``icontains``. Whether the
+    table exists is looked up once per database connection. A build inside a
+    transaction that has not committed yet is not cached, since a rollback
+    would drop the table again.
+    """
+
+    name = "sqlite_fts5"
+
+    def __init__(self, model, fields: Iterable[str]):
+        super().__init__(model, fields)
+        # Database alias -> (DB-API connection, whether the table existed).
+        self._ready_connections: dict[str, tuple[Any, bool]] = {}
+        # Aliases with a build whose transaction has not committed.
+        self._uncommitted_builds: set[str] = set()
+
+    @property
+    def table_name(self) -> str:
+        """Return the FTS5 virtual table name for the model."""
+        return f"powercrud_fts_{self.model._meta.db_table}"
+
+    def _quote(self, connection, name: str) -> str:
+        return connection.ops.quote_name(name)
+
+    def is_ready(self, using: str) -> bool:
+        connection = connections[using]
+        if connection.vendor != "sqlite":
+            return False
+        if not isinstance(self.model._meta.pk, models.IntegerField):
+            return False
+        cached = self._ready_connections.get(using)
+        if cached is not None and cached[0] is connection.connection:
+            return cached[1]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s",
+                [self.table_name],
+            )
+            ready = cursor.fetchone() is not None
+        if using not in self._uncommitted_builds:
+            self._ready_connections[using] = (connection.connection, ready)
+        return ready
+
+    @staticmethod
+    def build_match_expression(term: str, fields: tuple[str, ...]) -> str | None:
+        """Return an FTS5 ``MATCH`` expression for ``term`` scoped to ``fields``."""
+        tokens = _SEARCH_TOKEN_RE.findall(term)
+        if not tokens:
+            return None
+        columns = " ".join(fields)
+        phrases = []
+        for token in tokens:
+            escaped = token.replace('"', '""')
+            phrases.append(f'{{{columns}}} : "{escaped}"*')
+        return " AND ".join(phrases)
+
+    def filter_queryset(self, queryset, term: str, fields: tuple[str, ...]):
+        match = self.build_match_expression(term, fields)
+        if match is None:
+            return IcontainsSearchBackend.filter_icontains(queryset, term, fields)
+        table = self._quote(connections[queryset.db], self.table_name)
+        return queryset.filter(
+            pk__in=RawSQL(f"SELECT rowid FROM {table} WHERE {table} MATCH %s", [match])
+        )
+
+    def _row_values(self, instance) -> list[str]:
+        """Return the indexed text of ``instance``, with NULL as empty text."""
+        values = []
+        for field_name in self.fields:
+            value = getattr(instance, self.model._meta.get_field(field_name).attname)
+            values.append("" if value is None else str(value))
+        return values
+
+    def build_index(self, using: str | None = None) -> int:
+        using = using or router.db_for_write(self.model)
+        connection = connections[using]
+        table = self._quote(connection, self.table_name)
+        columns = ", ".join(self._quote(connection, name) for name in self.fields)
+        placeholders = ", ".join(["%s"] * (len(self.fields) + 1))
+        rows = 0
+        self._ready_connections.pop(using, None)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            cursor.execute(f"CREATE VIRTUAL TABLE {table} USING fts5({columns})")
+            batch = []
+            for values in (
+                self.model._default_manager.using(using)
+                .values_list("pk", *self.fields)
+                .iterator(chunk_size=2000)
+            ):
+                batch.append(
+                    [
+                        values[0],
+                        *("" if value is None else value for value in values[1:]),
+                    ]
+                )
+                if len(batch) >= 2000:
+                    cursor.executemany(
+                        f"INSERT INTO {table} (rowid, {columns}) VALUES ({placeholders})",
+                        batch,
+                    )
+                    rows += len(batch)
+                    batch = []
+            if batch:
+                cursor.executemany(
+                    f"INSERT INTO {table} (rowid, {columns}) VALUES ({placeholders})",
+                    batch,
+                )
+                rows += len(batch)
+        if connection.in_atomic_block:
+            self._uncommitted_builds.add(using)
+            transaction.on_commit(
+                lambda: self._uncommitted_builds.discard(using), using=using
+            )
+        else:
+            self._ready_connections[using] = (connection.connection, True)
+        return rows
+
+    def sync_instance(self, instance, using: str) -> None:
+        if not self.is_ready(using):
+            return
+        connection = connections[using]
+        table = self._quote(connection, self.table_name)
+        columns = ", ".join(self._quote(connection, name) for name in self.fields)
+        placeholders = ", ".join(["%s"] * (len(self.fields) + 1))
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table} WHERE rowid = %s", [instance.pk])
+            cursor.execute(
+                f"INSERT INTO {table} (rowid, {columns}) VALUES ({placeholders})",
+                [instance.pk, *self._row_values(instance)],
+            )
+
+    def remove_instance(self, instance, using: str) -> None:
+        if not self.is_ready(using):
+            return
+        table = self._quote(connections[using], self.table_name)
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {table} WHERE rowid = %s", [instance.pk])
+
+
+class PostgresSearchBackend(ListSearchBackend):
+    """
+    PostgreSQL search combining a ``tsvector`` match with trigram substrings.
+
+    A row matches when the search text matches the ``to_tsvector`` of the
+    fields, or when any field contains the search text. ``build_index()``
+    adds a GIN expression index for the ``tsvector`` and ``pg_trgm`` GIN
+    indexes that make the ``icontains`` lookups indexable. PostgreSQL keeps
+    both up to date itself, so no signal sync is needed.
+    """
+
+    name = "postgres"
+    search_config = "simple"
+
+    def is_ready(self, using: str) -> bool:
+        return connections[using].vendor == "postgresql"
+
+    def filter_queryset(self, queryset, term: str, fields: tuple[str, ...]):
+        from django.contrib.postgres.search import SearchQuery, SearchVector
+
+        contains = reduce(
+            or_, (models.Q(**{f"{name}__icontains": term}) for name in fields)
+        )
+        return queryset.alias(
+            _powercrud_search=SearchVector(*fields, config=self.search_config)
+        ).filter(
+            models.Q(
+                _powercrud_search=SearchQuery(
+                    term, config=self.search_config, search_type="websearch"
+                )
+            )
+            | contains
+        )
+
+    def get_index_statements(self, connection) -> list[str]:
+        """Return the SQL that creates this backend's indexes."""
+        quote = connection.ops.quote_name
+        table = self.model._meta.db_table
+        max_length = connection.ops.max_name_length()
+        columns = [self.model._meta.get_field(name).column for name in self.fields]
+        statements = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]
+        for column in columns:
+            index_name = truncate_name(f"{table}_{column}_pcrud_trgm", max_length)
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS {quote(index_name)} ON {quote(table)} "
+                f"USING gin (UPPER({quote(column)}::text) gin_trgm_ops)"
+            )
+        document = " || ' ' || ".join(
+            f"COALESCE({quote(column)}, '')" for column in columns
+        )
+        index_name = truncate_name(f"{table}_pcrud_tsvector", max_length)
+        statements.append(
+            f"CREATE INDEX IF NOT EXISTS {quote(index_name)} ON {quote(table)} "
+            f"USING gin (to_tsvector('{self.search_config}'::regconfig, {document}))"
+        )
+        return statements
+
+    def build_index(self, using: str | None = None) -> None:
+        connection = connections[using or router.db_for_write(self.model)]
+        with connection.cursor() as cursor:
+            for statement in self.get_index_statements(connection):
+                cursor.execute(statement)
+
+
+LIST_SEARCH_BACKENDS: dict[str, type[ListSearchBackend]] = {
+    IcontainsSearchBackend.name: IcontainsSearchBackend,
+    SQLiteFTS5SearchBackend.name: SQLiteFTS5SearchBackend,
+    PostgresSearchBackend.name: PostgresSearchBackend,
+}
+_AUTO_BACKENDS = {
+    "sqlite": SQLiteFTS5SearchBackend.name,
+    "postgresql": PostgresSearchBackend.name,
+}
+
+
+def get_list_search_backend_class(model, backend: str | None = "auto"):
+    """
+    Return the backend class for ``backend``.
+
+    ``backend`` is ``"auto"`` (pick by the model's read database), a
+    registered name, or a dotted import path to a ``ListSearchBackend``.
+    """
+    backend = backend or "auto"
+    if backend == "auto":
+        vendor = connections[router.db_for_read(model)].vendor
+        backend = _AUTO_BACKENDS.get(vendor, IcontainsSearchBackend.name)
+    if backend in LIST_SEARCH_BACKENDS:
+        return LIST_SEARCH_BACKENDS[backend]
+    try:
+        return import_string(backend)
+    except ImportError as exc:
+        raise ImproperlyConfigured(
+            f"Unknown list_search_backend {backend!r}; use one of "
+            f"{', '.join(['auto', *LIST_SEARCH_BACKENDS])} or a dotted path."
+        ) from exc
+
+
+def _sync_saved_instance(sender, instance, using, **kwargs) -> None:
+    """Refresh every search index for ``sender`` after a save."""
+    for backend in get_registered_search_backends(sender):
+        backend.sync_instance(instance, using)
+
+
+def _sync_deleted_instance(sender, instance, using, **kwargs) -> None:
+    """Drop ``instance`` from every search index for ``sender``."""
+    for backend in get_registered_search_backends(sender):
+        backend.remove_instance(instance, using)
+
+
+def _watch_model(model) -> None:
+    """Keep ``model``'s search indexes in sync when its rows change."""
+    if model in _WATCHED_MODELS:
+        return
+    dispatch_uid = f"{SEARCH_SIGNAL_PREFIX}:{model._meta.label_lower}"
+    post_save.connect(
+        _sync_saved_instance, sender=model, weak=False, dispatch_uid=dispatch_uid
+    )
+    post_delete.connect(
+        _sync_deleted_instance, sender=model, weak=False, dispatch_uid=dispatch_uid
+    )
+    _WATCHED_MODELS.add(model)
+
+
+def get_list_search_backend(
+    model, fields: Iterable[str], backend: str | None = "auto"
+) -> ListSearchBackend:
+    """
+    Return the shared search backend for ``fields`` of ``model``.
+
+    The first call for a backend connects ``post_save`` and ``post_delete`` so
+    its index stays in sync. ``register_view_search_backend()`` makes that
+    first call for every view when the app loads. ``bulk_create()``,
+    ``update()``, and raw SQL send no signals; rebuild with
+    ``pcrud_search_index`` after those.
+    """
+    backend_class = get_list_search_backend_class(model, backend)
+    key = (backend_class, model, tuple(fields))
+    instance = _SEARCH_BACKENDS.get(key)
+    if instance is None:
+        instance = backend_class(model, fields)
+        _SEARCH_BACKENDS[key] = instance
+        _watch_model(model)
+    return instance
+
+
+def register_view_search_backend(view_class) -> ListSearchBackend | None:
+    """Register the search backend of ``view_class``, if it has search fields."""
+    model = getattr(view_class, "model", None)
+    fields = getattr(view_class, "list_search_fields", None)
+    if model is None or not fields:
+        return None
+    return get_list_search_backend(
+        model, fields, getattr(view_class, "list_search_backend", "auto")
+    )
+
+
+def get_registered_search_backends(model=None) -> list[ListSearchBackend]:
+    """Return the backends in use, optionally only those for ``model``."""
+    return [
+        backend
+        for backend in _SEARCH_BACKENDS.values()
+        if model is None or backend.model is model
+    ]
+
+
+__all__ = [
+    "LIST_SEARCH_BACKENDS",
+    "IcontainsSearchBackend",
+    "ListSearchBackend",
+    "PostgresSearchBackend",
+    "SQLiteFTS5SearchBackend",
+    "get_list_search_backend",
+    "get_list_search_backend_class",
+    "get_registered_search_backends",
+    "register_view_search_backend",
+]
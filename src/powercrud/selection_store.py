@@ -0,0 +1,651 @@
+"""Persistent bulk-selection stores with a compact encoding.
+
+Bulk selections used to live in the session as a list of primary-key strings,
+so every toggle rewrote and re-serialised the whole list. ``SelectionStore``
+keeps one decoded set per request instead, and the backends persist it as:
+
+- ``session``: a compact payload in ``request.session`` (the default)
+- ``cache``: a compact payload in the PowerCRUD cache, keyed by user or session
+- ``database``: one ``BulkSelectionEntry`` row per selected record, so toggles
+  insert or delete one row
+
+Integer primary keys encode as sorted ``[start, end]`` ranges or, for dense
+selections, a bitmap, whichever is shorter. Other keys encode as a sorted list.
+
+A store can also hold ``SelectionPredicate`` entries, the normalised filter
+state of a "select all matching" click, plus the ids the user deselected
+afterwards. Those selections are rebuilt as querysets on the server instead of
+being written out id by id.
+"""
+
+from __future__ import annotations
+
+import base64
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Iterable
+
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from powercrud.conf import get_powercrud_setting
+from powercrud.logging import get_logger
+
+log = get_logger(__name__)
+
+SELECTION_SESSION_KEY = "powercrud_selections"
+SELECTION_PREDICATE_SESSION_KEY = "powercrud_selection_predicates"
+SELECTION_CACHE_PREFIX = "powercrud:selection"
+SELECTION_FORMAT_RANGES = "r"
+SELECTION_FORMAT_BITMAP = "b"
+SELECTION_FORMAT_STRINGS = "s"
+
+
+def _as_int(value: str) -> int | None:
+    """Return ``value`` as a non-negative int when it is written canonically."""
+    if value.isdigit() and (value == "0" or not value.startswith("0")):
+        return int(value)
+    return None
+
+
+def _to_ranges(numbers: list[int]) -> list[int]:
+    """Return sorted ``numbers`` as a flat ``[start, end, start, end, ...]`` list."""
+    ranges: list[int] = []
+    for number in numbers:
+        if ranges and number == ranges[-1] + 1:
+            ranges[-1] = number
+        else:
+            ranges.extend((number, number))
+    return ranges
+
+
+def _to_bitmap(numbers: list[int]) -> tuple[int, str]:
+    """Return ``(offset, base64 bitmap)`` for sorted ``numbers``."""
+    offset = numbers[0]
+    bitmap = bytearray((numbers[-1] - offset) // 8 + 1)
+    for number in numbers:
+        position = number - offset
+        bitmap[position >> 3] |= 1 << (position & 7)
+    return offset, base64.b64encode(bytes(bitmap)).decode("ascii")
+
+
+def encode_selection(ids: Iterable[Any]) -> dict[str, Any]:
+    """
+    Return a compact, JSON-serialisable payload for a set of selected ids.
+
+    Integer ids become ranges or a bitmap, whichever is shorter; any other id
+    falls back to a sorted list of strings.
+    """
+    values = {str(value) for value in ids}
+    numbers = []
+    for value in values:
+        number = _as_int(value)
+        if number is None:
+            return {"f": SELECTION_FORMAT_STRINGS, "d": sorted(values)}
+        numbers.append(number)
+    if not numbers:
+        return {"f": SELECTION_FORMAT_RANGES, "d": []}
+
+    numbers.sort()
+    ranges = _to_ranges(numbers)
+    # Each range costs two numbers plus separators; a bitmap costs 4/3 of a
+    # character per eight ids of span once base64-encoded, plus its offset.
+    range_cost = sum(len(str(number)) + 1 for number in ranges)
+    bitmap_cost = (
+        ((numbers[-1] - numbers[0]) // 8 + 1) * 4 // 3 + len(str(numbers[0])) + 8
+    )
+    if bitmap_cost < range_cost:
+        offset, bitmap = _to_bitmap(numbers)
+        return {"f": SELECTION_FORMAT_BITMAP, "o": offset, "d": bitmap}
+    return {"f": SELECTION_FORMAT_RANGES, "d": ranges}
+
+
+def decode_selection(payload: Any) -> set[str]:
+    """
+    Return the selected ids stored in ``payload``.
+
+    Lists of ids written before the compact encoding are read as they are.
+    """
+    if not payload:
+        return set()
+    if isinstance(payload, (list, tuple)):
+        return {str(value) for value in payload}
+
+    data = payload.get("d") or []
+    kind = payload.get("f")
+    if kind == SELECTION_FORMAT_STRINGS:
+        return {str(value) for value in data}
+    if kind == SELECTION_FORMAT_BITMAP:
+        offset = int(payload.get("o") or 0)
+        ids = set()
+        for index, byte in enumerate(base64.b64decode(data)):
+            while byte:
+                bit = byte & -byte
+                ids.add(str(offset + index * 8 + bit.bit_length() - 1))
+                byte ^= bit
+        return ids
+    ids = set()
+    for start, end in zip(data[::2], data[1::2]):
+        ids.update(str(number) for number in range(start, end + 1))
+    return ids
+
+
+def selection_sort_key(value: str) -> tuple[int, int, str]:
+    """Sort integer ids numerically ahead of any other ids."""
+    number = _as_int(value)
+    return (0, number, "") if number is not None else (1, 0, value)
+
+
+@dataclass(frozen=True)
+class SelectionPredicate:
+    """
+    The filter state behind one "select all matching" click.
+
+    ``filters`` holds the non-empty filter parameters, sorted by name.
+    ``max_pk`` bounds integer primary keys so records created after the click
+    are not swept into the selection.
+    """
+
+    filters: tuple[tuple[str, tuple[str, ...]], ...] = ()
+    max_pk: int | None = None
+
+    @classmethod
+    def from_params(cls, params, max_pk: int | None = None) -> "SelectionPredicate":
+        """Return a predicate for ``{name: [values]}`` filter parameters."""
+        filters = tuple(
+            sorted(
+                (str(name), tuple(str(value) for value in values))
+                for name, values in params.items()
+                if values
+            )
+        )
+        return cls(filters=filters, max_pk=max_pk)
+
+    def to_payload(self) -> dict[str, Any]:
+        """Return a JSON-serialisable form of this predicate."""
+        return {
+            "q": {name: list(values) for name, values in self.filters},
+            "m": self.max_pk,
+        }
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "SelectionPredicate":
+        """Return the predicate stored in ``payload``."""
+        return cls.from_params(payload.get("q") or {}, max_pk=payload.get("m"))
+
+
+class SelectionStore:
+    """
+    Bulk selection for one storage key and one request.
+
+    Subclasses implement ``load()`` and ``save()``. The decoded selection is
+    kept on the instance, so reads after the first cost a set lookup.
+    """
+
+    name = ""
+
+    def __init__(self, request, storage_key: str):
+        self.request = request
+        self.storage_key = storage_key
+        self._ids: set[str] | None = None
+        self._predicates: list[SelectionPredicate] | None = None
+        self._excluded: set[str] | None = None
+        # Resolved ids and count of a predicate selection, filled in by
+        # SelectionMixin.
+        self.resolved_ids: set[str] | None = None
+        self.resolved_count: int | None = None
+
+    def load(self) -> set[str]:
+        """Return the persisted selection."""
+        raise NotImplementedError
+
+    def save(self, ids: set[str]) -> None:
+        """Persist ``ids`` as the whole selection."""
+        raise NotImplementedError
+
+    def load_predicates(self) -> dict[str, Any] | None:
+        """
+        Return the persisted predicate payload.
+
+        Predicates and exclusions are small, so the default keeps them in the
+        session whatever store holds the explicit ids.
+        """
+        return self.request.session.get(SELECTION_PREDICATE_SESSION_KEY, {}).get(
+            self.storage_key
+        )
+
+    def save_predicates(self, payload: dict[str, Any] | None) -> None:
+        """Persist the predicate payload, or drop it when ``payload`` is empty."""
+        predicates = self.request.session.get(SELECTION_PREDICATE_SESSION_KEY, {})
+        if payload:
+            predicates[self.storage_key] = payload
+        elif self.storage_key in predicates:
+            del predicates[self.storage_key]
+        else:
+            return
+        self.request.session[SELECTION_PREDICATE_SESSION_KEY] = predicates
+        self.request.session.modified = True
+
+    def _load_predicate_state(self) -> None:
+        """Decode the predicates and exclusions once per store instance."""
+        if self._predicates is not None:
+            return
+        payload = self.load_predicates() or {}
+        self._predicates = [
+            SelectionPredicate.from_payload(item) for item in payload.get("p") or []
+        ]
+        self._excluded = decode_selection(payload.get("x"))
+
+    def _save_predicate_state(self) -> None:
+        """Persist the predicates and exclusions after a change."""
+        self.resolved_ids = self.resolved_count = None
+        if not self._predicates:
+            self._excluded = set()
+            self.save_predicates(None)
+            return
+        self.save_predicates(
+            {
+                "p": [predicate.to_payload() for predicate in self._predicates],
+                "x": encode_selection(self._excluded) if self._excluded else None,
+            }
+        )
+
+    @property
+    def predicates(self) -> list[SelectionPredicate]:
+        """Return the "select all matching" predicates in this selection."""
+        self._load_predicate_state()
+        return self._predicates
+
+    @property
+    def excluded(self) -> set[str]:
+        """Return ids deselected after a predicate selected them."""
+        self._load_predicate_state()
+        return self._excluded
+
+    def add_predicate(self, predicate: SelectionPredicate) -> None:
+        """Add ``predicate`` to the selection unless it is already there."""
+        if predicate not in self.predicates:
+            self._predicates.append(predicate)
+            self._save_predicate_state()
+
+    def exclude(self, object_ids: Iterable[Any]) -> None:
+        """Deselect predicate-matched ``object_ids``."""
+        added = {str(object_id) for object_id in object_ids} - self.excluded
+        if added and self.predicates:
+            self._excluded.update(added)
+            self._save_predicate_state()
+
+    def unexclude(self, object_ids: Iterable[Any]) -> None:
+        """Select previously excluded ``object_ids`` again."""
+        removed = {str(object_id) for object_id in object_ids} & self.excluded
+        if removed:
+            self._excluded.difference_update(removed)
+            self._save_predicate_state()
+
+    def _add(self, ids: set[str]) -> None:
+        """Persist newly added ``ids``; defaults to saving the whole selection."""
+        self.save(self.ids)
+
+    def _remove(self, ids: set[str]) -> None:
+        """Persist removed ``ids``; defaults to saving the whole selection."""
+        self.save(self.ids)
+
+    @property
+    def ids(self) -> set[str]:
+        """Return the selected ids, loading them once per store instance."""
+        if self._ids is None:
+            self._ids = self.load()
+        return self._ids
+
+    def get_ids(self) -> list[str]:
+        """Return the selected ids, integers first and in ascending order."""
+        return sorted(self.ids, key=selection_sort_key)
+
+    def count(self) -> int:
+        """Return how many records are selected."""
+        return len(self.ids)
+
+    def __contains__(self, object_id: Any) -> bool:
+        return str(object_id) in self.ids
+
+    def add(self, object_ids: Iterable[Any]) -> None:
+        """Add ``object_ids`` to the selection."""
+        added = {str(object_id) for object_id in object_ids} - self.ids
+        if added:
+            self.ids.update(added)
+            self.resolved_ids = self.resolved_count = None
+            self._add(added)
+
+    def remove(self, object_ids: Iterable[Any]) -> None:
+        """Remove ``object_ids`` from the selection."""
+        removed = {str(object_id) for object_id in object_ids} & self.ids
+        if removed:
+            self.ids.difference_update(removed)
+            self.resolved_ids = self.resolved_count = None
+            self._remove(removed)
+
+    def apply(self, added: Iterable[Any], removed: Iterable[Any]) -> None:
+        """Add ``added`` and remove ``removed`` with a single save."""
+        added = {str(object_id) for object_id in added} - self.ids
+        removed = {str(object_id) for object_id in removed} & self.ids
+        if added or removed:
+            self.ids.update(added)
+            self.ids.difference_update(removed)
+            self.resolved_ids = self.resolved_count = None
+            self.save(self.ids)
+
+    def toggle(self, object_id: Any) -> bool:
+        """Flip one record's selection and return whether it is now selected."""
+        if object_id in self:
+            self.remove([object_id])
+            return False
+        self.add([object_id])
+        return True
+
+    def replace(self, object_ids: Iterable[Any]) -> None:
+        """Replace the explicit ids with ``object_ids``."""
+        self._ids = {str(object_id) for object_id in object_ids}
+        self.resolved_ids = self.resolved_count = None
+        self.save(self._ids)
+
+    def clear(self) -> None:
+        """Drop the whole selection, including any predicates."""
+        self._ids = set()
+        self.save(self._ids)
+        self._predicates = []
+        self._save_predicate_state()
+
+
+class SessionSelectionStore(SelectionStore):
+    """Keep the encoded selection in ``request.session``."""
+
+    name = "session"
+
+    def load(self) -> set[str]:
+        payload = self.request.session.get(SELECTION_SESSION_KEY, {}).get(
+            self.storage_key
+        )
+        return decode_selection(payload)
+
+    def save(self, ids: set[str]) -> None:
+        selections = self.request.session.get(SELECTION_SESSION_KEY, {})
+        if ids:
+            selections[self.storage_key] = encode_selection(ids)
+        elif self.storage_key in selections:
+            del selections[self.storage_key]
+        else:
+            return
+        self.request.session[SELECTION_SESSION_KEY] = selections
+        self.request.session.modified = True
+
+
+def get_selection_owner_key(request) -> str:
+    """
+    Return who a cache or database selection belongs to.
+
+    Signed-in users keep their selection across sessions; anonymous users get
+    one per session, which is created if the request does not have one yet.
+    """
+    user = getattr(request, "user", None)
+    if user is not None and getattr(user, "is_authenticated", False):
+        return f"user:{user.pk}"
+    session = getattr(request, "session", None)
+    session_key = getattr(session, "session_key", None)
+    if session_key is None and callable(getattr(session, "save", None)):
+        session.save()
+        session_key = session.session_key
+    return f"session:{session_key or 'anonymous'}"
+
+
+class CacheSelectionStore(SelectionStore):
+    """Keep the encoded selection in the PowerCRUD cache, out of the session."""
+
+    name = "cache"
+
+    @property
+    def cache(self):
+        return caches[get_powercrud_setting("CACHE_NAME", "default")]
+
+    @property
+    def cache_key(self) -> str:
+        owner_key = get_selection_owner_key(self.request)
+        return f"{SELECTION_CACHE_PREFIX}:{owner_key}:{self.storage_key}"
+
+    def load(self) -> set[str]:
+        return decode_selection(self.cache.get(self.cache_key))
+
+    def save(self, ids: set[str]) -> None:
+        if ids:
+            self.cache.set(
+                self.cache_key,
+                encode_selection(ids),
+                get_powercrud_setting("BULK_SELECTION_TTL"),
+            )
+        else:
+            self.cache.delete(self.cache_key)
+
+    def load_predicates(self) -> dict[str, Any] | None:
+        return self.cache.get(f"{self.cache_key}:predicates")
+
+    def save_predicates(self, payload: dict[str, Any] | None) -> None:
+        if payload:
+            self.cache.set(
+                f"{self.cache_key}:predicates",
+                payload,
+                get_powercrud_setting("BULK_SELECTION_TTL"),
+            )
+        else:
+            self.cache.delete(f"{self.cache_key}:predicates")
+
+
+class DatabaseSelectionStore(SelectionStore):
+    """
+    Keep one ``BulkSelectionEntry`` row per selected record.
+
+    Until the selection is read, ``add()``, ``remove()``, ``toggle()``, and
+    ``count()`` touch only the affected rows. Each change stamps a row's
+    ``updated_at``, and ``cleanup_expired_selections()`` drops selections left
+    unchanged for longer than ``BULK_SELECTION_TTL``.
+    """
+
+    name = "database"
+    batch_size = 1000
+
+    @property
+    def entries(self):
+        from powercrud.models import BulkSelectionEntry
+
+        return BulkSelectionEntry.objects.filter(
+            owner_key=get_selection_owner_key(self.request),
+            storage_key=self.storage_key,
+        )
+
+    def load(self) -> set[str]:
+        return set(self.entries.values_list("object_id", flat=True))
+
+    def count(self) -> int:
+        if self._ids is None:
+            return self.entries.count()
+        return len(self._ids)
+
+    def add(self, object_ids: Iterable[Any]) -> None:
+        if self._ids is not None:
+            return super().add(object_ids)
+        self.resolved_ids = self.resolved_count = None
+        self._add({str(object_id) for object_id in object_ids})
+
+    def remove(self, object_ids: Iterable[Any]) -> None:
+        if self._ids is not None:
+            return super().remove(object_ids)
+        self.resolved_ids = self.resolved_count = None
+        self._remove({str(object_id) for object_id in object_ids})
+        self._touch()
+
+    def apply(self, added: Iterable[Any], removed: Iterable[Any]) -> None:
+        added = {str(object_id) for object_id in added}
+        removed = {str(object_id) for object_id in removed}
+        if self._ids is not None:
+            added -= self._ids
+            removed &= self._ids
+            self._ids.update(added)
+            self._ids.difference_update(removed)
+        self.resolved_ids = self.resolved_count = None
+        with transaction.atomic():
+            if removed:
+                self._remove(removed)
+            if added:
+                self._add(added)
+            elif removed:
+                self._touch()
+
+    def toggle(self, object_id: Any) -> bool:
+        if self._ids is not None:
+            return super().toggle(object_id)
+        self.resolved_ids = self.resolved_count = None
+        deleted, _ = self.entries.filter(object_id=str(object_id)).delete()
+        if deleted:
+            self._touch()
+            return False
+        self._add({str(object_id)})
+        return True
+
+    def _add(self, ids: set[str]) -> None:
+        from powercrud.models import BulkSelectionEntry
+
+        owner_key = get_selection_owner_key(self.request)
+        BulkSelectionEntry.objects.bulk_create(
+            [
+                BulkSelectionEntry(
+                    owner_key=owner_key,
+                    storage_key=self.storage_key,
+                    object_id=object_id,
+                )
+                for object_id in ids
+            ],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+
+    def _remove(self, ids: set[str]) -> None:
+        ids = list(ids)
+        for start in range(0, len(ids), self.batch_size):
+            self.entries.filter(
+                object_id__in=ids[start : start + self.batch_size]
+            ).delete()
+
+    def _touch(self) -> None:
+        """Stamp one remaining row so the selection counts as recently changed."""
+        remaining = list(self.entries.order_by().values_list("pk", flat=True)[:1])
+        if remaining:
+            self.entries.filter(pk=remaining[0]).update(updated_at=timezone.now())
+
+    def save(self, ids: set[str]) -> None:
+        self.entries.delete()
+        self._add(ids)
+
+
+def cleanup_expired_selections(ttl: int | None = None) -> int:
+    """
+    Delete database-store selections unchanged for more than ``ttl`` seconds.
+
+    A selection's age is that of its most recently changed row, so one toggle
+    keeps the whole selection alive. ``ttl`` defaults to
+    ``POWERCRUD_SETTINGS["BULK_SELECTION_TTL"]``; a falsy TTL keeps every row.
+    Returns the number of deleted rows.
+    """
+    from powercrud.models import BulkSelectionEntry
+
+    if ttl is None:
+        ttl = get_powercrud_setting("BULK_SELECTION_TTL")
+    if not ttl:
+        return 0
+    cutoff = timezone.now() - timedelta(seconds=ttl)
+    expired = (
+        BulkSelectionEntry.objects.values("owner_key", "storage_key")
+        .annotate(last_changed=Max("updated_at"))
+        .filter(last_changed__lt=cutoff)
+    )
+    deleted = 0
+    for selection in list(expired):
+        count, _ = BulkSelectionEntry.objects.filter(
+            owner_key=selection["owner_key"],
+            storage_key=selection["storage_key"],
+            updated_at__lt=cutoff,
+        ).delete()
+        deleted += count
+    return deleted
+
+
+SELECTION_STORES = {
+    store.name: store
+    for store in (SessionSelectionStore, CacheSelectionStore, DatabaseSelectionStore)
+}
+
+
+def get_selection_store_class(name: str | type | None = None) -> type:
+    """
+    Return the store class for ``name``, a store class, or a dotted path.
+
+    Defaults to ``POWERCRUD_SETTINGS["BULK_SELECTION_STORE"]``.
+    """
+    if name is None:
+        name = get_powercrud_setting("BULK_SELECTION_STORE") or "session"
+    if isinstance(name, type):
+        return name
+    if name in SELECTION_STORES:
+        return SELECTION_STORES[name]
+    return import_string(name)
+
+
+def resolve_selection_queryset(selection: dict[str, Any], user_id=None):
+    """
+    Rebuild a selection payload's queryset outside the request that made it.
+
+    ``selection`` comes from ``SelectionMixin.get_selection_payload()``: the
+    view's dotted path, the explicit ids, the predicates, and the exclusions.
+    The view is set up for a list request by ``user_id`` so its
+    ``get_queryset()`` scoping and filterset apply as they did in the browser.
+    """
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import AnonymousUser
+    from django.http import HttpRequest
+    from neapolitan.views import Role
+
+    view_class = import_string(selection["view"])
+    request = HttpRequest()
+    request.method = "GET"
+    request.session = {}
+    request.htmx = False
+    request.user = AnonymousUser()
+    if user_id is not None:
+        user_model = get_user_model()
+        request.user = user_model._default_manager.filter(pk=user_id).first() or (
+            AnonymousUser()
+        )
+    view = view_class(role=Role.LIST)
+    view.setup(request)
+    return view.build_selection_queryset(
+        decode_selection(selection.get("ids")),
+        [SelectionPredicate.from_payload(item) for item in selection.get("p") or []],
+        decode_selection(selection.get("x")),
+    )
+
+
+__all__ = [
+    "CacheSelectionStore",
+    "DatabaseSelectionStore",
+    "SELECTION_STORES",
+    "SelectionPredicate",
+    "SelectionStore",
+    "SessionSelectionStore",
+    "cleanup_expired_selections",
+    "decode_selection",
+    "encode_selection",
+    "get_selection_owner_key",
+    "get_selection_store_class",
+    "resolve_selection_queryset",
+    "selection_sort_key",
+]
@@ -76,6 +76,8 @@ export function installPowercrudRuntime({ createComposition } = {}) {
         filterRefreshTimer: null,
         filterPanelRefreshPending: false,
         lastRowSelectionAnchorId: null,
+        pendingSelectionChanges: new Map(),
+        selectionFlushTimer: null,
         selectionRequestVersion: 0,
     }));
     function warnMissingDependency(name, detail) {
@@ -705,6 +707,10 @@ export function installPowercrudRuntime({ createComposition } = {}) {
                     return;
                 }
             },
+            handleHtmxConfirm(event) {
+                const target = event.detail && event.detail.elt;
+                bulkActions.handleBulkHtmxConfirm(event, asElement(target));
+            },
             handleHtmxConfigRequest(event) {
                 const target = event.detail && event.detail.elt;
                 if (!(target instanceof Element) || !target.closest) {
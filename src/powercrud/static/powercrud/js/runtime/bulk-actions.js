@@ -1,5 +1,8 @@
 import { RANGE_SELECT_SUPPRESS_CLASS } from './selectors.js';
 
+// Row-selection changes are queued and sent together once clicking pauses.
+export const SELECTION_FLUSH_DELAY_MS = 300;
+
 export function createBulkActionsRuntime(context) {
     const {
         global,
@@ -123,6 +126,7 @@ export function createBulkActionsRuntime(context) {
         if (!(root instanceof Element)) {
             return;
         }
+        discardPendingSelectionChanges(root);
         setBulkRowsChecked(root, false);
         ensureObjectListState(root).lastRowSelectionAnchorId = null;
         syncBulkSelectionPresentation(root, 0);
@@ -140,19 +144,26 @@ export function createBulkActionsRuntime(context) {
             .filter(checkbox => checkbox instanceof HTMLInputElement);
     }
 
-    function hydrateCheckboxInitialState(checkbox) {
+    function hydrateCheckboxInitialState(checkbox, pending = null) {
         if (
             !(checkbox instanceof HTMLInputElement)
             || checkbox.dataset.powercrudSelectionHydrated === 'true'
         ) {
             return;
         }
-        checkbox.checked = checkbox.dataset.powercrudInitialChecked === 'true';
+        // Rows re-rendered before a queued change is flushed keep that change.
+        const pendingChecked = pending?.get(checkbox.dataset.id || '');
+        checkbox.checked = pendingChecked === undefined
+            ? checkbox.dataset.powercrudInitialChecked === 'true'
+            : pendingChecked;
         checkbox.dataset.powercrudSelectionHydrated = 'true';
     }
 
     function hydrateBulkSelectionState(root) {
-        getRowSelectionCheckboxes(root).forEach(hydrateCheckboxInitialState);
+        const pending = getPendingSelectionChanges(root);
+        getRowSelectionCheckboxes(root).forEach(
+            checkbox => hydrateCheckboxInitialState(checkbox, pending),
+        );
         const selectAllCheckbox = root.querySelector('[data-powercrud-select-all="true"]');
         if (
             selectAllCheckbox instanceof HTMLInputElement
@@ -234,23 +245,79 @@ export function createBulkActionsRuntime(context) {
         );
     }
 
-    function persistBulkSelectionBatch(root, objectIds, action) {
+    function getPendingSelectionChanges(root) {
+        const state = ensureObjectListState(root);
+        if (!(state.pendingSelectionChanges instanceof Map)) {
+            state.pendingSelectionChanges = new Map();
+        }
+        return state.pendingSelectionChanges;
+    }
+
+    function hasPendingSelectionChanges(root) {
+        return root instanceof Element && getPendingSelectionChanges(root).size > 0;
+    }
+
+    function cancelSelectionFlush(root) {
+        const state = ensureObjectListState(root);
+        if (state.selectionFlushTimer !== null) {
+            global.clearTimeout(state.selectionFlushTimer);
+            state.selectionFlushTimer = null;
+        }
+    }
+
+    function discardPendingSelectionChanges(root) {
+        cancelSelectionFlush(root);
+        getPendingSelectionChanges(root).clear();
+    }
+
+    function queueSelectionChanges(root, objectIds, checked) {
+        // Only the latest state of each row is kept, so clicking a row on and
+        // off again before the flush sends nothing for it.
         if (!root || !objectIds.length) {
             return;
         }
+        const pending = getPendingSelectionChanges(root);
+        objectIds.filter(Boolean).forEach(objectId => {
+            pending.set(String(objectId), checked);
+        });
+        cancelSelectionFlush(root);
+        ensureObjectListState(root).selectionFlushTimer = global.setTimeout(
+            () => flushSelectionChanges(root),
+            SELECTION_FLUSH_DELAY_MS,
+        );
+    }
+
+    function flushSelectionChanges(root) {
+        // Send every queued row change in one apply-selection request. The
+        // returned promise settles when the server has applied the batch.
+        if (!hasPendingSelectionChanges(root)) {
+            return Promise.resolve();
+        }
         const htmx = getHtmxInstance();
         const listUrl = root.dataset.powercrudListUrl;
         if (!htmx || !listUrl) {
-            return;
+            return Promise.resolve();
         }
-        htmx.ajax('POST', `${listUrl}toggle-all-selection/`, {
+        const pending = getPendingSelectionChanges(root);
+        const added = [];
+        const removed = [];
+        pending.forEach((checked, objectId) => {
+            (checked ? added : removed).push(objectId);
+        });
+        discardPendingSelectionChanges(root);
+        nextSelectionRequestVersion(root);
+        return Promise.resolve(htmx.ajax('POST', `${listUrl}apply-selection/`, {
             values: {
-                object_ids_csv: objectIds.join(','),
-                action,
+                add_csv: added.join(','),
+                remove_csv: removed.join(','),
             },
             target: '#bulk-actions-container',
             swap: 'outerHTML',
-        });
+        }));
+    }
+
+    function persistBulkSelectionBatch(root, objectIds, action) {
+        queueSelectionChanges(root, objectIds, action === 'add');
     }
 
     function toggleAllSelection(selectAllCheckbox) {
@@ -264,23 +331,14 @@ export function createBulkActionsRuntime(context) {
             showBulkActionsContainer(root);
         }
 
-        const htmx = getHtmxInstance();
-        const listUrl = root.dataset.powercrudListUrl;
-        if (!htmx || !listUrl) {
-            return;
-        }
-
         const allIds = selectAllCheckbox.checked
             ? getSelectedBulkRowIds(root)
             : getRowSelectionCheckboxes(root).map(cb => cb.dataset.id);
-        htmx.ajax('POST', `${listUrl}toggle-all-selection/`, {
-            values: {
-                object_ids_csv: allIds.join(','),
-                action: selectAllCheckbox.checked ? 'add' : 'remove',
-            },
-            target: '#bulk-actions-container',
-            swap: 'outerHTML',
-        });
+        persistBulkSelectionBatch(
+            root,
+            allIds,
+            selectAllCheckbox.checked ? 'add' : 'remove',
+        );
     }
 
     function handleRowSelectionChange(checkbox, event = null) {
@@ -444,6 +502,26 @@ export function createBulkActionsRuntime(context) {
         return true;
     }
 
+    function handleBulkHtmxConfirm(event, target) {
+        // Any other request from a list with queued selection changes, such
+        // as opening bulk edit or running a selection-aware button, waits
+        // until the batch has been saved so the server sees the same selection.
+        if (
+            !(target instanceof Element)
+            || target.matches('[data-powercrud-row-select="true"]')
+            || typeof event.detail?.issueRequest !== 'function'
+        ) {
+            return false;
+        }
+        const root = getObjectListRoot(target);
+        if (!hasPendingSelectionChanges(root)) {
+            return false;
+        }
+        event.preventDefault();
+        flushSelectionChanges(root).finally(() => event.detail.issueRequest());
+        return true;
+    }
+
     function handleBulkHtmxBeforeRequest(event, target) {
         if (target && target.matches && target.matches('[data-powercrud-row-select="true"]')) {
             if (target.dataset.powercrudSkipSelectionRequest === 'true') {
@@ -452,6 +530,12 @@ export function createBulkActionsRuntime(context) {
                 return true;
             }
             const root = getObjectListRoot(target);
+            if (root && root.dataset.powercrudListUrl) {
+                // Queue the click instead of sending one request per checkbox.
+                event.preventDefault();
+                queueSelectionChanges(root, [target.dataset.id], target.checked);
+                return true;
+            }
             if (root) {
                 target.dataset.powercrudSelectionRequestPending = 'true';
                 target.dataset.powercrudSelectionRequestVersion = String(
@@ -546,6 +630,7 @@ export function createBulkActionsRuntime(context) {
         clearBulkSelection,
         clearSelectionOptimistic,
         clearRowSelectionRequestState,
+        flushSelectionChanges,
         getRowSelectionCheckboxes,
         getSelectionRequestVersion,
         handleBulkEditQueued,
@@ -553,9 +638,11 @@ export function createBulkActionsRuntime(context) {
         handleBulkHtmxAfterRequest,
         handleBulkHtmxBeforeRequest,
         handleBulkHtmxBeforeSwap,
+        handleBulkHtmxConfirm,
         handleBulkHtmxResponseError,
         handleClearSelectionClick,
         handleSelectionExtraButtonAfterRequest,
+        hasPendingSelectionChanges,
         handleRowSelectionChange,
         handleRowSelectionClickCapture,
         handleRowSelectionMouseDownCapture,
@@ -3,6 +3,11 @@ import {
     NATIVE_STYLE_ATTR,
     NATIVE_TABINDEX_ATTR,
 } from './selectors.js';
+import {
+    bindRemoteOptionDependencies,
+    getRemoteOptionSettings,
+    withRemoteOptionPlugins,
+} from './remote-options.js';
 
 // Private DaisyUI presentation adapter for Tom Select-specific behavior. Core
 // retains semantic discovery, value synchronization, and lifecycle ordering.
@@ -264,11 +269,17 @@ export function createDaisyuiSearchableSelectAdapter(context) {
         if (!dialogElement) {
             settings.dropdownParent = 'body';
         }
+        Object.assign(settings, getRemoteOptionSettings(selectElement, { global }));
+        const plugins = withRemoteOptionPlugins(selectElement, settings.plugins);
+        if (plugins) {
+            settings.plugins = plugins;
+        }
 
         const instance = createInstance(selectElement, settings);
         if (!instance) {
             return;
         }
+        bindRemoteOptionDependencies(instance, selectElement);
 
         normaliseControl(instance);
         normaliseFilterFavourites(selectElement);
@@ -366,11 +377,17 @@ export function createDaisyuiSearchableSelectAdapter(context) {
         if (!dialogElement) {
             settings.dropdownParent = 'body';
         }
+        Object.assign(settings, getRemoteOptionSettings(selectElement, { global }));
+        const plugins = withRemoteOptionPlugins(selectElement, settings.plugins);
+        if (plugins) {
+            settings.plugins = plugins;
+        }
 
         const instance = createInstance(selectElement, settings);
         if (!instance) {
             return;
         }
+        bindRemoteOptionDependencies(instance, selectElement);
 
         normaliseControl(instance);
         if (isInlineSelect) {
@@ -0,0 +1,109 @@
+import {
+    REMOTE_OPTIONS_DEPENDS_ON_ATTR,
+    REMOTE_OPTIONS_URL_ATTR,
+} from './selectors.js';
+
+function getDependsOn(selectElement) {
+    return (selectElement.getAttribute(REMOTE_OPTIONS_DEPENDS_ON_ATTR) || '')
+        .split(',')
+        .map(name => name.trim())
+        .filter(Boolean);
+}
+
+function appendParentValues(searchParams, selectElement, parentName) {
+    searchParams.delete(parentName);
+    const form = selectElement.form;
+    if (!form) {
+        return;
+    }
+    Array.from(form.elements)
+        .filter(element => element.name === parentName)
+        .forEach(element => {
+            if (element instanceof HTMLSelectElement) {
+                Array.from(element.selectedOptions)
+                    .filter(option => option.value)
+                    .forEach(option => searchParams.append(parentName, option.value));
+                return;
+            }
+            if ((element.type === 'checkbox' || element.type === 'radio') && !element.checked) {
+                return;
+            }
+            if (element.value) {
+                searchParams.append(parentName, element.value);
+            }
+        });
+}
+
+// Tom Select settings that page options in from the PowerCRUD relation
+// options endpoint instead of reading them from the rendered <option> list.
+// Selects without the endpoint attribute get no extra settings.
+export function getRemoteOptionSettings(selectElement, { global }) {
+    const endpoint = selectElement.getAttribute(REMOTE_OPTIONS_URL_ATTR);
+    if (!endpoint) {
+        return {};
+    }
+
+    function buildUrl(query, page) {
+        const url = new URL(endpoint, global.location.href);
+        url.searchParams.set('q', query);
+        url.searchParams.set('page', String(page));
+        getDependsOn(selectElement).forEach(parentName => {
+            appendParentValues(url.searchParams, selectElement, parentName);
+        });
+        return url.toString();
+    }
+
+    return {
+        valueField: 'value',
+        labelField: 'label',
+        searchField: [],
+        preload: 'focus',
+        firstUrl(query) {
+            return buildUrl(query, 1);
+        },
+        load(query, callback) {
+            const url = typeof this.getUrl === 'function' ? this.getUrl(query) : buildUrl(query, 1);
+            const page = Number(new URL(url).searchParams.get('page') || 1);
+            global.fetch(url, {
+                credentials: 'same-origin',
+                headers: { Accept: 'application/json' },
+            })
+                .then(response => (response.ok ? response.json() : { results: [] }))
+                .then(data => {
+                    if (data.has_more && typeof this.setNextUrl === 'function') {
+                        this.setNextUrl(query, buildUrl(query, page + 1));
+                    }
+                    callback(data.results || []);
+                })
+                .catch(() => callback());
+        },
+    };
+}
+
+export function withRemoteOptionPlugins(selectElement, plugins) {
+    if (!selectElement.getAttribute(REMOTE_OPTIONS_URL_ATTR)) {
+        return plugins;
+    }
+    if (Array.isArray(plugins)) {
+        return [...plugins, 'virtual_scroll'];
+    }
+    return { ...(plugins || {}), virtual_scroll: {} };
+}
+
+// Parent values scope the remote options, so drop loaded options whenever a
+// declared parent field changes.
+export function bindRemoteOptionDependencies(instance, selectElement) {
+    const form = selectElement.form;
+    const dependsOn = getDependsOn(selectElement);
+    if (!form || dependsOn.length === 0 || !selectElement.getAttribute(REMOTE_OPTIONS_URL_ATTR)) {
+        return;
+    }
+    form.addEventListener('change', event => {
+        if (!dependsOn.includes(event.target?.name)) {
+            return;
+        }
+        instance.clear(true);
+        instance.clearOptions();
+        instance.loadedSearches = {};
+    });
+}
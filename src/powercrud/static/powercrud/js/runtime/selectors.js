@@ -31,3 +31,5 @@ export const IGNORED_VIEW_STATE_FIELD_NAMES = new Set([
     'view_key',
     'visible_columns',
 ]);
+export const REMOTE_OPTIONS_URL_ATTR = 'data-powercrud-options-url';
+export const REMOTE_OPTIONS_DEPENDS_ON_ATTR = 'data-powercrud-options-depends-on';
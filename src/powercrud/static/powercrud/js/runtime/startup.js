@@ -80,6 +80,7 @@ export function installPowercrudGlobalListeners({
     documentObject.addEventListener('input', handlers.handleFilterInput);
     documentObject.addEventListener('change', handlers.handleFilterChange);
     documentObject.addEventListener('submit', handlers.handleDocumentSubmitCapture, true);
+    documentObject.addEventListener('htmx:confirm', handlers.handleHtmxConfirm);
     documentObject.addEventListener('htmx:beforeRequest', handlers.handleHtmxBeforeRequest);
     documentObject.addEventListener('htmx:configRequest', handlers.handleHtmxConfigRequest);
     documentObject.body.addEventListener('bulkEditSuccess', handlers.handleBulkEditSuccess);
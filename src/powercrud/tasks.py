@@ -9,6 +9,7 @@ from powercrud.bulk_persistence import (
     BulkUpdateExecutionContext,
     resolve_bulk_update_persistence_backend,
 )
+from powercrud.selection_store import resolve_selection_queryset
 
 from .mixins.bulk_mixin import BulkMixin
 from .async_manager import AsyncManager
@@ -16,6 +17,60 @@ from .async_manager import AsyncManager
 log = get_logger(__name__)
 
 
+def _get_failure_message(action, result):
+    """Return the final progress message for a failed bulk result."""
+    chunks = result.get("chunks")
+    if chunks:
+        failed_ranges = result.get("failed_ranges") or [
+            (chunk["first_pk"], chunk["last_pk"])
+            for chunk in chunks
+            if not chunk["success"]
+        ]
+        processed = int(result.get("success_records", 0))
+        not_applied = ", ".join(
+            str(first) if first == last else f"{first}-{last}"
+            for first, last in failed_ranges
+        )
+        return (
+            f"partially completed {action}: {processed} processed, "
+            f"{len(failed_ranges)} of {len(chunks)} chunks failed, "
+            f"pk ranges not applied: {not_applied}: {result.get('errors')}"
+        )
+    return f"failed {action}: {result.get('errors')}"
+
+
+def _get_checkpoint_kwargs(manager, task_name, chunk_size):
+    """Return resume arguments for a chunked task, reading any saved checkpoint."""
+    if not (chunk_size and task_name):
+        return {}
+    resume_after = manager.get_checkpoint(task_name)
+    if resume_after is not None:
+        log.info(f"[WORKER] resuming {task_name} after pk {resume_after}")
+    return {
+        "resume_after": resume_after,
+        "checkpoint_callback": lambda pk: manager.set_checkpoint(task_name, pk),
+    }
+
+
+def _get_locked_selection_queryset(
+    manager, task_name, model_class, selection, user_id
+):
+    """
+    Rebuild a predicate selection the task holds a lock on.
+
+    The web request locked the selection payload itself rather than the ids
+    it matched, so the queryset comes straight from
+    ``resolve_selection_queryset()``. Its ``max_pk`` bound keeps rows created
+    after the job was queued out of it.
+    """
+    lock_id = manager.get_selection_lock_id(selection)
+    if not task_name or lock_id not in manager.get_locked_ids(
+        task_name, model_class._meta.label_lower
+    ):
+        raise RuntimeError("the selection's conflict lock is missing or expired")
+    return resolve_selection_queryset(selection, user_id)
+
+
 def bulk_delete_task(model_path, selected_ids, user_id, **kwargs):
     """
     Async bulk delete worker (django-q2 compatible).
@@ -32,6 +87,8 @@ def bulk_delete_task(model_path, selected_ids, user_id, **kwargs):
     bulk_update_persistence_backend_config = kwargs.pop(
         "bulk_update_persistence_backend_config", None
     )
+    selection = kwargs.pop("selection", None)
+    bulk_chunk_size = kwargs.pop("bulk_chunk_size", None)
     # Retrieve task identifier injected by AsyncManager
     task_name = kwargs.pop("task_key", None) or kwargs.get("task_name")
 
@@ -50,28 +107,40 @@ def bulk_delete_task(model_path, selected_ids, user_id, **kwargs):
             manager.update_progress(task_name, "starting delete")
 
         model_class = apps.get_model(model_path)
-        queryset = model_class.objects.filter(pk__in=selected_ids)
+        if selection:
+            queryset = _get_locked_selection_queryset(
+                manager, task_name, model_class, selection, user_id
+            )
+        else:
+            queryset = model_class.objects.filter(pk__in=selected_ids)
 
         # Use the shared business logic with progress callback
         mixin = BulkMixin()
+        mixin.bulk_chunk_size = bulk_chunk_size
 
         def progress_cb(current, total):
             if task_name:
                 manager.update_progress(task_name, f"deleting: {current}/{total}")
 
-        result = mixin._perform_bulk_delete(queryset, progress_callback=progress_cb)
+        result = mixin._perform_bulk_delete(
+            queryset,
+            progress_callback=progress_cb,
+            **_get_checkpoint_kwargs(manager, task_name, bulk_chunk_size),
+        )
 
         success = bool(result.get("success"))
         processed = int(result.get("success_records", 0))
 
         if task_name:
+            if bulk_chunk_size:
+                manager.remove_checkpoint(task_name)
             if success:
                 manager.update_progress(
                     task_name, f"completed delete: {processed} processed"
                 )
             else:
                 manager.update_progress(
-                    task_name, f"failed delete: {result.get('errors')}"
+                    task_name, _get_failure_message("delete", result)
                 )
 
         return success
@@ -110,6 +179,11 @@ def bulk_update_task(
     bulk_update_persistence_backend_config = kwargs.pop(
         "bulk_update_persistence_backend_config", None
     )
+    selection = kwargs.pop("selection", None)
+    bulk_full_clean = kwargs.pop("bulk_full_clean", True)
+    bulk_update_strategy = kwargs.pop("bulk_update_strategy", "auto")
+    bulk_chunk_size = kwargs.pop("bulk_chunk_size", None)
+    view_class_path = kwargs.pop("view_class_path", None)
     # Retrieve task identifier injected by AsyncManager
     task_name = kwargs.pop("task_key", None) or kwargs.get("task_name")
 
@@ -128,7 +202,12 @@ def bulk_update_task(
             manager.update_progress(task_name, "starting update")
 
         model_class = apps.get_model(model_path)
-        queryset = model_class.objects.filter(pk__in=selected_ids)
+        if selection:
+            queryset = _get_locked_selection_queryset(
+                manager, task_name, model_class, selection, user_id
+            )
+        else:
+            queryset = model_class.objects.filter(pk__in=selected_ids)
 
         def progress_cb(current, total):
             if task_name:
@@ -144,6 +223,11 @@ def bulk_update_task(
             user_id=user_id,
             task_name=task_name,
             manager_class_path=manager_class_path,
+            bulk_full_clean=bulk_full_clean,
+            bulk_update_strategy=bulk_update_strategy,
+            bulk_chunk_size=bulk_chunk_size,
+            view_class_path=view_class_path,
+            **_get_checkpoint_kwargs(manager, task_name, bulk_chunk_size),
         )
         result = backend.persist_bulk_update(
             queryset=queryset,
@@ -158,13 +242,15 @@ def bulk_update_task(
         processed = int(result.get("success_records", 0))
 
         if task_name:
+            if bulk_chunk_size:
+                manager.remove_checkpoint(task_name)
             if success:
                 manager.update_progress(
                     task_name, f"completed update: {processed} processed"
                 )
             else:
                 manager.update_progress(
-                    task_name, f"failed update: {result.get('errors')}"
+                    task_name, _get_failure_message("update", result)
                 )
 
         return success
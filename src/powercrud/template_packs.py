@@ -1,5 +1,6 @@
 """Public declarations and dynamic discovery for PowerCRUD template packs."""
 
+import sys
 from dataclasses import dataclass, field, replace
 from importlib import import_module
 from pathlib import PurePosixPath
@@ -8,6 +9,8 @@ from typing import Any, ClassVar, Literal, Mapping, Protocol
 from django import forms
 
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
 from powercrud.conf import get_powercrud_setting
 
@@ -18,6 +21,12 @@ BROWSER_ADAPTER_API_VERSION = 1
 _BUILTIN_TEMPLATE_PACKS = {"daisyui": "powercrud.packs.daisyui:template_pack"}
 _UNCONFIGURED_SELECTOR = object()
 _FRAMEWORK_STYLE_KEYS = {"daisyui": "daisyUI"}
+_TEMPLATE_PACK_SETTINGS = frozenset({"POWERCRUD_SETTINGS", "POWERCRUD_TEMPLATE_PACK"})
+# Validated declarations keyed by selector and server adapters keyed by their
+# ``module.path:attribute`` path. Each entry keeps the declaration path so a
+# hit can confirm the module attribute still points at the cached object.
+_RESOLVED_TEMPLATE_PACKS: dict[str, tuple[str, "TemplatePack"]] = {}
+_RESOLVED_SERVER_ADAPTERS: dict[str, object] = {}
 
 # These options promise a presentation outcome across every first-party pack.
 # Framework-specific class strings remain deliberately portable only within the
@@ -375,7 +384,7 @@ class TemplatePack:
 
 
 def get_selected_template_pack() -> TemplatePack:
-    """Resolve the current selector without caching settings or declarations."""
+    """Resolve the current selector, reusing validated declarations per selector."""
     selector = get_powercrud_setting(
         "POWERCRUD_TEMPLATE_PACK", default=_UNCONFIGURED_SELECTOR
     )
@@ -434,6 +443,11 @@ def get_template_pack_copy_destination() -> str:
 def get_template_pack_server_adapter() -> PowerCRUDServerAdapter:
     """Resolve and validate the selected pack's public server adapter."""
     template_pack = get_selected_template_pack()
+    cached_adapter = _RESOLVED_SERVER_ADAPTERS.get(template_pack.server_adapter)
+    if cached_adapter is not None and (
+        _current_declaration(template_pack.server_adapter) is cached_adapter
+    ):
+        return cached_adapter
     adapter = _load_template_pack(template_pack.server_adapter, template_pack.identity)
     api_version = getattr(adapter, "api_version", None)
     get_presentation = getattr(adapter, "get_presentation", None)
@@ -449,18 +463,44 @@ def get_template_pack_server_adapter() -> PowerCRUDServerAdapter:
             f"{SERVER_ADAPTER_API_VERSION}, callable get_presentation(), and callable "
             "get_widget_presentation()."
         )
+    _RESOLVED_SERVER_ADAPTERS[template_pack.server_adapter] = adapter
     return adapter
 
 
 def resolve_template_pack(selector: str) -> TemplatePack:
-    """Resolve a built-in identity or ``module.path:attribute`` declaration."""
+    """Resolve a built-in identity or ``module.path:attribute`` declaration.
+
+    Successful resolutions are cached per selector for the life of the process.
+    A cached entry is only reused while its module attribute still refers to
+    the same declaration, so rebinding a pack at runtime is picked up without
+    clearing the cache. Failures are never cached.
+    """
+    cached = _RESOLVED_TEMPLATE_PACKS.get(selector) if isinstance(selector, str) else None
+    if cached is not None:
+        declaration_path, template_pack = cached
+        if _current_declaration(declaration_path) is template_pack:
+            return template_pack
     declared_selector = _validate_selector(selector)
     declaration_path = _BUILTIN_TEMPLATE_PACKS.get(declared_selector, declared_selector)
     template_pack = _load_template_pack(declaration_path, selector)
     _validate_resolved_template_pack(template_pack, selector)
+    _RESOLVED_TEMPLATE_PACKS[selector] = (declaration_path, template_pack)
     return template_pack
 
 
+def clear_template_pack_cache() -> None:
+    """Forget every cached template-pack declaration and server adapter."""
+    _RESOLVED_TEMPLATE_PACKS.clear()
+    _RESOLVED_SERVER_ADAPTERS.clear()
+
+
+@receiver(setting_changed)
+def _clear_template_pack_cache_on_setting_changed(*, setting, **kwargs) -> None:
+    """Drop resolved packs when tests or runtime code override pack settings."""
+    if setting in _TEMPLATE_PACK_SETTINGS:
+        clear_template_pack_cache()
+
+
 def _require_string(value: object, field_name: str) -> None:
     """Require a non-empty string without leading or trailing whitespace."""
     if not isinstance(value, str) or not value or value != value.strip():
@@ -618,6 +658,15 @@ def _load_template_pack(declaration_path: str, original_selector: object) -> obj
         ) from exc
 
 
+def _current_declaration(declaration_path: str) -> object:
+    """Return the live attribute behind a cached declaration without importing."""
+    module_name, _, attribute_name = declaration_path.partition(":")
+    module = sys.modules.get(module_name)
+    if module is None:
+        return None
+    return getattr(module, attribute_name, None)
+
+
 def _validate_resolved_template_pack(template_pack: object, selector: object) -> None:
     """Reject malformed public declarations without whitelisting frameworks."""
     if not isinstance(template_pack, TemplatePack):
@@ -15,12 +15,13 @@ The module adapts to different CSS frameworks and supports HTMX and modal functi
 
 import json
 import warnings
+from dataclasses import dataclass
 from datetime import date, datetime, time  # Import temporal value classes
 from typing import Any, Dict, List, Optional
 
 from django import template
 from django.db import models
-from django.template import TemplateDoesNotExist
+from django.template import TemplateDoesNotExist, engines
 from django.template.loader import render_to_string
 from django.templatetags.static import static
 from django.utils.formats import date_format, time_format
@@ -219,106 +220,90 @@ def _get_semantic_column_width_mode(field) -> str:
     return "bounded"
 
 
-def _resolve_column_width_mode(
-    *, field_name: str, field, policy: str, configured_modes: dict[str, str]
-) -> str:
-    """Resolve one rendered column's explicit, inferred, or legacy width mode."""
-    explicit_mode = configured_modes.get(field_name)
-    if explicit_mode:
-        return explicit_mode
-    if policy == "semantic":
-        return _get_semantic_column_width_mode(field)
-    return "bounded"
-
-
 def _get_display_name_for_field(field_name: str, field) -> str:
     """Return a human label for a model or annotation field."""
     return resolve_field_label(None, field_name, field)
 
 
-def _format_list_field_value(
-    obj,
-    field_name: str,
-    field,
-    tick_svg: str,
-    cross_svg: str,
-    *,
-    is_model_field: bool,
-    value_format: str | None,
-    default_datetime_value_format: str,
-):
-    """
-    Format a model-field or annotation value for list-cell display.
-    """
-    value = getattr(obj, field_name, None)
-
-    if field is not None and getattr(field, "many_to_many", False):
-        return ", ".join(str(item) for item in getattr(obj, field_name).all())
+_BOOLEAN_TICK_SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16" fill="green" class="pc-boolean-icon size-4 inline-block"><path fill-rule="evenodd" d="M8 15A7 7 0 1 0 8 1a7 7 0 0 0 0 14Zm3.844-8.791a.75.75 0 0 0-1.188-.918l-3.7 4.79-1.649-1.833a.75.75 0 1 0-1.114 1.004l2.25 2.5a.75.75 0 0 0 1.15-.043l4.25-5.5Z" clip-rule="evenodd" /></svg>'
+_BOOLEAN_CROSS_SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16" fill="crimson" class="pc-boolean-icon size-4 inline-block"><path fill-rule="evenodd" d="M8 15A7 7 0 1 0 8 1a7 7 0 0 0 0 14Zm2.78-4.22a.75.75 0 0 1-1.06 0L8 9.06l-1.72 1.72a.75.75 0 1 1-1.06-1.06L6.94 8 5.22 6.28a.75.75 0 0 1 1.06-1.06L8 6.94l1.72-1.72a.75.75 0 1 1 1.06 1.06L9.06 8l1.72 1.72a.75.75 0 0 1 0 1.06Z" clip-rule="evenodd" /></svg>'
 
-    internal_type = field.get_internal_type() if field is not None else ""
-    if internal_type == "BooleanField" or isinstance(value, bool):
-        if value is True:
-            return mark_safe(tick_svg)
-        if value is False:
-            return mark_safe(cross_svg)
-        return ""
 
-    if isinstance(field, models.DateTimeField) and isinstance(value, datetime):
-        localized_value = template_localtime(value)
-        selected_format = value_format or default_datetime_value_format
-        if selected_format == "date":
-            return date_format(localized_value, "DATE_FORMAT", use_l10n=False)
-        if selected_format == "time":
-            return time_format(localized_value, "TIME_FORMAT", use_l10n=False)
-        return date_format(localized_value, "DATETIME_FORMAT", use_l10n=False)
+@dataclass(frozen=True, slots=True)
+class _ListColumnField:
+    """Model-level metadata for one list column, shared across requests."""
 
-    if isinstance(field, models.DateField) and isinstance(value, date):
-        return date_format(value, "DATE_FORMAT", use_l10n=False)
+    field: Any
+    is_model_field: bool
+    is_many_to_many: bool
+    is_boolean_field: bool
+    is_datetime_field: bool
+    is_date_field: bool
+    is_time_field: bool
+    is_relation: bool
+    default_align: str | None
+    semantic_width_mode: str
 
-    if isinstance(field, models.TimeField) and isinstance(value, time):
-        return time_format(value, "TIME_FORMAT", use_l10n=False)
 
-    if isinstance(value, (date, datetime)) and value is not None:
-        return value.strftime("%d/%m/%Y")
+_LIST_COLUMN_FIELD_CACHE: dict[tuple[Any, ...], _ListColumnField] = {}
 
-    if field is not None and getattr(field, "is_relation", False):
-        return str(value)
 
-    if field is not None and is_model_field:
-        return field.value_to_string(obj)
+def _get_output_field_signature(field) -> str:
+    """Return a hashable signature of an annotation output field's options."""
+    _name, _path, args, kwargs = field.deconstruct()
+    return repr((args, sorted(kwargs.items())))
 
-    return "" if value is None else str(value)
 
-
-def _resolve_cell_alignment(
-    *,
-    column_alignments: dict[str, str],
-    name: str,
-    default_align: str,
-) -> str:
-    """
-    Return the configured alignment override for a rendered cell when present.
+def _get_list_column_field(view, name: str, *, is_property: bool, queryset=None):
     """
-    return column_alignments.get(name, default_align)
+    Return the live field and cached field metadata for a rendered column.
 
-
-def _resolve_list_column_alignment(
-    *,
-    column_alignments: dict[str, str],
-    name: str,
-    field,
-    raw_value: Any = None,
-) -> str:
-    """Return the shared header and cell alignment for one rendered list column."""
-    if field is not None:
-        default_align = "center" if _should_center_field(field) else "left"
+    Model fields are keyed by model and name. Annotation columns are also keyed
+    by their output-field type and deconstructed options, such as
+    ``decimal_places`` or ``choices``, because the output-field instance is
+    rebuilt with each queryset.
+    """
+    if is_property:
+        field = None
+        is_model_field = False
     else:
-        default_align = "center" if isinstance(raw_value, bool) else "left"
-    return _resolve_cell_alignment(
-        column_alignments=column_alignments,
-        name=name,
-        default_align=default_align,
+        field = _get_model_field_or_none(view, name)
+        is_model_field = field is not None
+        if field is None:
+            field = _get_effective_list_field(view, name, queryset=queryset)
+    cache_key = (
+        view.model,
+        name,
+        is_property,
+        is_model_field,
+        type(field),
+        "" if is_model_field or field is None else _get_output_field_signature(field),
     )
+    cached = _LIST_COLUMN_FIELD_CACHE.get(cache_key)
+    if cached is not None:
+        return field, cached
+
+    internal_type = field.get_internal_type() if field is not None else ""
+    column_field = _ListColumnField(
+        field=field,
+        is_model_field=is_model_field,
+        is_many_to_many=bool(
+            field is not None and getattr(field, "many_to_many", False)
+        ),
+        is_boolean_field=internal_type == "BooleanField",
+        is_datetime_field=isinstance(field, models.DateTimeField),
+        is_date_field=isinstance(field, models.DateField),
+        is_time_field=isinstance(field, models.TimeField),
+        is_relation=bool(field is not None and getattr(field, "is_relation", False)),
+        default_align=(
+            None
+            if field is None
+            else ("center" if _should_center_field(field) else "left")
+        ),
+        semantic_width_mode=_get_semantic_column_width_mode(field),
+    )
+    _LIST_COLUMN_FIELD_CACHE[cache_key] = column_field
+    return field, column_field
 
 
 @register.filter
@@ -364,6 +349,42 @@ def _resolve_extra_button_permission_state(
     )
 
 
+_ROW_STATE_MISSING = object()
+
+
+def _resolve_batched_row_states(
+    view: Any,
+    objects: list[Any],
+    request: Any,
+    hook_name: str,
+) -> dict[str, dict[Any, Any]]:
+    """
+    Call an optional per-page batch hook and key its result by ``str(pk)``.
+
+    Returns an empty mapping when the hook is missing, returns nothing, or
+    raises, so rendering falls back to the per-row hooks.
+    """
+    hook = getattr(view, hook_name, None)
+    if not callable(hook) or not objects:
+        return {}
+    try:
+        states = hook(objects, request)
+    except Exception:
+        log.warning("%s() failed; using per-row hooks.", hook_name, exc_info=True)
+        return {}
+    if not isinstance(states, dict):
+        return {}
+    return {str(pk): state for pk, state in states.items() if isinstance(state, dict)}
+
+
+def _get_batched_row_state(object: Any, key: str) -> Any:
+    """Return one value from the row's batched permission state, if supplied."""
+    state = getattr(object, "_row_permission_state", None)
+    if isinstance(state, dict) and key in state:
+        return state[key]
+    return _ROW_STATE_MISSING
+
+
 def _resolve_standard_action_disabled_state(
     *,
     view: Any,
@@ -383,39 +404,44 @@ def _resolve_standard_action_disabled_state(
         return disable, disabled_reason
 
     if action_name == "Edit":
-        can_update = getattr(view, "can_update_object", None)
-        if callable(can_update):
+        state_prefix, checker_name, reason_name = (
+            "update",
+            "can_update_object",
+            "get_update_disabled_reason",
+        )
+    elif action_name == "Delete":
+        state_prefix, checker_name, reason_name = (
+            "delete",
+            "can_delete_object",
+            "get_delete_disabled_reason",
+        )
+    else:
+        return disable, disabled_reason
+
+    allowed = _get_batched_row_state(object, f"can_{state_prefix}")
+    if allowed is _ROW_STATE_MISSING:
+        checker = getattr(view, checker_name, None)
+        allowed = True
+        if callable(checker):
             try:
-                allowed = bool(can_update(object, request))
+                allowed = bool(checker(object, request))
             except Exception:
                 allowed = True
-            if not allowed:
-                disable = True
-                get_reason = getattr(view, "get_update_disabled_reason", None)
-                if callable(get_reason):
-                    try:
-                        disabled_reason = get_reason(object, request)
-                    except Exception:
-                        disabled_reason = None
+    if allowed:
         return disable, disabled_reason
 
-    if action_name != "Delete":
-        return disable, disabled_reason
-
-    can_delete = getattr(view, "can_delete_object", None)
-    if callable(can_delete):
-        try:
-            allowed = bool(can_delete(object, request))
-        except Exception:
-            allowed = True
-        if not allowed:
-            disable = True
-            get_reason = getattr(view, "get_delete_disabled_reason", None)
-            if callable(get_reason):
-                try:
-                    disabled_reason = get_reason(object, request)
-                except Exception:
-                    disabled_reason = None
+    disable = True
+    disabled_reason = _get_batched_row_state(
+        object, f"{state_prefix}_disabled_reason"
+    )
+    if disabled_reason is _ROW_STATE_MISSING:
+        disabled_reason = None
+        get_reason = getattr(view, reason_name, None)
+        if callable(get_reason):
+            try:
+                disabled_reason = get_reason(object, request)
+            except Exception:
+                disabled_reason = None
 
     return disable, disabled_reason
 
@@ -431,14 +457,24 @@ def _resolve_standard_action_permission_allowed(
     Return whether a built-in standard action should be available by permission.
     """
     if action_name == "View":
-        checker = getattr(view, "has_power_detail_permission", None)
+        state_key, checker = "detail_permission", getattr(
+            view, "has_power_detail_permission", None
+        )
     elif action_name == "Edit":
-        checker = getattr(view, "has_power_update_permission", None)
+        state_key, checker = "update_permission", getattr(
+            view, "has_power_update_permission", None
+        )
     elif action_name == "Delete":
-        checker = getattr(view, "has_power_delete_permission", None)
+        state_key, checker = "delete_permission", getattr(
+            view, "has_power_delete_permission", None
+        )
     else:
         return True
 
+    batched_allowed = _get_batched_row_state(object, state_key)
+    if batched_allowed is not _ROW_STATE_MISSING:
+        return bool(batched_allowed)
+
     if not callable(checker):
         return True
 
@@ -641,6 +677,7 @@ def _resolve_list_cell_tooltip(
 
 
 LIST_CELL_OPEN_IN_VALUES = {"current", "new", "modal"}
+_UNCOMPILED_LINK_SPEC = object()
 
 
 def _normalize_list_cell_open_in(value: Any, *, default: str = "new") -> str:
@@ -785,15 +822,39 @@ def _normalize_list_cell_link_result(result: Any, *, view: Any) -> dict[str, Any
     return normalized
 
 
-def _resolve_declarative_list_cell_link(
+@dataclass(frozen=True, slots=True)
+class _ListCellLinkSpec:
+    """Row-independent part of one declarative list-cell link."""
+
+    view_name: str
+    url: str
+    pk_attr: str | None
+    metadata: tuple[tuple[str, Any], ...]
+
+    def resolve(self, view: Any, obj: Any) -> dict[str, Any] | None:
+        """Return link metadata for ``obj`` or ``None`` when it has no target."""
+        url = self.url
+        if self.view_name:
+            if self.pk_attr is None:
+                return None
+            pk_value = getattr(obj, self.pk_attr, None)
+            if pk_value in {None, ""}:
+                return None
+            url = view.safe_reverse(self.view_name, kwargs={"pk": pk_value})
+        if not url:
+            return None
+        return {"url": url, **dict(self.metadata)}
+
+
+def _compile_declarative_list_cell_link(
     *,
     view: Any,
-    obj: Any,
+    model: Any,
     field_name: str,
     is_property: bool,
-) -> dict[str, Any] | None:
+) -> _ListCellLinkSpec | None:
     """
-    Resolve narrow declarative list-cell link config for one rendered cell.
+    Resolve the row-independent parts of declarative list-cell link config.
     """
     configured_links = _resolve_view_option(
         view,
@@ -818,6 +879,7 @@ def _resolve_declarative_list_cell_link(
     if not view_name and not url:
         return None
 
+    pk_attr = None
     if view_name:
         pk_attr = config.get("pk_attr")
         if pk_attr is None:
@@ -825,32 +887,24 @@ def _resolve_declarative_list_cell_link(
                 pk_attr = "pk"
             else:
                 try:
-                    model_field = obj._meta.get_field(field_name)
+                    model_field = model._meta.get_field(field_name)
                 except Exception:
                     model_field = None
                 if model_field is not None and getattr(model_field, "is_relation", False):
                     pk_attr = f"{field_name}_id"
                 else:
                     pk_attr = "pk"
-
-        if not isinstance(pk_attr, str) or not pk_attr.strip():
-            return None
-
-        pk_value = getattr(obj, pk_attr.strip(), None)
-        if pk_value in {None, ""}:
-            return None
-
-        url = view.safe_reverse(view_name, kwargs={"pk": pk_value})
-    if not url:
-        return None
+        # An unusable pk_attr keeps the spec so every row resolves to no link.
+        pk_attr = (
+            pk_attr.strip() if isinstance(pk_attr, str) and pk_attr.strip() else None
+        )
 
     open_in = _normalize_list_cell_open_in(
         config.get("open_in"),
         default=_resolve_list_cell_default_open_in(view),
     )
 
-    normalized: dict[str, Any] = {
-        "url": url,
+    metadata: dict[str, Any] = {
         "classes": str(
             get_template_pack_styles(view.get_framework_styles()).get(
                 "list_cell_link_class", "link link-info"
@@ -859,9 +913,9 @@ def _resolve_declarative_list_cell_link(
         "open_in": open_in,
     }
     if open_in == "new":
-        normalized["target"] = "_blank"
-        normalized["rel"] = "noopener noreferrer"
-    normalized.update(
+        metadata["target"] = "_blank"
+        metadata["rel"] = "noopener noreferrer"
+    metadata.update(
         _resolve_list_cell_modal_metadata(
             view=view,
             open_in=open_in,
@@ -869,7 +923,33 @@ def _resolve_declarative_list_cell_link(
             modal_presentation=config.get("modal_presentation"),
         )
     )
-    return normalized
+    return _ListCellLinkSpec(
+        view_name=view_name,
+        url=url,
+        pk_attr=pk_attr,
+        metadata=tuple(metadata.items()),
+    )
+
+
+def _resolve_declarative_list_cell_link(
+    *,
+    view: Any,
+    obj: Any,
+    field_name: str,
+    is_property: bool,
+) -> dict[str, Any] | None:
+    """
+    Resolve narrow declarative list-cell link config for one rendered cell.
+    """
+    link_spec = _compile_declarative_list_cell_link(
+        view=view,
+        model=type(obj),
+        field_name=field_name,
+        is_property=is_property,
+    )
+    if link_spec is None:
+        return None
+    return link_spec.resolve(view, obj)
 
 
 def _resolve_list_cell_link(
@@ -881,9 +961,13 @@ def _resolve_list_cell_link(
     is_property: bool,
     is_inline_editable: bool,
     request: Any,
+    link_spec: Any = _UNCOMPILED_LINK_SPEC,
 ) -> dict[str, Any] | None:
     """
     Resolve final list-cell link metadata, preferring hook overrides.
+
+    ``link_spec`` accepts the column's precompiled declarative link so the
+    link config is not re-read for every row.
     """
     if is_inline_editable:
         return None
@@ -908,6 +992,8 @@ def _resolve_list_cell_link(
         if normalized is not None:
             return normalized
 
+    if link_spec is not _UNCOMPILED_LINK_SPEC:
+        return link_spec.resolve(view, obj) if link_spec is not None else None
     return _resolve_declarative_list_cell_link(
         view=view,
         obj=obj,
@@ -993,6 +1079,7 @@ def _resolve_row_action_context(view: Any, object: Any) -> dict[str, Any]:
     # Standard actions with framework-specific button classes
     lock_reason = getattr(object, "_blocked_reason", None)
     lock_label = getattr(object, "_blocked_label", None)
+    batched_extra_action_states = getattr(object, "_extra_action_states", None) or {}
 
     standard_action_items: List[Dict[str, Any]] = []
     standard_actions = [
@@ -1046,33 +1133,41 @@ def _resolve_row_action_context(view: Any, object: Any) -> dict[str, Any]:
         )
 
         if url is not None:
-            hide_permission, disable_permission, permission_disabled_reason = (
-                _resolve_extra_action_permission_state(
-                    view=view,
-                    object=object,
-                    action=action,
-                    request=getattr(view, "request", None),
+            batched_state = batched_extra_action_states.get(str(action_index))
+            if batched_state is not None:
+                if batched_state.get("hidden"):
+                    continue
+                disable_permission = False
+                permission_disabled_reason = None
+                lazy_hidden_if = False
+            else:
+                hide_permission, disable_permission, permission_disabled_reason = (
+                    _resolve_extra_action_permission_state(
+                        view=view,
+                        object=object,
+                        action=action,
+                        request=getattr(view, "request", None),
+                    )
                 )
-            )
-            if hide_permission:
-                continue
+                if hide_permission:
+                    continue
 
-            lazy_hidden_if = (
-                is_row_actions_dropdown_mode(extra_actions_mode)
-                and row_action_states_url
-                and is_lazy_hidden_if_action(action)
-            )
-            if (
-                not disable_permission
-                and not lazy_hidden_if
-                and _resolve_extra_action_hidden_state(
-                    view=view,
-                    object=object,
-                    action=action,
-                    request=getattr(view, "request", None),
+                lazy_hidden_if = (
+                    is_row_actions_dropdown_mode(extra_actions_mode)
+                    and row_action_states_url
+                    and is_lazy_hidden_if_action(action)
                 )
-            ):
-                continue
+                if (
+                    not disable_permission
+                    and not lazy_hidden_if
+                    and _resolve_extra_action_hidden_state(
+                        view=view,
+                        object=object,
+                        action=action,
+                        request=getattr(view, "request", None),
+                    )
+                ):
+                    continue
 
             htmx_target: str = action.get("htmx_target", default_target)
             if htmx_target and not htmx_target.startswith("#"):
@@ -1096,7 +1191,14 @@ def _resolve_row_action_context(view: Any, object: Any) -> dict[str, Any]:
 
             lazy_disabled_state = False
             lazy_row_action_state = lazy_hidden_if
-            if disable_permission:
+            if batched_state is not None:
+                disable_extra = bool(batched_state.get("disabled"))
+                disabled_reason = (
+                    batched_state.get("reason") or None if disable_extra else None
+                )
+                if not disable_extra and lock_reason and action.get("lock_sensitive"):
+                    disable_extra, disabled_reason = True, lock_label
+            elif disable_permission:
                 disable_extra = True
                 disabled_reason = permission_disabled_reason
             elif (
@@ -1400,6 +1502,150 @@ def object_detail(object, view):
     }
 
 
+@dataclass(frozen=True, slots=True)
+class _ListColumnRenderer:
+    """Precompiled rendering decisions for one active list column."""
+
+    name: str
+    label: Any
+    is_property: bool
+    is_model_property: bool
+    column: _ListColumnField
+    datetime_value_format: str
+    configured_align: str | None
+    width_mode: str
+    is_inline_editable: bool
+    tooltip_spec: Any
+    dependency: dict[str, Any] | None
+    link_spec: _ListCellLinkSpec | None
+
+    def align_for(self, raw_value: Any) -> str:
+        """Return the column alignment, inspecting the value only when untyped."""
+        if self.configured_align is not None:
+            return self.configured_align
+        if self.column.default_align is not None:
+            return self.column.default_align
+        return "center" if isinstance(raw_value, bool) else "left"
+
+    def format_value(self, obj: Any) -> tuple[Any, Any]:
+        """Return the raw attribute value and its list-cell display value."""
+        if self.is_property:
+            value = getattr(obj, self.name)
+            if self.is_model_property and value is True:
+                return value, mark_safe(_BOOLEAN_TICK_SVG)
+            if self.is_model_property and value is False:
+                return value, mark_safe(_BOOLEAN_CROSS_SVG)
+            if isinstance(value, (date, datetime)) and value is not None:
+                return value, value.strftime("%d/%m/%Y")
+            return value, str(value)
+
+        column = self.column
+        value = getattr(obj, self.name, None)
+        if column.is_many_to_many:
+            return value, ", ".join(str(item) for item in value.all())
+
+        if column.is_boolean_field or isinstance(value, bool):
+            if value is True:
+                return value, mark_safe(_BOOLEAN_TICK_SVG)
+            if value is False:
+                return value, mark_safe(_BOOLEAN_CROSS_SVG)
+            return value, ""
+
+        if column.is_datetime_field and isinstance(value, datetime):
+            localized_value = template_localtime(value)
+            if self.datetime_value_format == "date":
+                return value, date_format(localized_value, "DATE_FORMAT", use_l10n=False)
+            if self.datetime_value_format == "time":
+                return value, time_format(localized_value, "TIME_FORMAT", use_l10n=False)
+            return value, date_format(localized_value, "DATETIME_FORMAT", use_l10n=False)
+
+        if column.is_date_field and isinstance(value, date):
+            return value, date_format(value, "DATE_FORMAT", use_l10n=False)
+
+        if column.is_time_field and isinstance(value, time):
+            return value, time_format(value, "TIME_FORMAT", use_l10n=False)
+
+        if isinstance(value, (date, datetime)) and value is not None:
+            return value, value.strftime("%d/%m/%Y")
+
+        if column.is_relation:
+            return value, str(value)
+
+        if column.is_model_field:
+            return value, column.field.value_to_string(obj)
+
+        return value, "" if value is None else str(value)
+
+
+def _compile_list_column_plan(
+    view: Any,
+    *,
+    fields: list[str],
+    properties: list[str],
+    queryset: Any,
+    column_alignments: dict[str, str],
+    column_value_formats: dict[str, str],
+    column_width_policy: str,
+    column_width_modes: dict[str, str],
+    default_datetime_value_format: str,
+    tooltip_specs: dict[str, Any],
+    inline_enabled: bool,
+    inline_fields: set[str],
+    inline_dependencies: dict[str, Any],
+) -> tuple[_ListColumnRenderer, ...]:
+    """
+    Build one renderer per active column so the row loop only applies them.
+
+    Field metadata is shared across requests. View options are resolved once
+    per render because hooks such as ``get_column_alignments()`` may vary by
+    request.
+    """
+    renderers = []
+    columns = [(name, False) for name in fields] + [(name, True) for name in properties]
+    for name, is_property in columns:
+        field, column = _get_list_column_field(
+            view, name, is_property=is_property, queryset=queryset
+        )
+        if is_property:
+            label = resolve_property_label(view, name, getattr(view.model, name, None))
+        else:
+            label = resolve_field_label(view, name, field)
+        explicit_width_mode = column_width_modes.get(name)
+        if explicit_width_mode:
+            width_mode = explicit_width_mode
+        elif column_width_policy == "semantic":
+            width_mode = column.semantic_width_mode
+        else:
+            width_mode = "bounded"
+        is_inline_editable = inline_enabled and name in inline_fields
+        renderers.append(
+            _ListColumnRenderer(
+                name=name,
+                label=label,
+                is_property=is_property,
+                is_model_property=is_property
+                and isinstance(getattr(view.model, name, None), property),
+                column=column,
+                datetime_value_format=column_value_formats.get(name)
+                or default_datetime_value_format,
+                configured_align=column_alignments.get(name),
+                width_mode=width_mode,
+                is_inline_editable=is_inline_editable,
+                tooltip_spec=tooltip_specs.get(name),
+                dependency=inline_dependencies.get(name) or None,
+                link_spec=None
+                if is_inline_editable
+                else _compile_declarative_list_cell_link(
+                    view=view,
+                    model=view.model,
+                    field_name=name,
+                    is_property=is_property,
+                ),
+            )
+        )
+    return tuple(renderers)
+
+
 @register.inclusion_tag(
     _SelectedPackTemplateNames("partial/list.html"), takes_context=True
 )
@@ -1453,6 +1699,17 @@ def object_list(context, objects, view):
     request = context.get("request") or getattr(view, "request", None)
     selected_ids = []
     if (
+        request
+        and enable_selection_controls
+        and hasattr(view, "get_selected_ids_among")
+    ):
+        # Only the rendered rows are looked up, so predicate selections are
+        # not read id by id.
+        objects = list(objects)
+        selected_ids = view.get_selected_ids_among(
+            request, [obj.pk for obj in objects]
+        )
+    elif (
         request
         and enable_selection_controls
         and hasattr(view, "get_selected_ids_from_session")
@@ -1460,6 +1717,7 @@ def object_list(context, objects, view):
         selected_ids = view.get_selected_ids_from_session(request)
         # Convert to strings for comparison
         selected_ids = [str(id) for id in selected_ids]
+    selected_id_set = set(selected_ids)
 
     # Get selection key suffix if available
     selection_key_suffix = ""
@@ -1545,61 +1803,37 @@ def object_list(context, objects, view):
     }
     list_cell_tooltip_url_getter = getattr(view, "get_list_cell_tooltip_url", None)
 
+    column_plan = _compile_list_column_plan(
+        view,
+        fields=fields,
+        properties=properties,
+        queryset=queryset,
+        column_alignments=column_alignments,
+        column_value_formats=column_value_formats,
+        column_width_policy=column_width_policy,
+        column_width_modes=column_width_modes,
+        default_datetime_value_format=default_datetime_value_format,
+        tooltip_specs=eligible_cell_tooltip_fields,
+        inline_enabled=inline_enabled,
+        inline_fields=inline_fields,
+        inline_dependencies=inline_dependencies,
+    )
+
     objects = list(objects)
     first_object = objects[0] if objects else None
 
-    # Create header metadata for each field
-    headers = []
-    for f in fields:
-        field = _get_effective_list_field(view, f, queryset=queryset)
-        headers.append(
-            {
-                "label": resolve_field_label(view, f, field),
-                "field_name": f,
-                "is_sortable": True,
-                "help_text": column_help_text.get(f, ""),
-                "align": _resolve_list_column_alignment(
-                    column_alignments=column_alignments,
-                    name=f,
-                    field=field,
-                    raw_value=getattr(first_object, f, None),
-                ),
-                "width_mode": _resolve_column_width_mode(
-                    field_name=f,
-                    field=field,
-                    policy=column_width_policy,
-                    configured_modes=column_width_modes,
-                ),
-            }
-        )
-
-    # Add properties with proper display names (not sortable)
-    for prop in properties:
-        prop_obj = getattr(view.model, prop, None)
-        display_name = resolve_property_label(view, prop, prop_obj)
-        headers.append(
-            {
-                "label": display_name,
-                "field_name": prop,
-                "is_sortable": False,
-                "help_text": column_help_text.get(prop, ""),
-                "align": _resolve_list_column_alignment(
-                    column_alignments=column_alignments,
-                    name=prop,
-                    field=None,
-                    raw_value=getattr(first_object, prop, None),
-                ),
-                "width_mode": _resolve_column_width_mode(
-                    field_name=prop,
-                    field=None,
-                    policy=column_width_policy,
-                    configured_modes=column_width_modes,
-                ),
-            }
-        )
-
-    TICK_SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16" fill="green" class="pc-boolean-icon size-4 inline-block"><path fill-rule="evenodd" d="M8 15A7 7 0 1 0 8 1a7 7 0 0 0 0 14Zm3.844-8.791a.75.75 0 0 0-1.188-.918l-3.7 4.79-1.649-1.833a.75.75 0 1 0-1.114 1.004l2.25 2.5a.75.75 0 0 0 1.15-.043l4.25-5.5Z" clip-rule="evenodd" /></svg>'
-    CROSS_SVG = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 16 16" fill="crimson" class="pc-boolean-icon size-4 inline-block"><path fill-rule="evenodd" d="M8 15A7 7 0 1 0 8 1a7 7 0 0 0 0 14Zm2.78-4.22a.75.75 0 0 1-1.06 0L8 9.06l-1.72 1.72a.75.75 0 1 1-1.06-1.06L6.94 8 5.22 6.28a.75.75 0 0 1 1.06-1.06L8 6.94l1.72-1.72a.75.75 0 1 1 1.06 1.06L9.06 8l1.72 1.72a.75.75 0 0 1 0 1.06Z" clip-rule="evenodd" /></svg>'
+    # Create header metadata for each field, then properties (not sortable)
+    headers = [
+        {
+            "label": renderer.label,
+            "field_name": renderer.name,
+            "is_sortable": not renderer.is_property,
+            "help_text": column_help_text.get(renderer.name, ""),
+            "align": renderer.align_for(getattr(first_object, renderer.name, None)),
+            "width_mode": renderer.width_mode,
+        }
+        for renderer in column_plan
+    ]
 
     bottom_row_count_for_upward_dropdown = _resolve_view_option(
         view,
@@ -1615,6 +1849,17 @@ def object_list(context, objects, view):
         0,
     )
 
+    row_permission_states = _resolve_batched_row_states(
+        view, objects, request, "get_row_permission_states"
+    )
+    extra_action_states = _resolve_batched_row_states(
+        view, objects, request, "get_extra_action_states"
+    )
+    resolve_inline_lock_states = getattr(view, "resolve_inline_lock_states", None)
+    if inline_enabled and inline_row_endpoint and callable(resolve_inline_lock_states):
+        # One cache get_many for every row's lock key instead of one get per row.
+        resolve_inline_lock_states(objects)
+
     object_list = []
     for row_index, obj in enumerate(objects):
         row_id = getattr(view, "get_inline_row_id", None)
@@ -1635,48 +1880,67 @@ def object_list(context, objects, view):
         inline_allowed = False
         action_blocked_reason = None
         action_blocked_label = None
-        can_update = getattr(view, "can_update_object", None)
-        update_allowed = True
-        if not _resolve_standard_action_permission_allowed(
+        row_key = str(obj.pk)
+        obj._row_permission_state = row_permission_states.get(row_key)
+        row_extra_action_states = extra_action_states.get(row_key)
+        obj._extra_action_states = (
+            {str(index): state for index, state in row_extra_action_states.items()}
+            if row_extra_action_states
+            else None
+        )
+        update_allowed = _resolve_standard_action_permission_allowed(
             view=view,
             object=obj,
             action_name="Edit",
             request=request,
-        ):
-            update_allowed = False
-        if update_allowed and callable(can_update):
-            try:
-                update_allowed = bool(can_update(obj, request))
-            except Exception:
+        )
+        if update_allowed:
+            update_allowed = _get_batched_row_state(obj, "can_update")
+            if update_allowed is _ROW_STATE_MISSING:
+                can_update = getattr(view, "can_update_object", None)
                 update_allowed = True
+                if callable(can_update):
+                    try:
+                        update_allowed = bool(can_update(obj, request))
+                    except Exception:
+                        update_allowed = True
+            update_allowed = bool(update_allowed)
         if not update_allowed:
-            get_update_reason = getattr(view, "get_update_disabled_reason", None)
-            if callable(get_update_reason):
-                try:
-                    action_blocked_label = get_update_reason(obj, request)
-                except Exception:
-                    action_blocked_label = None
+            action_blocked_label = _get_batched_row_state(obj, "update_disabled_reason")
+            if action_blocked_label is _ROW_STATE_MISSING:
+                action_blocked_label = None
+                get_update_reason = getattr(view, "get_update_disabled_reason", None)
+                if callable(get_update_reason):
+                    try:
+                        action_blocked_label = get_update_reason(obj, request)
+                    except Exception:
+                        action_blocked_label = None
 
         if inline_enabled and inline_row_url:
-            lock_checker = getattr(view, "is_inline_row_locked", None)
-            is_locked = False
-            if callable(lock_checker):
-                try:
-                    is_locked = bool(lock_checker(obj))
-                except Exception:
-                    is_locked = False
+            is_locked = _get_batched_row_state(obj, "inline_locked")
+            if is_locked is _ROW_STATE_MISSING:
+                lock_checker = getattr(view, "is_inline_row_locked", None)
+                is_locked = False
+                if callable(lock_checker):
+                    try:
+                        is_locked = bool(lock_checker(obj))
+                    except Exception:
+                        is_locked = False
+            is_locked = bool(is_locked)
 
-            can_inline_callable = getattr(view, "can_inline_edit", None)
-            can_inline = inline_enabled
-            if callable(can_inline_callable) and request is not None:
-                try:
-                    can_inline = bool(can_inline_callable(obj, request))
-                except Exception:
+            can_inline = _get_batched_row_state(obj, "can_inline_edit")
+            if can_inline is _ROW_STATE_MISSING:
+                can_inline_callable = getattr(view, "can_inline_edit", None)
+                if callable(can_inline_callable) and request is not None:
+                    try:
+                        can_inline = bool(can_inline_callable(obj, request))
+                    except Exception:
+                        can_inline = False
+                elif not callable(can_inline_callable):
+                    can_inline = inline_enabled
+                else:
                     can_inline = False
-            elif not callable(can_inline_callable):
-                can_inline = inline_enabled
-            else:
-                can_inline = False
+            can_inline = bool(can_inline)
 
             if is_locked:
                 lock_details = {}
@@ -1712,8 +1976,7 @@ def object_list(context, objects, view):
                 kwargs={"pk": obj.pk},
             ) or view.safe_reverse(dependency_endpoint_name)
 
-        def resolve_cell_dependency(field_name: str):
-            dependency = inline_dependencies.get(field_name)
+        def resolve_cell_dependency(dependency):
             if not dependency:
                 return None
             resolved = dict(dependency)
@@ -1747,8 +2010,8 @@ def object_list(context, objects, view):
             field_name: str,
             *,
             is_property: bool,
+            spec: Any,
         ) -> dict[str, str | None]:
-            spec = eligible_cell_tooltip_fields.get(field_name)
             if not spec:
                 return {
                     "tooltip_text": None,
@@ -1788,7 +2051,7 @@ def object_list(context, objects, view):
         record = {
             "object": obj,
             "id": str(obj.pk),  # Add ID for selection tracking
-            "is_selected": str(obj.pk) in selected_ids
+            "is_selected": str(obj.pk) in selected_id_set
             if enable_selection_controls
             else False,  # Check if this object is selected
             "row_id": row_id,
@@ -1803,116 +2066,32 @@ def object_list(context, objects, view):
             "has_actions": has_actions,
         }
 
-        for f in fields:
-            model_field = _get_model_field_or_none(view, f)
-            effective_field = model_field or _get_effective_list_field(
-                view,
-                f,
-                queryset=queryset,
-            )
-            display_value = _format_list_field_value(
-                obj,
-                f,
-                effective_field,
-                TICK_SVG,
-                CROSS_SVG,
-                is_model_field=model_field is not None,
-                value_format=column_value_formats.get(f),
-                default_datetime_value_format=default_datetime_value_format,
-            )
-
-            cell_align = _resolve_list_column_alignment(
-                column_alignments=column_alignments,
-                name=f,
-                field=effective_field,
-                raw_value=getattr(obj, f, None),
-            )
-            tooltip_metadata = resolve_cell_tooltip_metadata(f, is_property=False)
-
+        for renderer in column_plan:
+            raw_value, display_value = renderer.format_value(obj)
             record["cells"].append(
                 {
-                    "name": f,
-                    "label": resolve_field_label(view, f, effective_field),
+                    "name": renderer.name,
+                    "label": renderer.label,
                     "value": display_value,
-                    "is_property": False,
-                    "is_inline_editable": inline_enabled and f in inline_fields,
-                    "dependency": resolve_cell_dependency(f),
-                    "align": cell_align,
-                    "width_mode": _resolve_column_width_mode(
-                        field_name=f,
-                        field=effective_field,
-                        policy=column_width_policy,
-                        configured_modes=column_width_modes,
+                    "is_property": renderer.is_property,
+                    "is_inline_editable": renderer.is_inline_editable,
+                    "dependency": resolve_cell_dependency(renderer.dependency),
+                    "align": renderer.align_for(raw_value),
+                    "width_mode": renderer.width_mode,
+                    **resolve_cell_tooltip_metadata(
+                        renderer.name,
+                        is_property=renderer.is_property,
+                        spec=renderer.tooltip_spec,
                     ),
-                    **tooltip_metadata,
                     "link": _resolve_list_cell_link(
                         view=view,
                         obj=obj,
-                        field_name=f,
+                        field_name=renderer.name,
                         value=display_value,
-                        is_property=False,
-                        is_inline_editable=inline_enabled and f in inline_fields,
-                        request=request,
-                    ),
-                }
-            )
-            record["fields"].append(display_value)
-
-        for prop in properties:
-            prop_value = getattr(obj, prop)
-            prop_align = _resolve_list_column_alignment(
-                column_alignments=column_alignments,
-                name=prop,
-                field=None,
-                raw_value=prop_value,
-            )
-            tooltip_metadata = resolve_cell_tooltip_metadata(
-                prop,
-                is_property=True,
-            )
-            if (
-                isinstance(getattr(obj.__class__, prop), property)
-                and prop_value is True
-            ):
-                display_value = mark_safe(TICK_SVG)
-            elif (
-                isinstance(getattr(obj.__class__, prop), property)
-                and prop_value is False
-            ):
-                display_value = mark_safe(CROSS_SVG)
-            elif isinstance(prop_value, (date, datetime)) and prop_value is not None:
-                display_value = prop_value.strftime("%d/%m/%Y")
-            else:
-                display_value = str(prop_value)
-
-            record["cells"].append(
-                {
-                    "name": prop,
-                    "label": resolve_property_label(
-                        view,
-                        prop,
-                        getattr(view.model, prop, None),
-                    ),
-                    "value": display_value,
-                    "is_property": True,
-                    "is_inline_editable": inline_enabled and prop in inline_fields,
-                    "dependency": resolve_cell_dependency(prop),
-                    "align": prop_align,
-                    "width_mode": _resolve_column_width_mode(
-                        field_name=prop,
-                        field=None,
-                        policy=column_width_policy,
-                        configured_modes=column_width_modes,
-                    ),
-                    **tooltip_metadata,
-                    "link": _resolve_list_cell_link(
-                        view=view,
-                        obj=obj,
-                        field_name=prop,
-                        value=display_value,
-                        is_property=True,
-                        is_inline_editable=inline_enabled and prop in inline_fields,
+                        is_property=renderer.is_property,
+                        is_inline_editable=renderer.is_inline_editable,
                         request=request,
+                        link_spec=renderer.link_spec,
                     ),
                 }
             )
@@ -1926,7 +2105,7 @@ def object_list(context, objects, view):
     # Get all current filter parameters
     filter_params = build_navigation_querydict(
         request.GET if request else {},
-        exclude={"sort", "page"},
+        exclude={"sort", "page", "cursor"},
     )
 
     use_htmx = context.get("use_htmx", view.get_use_htmx())
@@ -1940,6 +2119,10 @@ def object_list(context, objects, view):
         else getattr(view, "extra_actions_mode", "dropdown"),
     )
     has_row_actions = any(row.get("has_actions") for row in object_list)
+    list_stream = context.get("list_stream")
+    if list_stream is not None:
+        # Streamed chunks must keep the actions column of the first chunk.
+        has_row_actions = list_stream.share_has_row_actions(has_row_actions)
     inline_edit_always_visible = False
     if hasattr(view, "get_inline_edit_always_visible"):
         inline_edit_always_visible = view.get_inline_edit_always_visible()
@@ -2003,9 +2186,33 @@ def object_list(context, objects, view):
             "bulk_selection_controls_template_paths"
         )
         or _get_focused_component_template_paths(view, "bulk_selection_controls"),
+        "list_stream_marker": getattr(list_stream, "marker", ""),
     }
 
 
+_STREAMED_ROWS_TEMPLATE = None
+
+
+def render_object_list_rows(context, objects, view) -> str:
+    """
+    Render only the table rows for ``objects``.
+
+    Used to stream the remaining chunks of an unpaginated list after the page
+    has rendered. ``context`` is the list view context, so each chunk is built
+    with the same columns, selection state, and row templates as the page.
+    """
+    global _STREAMED_ROWS_TEMPLATE
+    if _STREAMED_ROWS_TEMPLATE is None:
+        _STREAMED_ROWS_TEMPLATE = engines["django"].from_string(
+            "{% with inline_enabled=inline_edit.enabled %}"
+            "{% for row in object_list %}{% include table_row_template_paths %}"
+            "{% endfor %}{% endwith %}"
+        )
+    row_context = object_list(context, objects, view)
+    row_context["list_stream_marker"] = ""
+    return _STREAMED_ROWS_TEMPLATE.render(row_context, context.get("request"))
+
+
 @register.simple_tag
 def get_proper_elided_page_range(paginator, number, on_each_side=1, on_ends=1):
     """
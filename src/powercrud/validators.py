@@ -151,7 +151,15 @@ class PowerCRUDMixinValidator(BaseModel):
         default=None, ge=0
     )
     show_record_count: Optional[bool] = None
+    record_count_strategy: Optional[
+        Literal["exact", "cached", "estimated", "has_more"]
+    ] = "exact"
+    record_count_cache_timeout: Optional[int] = Field(default=None, gt=0)
     show_bulk_selection_meta: Optional[bool] = None
+    bulk_select_all_predicate: Optional[bool] = None
+    auto_related_lookups: Optional[bool] = None
+    list_column_projection: Optional[bool] = None
+    property_field_dependencies: Optional[Dict[str, List[str]]] = None
     extra_button_selection_controls_disabled: Optional[bool] = False
 
     # form fields
@@ -164,6 +172,8 @@ class PowerCRUDMixinValidator(BaseModel):
     bulk_fields: Optional[List[str]] = None
     bulk_delete: Optional[bool] = None
     bulk_full_clean: Optional[bool] = None
+    bulk_update_strategy: Optional[Literal["auto", "save", "update"]] = None
+    bulk_chunk_size: Optional[int] = Field(default=None, gt=0)
     bulk_async: Optional[bool] = None
     bulk_async_conflict_checking: Optional[bool] = None
     bulk_min_async_records: Optional[int] = None
@@ -175,7 +185,10 @@ class PowerCRUDMixinValidator(BaseModel):
     dropdown_sort_options: Optional[Dict[str, str]] = None
     default_filterset_fields: Optional[List[str]] = None
     filter_null_fields_exclude: Optional[List[str]] = None
+    list_search_fields: Optional[List[str]] = None
+    list_search_backend: Optional[str] = None
     m2m_filter_and_logic: Optional[bool] = None
+    m2m_filter_and_strategy: Optional[Literal["auto", "joins", "grouped"]] = None
     inline_preserve_required_fields: Optional[bool] = None
     async_manager_class: Optional[Any] = None
     async_manager_class_path: Optional[str] = None
@@ -183,6 +196,15 @@ class PowerCRUDMixinValidator(BaseModel):
     paginate_by: Optional[int] = DEFAULT_PAGINATE_BY
     page_size_options: Optional[List[int]] = None
     page_size_all_enabled: Optional[bool] = True
+    page_size_all_streaming: Optional[bool] = None
+    page_size_all_stream_chunk_size: Optional[int] = Field(default=None, gt=0)
+    pagination_mode: Optional[Literal["offset", "keyset"]] = "offset"
+    list_snapshot: Optional[bool] = None
+    list_snapshot_timeout: Optional[int] = Field(default=None, gt=0)
+    list_snapshot_max_rows: Optional[int] = Field(default=None, gt=0)
+    list_snapshot_watch_models: Optional[List[Any]] = None
+    remote_relation_options: Optional[Union[bool, List[str]]] = None
+    relation_options_page_size: Optional[int] = Field(default=None, gt=0)
 
     @field_validator("fields", "properties", "detail_fields", "detail_properties")
     @classmethod
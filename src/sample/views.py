@@ -196,6 +196,12 @@ class BookCRUDView(SampleCRUDMixin):
     fields = "__all__"
     exclude = ["description"]
     properties = "__all__"
+    property_field_dependencies = {
+        "isbn_empty": ["isbn"],
+        "description_empty": ["description"],
+        "there_are_so_many_pages_this_header_surely_will_wrap": ["pages"],
+        "a_really_long_property_header_for_title": ["title"],
+    }
     list_options_enabled = True
     column_width_policy = "semantic"
     default_list_fields = [
@@ -229,6 +229,22 @@ class TestConflictDetection(AsyncManagerTestMixin, TestCase):
         conflicts = self.async_manager.check_conflict(object_data)
         self.assertEqual(conflicts, {2}, "Should detect conflict on Book ID 2")
 
+    def test_get_lock_task_names_reads_all_keys_in_one_call(self):
+        """Test page-level lock lookups use a single cache get_many call."""
+        self.async_manager.add_conflict_ids("page_task", {"myapp.Book": {2, 4}})
+
+        with patch.object(
+            self.async_manager.cache,
+            "get_many",
+            wraps=self.async_manager.cache.get_many,
+        ) as get_many:
+            task_names = self.async_manager.get_lock_task_names(
+                "myapp.Book", [1, 2, 3, 4]
+            )
+
+        self.assertEqual(task_names, {2: "page_task", 4: "page_task"})
+        self.assertEqual(get_many.call_count, 1, "Should batch every lock key")
+
     def test_remove_conflict_ids_cleanup(self):
         """Test complete cleanup of per-object locks and tracking sets."""
         task_id = "cleanup_task"
@@ -0,0 +1,25 @@
+"""Collection rules for opt-in PowerCRUD performance benchmarks.
+
+Benchmarks compare a "before" and "after" code path inside one process and
+print the timings. They are skipped unless ``POWERCRUD_RUN_BENCHMARKS=1`` so the
+regular suite stays fast and free of timing-sensitive assertions.
+"""
+
+import os
+
+import pytest
+
+
+def pytest_collection_modifyitems(config, items):
+    """Mark every benchmark and skip it unless benchmarks were requested."""
+    run_benchmarks = os.environ.get("POWERCRUD_RUN_BENCHMARKS") == "1"
+    skip_marker = pytest.mark.skip(
+        reason="set POWERCRUD_RUN_BENCHMARKS=1 to run benchmarks"
+    )
+    benchmark_dir = os.path.dirname(__file__)
+    for item in items:
+        if not str(item.fspath).startswith(benchmark_dir):
+            continue
+        item.add_marker(pytest.mark.benchmark)
+        if not run_benchmarks:
+            item.add_marker(skip_marker)
@@ -0,0 +1,61 @@
+"""Timing helpers shared by the opt-in PowerCRUD benchmarks."""
+
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timing summary for one measured callable."""
+
+    label: str
+    median_ms: float
+    best_ms: float
+    rounds: int
+
+    def __str__(self) -> str:
+        return (
+            f"{self.label}: median {self.median_ms:.3f} ms, "
+            f"best {self.best_ms:.3f} ms over {self.rounds} rounds"
+        )
+
+
+def measure(
+    label: str,
+    func: Callable[[], object],
+    *,
+    rounds: int = 20,
+    warmup: int = 2,
+    setup: Callable[[], object] | None = None,
+) -> BenchmarkResult:
+    """Time ``func`` over several rounds, running ``setup`` untimed before each."""
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        func()
+
+    samples = []
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+
+    return BenchmarkResult(
+        label=label,
+        median_ms=statistics.median(samples),
+        best_ms=min(samples),
+        rounds=rounds,
+    )
+
+
+def report(*results: BenchmarkResult) -> None:
+    """Print benchmark results plus the speed-up of the last result vs the first."""
+    for result in results:
+        print(result)
+    if len(results) >= 2 and results[-1].median_ms:
+        speedup = results[0].median_ms / results[-1].median_ms
+        print(f"speed-up ({results[0].label} -> {results[-1].label}): {speedup:.1f}x")
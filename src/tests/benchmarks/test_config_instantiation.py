@@ -0,0 +1,31 @@
+"""Benchmark per-request view instantiation with and without compiled config."""
+
+from neapolitan.views import Role
+
+from powercrud.mixins.config_mixin import clear_compiled_config_cache
+from sample.views import BookCRUDView
+
+from .harness import measure, report
+
+
+def test_view_instantiation_uses_compiled_config():
+    """Compare a cold pipeline run with the cached compiled overlay."""
+    initkwargs = Role.LIST.extra_initkwargs()
+
+    uncached = measure(
+        "uncompiled __init__",
+        lambda: BookCRUDView(**initkwargs),
+        setup=clear_compiled_config_cache,
+        rounds=50,
+    )
+    BookCRUDView(**initkwargs)
+    cached = measure(
+        "compiled __init__",
+        lambda: BookCRUDView(**initkwargs),
+        rounds=200,
+    )
+    report(uncached, cached)
+
+    assert cached.median_ms < uncached.median_ms, (
+        "Instantiating from the compiled config should be cheaper than a cold run."
+    )
@@ -0,0 +1,109 @@
+"""Benchmark offset against keyset pagination on page 1 and page 10,000."""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+from neapolitan.views import Role
+
+from powercrud.mixins.paginate_mixin import KEYSET_CURSOR_QUERY_PARAM
+from sample.models import Author, Book
+from sample.views import BookCRUDView
+
+from .harness import measure, report
+
+PAGE_SIZE = 10
+DEEP_PAGE = 10_000
+ROW_COUNT = PAGE_SIZE * DEEP_PAGE
+
+
+class KeysetBookView(BookCRUDView):
+    """Sample book view paginated with keyset cursors."""
+
+    pagination_mode = "keyset"
+
+
+def _create_rows() -> None:
+    """Create enough books for page 10,000 to exist."""
+    author = Author.objects.create(name="Bench Author")
+    for start in range(0, ROW_COUNT, 10_000):
+        Book.objects.bulk_create(
+            Book(
+                title=f"Bench {index}",
+                author=author,
+                published_date="2024-01-01",
+                isbn=f"974{index:010d}",
+                pages=index,
+            )
+            for index in range(start, min(start + 10_000, ROW_COUNT))
+        )
+
+
+def _view(view_class, query: str = ""):
+    """Return ``view_class`` bound to an anonymous list request."""
+    request = RequestFactory().get(f"/?{query}")
+    request.htmx = False
+    request.session = {}
+    request.user = AnonymousUser()
+    view = view_class(role=Role.LIST)
+    view.setup(request)
+    return view
+
+
+def _paginate(view):
+    """Fetch the requested page's rows through the view's pagination."""
+    queryset = view._apply_queryset_sorting(Book.objects.all())
+    page = view.paginate_queryset(queryset, PAGE_SIZE)
+    rows = list(page.object_list)
+    assert len(rows) == PAGE_SIZE
+    return rows
+
+
+def _deep_cursor_query(sort: str) -> str:
+    """Return the query string of keyset page 10,000 for ``sort``."""
+    view = _view(KeysetBookView, f"sort={sort}")
+    queryset = view._apply_queryset_sorting(Book.objects.all())
+    ordering = view.get_keyset_ordering(queryset)
+    offset = PAGE_SIZE * (DEEP_PAGE - 1)
+    previous_row = queryset[offset - 1]
+    cursor = view._encode_keyset_cursor(
+        ordering, previous_row, "next", offset, view._get_keyset_query_key()
+    )
+    return view._build_keyset_query_string(cursor)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("sort", ["isbn", "-isbn"])
+def test_keyset_deep_page_matches_first_page_cost(sort):
+    """Offset pagination slows down on deep pages; keyset pagination should not."""
+    _create_rows()
+    deep_query = _deep_cursor_query(sort)
+    assert KEYSET_CURSOR_QUERY_PARAM in deep_query
+
+    offset_views = {
+        1: _view(BookCRUDView, f"sort={sort}&page=1"),
+        DEEP_PAGE: _view(BookCRUDView, f"sort={sort}&page={DEEP_PAGE}"),
+    }
+    keyset_views = {
+        1: _view(KeysetBookView, f"sort={sort}"),
+        DEEP_PAGE: _view(KeysetBookView, deep_query),
+    }
+    assert [row.pk for row in _paginate(offset_views[DEEP_PAGE])] == [
+        row.pk for row in _paginate(keyset_views[DEEP_PAGE])
+    ], "Both modes should return the same rows for page 10,000."
+
+    results = [
+        measure(
+            f"{mode} page {number} (sort={sort})",
+            lambda view=view: _paginate(view),
+            rounds=10,
+        )
+        for mode, views in (("offset", offset_views), ("keyset", keyset_views))
+        for number, view in views.items()
+    ]
+    offset_first, offset_deep, keyset_first, keyset_deep = results
+    report(offset_first, keyset_first)
+    report(offset_deep, keyset_deep)
+
+    assert keyset_deep.median_ms < offset_deep.median_ms, (
+        "Seeking to page 10,000 should beat scanning past 99,990 rows."
+    )
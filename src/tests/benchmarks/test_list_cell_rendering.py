@@ -0,0 +1,121 @@
+"""Benchmark list-cell rendering on a 500-row page with a precompiled column plan."""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+from neapolitan.views import Role
+
+from powercrud.templatetags import powercrud as powercrud_tags
+from sample.models import Author, Book, Genre
+from sample.views import BookCRUDView
+
+from .harness import measure, report
+
+ROW_COUNT = 500
+
+
+class FullPageBookView(BookCRUDView):
+    """Sample book view that renders every row on one page."""
+
+    page_size_options = None
+    page_size_all_enabled = True
+    paginate_by = None
+
+
+def _create_rows() -> None:
+    """Create 500 books spread across authors with one shared genre."""
+    authors = Author.objects.bulk_create(
+        Author(name=f"Bench Author {index}") for index in range(50)
+    )
+    genre = Genre.objects.create(name="Bench Genre")
+    books = Book.objects.bulk_create(
+        Book(
+            title=f"Bench {index}",
+            author=authors[index % len(authors)],
+            published_date="2024-01-01",
+            isbn=f"977{index:010d}",
+            pages=index,
+        )
+        for index in range(ROW_COUNT)
+    )
+    Book.genres.through.objects.bulk_create(
+        Book.genres.through(book_id=book.pk, genre_id=genre.pk) for book in books
+    )
+
+
+def _list_request():
+    """Return an anonymous list request suitable for calling the view directly."""
+    request = RequestFactory().get("/")
+    request.htmx = False
+    request.session = {}
+    request.user = AnonymousUser()
+    return request
+
+
+def _plan_for(view, fields, properties):
+    """Compile a column plan with the sample view's default column options."""
+    return powercrud_tags._compile_list_column_plan(
+        view,
+        fields=fields,
+        properties=properties,
+        queryset=None,
+        column_alignments={},
+        column_value_formats={},
+        column_width_policy="semantic",
+        column_width_modes={},
+        default_datetime_value_format="date",
+        tooltip_specs={},
+        inline_enabled=False,
+        inline_fields=set(),
+        inline_dependencies={},
+    )
+
+
+@pytest.mark.django_db
+def test_column_plan_removes_per_cell_resolution():
+    """Compare resolving every cell's column options with a plan compiled once."""
+    _create_rows()
+    view = FullPageBookView(role=Role.LIST)
+    view.request = _list_request()
+    fields = list(view.fields)
+    properties = list(view.properties)
+    rows = list(
+        view.plan_list_queryset(Book.objects.order_by("pk"), list_column_state=None)
+    )
+
+    def resolve_per_cell():
+        for obj in rows:
+            for name in fields:
+                (renderer,) = _plan_for(view, [name], [])
+                renderer.format_value(obj)
+            for name in properties:
+                (renderer,) = _plan_for(view, [], [name])
+                renderer.format_value(obj)
+
+    def apply_compiled_plan():
+        plan = _plan_for(view, fields, properties)
+        for obj in rows:
+            for renderer in plan:
+                renderer.format_value(obj)
+
+    per_cell = measure("per-cell column resolution", resolve_per_cell, rounds=5)
+    compiled = measure("compiled column plan", apply_compiled_plan, rounds=5)
+    report(per_cell, compiled)
+
+    assert compiled.median_ms < per_cell.median_ms, (
+        "Applying a precompiled column plan should beat per-cell resolution."
+    )
+
+
+@pytest.mark.django_db
+def test_full_page_render_of_500_rows():
+    """Report the end-to-end render time of a 500-row list page."""
+    _create_rows()
+    list_view = FullPageBookView.as_view(role=Role.LIST)
+
+    def render():
+        response = list_view(_list_request())
+        response.render()
+        assert response.status_code == 200
+
+    report(measure(f"{ROW_COUNT}-row list render", render, rounds=5))
@@ -0,0 +1,85 @@
+"""Benchmark chained M2M AND filters against the grouped through-table subquery."""
+
+import pytest
+
+from powercrud.mixins.filtering_mixin import AllValuesModelMultipleChoiceFilter
+from sample.models import Author, Book, Genre
+
+from .harness import measure, report
+
+ROW_COUNT = 100_000
+GENRE_COUNT = 12
+
+
+def _create_rows() -> list[Genre]:
+    """Create 100k books, each tagged with a rotating run of eight genres or fewer."""
+    author = Author.objects.create(name="Bench Author")
+    genres = Genre.objects.bulk_create(
+        Genre(name=f"Genre {index}") for index in range(GENRE_COUNT)
+    )
+    through = Book.genres.through
+    for start in range(0, ROW_COUNT, 10_000):
+        books = Book.objects.bulk_create(
+            Book(
+                title=f"Bench {index}",
+                author=author,
+                published_date="2024-01-01",
+                isbn=f"976{index:010d}",
+                pages=index,
+            )
+            for index in range(start, min(start + 10_000, ROW_COUNT))
+        )
+        through.objects.bulk_create(
+            through(
+                book_id=book.pk, genre_id=genres[(book.pk + offset) % GENRE_COUNT].pk
+            )
+            for book in books
+            for offset in range(book.pk % 9)
+        )
+    return genres
+
+
+def _chained(queryset, values):
+    """Reproduce the previous one-join-per-value AND filter."""
+    for value in values:
+        queryset = queryset.filter(genres=value)
+    return queryset
+
+
+@pytest.mark.django_db
+def test_grouped_m2m_and_filter_against_chained_joins():
+    """Report chained joins and the grouped subquery for 1, 3, and 8 values."""
+    genres = _create_rows()
+    grouped = AllValuesModelMultipleChoiceFilter(
+        field_name="genres", queryset=Genre.objects.all(), strategy="grouped"
+    )
+
+    for selected_count in (1, 3, 8):
+        selected = genres[:selected_count]
+        before = set(
+            _chained(Book.objects.all(), selected).values_list("pk", flat=True)
+        )
+        after = set(
+            grouped.filter(Book.objects.all(), selected).values_list("pk", flat=True)
+        )
+        assert before == after, "Both filters should match the same books."
+
+        results = [
+            measure(
+                f"chained joins ({selected_count} selected)",
+                lambda selected=selected: list(
+                    _chained(Book.objects.all(), selected).values_list("pk", flat=True)
+                ),
+                rounds=5,
+            ),
+            measure(
+                f"grouped subquery ({selected_count} selected)",
+                lambda selected=selected: list(
+                    grouped.filter(Book.objects.all(), selected).values_list(
+                        "pk", flat=True
+                    )
+                ),
+                rounds=5,
+            ),
+        ]
+        report(*results)
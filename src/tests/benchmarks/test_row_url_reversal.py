@@ -0,0 +1,102 @@
+"""Benchmark per-row URL reversal on a 200-row page with inline editing and dropdown actions."""
+
+import re
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+from django.urls import NoReverseMatch, reverse
+from neapolitan.views import Role
+
+from powercrud.mixins import url_mixin
+from sample.models import Author, Book
+from sample.views import BookCRUDView
+
+from .harness import measure, report
+
+ROW_COUNT = 200
+
+
+class TemplatedUrlBookView(BookCRUDView):
+    """Sample book view rendering every row, with inline editing and dropdown actions."""
+
+    page_size_options = None
+    page_size_all_enabled = True
+    paginate_by = None
+    extra_actions_mode = "dropdown"
+
+
+class PerCallReverseBookView(TemplatedUrlBookView):
+    """The same view reversing every URL with a full ``reverse()`` call."""
+
+    def safe_reverse(self, viewname, kwargs=None):
+        try:
+            return reverse(viewname, kwargs=kwargs)
+        except NoReverseMatch:
+            return None
+
+
+def _create_rows() -> None:
+    """Create 200 books spread across a handful of authors."""
+    authors = Author.objects.bulk_create(
+        Author(name=f"Url Author {index}") for index in range(10)
+    )
+    Book.objects.bulk_create(
+        Book(
+            title=f"Url Bench {index}",
+            author=authors[index % len(authors)],
+            published_date="2024-01-01",
+            isbn=f"976{index:010d}",
+            pages=index,
+        )
+        for index in range(ROW_COUNT)
+    )
+
+
+def _render(view_class):
+    """Return a callable that renders the full list page for ``view_class``."""
+    list_view = view_class.as_view(role=Role.LIST)
+
+    def render():
+        request = RequestFactory().get("/")
+        request.htmx = False
+        request.session = {}
+        request.user = AnonymousUser()
+        response = list_view(request)
+        response.render()
+        assert response.status_code == 200
+        return response.content
+
+    return render
+
+
+def _row_urls(content: bytes) -> list[str]:
+    """Return every per-row sample URL in rendered list HTML."""
+    return re.findall(r"/sample/bigbook/\d+/[\w/-]*", content.decode())
+
+
+@pytest.mark.django_db
+def test_url_templates_reduce_reverse_calls_on_200_rows():
+    """Compare per-call reversal with per-request URL templates on a 200-row page."""
+    _create_rows()
+    per_call = _render(PerCallReverseBookView)
+    templated = _render(TemplatedUrlBookView)
+
+    with mock.patch.object(url_mixin, "reverse", wraps=url_mixin.reverse) as spy:
+        templated()
+    templated_reverse_calls = spy.call_count
+
+    per_call_result = measure("reverse() per row URL", per_call, rounds=5)
+    templated_result = measure("per-request URL templates", templated, rounds=5)
+    report(per_call_result, templated_result)
+    print(f"reverse() calls with URL templates: {templated_reverse_calls}")
+
+    templated_urls = _row_urls(templated())
+    assert len(templated_urls) >= ROW_COUNT, "Every row should render its URLs."
+    assert templated_urls == _row_urls(per_call()), (
+        "Both strategies should render identical row URLs."
+    )
+    assert templated_reverse_calls < ROW_COUNT, (
+        "Row URLs should be formatted from templates instead of reversed per row."
+    )
@@ -0,0 +1,37 @@
+"""Benchmark a full list-page render with cold and warm template-pack caches."""
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+
+from powercrud.template_packs import clear_template_pack_cache
+from sample.models import Author, Book
+
+from .harness import measure, report
+
+
+@pytest.mark.django_db
+def test_full_page_render_reuses_resolved_template_pack():
+    """Report list renders that re-resolve the pack against cached resolution."""
+    author = Author.objects.create(name="Benchmark Author")
+    Book.objects.bulk_create(
+        Book(
+            title=f"Benchmark {index}",
+            author=author,
+            published_date="2024-01-01",
+            bestseller=False,
+            isbn=f"978{index:010d}",
+            pages=100 + index,
+        )
+        for index in range(25)
+    )
+    client = Client()
+    url = reverse("sample:bigbook-list")
+
+    def render():
+        response = client.get(url)
+        assert response.status_code == 200
+
+    cold = measure("uncached pack resolution", render, setup=clear_template_pack_cache)
+    warm = measure("cached pack resolution", render)
+    report(cold, warm)
@@ -84,6 +84,52 @@ def test_handle_async_bulk_operation_enqueues(monkeypatch):
     )
 
 
+def test_handle_async_bulk_operation_sends_selection_instead_of_ids(monkeypatch):
+    captured = {}
+
+    class Manager(CustomManager):
+        def launch_async_task(self, *args, **kwargs):
+            captured["args"] = args
+            captured["kwargs"] = kwargs
+            return "queued"
+
+    view = DummyAsyncView()
+    view.async_manager_class = Manager
+    monkeypatch.setattr(
+        view, "_check_for_selection_conflicts", lambda selection, user_id: False
+    )
+    monkeypatch.setattr(
+        view,
+        "async_queue_success",
+        lambda request, task_name, ids, selected_count: selected_count,
+    )
+    selection = {"view": "sample.views.BookCRUDView", "ids": {}, "p": [], "x": {}}
+
+    result = view._handle_async_bulk_operation(
+        SimpleNamespace(user=SimpleNamespace(is_anonymous=False, id=1)),
+        [],
+        delete_selected=True,
+        bulk_fields=[],
+        fields_to_update=[],
+        field_data=[],
+        selection=selection,
+        selected_count=3,
+    )
+    assert captured["args"][2] == [], (
+        "Predicate selections should not send their ids through the task broker."
+    )
+    assert captured["kwargs"]["selection"] == selection, (
+        "Workers should receive the selection payload to rebuild the queryset."
+    )
+    assert captured["kwargs"]["conflict_ids"] is None, (
+        "Predicate selections should not be locked row by row."
+    )
+    assert captured["kwargs"]["conflict_selections"] == {"sample.book": selection}, (
+        "The selection payload should be locked as a whole."
+    )
+    assert result == 3, "The success response should report the counted selection."
+
+
 def test_get_async_manager_uses_settings(monkeypatch):
     view = DummyAsyncView()
     mgr = view.get_async_manager()
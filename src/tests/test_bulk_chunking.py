@@ -0,0 +1,235 @@
+"""Tests for chunked, resumable bulk operations with per-chunk commits."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from powercrud import tasks
+from powercrud.async_manager import AsyncManager
+from powercrud.mixins.bulk_mixin.operation_mixin import OperationMixin
+from sample.models import Author
+
+
+class ChunkedHarness(OperationMixin):
+    """Concrete operation mixin committing two rows per chunk."""
+
+    bulk_fields = ["bio"]
+    bulk_chunk_size = 2
+
+
+class CheckpointManager:
+    """Async manager double that stores checkpoints in a dict."""
+
+    def __init__(self, checkpoint=None):
+        self.checkpoints = {} if checkpoint is None else {"task-1": checkpoint}
+        self.progress_updates = []
+
+    def update_progress(self, task_name, message):
+        self.progress_updates.append((task_name, message))
+
+    def get_checkpoint(self, task_name):
+        return self.checkpoints.get(task_name)
+
+    def set_checkpoint(self, task_name, last_pk):
+        self.checkpoints[task_name] = last_pk
+
+    def remove_checkpoint(self, task_name):
+        self.checkpoints.pop(task_name, None)
+
+
+def _bio_update(harness, queryset, **kwargs):
+    """Set every selected author's bio through ``_perform_bulk_update``."""
+    field = Author._meta.get_field("bio")
+    return harness._perform_bulk_update(
+        queryset,
+        bulk_fields=["bio"],
+        fields_to_update=["bio"],
+        field_data=[
+            {
+                "field": "bio",
+                "value": "Chunked",
+                "info": {
+                    "type": "TextField",
+                    "is_relation": False,
+                    "is_m2m": False,
+                    "field": field,
+                    "verbose_name": "bio",
+                },
+            }
+        ],
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def authors():
+    """Create five authors in primary-key order."""
+    return [Author.objects.create(name=f"Author {index}") for index in range(5)]
+
+
+@pytest.mark.django_db
+def test_chunked_delete_reports_each_chunk(authors):
+    """Deletes should run in pk-ordered chunks and report each one."""
+    progress = []
+    checkpoints = []
+
+    result = ChunkedHarness()._perform_bulk_delete(
+        Author.objects.all(),
+        progress_callback=lambda current, total: progress.append((current, total)),
+        checkpoint_callback=checkpoints.append,
+    )
+
+    assert result["success"] is True, "Every chunk should succeed"
+    assert result["success_records"] == 5, "All authors should be deleted"
+    assert [(chunk["first_pk"], chunk["last_pk"]) for chunk in result["chunks"]] == [
+        (authors[0].pk, authors[1].pk),
+        (authors[2].pk, authors[3].pk),
+        (authors[4].pk, authors[4].pk),
+    ], "Chunks should cover the selection in primary-key order"
+    assert checkpoints == [authors[1].pk, authors[3].pk, authors[4].pk], (
+        "Each finished chunk should checkpoint its last primary key"
+    )
+    assert progress[-1] == (5, 5), "Progress should count across chunks"
+    assert not Author.objects.exists(), "The deletes should be committed"
+
+
+@pytest.mark.django_db
+def test_failing_chunk_rolls_back_only_its_own_rows(monkeypatch, authors):
+    """One bad row should undo its chunk while the other chunks commit."""
+    original_full_clean = Author.full_clean
+
+    def full_clean(self, *args, **kwargs):
+        if self.pk == authors[2].pk:
+            raise ValidationError({"bio": ["Rejected"]})
+        return original_full_clean(self, *args, **kwargs)
+
+    monkeypatch.setattr(Author, "full_clean", full_clean)
+    checkpoints = []
+
+    result = _bio_update(
+        ChunkedHarness(), Author.objects.all(), checkpoint_callback=checkpoints.append
+    )
+
+    assert result["success"] is False, "A failed chunk should fail the result"
+    assert result["success_records"] == 3, "The other chunks should still count"
+    assert [chunk["success"] for chunk in result["chunks"]] == [True, False, True], (
+        "Only the chunk holding the bad row should fail"
+    )
+    assert result["errors"] == [("bio", ["Rejected"])], (
+        "Chunk errors should be collected in the standard format"
+    )
+    assert list(Author.objects.order_by("pk").values_list("bio", flat=True)) == [
+        "Chunked",
+        "Chunked",
+        "",
+        "",
+        "Chunked",
+    ], "The failed chunk's rows should keep their old values"
+    assert result["failed_ranges"] == [(authors[2].pk, authors[3].pk)], (
+        "The rolled-back chunk's primary-key range should be reported"
+    )
+    assert checkpoints == [authors[1].pk], (
+        "The checkpoint should not advance past the failed chunk"
+    )
+
+
+@pytest.mark.django_db
+def test_resume_after_skips_committed_rows(authors):
+    """Resuming should only process rows after the checkpointed primary key."""
+    result = _bio_update(
+        ChunkedHarness(), Author.objects.all(), resume_after=authors[1].pk
+    )
+
+    assert result["success_records"] == 3, "Only the remaining rows should run"
+    assert list(Author.objects.filter(bio="Chunked").values_list("pk", flat=True)) == [
+        author.pk for author in authors[2:]
+    ], "Rows up to the checkpoint should not be touched again"
+
+
+@pytest.mark.django_db
+def test_bulk_delete_task_resumes_from_manager_checkpoint(monkeypatch, authors):
+    """A restarted delete task should pick up after the saved checkpoint."""
+    manager = CheckpointManager(checkpoint=authors[2].pk)
+    monkeypatch.setattr(
+        tasks.AsyncManager,
+        "resolve_manager",
+        classmethod(lambda cls, manager_class_path=None, config=None: manager),
+    )
+
+    result = tasks.bulk_delete_task(
+        "sample.Author",
+        [author.pk for author in authors],
+        None,
+        task_key="task-1",
+        bulk_chunk_size=2,
+    )
+
+    assert result is True, "The resumed task should succeed"
+    assert list(Author.objects.order_by("pk").values_list("pk", flat=True)) == [
+        author.pk for author in authors[:3]
+    ], "Rows at or before the checkpoint should be skipped"
+    assert manager.checkpoints == {}, "A finished task should drop its checkpoint"
+
+
+@pytest.mark.django_db
+def test_bulk_update_task_reports_ranges_not_applied(monkeypatch, authors):
+    """A partly failed task should name the primary-key ranges it rolled back."""
+    original_full_clean = Author.full_clean
+
+    def full_clean(self, *args, **kwargs):
+        if self.pk == authors[2].pk:
+            raise ValidationError({"bio": ["Rejected"]})
+        return original_full_clean(self, *args, **kwargs)
+
+    monkeypatch.setattr(Author, "full_clean", full_clean)
+    manager = CheckpointManager()
+    monkeypatch.setattr(
+        tasks.AsyncManager,
+        "resolve_manager",
+        classmethod(lambda cls, manager_class_path=None, config=None: manager),
+    )
+    field = Author._meta.get_field("bio")
+
+    result = tasks.bulk_update_task(
+        "sample.Author",
+        [author.pk for author in authors],
+        None,
+        ["bio"],
+        ["bio"],
+        [
+            {
+                "field": "bio",
+                "value": "Chunked",
+                "info": {
+                    "type": "TextField",
+                    "is_relation": False,
+                    "is_m2m": False,
+                    "field": field,
+                    "verbose_name": "bio",
+                },
+            }
+        ],
+        task_key="task-1",
+        bulk_chunk_size=2,
+    )
+
+    message = manager.progress_updates[-1][1]
+    assert result is False, "A failed chunk should fail the task"
+    assert f"pk ranges not applied: {authors[2].pk}-{authors[3].pk}" in message, (
+        "The final progress message should name the rolled-back range"
+    )
+
+
+def test_async_manager_round_trips_checkpoints():
+    """Checkpoints should be stored per task in the async cache."""
+    manager = AsyncManager()
+    task_name = f"checkpoint-{uuid.uuid4()}"
+
+    manager.set_checkpoint(task_name, 42)
+    assert manager.get_checkpoint(task_name) == 42, "The checkpoint should persist"
+
+    manager.remove_checkpoint(task_name)
+    assert manager.get_checkpoint(task_name) is None, "Removal should clear it"
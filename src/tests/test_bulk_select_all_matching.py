@@ -1,10 +1,17 @@
 import json
 
 import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from neapolitan.views import Role
+
+from powercrud.selection_store import decode_selection
 from sample.models import Author
+from sample.views import AuthorCRUDView
 
 
 def normalize_html_text(value: str) -> str:
@@ -21,6 +28,12 @@ def set_bulk_selection(client, model_name: str, ids: list[int]) -> None:
     session.save()
 
 
+def get_bulk_selection(client, model_name: str) -> set[str]:
+    """Return the decoded bulk selection stored in the test client session."""
+    selections = client.session.get("powercrud_selections", {})
+    return decode_selection(selections.get(f"powercrud_bulk_{model_name}_"))
+
+
 @pytest.mark.django_db
 def test_author_list_shows_select_all_matching_cta_when_any_record_is_selected(client):
     """Render the queryset-wide select-all CTA once any selection exists and all matches fit within the cap."""
@@ -110,8 +123,7 @@ def test_select_all_matching_endpoint_expands_session_selection_and_triggers_ref
         reverse("sample:author-select-all-matching"),
         HTTP_HX_REQUEST="true",
     )
-    session = client.session
-    selected_ids = session["powercrud_selections"]["powercrud_bulk_author_"]
+    selected_ids = get_bulk_selection(client, "author")
 
     assert response.status_code == 200, (
         "Select-all matching endpoint should respond successfully to an HTMX request."
@@ -144,8 +156,7 @@ def test_select_all_matching_endpoint_respects_configured_selection_cap(client):
         reverse("sample:author-select-all-matching"),
         HTTP_HX_REQUEST="true",
     )
-    session = client.session
-    selected_ids = session["powercrud_selections"]["powercrud_bulk_author_"]
+    selected_ids = get_bulk_selection(client, "author")
 
     assert response.status_code == 200, (
         "Select-all matching endpoint should still respond successfully when only a capped subset of matching records can be added."
@@ -172,8 +183,7 @@ def test_select_all_matching_endpoint_preserves_existing_selection_outside_curre
         f"{reverse('sample:author-select-all-matching')}?name=Ali",
         HTTP_HX_REQUEST="true",
     )
-    session = client.session
-    selected_ids = session["powercrud_selections"]["powercrud_bulk_author_"]
+    selected_ids = get_bulk_selection(client, "author")
 
     assert response.status_code == 200, (
         "Select-all matching endpoint should accept current filter params from the query string."
@@ -183,3 +193,97 @@ def test_select_all_matching_endpoint_preserves_existing_selection_outside_curre
     ), (
         "Select-all matching should preserve records selected outside the current filter while adding the matching filtered records."
     )
+
+
+@pytest.mark.django_db
+def test_apply_selection_endpoint_applies_batched_changes(client):
+    """Apply queued row additions and removals from one batched request."""
+    authors = [Author.objects.create(name=f"Author {index:02d}") for index in range(4)]
+    set_bulk_selection(client, "author", [authors[0].pk, authors[1].pk])
+
+    response = client.post(
+        reverse("sample:author-apply-selection"),
+        {
+            "add_csv": f"{authors[2].pk},{authors[3].pk}",
+            "remove_csv": str(authors[0].pk),
+        },
+        HTTP_HX_REQUEST="true",
+    )
+
+    assert response.status_code == 200, (
+        "Apply-selection endpoint should accept a batch of row-selection changes."
+    )
+    assert get_bulk_selection(client, "author") == {
+        str(authors[1].pk),
+        str(authors[2].pk),
+        str(authors[3].pk),
+    }, "Apply-selection endpoint should add and remove the batched ids together."
+    assert json.loads(response["HX-Trigger"]) == {"refreshTable": True}, (
+        "Apply-selection endpoint should refresh the list like the single-row toggle."
+    )
+
+
+@pytest.mark.django_db
+def test_apply_selection_endpoint_rejects_conflicting_changes(client):
+    """Refuse batches that both add and remove the same record."""
+    author = Author.objects.create(name="Conflicted Author")
+
+    response = client.post(
+        reverse("sample:author-apply-selection"),
+        {"add": [author.pk], "remove": [author.pk]},
+        HTTP_HX_REQUEST="true",
+    )
+
+    assert response.status_code == 400, (
+        "Apply-selection endpoint should reject an id that is both added and removed."
+    )
+    assert get_bulk_selection(client, "author") == set(), (
+        "A rejected batch should leave the selection unchanged."
+    )
+
+
+def _count_statements(queries) -> list[str]:
+    """Return captured SQL statements that count or probe the author table."""
+    return [
+        query["sql"]
+        for query in queries.captured_queries
+        if '"sample_author"' in query["sql"]
+        and ("COUNT(" in query["sql"].upper() or query["sql"].startswith('SELECT 1 AS "a"'))
+    ]
+
+
+@pytest.mark.django_db
+def test_author_list_counts_total_and_selection_in_one_aggregate(client):
+    """Pagination and the select-all row should share one counting query."""
+    authors = [Author.objects.create(name=f"Counted {index:02d}") for index in range(16)]
+    set_bulk_selection(client, "author", [authors[0].pk, authors[1].pk])
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("sample:author-list"))
+    response_text = normalize_html_text(response.content.decode())
+
+    assert "Add up to" in response_text or "Select all 16 matching records" in response_text
+    count_statements = _count_statements(queries)
+    assert len(count_statements) == 1, (
+        "The filtered total and selected-in-filter count should come from one aggregate."
+    )
+    assert "FILTER" in count_statements[0].upper() or "CASE" in count_statements[0].upper()
+
+
+@pytest.mark.django_db
+def test_list_counts_are_shared_with_allow_empty_check(rf):
+    """allow_empty=False should reuse the shared aggregate instead of exists()."""
+    Author.objects.create(name="Only Author")
+    request = rf.get("/")
+    request.htmx = False
+    request.session = {}
+    request.user = AnonymousUser()
+
+    with CaptureQueriesContext(connection) as queries:
+        response = AuthorCRUDView.as_view(role=Role.LIST, allow_empty=False)(request)
+        response.render()
+
+    assert response.status_code == 200
+    assert len(_count_statements(queries)) == 1, (
+        "Emptiness, pagination, and record counts should share one aggregate."
+    )
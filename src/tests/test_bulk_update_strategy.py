@@ -0,0 +1,314 @@
+"""Tests for the set-based ``queryset.update()`` bulk update fast path."""
+
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+
+from powercrud import search
+from powercrud.bulk_persistence import (
+    BulkUpdateExecutionContext,
+    DefaultBulkUpdatePersistenceBackend,
+)
+from powercrud.list_snapshots import _invalidate_on_change, get_snapshot_version
+from powercrud.mixins.bulk_mixin import BulkMixin
+from powercrud.mixins.bulk_mixin.operation_mixin import OperationMixin
+from sample.models import Author, Book, Genre, Profile
+
+
+class StrategyHarness(OperationMixin):
+    """Concrete operation mixin with the fast path enabled by default."""
+
+    bulk_fields = ["nickname", "status", "favorite_genre"]
+    bulk_full_clean = False
+    bulk_update_strategy = "auto"
+
+
+class SaveOnlyBulkView(BulkMixin):
+    """Importable view that always keeps the per-object save path."""
+
+    bulk_fields = ["status"]
+
+    def get_bulk_update_strategy(self, queryset, field_data):
+        return "save"
+
+
+class RecordingSearchBackend(search.IcontainsSearchBackend):
+    """Search backend that records each synced instance's status."""
+
+    def __init__(self, model, fields):
+        super().__init__(model, fields)
+        self.synced = []
+
+    def sync_instance(self, instance, using):
+        self.synced.append((instance.pk, instance.status))
+
+
+def _field(model, name, value, **extra):
+    """Return one normalized ``field_data`` entry for ``model.name``."""
+    field = model._meta.get_field(name)
+    return {
+        "field": name,
+        "value": value,
+        "info": {
+            "type": field.get_internal_type(),
+            "is_relation": field.is_relation,
+            "is_m2m": field.many_to_many,
+            "field": field,
+            "verbose_name": name,
+            "choices": getattr(field, "choices", None),
+            "null": field.null,
+            "blank": field.blank,
+            **extra,
+        },
+    }
+
+
+def _update(harness, queryset, field_data, **kwargs):
+    """Run ``_perform_bulk_update`` for every field in ``field_data``."""
+    fields = [entry["field"] for entry in field_data]
+    return harness._perform_bulk_update(
+        queryset,
+        bulk_fields=harness.bulk_fields,
+        fields_to_update=fields,
+        field_data=field_data,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def profiles():
+    """Create three profiles sharing the default status."""
+    return [
+        Profile.objects.create(author=Author.objects.create(name=name), nickname=name)
+        for name in ("Alpha", "Beta", "Gamma")
+    ]
+
+
+@pytest.mark.django_db
+def test_fast_path_updates_scalar_and_fk_fields_in_one_query(profiles):
+    """Scalar and FK values should be written with one UPDATE statement."""
+    genre = Genre.objects.create(name="Sci-Fi")
+    harness = StrategyHarness()
+    progress = []
+
+    with CaptureQueriesContext(connection) as queries:
+        result = _update(
+            harness,
+            Profile.objects.all(),
+            [
+                _field(Profile, "status", "Review"),
+                _field(Profile, "favorite_genre", str(genre.pk)),
+            ],
+            progress_callback=lambda current, total: progress.append((current, total)),
+        )
+
+    statements = [query["sql"].split(" ", 1)[0] for query in queries.captured_queries]
+    assert result == {"success": True, "success_records": 3, "errors": []}, (
+        "The fast path should keep the standard result contract"
+    )
+    assert statements.count("UPDATE") == 1, "All rows should share one UPDATE"
+    assert statements.count("SELECT") == 1, "The genre should be loaded once"
+    assert progress == [(3, 3)], "Progress should be reported once at the end"
+    assert set(Profile.objects.values_list("status", "favorite_genre")) == {
+        ("Review", genre.pk)
+    }, "Every selected profile should receive the new values"
+
+
+@pytest.mark.django_db
+def test_auto_strategy_keeps_per_object_saves_with_full_clean(profiles):
+    """``auto`` should only use ``update()`` when full_clean is off."""
+    harness = StrategyHarness()
+    harness.bulk_full_clean = True
+    field_data = [_field(Profile, "status", "Review")]
+
+    assert harness.get_bulk_update_strategy(Profile.objects.all(), field_data) == (
+        "save"
+    ), "Model validation should keep the per-object path"
+
+    harness.bulk_update_strategy = "update"
+    assert harness.get_bulk_update_strategy(Profile.objects.all(), field_data) == (
+        "update"
+    ), "An explicit strategy should opt in to field-level validation"
+
+
+@pytest.mark.django_db
+def test_fast_path_falls_back_for_m2m_and_custom_save():
+    """M2M fields and models with ``save()`` overrides need per-object saves."""
+    harness = StrategyHarness()
+    harness.bulk_update_strategy = "update"
+
+    assert (
+        harness.get_bulk_update_strategy(
+            Author.objects.all(), [_field(Author, "genres", None)]
+        )
+        == "save"
+    ), "M2M updates cannot run through queryset.update()"
+    assert (
+        harness.get_bulk_update_strategy(
+            Book.objects.all(), [_field(Book, "title", "New")]
+        )
+        == "save"
+    ), "Book.save() must run for every object"
+
+
+@pytest.mark.django_db
+def test_fast_path_reports_field_validation_errors(profiles):
+    """With full_clean on, each value should still pass its field's clean()."""
+    harness = StrategyHarness()
+    harness.bulk_full_clean = True
+    harness.bulk_update_strategy = "update"
+
+    result = _update(
+        harness, Profile.objects.all(), [_field(Profile, "status", "Unknown")]
+    )
+
+    assert result["success"] is False, "An invalid choice should fail the update"
+    assert result["success_records"] == 0, "No rows should be reported as updated"
+    assert [name for name, _messages in result["errors"]] == ["status"], (
+        "Field errors should be keyed by field name like full_clean() errors"
+    )
+    assert not Profile.objects.filter(status="Unknown").exists(), (
+        "Invalid values should not be written"
+    )
+
+
+@pytest.mark.django_db
+def test_fast_path_reports_missing_related_objects(profiles):
+    """A missing FK target should fail with the same message as the save path."""
+    result = _update(
+        StrategyHarness(),
+        Profile.objects.all(),
+        [_field(Profile, "favorite_genre", "999999")],
+    )
+
+    assert result["success"] is False, "A missing genre should fail the update"
+    assert "Invalid value for favorite_genre" in result["errors"][0][1][0], (
+        "The related lookup error should be reported"
+    )
+
+
+@pytest.mark.django_db
+def test_default_backend_reads_strategy_from_context(monkeypatch, profiles):
+    """The built-in backend should honour the view's full_clean setting."""
+    calls = []
+    monkeypatch.setattr(
+        OperationMixin,
+        "_perform_set_based_bulk_update",
+        lambda self, *args, **kwargs: calls.append(self) or {"success": True},
+    )
+    field_data = [_field(Profile, "status", "Paused")]
+
+    DefaultBulkUpdatePersistenceBackend().persist_bulk_update(
+        queryset=Profile.objects.all(),
+        bulk_fields=["status"],
+        fields_to_update=["status"],
+        field_data=field_data,
+        context=BulkUpdateExecutionContext(mode="sync", bulk_full_clean=False),
+    )
+
+    assert calls, "Disabling full_clean in the context should enable update()"
+
+
+@pytest.mark.django_db
+def test_powercrud_receivers_keep_the_fast_path_and_still_run(profiles):
+    """PowerCRUD's own receivers should not force per-object saves."""
+    harness = StrategyHarness()
+    field_data = [_field(Profile, "status", "Review")]
+    post_save.connect(
+        _invalidate_on_change, sender=Profile, weak=False, dispatch_uid="test-own"
+    )
+    try:
+        strategy = harness.get_bulk_update_strategy(Profile.objects.all(), field_data)
+        version = get_snapshot_version([Profile])
+        result = _update(harness, Profile.objects.all(), field_data)
+    finally:
+        post_save.disconnect(sender=Profile, dispatch_uid="test-own")
+
+    assert strategy == "update", "PowerCRUD receivers should not block update()"
+    assert result["success_records"] == 3, "Every profile should be updated"
+    assert get_snapshot_version([Profile]) != version, (
+        "The set-based update should drop list snapshots itself"
+    )
+
+
+@pytest.mark.django_db
+def test_project_receivers_fall_back_to_per_object_saves(profiles):
+    """A project's own post_save receiver must still see every save."""
+    harness = StrategyHarness()
+
+    def receiver(sender, **kwargs):
+        return None
+
+    post_save.connect(receiver, sender=Profile, dispatch_uid="test-project")
+    try:
+        strategy = harness.get_bulk_update_strategy(
+            Profile.objects.all(), [_field(Profile, "status", "Review")]
+        )
+    finally:
+        post_save.disconnect(sender=Profile, dispatch_uid="test-project")
+
+    assert strategy == "save", "Project receivers need per-object saves"
+
+
+@pytest.mark.django_db
+def test_fast_path_syncs_search_index_for_updated_rows(monkeypatch, profiles):
+    """Rows updated by queryset.update() should be re-synced to the search index."""
+    backend = RecordingSearchBackend(Profile, ["nickname"])
+    monkeypatch.setattr(search, "_SEARCH_BACKENDS", {"recording": backend})
+
+    result = _update(
+        StrategyHarness(),
+        Profile.objects.filter(status="Active"),
+        [_field(Profile, "status", "Review")],
+    )
+
+    assert result["success_records"] == 3, "Every active profile should be updated"
+    assert sorted(backend.synced) == [(profile.pk, "Review") for profile in profiles], (
+        "Rows that no longer match the selection filter should still be synced"
+    )
+
+
+@pytest.mark.django_db
+def test_default_backend_consults_view_overrides(monkeypatch, profiles):
+    """The built-in backend should run the view's own strategy override."""
+    calls = []
+    monkeypatch.setattr(
+        OperationMixin,
+        "_perform_set_based_bulk_update",
+        lambda self, *args, **kwargs: calls.append(self) or {"success": True},
+    )
+
+    result = DefaultBulkUpdatePersistenceBackend().persist_bulk_update(
+        queryset=Profile.objects.all(),
+        bulk_fields=["status"],
+        fields_to_update=["status"],
+        field_data=[_field(Profile, "status", "Paused")],
+        context=BulkUpdateExecutionContext(
+            mode="async",
+            bulk_full_clean=False,
+            view_class_path=SaveOnlyBulkView().get_bulk_update_view_class_path(),
+        ),
+    )
+
+    assert not calls, "The view's get_bulk_update_strategy() should be used"
+    assert result["success_records"] == 3, "The per-object path should run"
+    assert set(Profile.objects.values_list("status", flat=True)) == {"Paused"}, (
+        "Every profile should be saved with the new status"
+    )
+
+
+def test_view_class_path_skips_classes_without_an_import_path():
+    """Locally defined views cannot be rebuilt by path, so report none."""
+
+    class LocalView(BulkMixin):
+        pass
+
+    assert SaveOnlyBulkView().get_bulk_update_view_class_path() == (
+        f"{__name__}.SaveOnlyBulkView"
+    ), "Module-level views should report their import path"
+    assert LocalView().get_bulk_update_view_class_path() is None, (
+        "Views defined in a function have no import path"
+    )
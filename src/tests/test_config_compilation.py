@@ -0,0 +1,157 @@
+"""Tests for compiled per-class PowerCRUD view configuration."""
+
+from __future__ import annotations
+
+import warnings
+
+import pytest
+from django.test import override_settings
+from neapolitan.views import CRUDView, Role
+
+from powercrud.mixins import PowerCRUDMixin
+from powercrud.mixins import config_mixin as config_module
+from powercrud.mixins.config_mixin import (
+    clear_compiled_config_cache,
+    get_compiled_view_config,
+)
+from sample.models import Book
+
+
+class CompiledBookView(PowerCRUDMixin, CRUDView):
+    model = Book
+    namespace = "sample"
+    url_base = "compiled-book"
+    base_template_path = "sample/base.html"
+    fields = ["title", "author", "pages"]
+    use_htmx = True
+    extra_actions = [{"url_name": "sample:bigbook-detail", "text": "Open"}]
+
+
+@pytest.fixture(autouse=True)
+def reset_compiled_config_cache():
+    """Start each test from an empty compiled-config cache."""
+    clear_compiled_config_cache()
+    yield
+    clear_compiled_config_cache()
+
+
+def _count_validator_runs(monkeypatch) -> list[int]:
+    """Patch the pydantic validator to count full pipeline executions."""
+    calls = []
+    validator_cls = config_module.PowerCRUDMixinValidator
+
+    class CountingValidator(validator_cls):
+        def __init__(self, **data):
+            calls.append(1)
+            super().__init__(**data)
+
+    monkeypatch.setattr(config_module, "PowerCRUDMixinValidator", CountingValidator)
+    return calls
+
+
+def test_second_instance_reuses_compiled_config(monkeypatch):
+    """Only the first instance of a view class should run the validation pipeline."""
+    calls = _count_validator_runs(monkeypatch)
+
+    first = CompiledBookView(**Role.LIST.extra_initkwargs())
+    second = CompiledBookView(**Role.LIST.extra_initkwargs())
+
+    assert len(calls) == 1, "The pydantic validator should run once per view class."
+    assert second.fields == first.fields == ["title", "author", "pages"], (
+        "Cached instances should receive the resolved field list."
+    )
+    assert second.extra_actions == first.extra_actions, (
+        "Normalized extra actions should be replayed onto cached instances."
+    )
+    assert (
+        get_compiled_view_config(CompiledBookView, Role.LIST.extra_initkwargs())
+        is not None
+    ), "The compiled artifact should be retrievable for the class."
+
+
+def test_compiled_config_values_are_not_shared_between_instances():
+    """Mutating one instance must not leak into the compiled artifact."""
+    first = CompiledBookView()
+    first.fields.append("isbn")
+    first.extra_actions[0]["text"] = "Mutated"
+
+    second = CompiledBookView()
+
+    assert second.fields == ["title", "author", "pages"], (
+        "Instance list mutation should not change later instances."
+    )
+    assert second.extra_actions[0]["text"] == "Open", (
+        "Nested extra-action dicts should be cloned for each instance."
+    )
+
+
+def test_distinct_initkwargs_compile_separately(monkeypatch):
+    """Different as_view() initkwargs should each compile their own overlay."""
+    calls = _count_validator_runs(monkeypatch)
+
+    default_view = CompiledBookView()
+    override_view = CompiledBookView(fields=["title"])
+    CompiledBookView(fields=["title"])
+
+    assert default_view.fields == ["title", "author", "pages"]
+    assert override_view.fields == ["title"], (
+        "Instance overrides should still be honoured."
+    )
+    assert len(calls) == 2, "Each distinct override set should compile exactly once."
+
+
+def test_replacing_class_attribute_invalidates_compiled_config(monkeypatch):
+    """Replacing a declared class attribute should trigger recompilation."""
+    CompiledBookView()
+    monkeypatch.setattr(CompiledBookView, "fields", ["title", "isbn"])
+
+    view = CompiledBookView()
+
+    assert view.fields == ["title", "isbn"], (
+        "A replaced class declaration should not be served from a stale cache."
+    )
+
+
+def test_setting_changed_clears_compiled_config():
+    """Django's setting_changed signal should drop compiled view configuration."""
+    CompiledBookView()
+    assert get_compiled_view_config(CompiledBookView) is not None
+
+    with override_settings(POWERCRUD_SETTINGS={}):
+        assert get_compiled_view_config(CompiledBookView) is None, (
+            "Overriding settings should invalidate compiled configuration."
+        )
+
+
+def test_cached_instances_replay_configuration_warnings():
+    """Deprecation warnings should surface for cached instances too."""
+
+    class LegacyModalBookView(CompiledBookView):
+        modal_box_classes = "legacy-box"
+
+    with warnings.catch_warnings(record=True) as first_caught:
+        warnings.simplefilter("always")
+        LegacyModalBookView()
+    with warnings.catch_warnings(record=True) as second_caught:
+        warnings.simplefilter("always")
+        LegacyModalBookView()
+
+    first_messages = [str(w.message) for w in first_caught]
+    second_messages = [str(w.message) for w in second_caught]
+    assert any("modal_box_classes is deprecated" in m for m in first_messages)
+    assert second_messages == first_messages, (
+        "Cached instances should replay the same configuration warnings."
+    )
+
+
+def test_invalid_configuration_is_not_cached():
+    """Configuration errors should keep raising instead of being cached."""
+
+    class BrokenBookView(CompiledBookView):
+        fields = ["title", "not_a_field"]
+
+    for _ in range(2):
+        with pytest.raises(Exception, match="not_a_field"):
+            BrokenBookView()
+
+    assert get_compiled_view_config(BrokenBookView) is None
@@ -0,0 +1,103 @@
+"""Tests for the memoized ConfigMixin.config() namespace."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+from django.test import override_settings
+from django.urls import reverse
+from neapolitan.views import CRUDView
+
+from powercrud.mixins import PowerCRUDMixin
+from powercrud.mixins.config_mixin import resolve_config
+from sample.models import Book
+
+
+class NamespaceBookView(PowerCRUDMixin, CRUDView):
+    model = Book
+    namespace = "sample"
+    url_base = "namespace-book"
+    base_template_path = "sample/base.html"
+    fields = ["title", "author", "pages"]
+    use_htmx = True
+
+
+def test_config_namespace_is_memoized_per_instance():
+    """Repeated config() calls should return the same namespace object."""
+    view = NamespaceBookView()
+
+    first = view.config()
+    second = resolve_config(view)
+
+    assert first is second, "config() should reuse the memoized namespace."
+    assert view.get_config_namespace_build_count() == 1, (
+        "The namespace should only be built once while config is unchanged."
+    )
+
+
+def test_assigning_config_attribute_rebuilds_namespace():
+    """Assigning a config attribute should be visible on the next config() call."""
+    view = NamespaceBookView()
+    assert view.config().show_record_count is False
+
+    view.show_record_count = True
+
+    assert view.config().show_record_count is True, (
+        "Attribute assignments should invalidate the memoized namespace."
+    )
+    assert view.get_config_namespace_build_count() == 2
+
+
+def test_unrelated_attribute_assignment_keeps_namespace():
+    """Non-config attributes such as request state should not force a rebuild."""
+    view = NamespaceBookView()
+    namespace = view.config()
+
+    view.object_list = []
+    view.kwargs = {"pk": 1}
+
+    assert view.config() is namespace, (
+        "Only configuration attributes should bump the namespace version."
+    )
+
+
+def test_deleting_config_attribute_rebuilds_namespace():
+    """Removing an instance override should fall back to the class value."""
+    view = NamespaceBookView()
+    view.table_classes = "instance-only"
+    assert view.config().table_classes == "instance-only"
+
+    del view.table_classes
+
+    assert view.config().table_classes == NamespaceBookView.table_classes
+
+
+def test_setting_changed_rebuilds_namespace():
+    """Settings overrides should invalidate memoized namespaces."""
+    view = NamespaceBookView()
+    namespace = view.config()
+
+    with override_settings(POWERCRUD_SETTINGS={}):
+        assert view.config() is not namespace, (
+            "setting_changed should bump the process-wide namespace generation."
+        )
+
+
+@pytest.mark.django_db
+def test_list_request_logs_config_namespace_rebuilds(client, caplog):
+    """A list request should log how many namespace rebuilds it needed."""
+    caplog.set_level(logging.DEBUG, logger="powercrud")
+
+    response = client.get(reverse("sample:bigbook-list"))
+
+    assert response.status_code == 200
+    messages = [
+        record.getMessage()
+        for record in caplog.records
+        if "rebuilt its config namespace" in record.getMessage()
+    ]
+    assert messages, "Dispatch should log the per-request rebuild counter."
+    assert "BookCRUDView rebuilt its config namespace 1 time(s)" in messages[-1], (
+        "An unmodified list request should build the namespace exactly once."
+    )
@@ -4422,6 +4422,46 @@ def test_book_row_action_states_endpoint_returns_lazy_disabled_reason(client):
     }, "Description Preview should return its lazy disabled reason for blank descriptions."
 
 
+@pytest.mark.django_db
+def test_row_action_states_endpoint_falls_back_when_batch_hook_fails(
+    client, monkeypatch
+):
+    """A failing batch hook should fall back to per-row hooks, not a 500."""
+    author = Author.objects.create(name="Lazy Fallback Author")
+    book = Book.objects.create(
+        title="Lazy Fallback",
+        author=author,
+        published_date=date(2024, 10, 6),
+        bestseller=False,
+        isbn="9876543210672",
+        pages=45,
+        description="",
+    )
+
+    def failing_hook(self, objects, request):
+        raise RuntimeError("batch hook failed")
+
+    monkeypatch.setattr(
+        sample_views.BookCRUDView,
+        "get_extra_action_states",
+        failing_hook,
+        raising=False,
+    )
+
+    _login_sample_manager(client)
+    response = client.get(
+        reverse("sample:bigbook-row-action-states", args=[book.pk]),
+        HTTP_X_REQUESTED_WITH="XMLHttpRequest",
+    )
+
+    assert response.status_code == 200, (
+        "A failing get_extra_action_states() hook should not break the endpoint."
+    )
+    assert response.json()["actions"]["1"]["disabled"] is True, (
+        "The per-row disabled_if hook should decide the state instead."
+    )
+
+
 @pytest.mark.django_db
 def test_book_row_action_states_endpoint_reports_hidden_lazy_action(client):
     """Return hidden state when the row hidden_if hook now matches."""
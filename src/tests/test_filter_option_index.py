@@ -0,0 +1,182 @@
+"""Tests for the cached ordered-option index behind filter dropdowns."""
+
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from powercrud import filter_options
+from powercrud.apps import connect_view_receivers
+from powercrud.mixins.filtering_mixin import (
+    NULL_FILTER_SENTINEL,
+    FilteringMixin,
+    NullableModelChoiceField,
+    OptionIndexModelChoiceField,
+)
+from sample.models import Author, Book, Profile
+
+
+class DropdownHarness(FilteringMixin):
+    """Minimal view stand-in for dropdown queryset resolution."""
+
+    model = Book
+    dropdown_sort_options = {}
+
+    def __init__(self):
+        self.request = RequestFactory().get("/")
+
+
+def _labels(field) -> list[str]:
+    """Return the non-blank option labels of ``field``."""
+    return [str(label) for value, label in field.choices if value != ""]
+
+
+@pytest.mark.django_db
+def test_unordered_options_are_listed_by_label_from_the_cached_index():
+    """Unordered querysets should be sorted once, then served from the cache."""
+    for name in ("beta", "Alpha", "gamma"):
+        Author.objects.create(name=name)
+
+    first = OptionIndexModelChoiceField(queryset=Author.objects.all())
+    second = OptionIndexModelChoiceField(queryset=Author.objects.all())
+    assert _labels(first) == ["Alpha", "beta", "gamma"], (
+        "Labels should be ordered case-insensitively like the old __str__ sort."
+    )
+    with CaptureQueriesContext(connection) as queries:
+        labels = _labels(second)
+
+    assert labels == ["Alpha", "beta", "gamma"]
+    assert queries.captured_queries == [], (
+        "A cached option index should not read the related table again."
+    )
+
+
+@pytest.mark.django_db
+def test_saving_or_deleting_a_related_row_invalidates_the_index():
+    """post_save and post_delete on the related model should rebuild the index."""
+    beta = Author.objects.create(name="beta")
+    Author.objects.create(name="gamma")
+    assert _labels(OptionIndexModelChoiceField(queryset=Author.objects.all())) == [
+        "beta",
+        "gamma",
+    ]
+
+    Author.objects.create(name="alpha")
+    beta.delete()
+
+    assert _labels(OptionIndexModelChoiceField(queryset=Author.objects.all())) == [
+        "alpha",
+        "gamma",
+    ]
+
+
+@pytest.mark.django_db
+def test_scoped_querysets_use_separate_indexes():
+    """Filtered option querysets must not reuse another queryset's index."""
+    Author.objects.create(name="Alan")
+    Author.objects.create(name="Betty")
+
+    everyone = OptionIndexModelChoiceField(queryset=Author.objects.all())
+    only_a = OptionIndexModelChoiceField(
+        queryset=Author.objects.filter(name__startswith="A")
+    )
+
+    assert _labels(everyone) == ["Alan", "Betty"]
+    assert _labels(only_a) == ["Alan"]
+
+
+@pytest.mark.django_db
+def test_ordered_querysets_keep_database_order_and_instances():
+    """An explicit order_by() should bypass the index entirely."""
+    Author.objects.create(name="Alan")
+    Author.objects.create(name="Betty")
+
+    field = OptionIndexModelChoiceField(queryset=Author.objects.order_by("-name"))
+    choices = [choice for choice in field.choices if choice[0] != ""]
+
+    assert [label for _value, label in choices] == ["Betty", "Alan"]
+    assert all(value.instance is not None for value, _label in choices)
+
+
+@pytest.mark.django_db
+def test_nullable_relation_filter_keeps_null_choice_with_indexed_options():
+    """The empty-only sentinel should stay second when options come from the index."""
+    Author.objects.create(name="beta")
+    Author.objects.create(name="Alpha")
+
+    field = NullableModelChoiceField(queryset=Author.objects.all())
+
+    assert [str(value) for value, _label in field.choices] == [
+        "",
+        NULL_FILTER_SENTINEL,
+        str(Author.objects.get(name="Alpha").pk),
+        str(Author.objects.get(name="beta").pk),
+    ]
+
+
+@override_settings(
+    POWERCRUD_SETTINGS={"FILTER_DROPDOWN_SORT_KEYS": {"sample.Author": "-name"}}
+)
+def test_declared_sort_key_orders_dropdown_options_in_the_database():
+    """A declared sort key should win over the name/title heuristics."""
+    queryset = DropdownHarness().get_filter_queryset_for_field(
+        "author", Book._meta.get_field("author")
+    )
+
+    assert queryset.query.order_by == ("-name",)
+
+
+@pytest.mark.django_db
+def test_str_fallback_keeps_returning_a_label_ordered_queryset():
+    """The public hook should still return a queryset ordered by ``__str__``."""
+    for nickname in ("beta", "Alpha", "gamma"):
+        Profile.objects.create(
+            author=Author.objects.create(name=nickname), nickname=nickname
+        )
+    harness = DropdownHarness()
+    profile_field = Author._meta.get_field("profile")
+    expected = ["Alpha (Alpha)", "beta (beta)", "gamma (gamma)"]
+
+    queryset = harness.get_filter_queryset_for_field("profile", profile_field)
+    with CaptureQueriesContext(connection) as queries:
+        again = harness.get_filter_queryset_for_field("profile", profile_field)
+
+    assert [str(profile) for profile in queryset] == expected, (
+        "Overrides calling the hook should still get __str__ order."
+    )
+    assert filter_options.is_label_ordered(again)
+    assert queries.captured_queries == [], (
+        "The ordering should be built from the cached index, not the table."
+    )
+    assert _labels(OptionIndexModelChoiceField(queryset=queryset)) == expected, (
+        "Dropdowns should list a label-ordered queryset from the index."
+    )
+
+
+@pytest.mark.django_db
+def test_view_receivers_are_connected_before_any_index_is_built(monkeypatch):
+    """Loading a view should watch its related models without a rendered dropdown."""
+    monkeypatch.setattr(filter_options, "_WATCHED_MODELS", set())
+    post_save.disconnect(
+        sender=Author,
+        dispatch_uid=f"{filter_options.OPTION_INDEX_CACHE_PREFIX}:sample.author",
+    )
+
+    class AuthorFilterView(DropdownHarness):
+        filterset_fields = ["author", "title"]
+
+    connect_view_receivers([AuthorFilterView])
+    version = filter_options._get_version_key(Author)
+    cache.set(version, "before", None)
+    Author.objects.create(name="Alan")
+
+    assert filter_options._WATCHED_MODELS == {Author}, (
+        "Only relation filters should be watched."
+    )
+    assert cache.get(version) != "before", (
+        "A save should invalidate the index before any dropdown is rendered."
+    )
@@ -5,11 +5,21 @@ from datetime import date
 import pytest
 from django import forms
 from django.core.exceptions import ImproperlyConfigured
-from django.db.models import BooleanField, Case, Value, When
-from django_filters import BooleanFilter, CharFilter, ChoiceFilter, FilterSet
+from django.db.models import BooleanField, Case, IntegerField, Value, When
+from django_filters import (
+    BooleanFilter,
+    CharFilter,
+    ChoiceFilter,
+    FilterSet,
+    NumberFilter,
+)
+from django.db import connection
 from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 
+from powercrud.mixins import filtering_mixin
 from powercrud.mixins.filtering_mixin import (
+    AllValuesModelMultipleChoiceFilter,
     FilteringMixin,
     HTMXFilterSetMixin,
     NULL_FILTER_SENTINEL,
@@ -746,3 +756,227 @@ def test_invalid_default_filterset_fields_raise_clear_error_for_custom_filterset
     assert "default_filterset_fields contains unknown filters: pages" in str(
         exc_info.value
     ), "Unknown default_filterset_fields entries should raise a clear configuration error naming the invalid filter."
+
+
+class ScopedAuthorFilterHarness(BaseFilterHarness):
+    """Harness whose author filter options depend on the request."""
+
+    model = Book
+    filterset_fields = ["author", "title"]
+    filter_queryset_options = {
+        "author": lambda request, field_name, model_field: {
+            "name__startswith": request.GET.get("scope", "")
+        }
+    }
+
+
+@pytest.mark.django_db
+def test_generated_filterset_class_is_reused_with_per_request_htmx_attrs():
+    """Build the generated class once and apply HTMX attrs to each instance."""
+    htmx_view = FilterHarness(RequestFactory().get("/"))
+    plain_view = FilterHarness(RequestFactory().get("/"))
+    plain_view.use_htmx = False
+
+    htmx_filterset = htmx_view.get_filterset(Book.objects.all())
+    plain_filterset = plain_view.get_filterset(Book.objects.all())
+
+    assert type(htmx_filterset) is type(plain_filterset), (
+        "Requests for the same view configuration should share one FilterSet class."
+    )
+    assert "hx-get" in htmx_filterset.form.fields["bestseller"].widget.attrs
+    assert "hx-get" not in plain_filterset.form.fields["bestseller"].widget.attrs, (
+        "HTMX attrs are request state and must not leak through the cached class."
+    )
+
+
+@pytest.mark.django_db
+def test_generated_filter_option_querysets_follow_each_request():
+    """Related-model options should be rebuilt for every filterset instance."""
+    Author.objects.create(name="Alan")
+    Author.objects.create(name="Betty")
+
+    filtersets = [
+        ScopedAuthorFilterHarness(RequestFactory().get("/", {"scope": scope}))
+        .get_filterset(Book.objects.all())
+        for scope in ("A", "B")
+    ]
+
+    assert type(filtersets[0]) is type(filtersets[1])
+    assert [
+        list(filterset.form.fields["author"].queryset.values_list("name", flat=True))
+        for filterset in filtersets
+    ] == [["Alan"], ["Betty"]], (
+        "Request-aware filter_queryset_options must not be frozen into the class."
+    )
+
+
+@pytest.mark.django_db
+def test_annotation_output_field_is_part_of_generated_filterset_key():
+    """Annotation filters with different output fields need different classes."""
+    view = AnnotationBookFilterHarness(RequestFactory().get("/"))
+    boolean_queryset = Book.objects.annotate(
+        long_book=Case(
+            When(pages__gte=400, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+    )
+    integer_queryset = Book.objects.annotate(
+        long_book=Case(
+            When(pages__gte=400, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+    )
+
+    boolean_filterset = view.get_filterset(boolean_queryset)
+    integer_filterset = view.get_filterset(integer_queryset)
+
+    assert view.get_filterset_class_cache_key(
+        view.filterset_fields, boolean_queryset
+    ) != view.get_filterset_class_cache_key(view.filterset_fields, integer_queryset)
+    assert isinstance(boolean_filterset.filters["long_book"], BooleanFilter)
+    assert isinstance(integer_filterset.filters["long_book"], NumberFilter), (
+        "A cached class built for a boolean annotation must not serve an integer one."
+    )
+
+
+def _book(title: str, author: Author, genres: list[Genre]) -> Book:
+    """Create a book tagged with ``genres``."""
+    book = Book.objects.create(
+        title=title,
+        author=author,
+        published_date=date(2024, 1, 1),
+        isbn=f"975{Book.objects.count():010d}",
+        pages=100,
+    )
+    book.genres.set(genres)
+    return book
+
+
+@pytest.mark.django_db
+def test_m2m_and_filter_matches_all_values_with_one_grouped_subquery():
+    """AND logic should group the through table once instead of joining per value."""
+    author = Author.objects.create(name="Tagger")
+    fiction, poetry, history = (
+        Genre.objects.create(name=name) for name in ("Fiction", "Poetry", "History")
+    )
+    both = _book("Both", author, [fiction, poetry])
+    all_three = _book("All three", author, [fiction, poetry, history])
+    _book("Fiction only", author, [fiction])
+
+    request = RequestFactory().get(
+        "/", {"genres": [str(fiction.pk), str(poetry.pk), str(fiction.pk)]}
+    )
+    view = FilterHarness(request)
+    view.m2m_filter_and_strategy = "grouped"
+    filterset = view.get_filterset(Book.objects.all())
+    with CaptureQueriesContext(connection) as queries:
+        matched = set(filterset.qs)
+
+    assert matched == {both, all_three}, (
+        "Only books tagged with every selected genre should remain."
+    )
+    sql = queries.captured_queries[-1]["sql"].upper()
+    assert "HAVING COUNT(DISTINCT" in sql
+    assert sql.count("JOIN") == 0, (
+        "The through-table subquery should not join once per selected value."
+    )
+
+
+@pytest.mark.django_db
+def test_m2m_and_filter_groups_model_rows_for_lookup_paths():
+    """Lookup paths through a relation should use the same all-values semantics."""
+    fiction, poetry = Genre.objects.create(name="Fiction"), Genre.objects.create(
+        name="Poetry"
+    )
+    versatile = Author.objects.create(name="Versatile")
+    versatile.genres.set([fiction, poetry])
+    novelist = Author.objects.create(name="Novelist")
+    novelist.genres.set([fiction])
+    kept = _book("Kept", versatile, [])
+    _book("Dropped", novelist, [])
+
+    author_genres = AllValuesModelMultipleChoiceFilter(
+        field_name="author__genres", queryset=Genre.objects.all()
+    )
+
+    assert list(author_genres.filter(Book.objects.all(), [fiction, poetry])) == [kept]
+
+
+@pytest.mark.django_db
+def test_m2m_and_filter_auto_strategy_keeps_chained_joins_where_they_win(
+    monkeypatch,
+):
+    """``auto`` should chain joins on SQLite or for few values, else group."""
+    genres = [Genre.objects.create(name=f"Genre {index}") for index in range(3)]
+    tagged = _book("Tagged", Author.objects.create(name="Tagger"), genres)
+    genre_filter = AllValuesModelMultipleChoiceFilter(
+        field_name="genres", queryset=Genre.objects.all(), strategy="auto"
+    )
+    selected = {genre.pk for genre in genres}
+
+    with CaptureQueriesContext(connection) as queries:
+        matched = list(genre_filter.filter(Book.objects.all(), genres))
+
+    assert matched == [tagged]
+    assert "HAVING" not in queries.captured_queries[-1]["sql"].upper(), (
+        "SQLite should keep the faster chained joins."
+    )
+
+    monkeypatch.setattr(connection, "vendor", "postgresql")
+    assert genre_filter.get_strategy(Book.objects.all(), selected) == "grouped"
+    assert genre_filter.get_strategy(Book.objects.all(), selected - {genres[0].pk}) == (
+        "joins"
+    ), "Small selections should keep chained joins on every database."
+    assert AllValuesModelMultipleChoiceFilter(
+        field_name="genres", queryset=Genre.objects.all()
+    ).get_strategy(Book.objects.all(), selected) == "joins", (
+        "Chained joins should stay the default on every database."
+    )
+
+
+@pytest.mark.django_db
+def test_as_view_initkwargs_are_part_of_generated_filterset_key():
+    """Two routes of one view class with different options need their own class."""
+    from sample.views import BookCRUDView
+
+    views = []
+    for sort_field in ("name", "-name"):
+        view = BookCRUDView(
+            filterset_fields=["author"],
+            dropdown_sort_options={"author": sort_field},
+        )
+        view.request = RequestFactory().get("/")
+        views.append(view)
+
+    keys = [
+        view.get_filterset_class_cache_key(["author"], Book.objects.all())
+        for view in views
+    ]
+    classes = [type(view.get_filterset(Book.objects.all())) for view in views]
+
+    assert keys[0] != keys[1]
+    assert classes[0] is not classes[1], (
+        "A FilterSet generated for one route must not serve another route's options."
+    )
+
+
+@pytest.mark.django_db
+def test_generated_filterset_class_cache_is_bounded(monkeypatch):
+    """The oldest generated class should be evicted once the cache is full."""
+    monkeypatch.setattr(filtering_mixin, "_GENERATED_FILTERSET_CLASSES", {})
+    monkeypatch.setattr(filtering_mixin, "_GENERATED_FILTERSET_CLASSES_MAX_SIZE", 2)
+
+    for fields in (["author"], ["genres"], ["bestseller"]):
+        view = FilterHarness(RequestFactory().get("/"))
+        view.filterset_fields = fields
+        view.get_filterset(Book.objects.all())
+
+    cached_fields = [
+        list(filterset_class.base_filters)
+        for filterset_class in filtering_mixin._GENERATED_FILTERSET_CLASSES.values()
+    ]
+    assert cached_fields == [["genres"], ["bestseller"]], (
+        "The cache should keep only the most recently generated classes."
+    )
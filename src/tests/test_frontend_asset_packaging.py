@@ -3,6 +3,8 @@
 import json
 from pathlib import Path
 
+import pytest
+
 import powercrud
 
 
@@ -332,6 +334,67 @@ def test_runtime_js_clears_opted_in_selection_extra_buttons_after_success() -> N
     ), "Internal clear requests should not reuse the marked extra button as their HTMX source."
 
 
+def test_runtime_js_batches_row_selection_changes() -> None:
+    """Runtime JS should queue row toggles and flush them in one request."""
+    package_root = Path(powercrud.__file__).resolve().parent
+    startup_js = package_root / "static" / "powercrud" / "js" / "runtime" / "startup.js"
+    bulk_actions_js = (
+        package_root / "static" / "powercrud" / "js" / "runtime" / "bulk-actions.js"
+    )
+
+    startup = startup_js.read_text(encoding="utf-8")
+    bulk_actions = bulk_actions_js.read_text(encoding="utf-8")
+
+    assert (
+        "queueSelectionChanges(root, [target.dataset.id], target.checked);" in bulk_actions
+    ), "Row checkbox requests should be queued instead of sent one by one."
+    assert "`${listUrl}apply-selection/`" in bulk_actions, (
+        "Queued selection changes should flush through the batch endpoint."
+    )
+    assert "flushSelectionChanges(root).finally(() => event.detail.issueRequest());" in (
+        bulk_actions
+    ), "Other list requests should wait for queued selection changes to save."
+    assert (
+        "documentObject.addEventListener('htmx:confirm', handlers.handleHtmxConfirm);"
+        in startup
+    ), "Startup runtime should register the confirm hook that flushes the queue."
+
+
+def test_row_selection_templates_keep_the_per_row_fallback() -> None:
+    """Row checkboxes should keep their own toggle request for stale bundles."""
+    package_root = Path(powercrud.__file__).resolve().parent
+    templates = [
+        package_root
+        / "templates"
+        / "powercrud"
+        / "packs"
+        / "daisyui"
+        / "partial"
+        / "bulk_selection_controls.html",
+        package_root
+        / "contrib"
+        / "bootstrap5"
+        / "templates"
+        / "powercrud"
+        / "packs"
+        / "bootstrap5"
+        / "partial"
+        / "bulk_selection_controls.html",
+    ]
+
+    for template in templates:
+        markup = template.read_text(encoding="utf-8")
+        assert 'data-powercrud-row-select="true"' in markup, (
+            f"{template.parent.parent.name} should mark row checkboxes for batching."
+        )
+        assert 'hx-post="{{ list_view_url }}toggle-selection/{{ row.id }}/"' in (
+            markup
+        ), (
+            f"{template.parent.parent.name} row checkboxes should keep the "
+            "per-row toggle request when the runtime cannot batch them."
+        )
+
+
 def test_runtime_startup_centralises_once_only_listener_registration() -> None:
     """Startup runtime should own once-only listener registration without moving handlers."""
     package_root = Path(powercrud.__file__).resolve().parent
@@ -495,6 +558,23 @@ def test_bundle_manifest_keeps_existing_entry_key() -> None:
     )
 
 
+@pytest.mark.xfail(
+    strict=True,
+    reason="Packaged bundle predates selection batching; rebuild with npm run build.",
+)
+def test_packaged_bundle_batches_row_selection_changes() -> None:
+    """The packaged Vite bundle should carry the batched selection runtime."""
+    package_root = Path(powercrud.__file__).resolve().parent
+    bundle = "".join(
+        path.read_text(encoding="utf-8", errors="ignore")
+        for path in sorted((package_root / "assets" / "django_assets").glob("*.js"))
+    )
+
+    assert "apply-selection/" in bundle, (
+        "Projects loading the packaged manifest should batch row selection changes."
+    )
+
+
 def test_runtime_css_themes_tomselect_with_daisyui_semantic_tokens() -> None:
     """Packaged runtime CSS should override TomSelect with daisyUI semantic theme tokens."""
     package_root = Path(powercrud.__file__).resolve().parent
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import uuid
 from types import SimpleNamespace
 
 import pytest
@@ -8,6 +9,7 @@ from django.http import HttpResponse
 from django.template import TemplateDoesNotExist
 from django.test import RequestFactory, override_settings
 from django.contrib.sessions.middleware import SessionMiddleware
+from django.db.models import UUIDField
 from neapolitan.views import Role
 
 from powercrud.actions import PowerButton
@@ -395,6 +397,34 @@ def test_toggle_all_selection_view_accepts_csv_object_ids(monkeypatch):
     )
 
 
+@pytest.mark.django_db
+def test_selection_endpoints_accept_uuid_primary_keys(monkeypatch):
+    """Batched and page-level selection should not assume integer pks."""
+    first, second = (str(uuid.uuid4()) for _ in range(2))
+    monkeypatch.setattr(Book._meta, "pk", UUIDField(primary_key=True))
+    monkeypatch.setattr(
+        "powercrud.mixins.bulk_mixin.selection_mixin.render",
+        lambda request, template, context: DummyPartialResponse(context),
+    )
+
+    request = make_request(RequestFactory(), method="post", data={"add": [first]})
+    response = DummyBulkView(request).apply_selection_view(request)
+    assert response.status_code == 200, "UUID row clicks should be applied"
+
+    request = make_request(
+        RequestFactory(), method="post", data={"object_ids": [second], "action": "add"}
+    )
+    response = DummyBulkView(request).toggle_all_selection_view(request)
+    assert response.status_code == 200, "UUID page toggles should be applied"
+    assert response.context_data["selected_ids"] == [second], (
+        "UUID ids should be stored as strings"
+    )
+
+    request = make_request(RequestFactory(), method="post", data={"add": ["nope"]})
+    response = DummyBulkView(request).apply_selection_view(request)
+    assert response.status_code == 400, "Ids the pk field rejects should fail"
+
+
 @pytest.mark.django_db
 def test_get_storage_key_includes_suffix():
     request = make_request(RequestFactory())
@@ -0,0 +1,151 @@
+"""Tests for the list-query index advisor and its management command."""
+
+from __future__ import annotations
+
+import json
+from io import StringIO
+
+import pytest
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection, models
+from neapolitan.views import CRUDView
+
+from powercrud.index_advice import advise_view
+from powercrud.management.commands.pcrud_index_advice import _is_project_app
+from powercrud.management.discovery import iter_routed_powercrud_views
+from powercrud.mixins import PowerCRUDMixin
+from sample.models import Book
+from sample.views import BookCRUDView
+
+VIEW_PATH = "tests.test_index_advice.AdvisedBookView"
+
+
+class AdvisedBookView(PowerCRUDMixin, CRUDView):
+    model = Book
+    namespace = "sample"
+    url_base = "bigbook"
+    base_template_path = "sample/base.html"
+    fields = ["title", "isbn", "pages"]
+    filterset_fields = ["author", "pages", "description"]
+
+
+def _queries(result) -> dict:
+    """Return a view's query advice keyed by label."""
+    return {query.label: query for query in result.queries}
+
+
+@pytest.mark.django_db
+def test_advise_view_suggests_sort_index_for_unindexed_column():
+    """Sorting on an unindexed column should suggest a (column, pk) index."""
+    result = advise_view(AdvisedBookView)
+    queries = _queries(result)
+
+    assert result.error is None, "Explaining the sample view should not fail"
+    assert queries["sort=pages"].needs_index, "Sorting on pages should sort rows"
+    assert [(s.model, s.fields) for s in result.suggestions] == [
+        (Book, ("pages", "id"))
+    ], "Only the unindexed pages column should get an index suggestion"
+
+
+@pytest.mark.django_db
+def test_advise_view_skips_columns_with_existing_indexes():
+    """Unique, FK, and primary-key columns should not get new indexes."""
+    queries = _queries(advise_view(AdvisedBookView))
+
+    assert not queries["sort=isbn"].needs_index, "The unique isbn index serves sorts"
+    assert not queries["filter=author"].needs_index, "The FK index serves filters"
+    assert not queries["default"].needs_index, "The pk order needs no sort"
+
+
+@pytest.mark.django_db
+def test_advise_view_points_text_filters_at_list_search():
+    """Substring filters should be explained but not given a B-tree index."""
+    query = _queries(advise_view(AdvisedBookView))["filter=description"]
+
+    assert query.needs_index, "Substring filters should scan the table"
+    assert not query.suggestions, "A B-tree index cannot serve icontains"
+    assert "list_search_fields" in query.notes[0], "The note should name the fix"
+
+
+def test_iter_routed_powercrud_views_yields_each_class_once():
+    """Discovery should de-duplicate the URL patterns of every role."""
+    view_classes = list(iter_routed_powercrud_views())
+
+    assert BookCRUDView in view_classes, "Routed sample views should be found"
+    assert len(view_classes) == len(set(view_classes)), "Classes should be unique"
+
+
+@pytest.mark.django_db
+def test_index_advice_command_prints_json():
+    """The --json option should report findings as structured data."""
+    stdout = StringIO()
+
+    call_command("pcrud_index_advice", VIEW_PATH, "--json", stdout=stdout)
+
+    [payload] = json.loads(stdout.getvalue())
+    assert payload["view"] == VIEW_PATH, "The view should be named by dotted path"
+    assert payload["suggestions"][0]["fields"] == ["pages", "id"], (
+        "Suggestions should list the index fields"
+    )
+
+
+@pytest.mark.django_db
+def test_index_advice_command_prints_meta_indexes():
+    """--emit-meta should print Meta.indexes entries for makemigrations."""
+    stdout = StringIO()
+
+    call_command("pcrud_index_advice", VIEW_PATH, "--emit-meta", stdout=stdout)
+
+    output = stdout.getvalue()
+    assert f"{Book._meta.label}: add to Book.Meta.indexes" in output, (
+        "The model whose Meta needs the index should be named"
+    )
+    assert "models.Index(fields=['pages', 'id'], name=" in output, (
+        "The index should cover pages, pk"
+    )
+    assert "makemigrations" in output, "The migration should be left to Django"
+
+
+@pytest.mark.django_db
+def test_index_advice_command_skips_existing_index_names():
+    """Indexes that already exist in the database should not be emitted again."""
+    index = models.Index(fields=["pages", "id"])
+    index.set_name_with_model(Book)
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE INDEX {quote(index.name)} ON {quote(Book._meta.db_table)} "
+            f"({quote('pages')}, {quote('id')})"
+        )
+    stdout = StringIO()
+
+    call_command("pcrud_index_advice", VIEW_PATH, "--emit-meta", stdout=stdout)
+
+    output = stdout.getvalue()
+    assert index.name not in output, "An existing index name should not be emitted"
+    assert "No Meta.indexes changes needed." in output, "Nothing should be left to add"
+
+
+def test_only_project_apps_receive_meta_indexes():
+    """Django's own apps and installed packages should never be edited."""
+    assert not _is_project_app(apps.get_app_config("auth")), (
+        "django.contrib.auth lives outside the project"
+    )
+    assert _is_project_app(apps.get_app_config("sample")), (
+        "The sample app is part of the project"
+    )
+
+
+class BrokenBookView(AdvisedBookView):
+    def get_queryset(self):
+        raise RuntimeError("misconfigured")
+
+
+@pytest.mark.django_db
+def test_advise_view_reports_errors_per_view():
+    """A view that cannot build its queryset should report an error, not raise."""
+    result = advise_view(BrokenBookView)
+
+    assert result.error == "misconfigured", "The failure should be recorded"
+    assert not result.suggestions, "A failed view should not suggest indexes"
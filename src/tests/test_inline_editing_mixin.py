@@ -1626,6 +1626,9 @@ class DummyQueryset:
     def first(self):
         return self.record
 
+    def __iter__(self):
+        return iter([self.record])
+
 
 class DummyRecordModel:
     def __init__(self, record):
@@ -1676,3 +1679,64 @@ def test_inline_lock_metadata_includes_user_and_label(sample_book):
     assert metadata["task"] == "task-123"
     assert metadata["lock_key"] == lock_key
     assert "Casey" in metadata["label"]
+
+
+class CountingLockCache(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.get_calls = 0
+        self.get_many_calls = 0
+
+    def get(self, key, default=None):
+        self.get_calls += 1
+        return super().get(key, default)
+
+    def get_many(self, keys):
+        self.get_many_calls += 1
+        return {key: self[key] for key in keys if key in self}
+
+
+class PageLockAsyncManager(DummyAsyncManager):
+    def __init__(self, record, locked_keys):
+        super().__init__(record, "")
+        self.cache = CountingLockCache({key: "task-123" for key in locked_keys})
+
+    def get_lock_task_names(self, model_name, obj_ids):
+        keys = {f"{self.conflict_model_prefix}{model_name}:{pk}": pk for pk in obj_ids}
+        found = self.cache.get_many(list(keys))
+        return {keys[key]: task_name for key, task_name in found.items()}
+
+
+class PageLockMetadataView(LockMetadataView):
+    def get_conflict_checking_enabled(self):
+        return True
+
+
+@pytest.mark.django_db
+def test_resolve_inline_lock_states_batches_cache_and_record_lookups():
+    """A list page should resolve every row's lock with one get_many and one query."""
+    record = SimpleNamespace(
+        task_name="task-123",
+        status="running",
+        message="Processing",
+        created_at=timezone.now(),
+        updated_at=timezone.now(),
+        user="Casey",
+    )
+    rows = [SimpleNamespace(pk=pk) for pk in (1, 2, 3)]
+    manager = PageLockAsyncManager(record, ["pc-lock:sample.book:2"])
+    view = PageLockMetadataView(manager)
+
+    states = view.resolve_inline_lock_states(rows)
+
+    assert manager.cache.get_many_calls == 1, "All lock keys should be read at once."
+    assert manager._record_model.objects.kwargs == {"task_name__in": {"task-123"}}, (
+        "Dashboard records should be loaded with one task_name__in query."
+    )
+    assert states[1] == {} and states[3] == {}
+    assert "Casey" in states[2]["label"]
+    assert [view.is_inline_row_locked(row) for row in rows] == [False, True, False]
+    assert view.get_inline_lock_details(rows[1]) is states[2]
+    assert manager.cache.get_calls == 0, (
+        "Row-level lock checks should reuse the attached page-level state."
+    )
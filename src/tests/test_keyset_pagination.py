@@ -0,0 +1,209 @@
+"""Tests for opt-in keyset (cursor) pagination."""
+
+from __future__ import annotations
+
+import re
+from urllib.parse import parse_qs
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.db.models import Count
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from neapolitan.views import CRUDView, Role
+
+from powercrud.mixins import PowerCRUDMixin
+from powercrud.mixins.paginate_mixin import KeysetPage
+from sample.models import Author, Book
+
+TITLE_PATTERN = re.compile(r'data-tippy-content="Keyset (\d+)"')
+
+
+class KeysetBookView(PowerCRUDMixin, CRUDView):
+    model = Book
+    namespace = "sample"
+    url_base = "bigbook"
+    base_template_path = "sample/base.html"
+    fields = ["title", "pages"]
+    paginate_by = 3
+    pagination_mode = "keyset"
+    show_record_count = True
+
+
+def _create_books(count: int) -> None:
+    """Create ``count`` books whose page counts repeat in pairs."""
+    author = Author.objects.create(name="Seeker")
+    Book.objects.bulk_create(
+        Book(
+            title=f"Keyset {index}",
+            author=author,
+            published_date="2024-01-01",
+            isbn=f"975{index:010d}",
+            pages=index // 2,
+        )
+        for index in range(count)
+    )
+
+
+def _view(query: str = "", htmx: bool = False) -> KeysetBookView:
+    """Return a list view bound to a GET request with ``query``."""
+    request = RequestFactory().get(f"/?{query}")
+    request.htmx = htmx
+    request.session = {}
+    request.user = AnonymousUser()
+    view = KeysetBookView(role=Role.LIST)
+    view.setup(request)
+    return view
+
+
+def _page(query: str = "") -> KeysetPage:
+    """Paginate the sorted list queryset for ``query``."""
+    view = _view(query)
+    queryset = view._apply_queryset_sorting(Book.objects.all())
+    return view.paginate_queryset(queryset, view.get_paginate_by())
+
+
+def _titles(page) -> list[int]:
+    """Return the book indexes on ``page``."""
+    return [int(book.title.split()[-1]) for book in page.object_list]
+
+
+def _walk(query: str, direction: str) -> list[list[int]]:
+    """Follow next or previous links from ``query`` until they run out."""
+    pages = []
+    page = _page(query)
+    while True:
+        pages.append(_titles(page))
+        link = getattr(page, f"{direction}_query_string")
+        if not link:
+            return pages
+        query = link
+        page = _page(query)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("sort", ["", "pages", "-pages", "-title"])
+def test_next_and_previous_links_cover_every_row_once(sort):
+    """Walking forward then back should visit the same pages in both directions."""
+    _create_books(10)
+    base = f"sort={sort}" if sort else ""
+
+    forward = _walk(base, "next")
+    last_page_query = base
+    for _ in forward[1:]:
+        last_page_query = _page(last_page_query).next_query_string
+    backward = _walk(last_page_query, "previous")
+
+    expected = [
+        int(book.title.split()[-1])
+        for book in _view(base)._apply_queryset_sorting(Book.objects.all())
+    ]
+    assert [index for page in forward for index in page] == expected, (
+        "Forward keyset pages should follow the (sort, pk) ordering without gaps."
+    )
+    assert [len(page) for page in forward] == [3, 3, 3, 1]
+    assert backward == forward[::-1], (
+        "Previous links should revisit the same pages back to page 1."
+    )
+
+
+@pytest.mark.django_db
+def test_keyset_page_tracks_offsets_for_record_counts():
+    """Record-count start and end indexes should follow the cursor offset."""
+    _create_books(10)
+    second_page = _page(_page().next_query_string)
+
+    view = _view()
+    context = view.get_record_count_context(
+        queryset=Book.objects.all(),
+        page_obj=second_page,
+        paginator=second_page.paginator,
+    )
+
+    assert (context["record_count_start"], context["record_count_end"]) == (4, 6)
+    assert context["record_count_total"] == 10
+    assert second_page.has_previous() and second_page.has_next()
+
+
+@pytest.mark.django_db
+def test_deep_keyset_page_does_not_use_offset():
+    """The seek query should filter past the cursor instead of using OFFSET."""
+    _create_books(10)
+    second_page_query = _page("sort=pages").next_query_string
+
+    with CaptureQueriesContext(connection) as queries:
+        _page(second_page_query)
+
+    (sql,) = [query["sql"] for query in queries.captured_queries]
+    assert "OFFSET" not in sql.upper(), "Keyset pages must not scan skipped rows."
+    assert '"sample_book"."pages" >' in sql
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-a-cursor", "eyJkIjoibiJ9:forged:signature"],
+)
+def test_invalid_cursor_falls_back_to_first_page(cursor):
+    """Tampered cursors should not raise and should show the first page."""
+    _create_books(5)
+
+    page = _page(f"cursor={cursor}")
+
+    assert _titles(page) == [0, 1, 2]
+    assert not page.has_previous()
+
+
+@pytest.mark.django_db
+def test_cursor_from_other_filters_or_sort_is_ignored():
+    """A cursor is only valid for the sort and filters it was issued for."""
+    _create_books(10)
+    cursor = parse_qs(_page("sort=pages").next_query_string)["cursor"][0]
+
+    page = _page(f"sort=-pages&cursor={cursor}")
+
+    assert not page.has_previous(), "Changing the sort should restart from page 1."
+
+
+def test_only_non_null_field_sorts_use_keyset_ordering():
+    """Nullable, annotated, and relation-valued sort keys fall back to offsets."""
+    view = _view()
+
+    assert view.get_keyset_ordering(Book.objects.order_by("title", "pk")) is not None
+    assert view.get_keyset_ordering(Book.objects.order_by("author__name", "pk")), (
+        "Sorts through non-null forward relations can be seeked."
+    )
+    assert view.get_keyset_ordering(Book.objects.order_by("title", "-pk")) is None
+    assert view.get_keyset_ordering(Book.objects.order_by("author", "pk")) is None
+    assert (
+        view.get_keyset_ordering(Book.objects.order_by("uneditable_field", "pk"))
+        is None
+    ), "NULL sort values cannot be compared with > or <."
+    assert (
+        view.get_keyset_ordering(
+            Book.objects.annotate(n=Count("genres")).order_by("n", "pk")
+        )
+        is None
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("htmx", [False, True])
+def test_keyset_list_renders_cursor_navigation(htmx):
+    """Full-page and HTMX list responses should render cursor Next links."""
+    _create_books(7)
+    request = RequestFactory().get("/?sort=pages")
+    request.htmx = htmx
+    request.session = {}
+    request.user = AnonymousUser()
+
+    response = KeysetBookView.as_view(role=Role.LIST)(request)
+    if hasattr(response, "render"):
+        response.render()
+    content = response.content.decode()
+
+    assert 'data-powercrud-pagination-mode="keyset"' in content
+    assert "cursor=" in content and "?page=" not in content
+    assert "Showing 1-3 of 7" in " ".join(content.split())
+    assert [int(i) for i in TITLE_PATTERN.findall(content)] == [0, 1, 2]
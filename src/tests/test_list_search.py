@@ -0,0 +1,217 @@
+"""Tests for pluggable list search backends and the quick-search filter."""
+
+from __future__ import annotations
+
+from io import StringIO
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from neapolitan.views import CRUDView, Role
+
+from powercrud import search
+from powercrud.apps import connect_view_receivers
+from powercrud.mixins import PowerCRUDMixin
+from powercrud.mixins.filtering_mixin import LIST_SEARCH_QUERY_PARAM, ListSearchFilter
+from powercrud.search import (
+    IcontainsSearchBackend,
+    PostgresSearchBackend,
+    SQLiteFTS5SearchBackend,
+    get_list_search_backend,
+)
+from sample.models import Author, Book
+
+
+class SearchBookView(PowerCRUDMixin, CRUDView):
+    model = Book
+    namespace = "sample"
+    url_base = "bigbook"
+    base_template_path = "sample/base.html"
+    use_htmx = True
+    fields = ["title", "isbn", "pages"]
+    filterset_fields = ["title", "pages"]
+    default_filterset_fields = ["pages"]
+    list_search_fields = ["title", "description"]
+
+
+def _books(*titles: str) -> list[Book]:
+    """Create one book per title."""
+    author = Author.objects.create(name="Searcher")
+    return [
+        Book.objects.create(
+            title=title,
+            author=author,
+            published_date="2024-01-01",
+            isbn=f"978{index:010d}",
+            pages=100,
+            description=f"About {title.lower()}",
+        )
+        for index, title in enumerate(titles)
+    ]
+
+
+def _filterset(query: str):
+    """Return the view's filterset bound to ``query``."""
+    view = SearchBookView(role=Role.LIST)
+    view.setup(RequestFactory().get(f"/?{query}"))
+    return view.get_filterset(Book.objects.all())
+
+
+@pytest.mark.django_db
+def test_fts5_backend_falls_back_to_icontains_until_the_index_is_built():
+    """An unbuilt FTS5 table should not break search; icontains answers it."""
+    _books("Dune", "Dune Messiah", "Emma")
+    backend = get_list_search_backend(Book, ["title", "description"], "sqlite_fts5")
+
+    assert backend.is_ready("default") is False
+    with CaptureQueriesContext(connection) as queries:
+        titles = sorted(b.title for b in backend.search(Book.objects.all(), "une"))
+
+    assert titles == ["Dune", "Dune Messiah"], "Fallback should keep substring matches."
+    assert "LIKE" in queries.captured_queries[-1]["sql"].upper()
+
+
+@pytest.mark.django_db
+def test_fts5_backend_matches_every_token_as_a_prefix():
+    """A built FTS5 index should answer searches with MATCH on every token."""
+    _books("Dune Messiah", "Children of Dune", "Emma")
+    backend = get_list_search_backend(Book, ["title", "description"], "sqlite_fts5")
+    assert backend.build_index() == 3
+
+    with CaptureQueriesContext(connection) as queries:
+        titles = sorted(b.title for b in backend.search(Book.objects.all(), "dun mess"))
+    by_description = [
+        book.title for book in backend.search(Book.objects.all(), "about emma")
+    ]
+
+    assert titles == ["Dune Messiah"]
+    assert "MATCH" in queries.captured_queries[-1]["sql"].upper()
+    assert by_description == ["Emma"], "Every indexed field should be searched."
+
+
+@pytest.mark.django_db
+def test_fts5_index_follows_saves_and_deletes():
+    """post_save and post_delete should keep a built index in sync."""
+    dune, emma = _books("Dune", "Emma")
+    backend = get_list_search_backend(Book, ["title", "description"], "sqlite_fts5")
+    backend.build_index()
+
+    dune.title = "Arrakis"
+    dune.save()
+    emma.delete()
+
+    assert [b.title for b in backend.search(Book.objects.all(), "arrakis")] == [
+        "Arrakis"
+    ]
+    assert list(backend.search(Book.objects.all(), "dune", ["title"])) == [], (
+        "The old title should leave the index."
+    )
+    assert list(backend.search(Book.objects.all(), "emma")) == []
+
+
+@pytest.mark.django_db
+def test_column_scoped_search_only_matches_that_column():
+    """Per-column text filters should not match other indexed fields."""
+    _books("Dune", "Emma")
+    backend = get_list_search_backend(Book, ["title", "description"], "sqlite_fts5")
+    backend.build_index()
+
+    assert list(backend.search(Book.objects.all(), "about", ["title"])) == []
+    assert len(backend.search(Book.objects.all(), "about", ["description"])) == 2
+
+
+@pytest.mark.django_db
+def test_generated_filterset_adds_a_visible_quick_search_box():
+    """The search filter should lead the form and stay visible with defaults."""
+    _books("Dune", "Emma")
+    filterset = _filterset(f"{LIST_SEARCH_QUERY_PARAM}=emma")
+    view = SearchBookView(role=Role.LIST)
+    view.setup(RequestFactory().get("/"))
+
+    assert next(iter(filterset.form.fields)) == LIST_SEARCH_QUERY_PARAM
+    assert "hx-get" in filterset.form.fields[LIST_SEARCH_QUERY_PARAM].widget.attrs
+    assert [book.title for book in filterset.qs] == ["Emma"]
+    assert LIST_SEARCH_QUERY_PARAM in view.get_visible_filter_names(_filterset("")), (
+        "The quick-search box should not need default_filterset_fields."
+    )
+
+
+@pytest.mark.django_db
+def test_text_filters_for_indexed_fields_use_the_search_backend():
+    """Generated text filters on list_search_fields should use the backend."""
+    _books("Dune", "Emma")
+    filterset = _filterset("title=dun")
+
+    assert isinstance(filterset.filters["title"], ListSearchFilter)
+    assert [book.title for book in filterset.qs] == ["Dune"]
+
+
+def test_search_fields_must_be_text_fields():
+    """Non-text fields cannot be indexed for search."""
+    with pytest.raises(ImproperlyConfigured):
+        IcontainsSearchBackend(Book, ["pages"])
+
+
+def test_postgres_backend_indexes_match_the_queries_it_runs():
+    """Trigram indexes should cover UPPER(col::text) like Django's icontains."""
+    statements = PostgresSearchBackend(
+        Book, ["title", "description"]
+    ).get_index_statements(connection)
+
+    assert statements[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+    assert 'USING gin (UPPER("title"::text) gin_trgm_ops)' in statements[1]
+    assert (
+        "to_tsvector('simple'::regconfig, COALESCE(\"title\", '') || ' ' || "
+        "COALESCE(\"description\", ''))" in statements[-1]
+    )
+
+
+@pytest.mark.django_db
+def test_search_index_command_builds_indexes_for_named_views():
+    """pcrud_search_index should build the index of each view it is given."""
+    _books("Dune", "Emma")
+    stdout = StringIO()
+
+    call_command(
+        "pcrud_search_index", "tests.test_list_search.SearchBookView", stdout=stdout
+    )
+
+    assert "Built sqlite_fts5 index for sample.Book: title, description (2 rows)" in (
+        stdout.getvalue()
+    )
+    assert SQLiteFTS5SearchBackend(Book, ["title", "description"]).is_ready("default")
+
+
+@pytest.mark.django_db
+def test_fts5_readiness_is_looked_up_once_per_connection():
+    """Saves and searches should not query sqlite_master every time."""
+    backend = SQLiteFTS5SearchBackend(Book, ["title"])
+    assert backend.is_ready("default") is False
+
+    with CaptureQueriesContext(connection) as queries:
+        assert backend.is_ready("default") is False
+
+    assert queries.captured_queries == [], "The lookup should be cached."
+
+
+@pytest.mark.django_db
+def test_view_search_backends_sync_before_the_first_search(monkeypatch):
+    """Loading a view should connect its index sync without building a filterset."""
+    monkeypatch.setattr(search, "_SEARCH_BACKENDS", {})
+    monkeypatch.setattr(search, "_WATCHED_MODELS", set())
+    post_save.disconnect(
+        sender=Book, dispatch_uid=f"{search.SEARCH_SIGNAL_PREFIX}:sample.book"
+    )
+
+    connect_view_receivers([SearchBookView])
+    (backend,) = search.get_registered_search_backends(Book)
+    backend.build_index()
+    _books("Dune")
+
+    assert [book.title for book in backend.search(Book.objects.all(), "dune")] == [
+        "Dune"
+    ], "Rows saved before any search should reach the index."
@@ -0,0 +1,227 @@
+"""Tests for snapshot list pagination backed by cached ordered pk lists."""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import BooleanField, Case, Value, When
+from django.db.models.signals import post_delete
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from neapolitan.views import CRUDView, Role
+
+from powercrud import list_snapshots
+from powercrud.list_snapshots import invalidate_list_snapshots
+from powercrud.mixins import PowerCRUDMixin
+from sample.models import Author, Book
+
+
+class SnapshotBookView(PowerCRUDMixin, CRUDView):
+    model = Book
+    namespace = "sample"
+    url_base = "bigbook"
+    base_template_path = "sample/base.html"
+    queryset = Book.objects.annotate(
+        long_book=Case(
+            When(pages__gte=3, then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+    )
+    fields = ["title", "pages", "long_book"]
+    filterset_fields = ["title"]
+    paginate_by = 2
+    show_record_count = True
+    list_snapshot = True
+
+
+def _create_books(count: int) -> list[Book]:
+    """Create ``count`` books whose page counts follow their index."""
+    author = Author.objects.create(name="Snapshotter")
+    return Book.objects.bulk_create(
+        Book(
+            title=f"Snap {index}",
+            author=author,
+            published_date="2024-01-01",
+            isbn=f"977{index:010d}",
+            pages=index,
+        )
+        for index in range(count)
+    )
+
+
+def _page(query: str = "", **initkwargs):
+    """Run the list view for ``query``; return its page rows and captured SQL."""
+    request = RequestFactory().get(f"/?{query}")
+    request.htmx = False
+    request.session = {}
+    request.user = AnonymousUser()
+    with CaptureQueriesContext(connection) as queries:
+        response = SnapshotBookView.as_view(role=Role.LIST, **initkwargs)(request)
+        response.render()
+    assert response.status_code == 200
+    page = response.context_data["page_obj"]
+    sql = [entry["sql"] for entry in queries.captured_queries]
+    return page, " ".join(response.content.decode().split()), sql
+
+
+def _list_queries(sql: list[str]) -> list[str]:
+    """Return captured statements that read the book list itself."""
+    return [
+        statement
+        for statement in sql
+        if 'FROM "sample_book"' in statement and "sample_author" not in statement
+    ]
+
+
+@pytest.mark.django_db
+def test_later_pages_fetch_only_their_rows_from_the_snapshot():
+    """Page 2 should slice the cached pks instead of re-running the list query."""
+    _create_books(5)
+    _page("sort=pages")
+
+    page, text, sql = _page("sort=pages&page=2")
+
+    assert [book.title for book in page.object_list] == ["Snap 2", "Snap 3"]
+    assert [book.long_book for book in page.object_list] == [False, True], (
+        "Page rows should keep the view queryset's annotations."
+    )
+    assert "Showing 3-4 of 5 total records" in text
+    list_sql = _list_queries(sql)
+    assert len(list_sql) == 1, "Only the page rows should be read."
+    assert " IN (" in list_sql[0] and "OFFSET" not in list_sql[0].upper()
+    assert not any("COUNT(" in statement.upper() for statement in list_sql)
+
+
+@pytest.mark.django_db
+def test_flipping_sort_direction_reuses_the_snapshot_reversed():
+    """A descending request for the same sort field should reverse the snapshot."""
+    _create_books(5)
+    _page("sort=pages")
+
+    page, _text, sql = _page("sort=-pages")
+
+    assert [book.title for book in page.object_list] == ["Snap 4", "Snap 3"]
+    assert len(_list_queries(sql)) == 1
+
+
+@pytest.mark.django_db
+def test_filter_and_sort_field_changes_take_new_snapshots():
+    """Different filters or sort fields must not reuse another state's pks."""
+    _create_books(5)
+    _page("sort=pages")
+
+    filtered, _text, _sql = _page("sort=pages&title=Snap 4")
+    by_title, _text, sql = _page("sort=-title")
+
+    assert [book.title for book in filtered.object_list] == ["Snap 4"]
+    assert [book.title for book in by_title.object_list] == ["Snap 4", "Snap 3"]
+    assert len(_list_queries(sql)) == 2, "A new sort field needs a new pk list."
+
+
+def _bulk_create_book(author: Author, index: int) -> None:
+    """Add a book without sending ``post_save``."""
+    Book.objects.bulk_create(
+        [
+            Book(
+                title=f"Snap new {index}",
+                author=author,
+                published_date="2024-01-01",
+                isbn=f"97799999999{index:02d}",
+                pages=99,
+            )
+        ]
+    )
+
+
+@pytest.mark.django_db
+def test_snapshots_follow_the_view_model_and_watched_models():
+    """Saves on the view's model or watched models refresh; silent writes wait."""
+    books = _create_books(3)
+    author = books[0].author
+    _page("sort=pages", list_snapshot_watch_models=["sample.Author"])
+    _bulk_create_book(author, 1)
+
+    _stale, stale_text, _sql = _page(
+        "sort=pages&page=2", list_snapshot_watch_models=["sample.Author"]
+    )
+    author.save()
+    _fresh, watched_text, _sql = _page(
+        "sort=pages&page=2", list_snapshot_watch_models=["sample.Author"]
+    )
+    Book.objects.get(title="Snap new 1").delete()
+    _fresh, own_model_text, _sql = _page(
+        "sort=pages&page=2", list_snapshot_watch_models=["sample.Author"]
+    )
+
+    assert "of 3 total records" in stale_text, "bulk_create sends no signal."
+    assert "of 4 total records" in watched_text, (
+        "A watched model's post_save should drop the snapshot."
+    )
+    assert "of 3 total records" in own_model_text, (
+        "The view's own model should be watched without configuration."
+    )
+
+
+@pytest.mark.django_db
+def test_snapshot_receivers_are_connected_before_the_list_is_served(monkeypatch):
+    """Defining a snapshot view should watch its model before any request."""
+    monkeypatch.setattr(list_snapshots, "_WATCHED_MODELS", set())
+    post_delete.disconnect(
+        sender=Book,
+        dispatch_uid=f"{list_snapshots.LIST_SNAPSHOT_CACHE_PREFIX}:sample.book",
+    )
+    books = _create_books(2)
+
+    class DefinedSnapshotView(SnapshotBookView):
+        pass
+
+    version = list_snapshots._get_version_key(Book)
+    cache.set(version, "before", None)
+    books[0].delete()
+
+    assert cache.get(version) != "before", (
+        "A delete should drop snapshots before the list is first rendered."
+    )
+
+
+@pytest.mark.django_db
+def test_invalidate_list_snapshots_refreshes_watching_views():
+    """Manual invalidation covers bulk writes that send no model signals."""
+    _create_books(3)
+    _page("sort=pages", list_snapshot_watch_models=["sample.Book"])
+    Book.objects.filter(pages=0).update(pages=100)
+    invalidate_list_snapshots(Book)
+
+    page, _text, _sql = _page("sort=pages", list_snapshot_watch_models=["sample.Book"])
+
+    assert [book.title for book in page.object_list] == ["Snap 1", "Snap 2"]
+
+
+@pytest.mark.django_db
+def test_lists_over_the_row_limit_use_normal_pagination():
+    """Lists longer than list_snapshot_max_rows should not be cached."""
+    _create_books(5)
+
+    page, _text, sql = _page("sort=pages&page=2", list_snapshot_max_rows=3)
+
+    assert [book.title for book in page.object_list] == ["Snap 2", "Snap 3"]
+    assert any("OFFSET" in statement.upper() for statement in _list_queries(sql))
+
+
+@pytest.mark.django_db
+def test_lists_over_the_row_limit_skip_the_pk_read_on_later_requests():
+    """An oversized list should be remembered, so its pks are read only once."""
+    _create_books(5)
+    _page("sort=pages", list_snapshot_max_rows=3)
+
+    page, _text, sql = _page("sort=pages&page=2", list_snapshot_max_rows=3)
+
+    assert [book.title for book in page.object_list] == ["Snap 2", "Snap 3"], (
+        "The oversized list should still paginate normally"
+    )
+    assert not any(
+        "LIMIT 4" in statement.upper() for statement in _list_queries(sql)
+    ), "Later requests should not re-read max_rows + 1 pks"
@@ -0,0 +1,148 @@
+"""Tests for streaming unpaginated list rows in chunks."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import replace
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import transaction
+from django.test import RequestFactory
+from neapolitan.views import CRUDView, Role
+
+from powercrud.mixins import PowerCRUDMixin
+from sample.models import Author, Book
+
+ROW_PATTERN = re.compile(r'data-tippy-content="Streamed (\d+)"')
+
+
+class StreamedBookView(PowerCRUDMixin, CRUDView):
+    model = Book
+    namespace = "sample"
+    url_base = "bigbook"
+    base_template_path = "sample/base.html"
+    fields = ["title", "author"]
+    page_size_options = None
+    page_size_all_enabled = True
+    paginate_by = None
+    page_size_all_streaming = True
+    page_size_all_stream_chunk_size = 3
+
+
+def _create_books(count: int) -> None:
+    """Create ``count`` books that share one author."""
+    author = Author.objects.create(name="Streamer")
+    Book.objects.bulk_create(
+        Book(
+            title=f"Streamed {index}",
+            author=author,
+            published_date="2024-01-01",
+            isbn=f"976{index:010d}",
+            pages=index,
+        )
+        for index in range(count)
+    )
+
+
+def _list_request(htmx: bool = False):
+    """Return an anonymous list request suitable for calling the view directly."""
+    request = RequestFactory().get("/", HTTP_HX_REQUEST="true" if htmx else None)
+    request.htmx = htmx
+    request.session = {}
+    request.user = AnonymousUser()
+    return request
+
+
+def _rendered_titles(response) -> list[int]:
+    """Return the book indexes rendered in a list response, in order."""
+    if response.streaming:
+        content = b"".join(response.streaming_content).decode()
+    else:
+        response.render()
+        content = response.content.decode()
+    return [int(index) for index in ROW_PATTERN.findall(content)]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("htmx", [False, True])
+def test_long_unpaginated_list_is_streamed_in_order(htmx):
+    """Rows beyond the first chunk should stream in after the rendered page."""
+    _create_books(8)
+
+    response = StreamedBookView.as_view(role=Role.LIST)(_list_request(htmx=htmx))
+
+    assert response.streaming, "A list longer than one chunk should stream."
+    assert _rendered_titles(response) == list(range(8)), (
+        "Streamed chunks should keep the list ordering and render every row once."
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_streamed_rows_reuse_the_page_row_templates():
+    """Later chunks should render with the same columns as the first chunk."""
+    _create_books(4)
+
+    response = StreamedBookView.as_view(role=Role.LIST)(_list_request())
+    content = b"".join(response.streaming_content).decode()
+
+    assert "powercrud-list-stream" not in content, "The marker must not reach clients."
+    assert content.count("<tr") == 5, "Expected one header row and four body rows."
+    assert content.rstrip().endswith("</html>"), "The page tail should follow the rows."
+
+
+@pytest.mark.django_db(transaction=True)
+def test_list_within_one_chunk_renders_normally():
+    """A list that fits in the first chunk should not pay for streaming."""
+    _create_books(2)
+
+    response = StreamedBookView.as_view(role=Role.LIST)(_list_request())
+
+    assert not response.streaming
+    assert _rendered_titles(response) == [0, 1]
+
+
+class MarkerlessShellBookView(StreamedBookView):
+    """Stand-in for a custom table shell that does not emit the stream marker."""
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        if context.get("list_stream") is not None:
+            context["list_stream"] = replace(context["list_stream"], marker="")
+        return context
+
+
+@pytest.mark.django_db(transaction=True)
+def test_table_shell_without_marker_falls_back_to_eager_rendering():
+    """Custom table shells that omit the marker should still render every row."""
+    _create_books(7)
+
+    response = MarkerlessShellBookView.as_view(role=Role.LIST)(_list_request())
+
+    assert not response.streaming, "Without the marker there is nothing to splice."
+    assert _rendered_titles(response) == list(range(7)), (
+        "The fallback render should include the rows that were not yet read."
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_list_inside_a_transaction_renders_without_streaming():
+    """Lists rendered inside a transaction, as with ATOMIC_REQUESTS, render eagerly."""
+    _create_books(8)
+
+    with transaction.atomic():
+        response = StreamedBookView.as_view(role=Role.LIST)(_list_request())
+        assert not response.streaming, (
+            "A commit after the view returns would close the cursor mid-stream."
+        )
+        assert _rendered_titles(response) == list(range(8)), (
+            "The eager render should include every row."
+        )
+
+
+def test_streaming_is_opt_in():
+    """Views without page_size_all_streaming should not build a stream."""
+    view = StreamedBookView(role=Role.LIST, page_size_all_streaming=False)
+
+    assert view.get_list_stream_chunk_size() is None
+    assert view.get_list_stream(Book.objects.none()) is None
@@ -0,0 +1,232 @@
+"""Tests for automatic select_related/prefetch_related planning."""
+
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from neapolitan.views import CRUDView, Role
+
+from powercrud.mixins import ListQueryPlan, PowerCRUDMixin
+from sample.models import Author, Book, Genre
+
+
+class PlannedBookView(PowerCRUDMixin, CRUDView):
+    model = Book
+    namespace = "sample"
+    url_base = "planned-book"
+    base_template_path = "sample/base.html"
+    fields = ["title", "author", "genres"]
+    detail_fields = ["title", "author", "genres"]
+
+
+def _create_books(count: int, start: int = 0) -> None:
+    """Create books that each have their own author and one shared genre."""
+    genre = Genre.objects.create(name=f"Planned {start}")
+    authors = Author.objects.bulk_create(
+        Author(name=f"Planner {index}") for index in range(start, start + count)
+    )
+    books = Book.objects.bulk_create(
+        Book(
+            title=f"Planned {index}",
+            author=author,
+            published_date="2024-01-01",
+            isbn=f"979{index:010d}",
+            pages=100,
+        )
+        for index, author in enumerate(authors, start=start)
+    )
+    Book.genres.through.objects.bulk_create(
+        Book.genres.through(book_id=book.pk, genre_id=genre.pk) for book in books
+    )
+
+
+def _count_list_queries(client) -> int:
+    """Render the sample book list and return the number of SQL queries."""
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("sample:bigbook-list"))
+    assert response.status_code == 200
+    return len(queries.captured_queries)
+
+
+def test_list_plan_covers_relation_columns():
+    """FK columns should be joined and M2M columns prefetched."""
+    view = PlannedBookView(role=Role.LIST)
+
+    plan = view.get_list_query_plan(Book.objects.order_by("pk"), view.fields)
+
+    assert plan.select_related == ("author",), "FK columns should use select_related."
+    assert plan.prefetch_related == ("genres",), "M2M columns should be prefetched."
+
+
+def test_list_plan_ignores_attnames_and_follows_relation_sorts():
+    """Stored key attnames need no join, while FK sort paths are joined."""
+    view = PlannedBookView(
+        role=Role.LIST,
+        link_fields={
+            "title": {"view_name": "sample:bigbook-detail", "pk_attr": "author_id"}
+        },
+    )
+
+    plan = view.get_list_query_plan(
+        Book.objects.order_by("-author__name", "pk"), ["title"]
+    )
+
+    assert plan.select_related == ("author",), (
+        "Only the relation behind the sort expression should be joined."
+    )
+    assert plan.prefetch_related == ()
+
+
+def test_opt_out_and_override_hook_leave_queryset_unchanged():
+    """auto_related_lookups=False and an empty override plan both skip planning."""
+    queryset = Book.objects.order_by("pk")
+    opted_out = PlannedBookView(role=Role.LIST, auto_related_lookups=False)
+
+    class ManualPlanBookView(PlannedBookView):
+        def get_list_query_plan(self, queryset, active_columns):
+            return ListQueryPlan(prefetch_related=("genres",))
+
+    manual = ManualPlanBookView(role=Role.LIST)
+    planned = manual.plan_list_queryset(queryset)
+
+    assert opted_out.plan_list_queryset(queryset) is queryset, (
+        "Opting out should return the queryset untouched."
+    )
+    assert planned.query.select_related is False, "The override plan adds no joins."
+    assert planned._prefetch_related_lookups == ("genres",)
+
+
+def test_values_querysets_are_not_planned():
+    """Querysets that do not yield model instances cannot take related lookups."""
+    view = PlannedBookView(role=Role.LIST)
+    queryset = Book.objects.values("title")
+
+    assert view.plan_list_queryset(queryset) is queryset
+
+
+def test_detail_queryset_joins_detail_relations():
+    """Detail views should join single-valued detail fields."""
+    view = PlannedBookView(role=Role.DETAIL)
+    view.request = RequestFactory().get("/")
+
+    queryset = view.get_queryset()
+
+    assert queryset.query.select_related == {"author": {}}, (
+        "Detail FK fields should be joined when resolving the object."
+    )
+
+
+@pytest.mark.django_db
+def test_sample_list_query_count_is_independent_of_row_count(client):
+    """Adding rows must not add per-row author or genre queries."""
+    _create_books(3)
+    small_page_queries = _count_list_queries(client)
+
+    _create_books(9, start=3)
+    larger_page_queries = _count_list_queries(client)
+
+    assert larger_page_queries == small_page_queries, (
+        "The planned list queryset should render FK and M2M columns without N+1 queries."
+    )
+
+
+@pytest.mark.django_db
+def test_sample_detail_query_count_includes_author_join(client):
+    """The sample detail page should load the book and its author in one query."""
+    _create_books(1)
+    book = Book.objects.get()
+    client.post(reverse("sample:demo-login", args=["manager"]))
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse("sample:bigbook-detail", args=[book.pk]))
+
+    assert response.status_code == 200
+    author_queries = [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith('SELECT "sample_author"')
+    ]
+    assert author_queries == [], "The author should arrive via the book query join."
+
+
+class ProjectedBookView(PlannedBookView):
+    url_base = "bigbook"
+    properties = ["isbn_empty"]
+    list_column_projection = True
+    property_field_dependencies = {"isbn_empty": ["isbn"]}
+
+
+def test_projection_loads_rendered_columns_and_property_dependencies():
+    """Projection should load the pk, field columns, and declared property inputs."""
+    view = ProjectedBookView(role=Role.LIST)
+    queryset = Book.objects.order_by("-published_date", "-pk")
+
+    plan = view.get_list_query_plan(
+        queryset, ["title", "author", "genres", "isbn_empty"]
+    )
+    sql = str(view.apply_list_query_plan(queryset, plan).query)
+
+    assert plan.only == ("id", "title", "author", "isbn", "published_date"), (
+        "The projection should cover columns, property dependencies, and sort keys."
+    )
+    assert '"sample_book"."description"' not in sql, (
+        "Large unrendered text columns should not be fetched."
+    )
+
+
+def test_projection_is_skipped_for_undeclared_properties():
+    """An active property without declared dependencies disables projection."""
+    view = ProjectedBookView(role=Role.LIST, property_field_dependencies={})
+
+    plan = view.get_list_query_plan(
+        Book.objects.order_by("pk"), ["title", "isbn_empty"]
+    )
+
+    assert plan.only == (), "Projecting would cause deferred loads in the property."
+
+
+def test_projection_respects_explicit_queryset_deferral():
+    """A view queryset that already uses only()/defer() keeps its own projection."""
+    view = ProjectedBookView(role=Role.LIST)
+    queryset = Book.objects.defer("uneditable_field").order_by("pk")
+
+    planned = view.plan_list_queryset(queryset)
+
+    assert planned.query.deferred_loading == (frozenset({"uneditable_field"}), True)
+
+
+def test_property_field_dependencies_must_reference_model_fields():
+    """Unknown dependency fields should fail during configuration."""
+
+    class BrokenDependencyView(ProjectedBookView):
+        property_field_dependencies = {"isbn_empty": ["not_a_field"]}
+
+    with pytest.raises(ValueError, match="not_a_field"):
+        BrokenDependencyView()
+
+
+@pytest.mark.django_db
+def test_projected_list_render_has_no_deferred_field_queries(rf):
+    """Rendering a projected list must not load deferred fields row by row."""
+    list_view = ProjectedBookView.as_view(role=Role.LIST)
+
+    def count_queries() -> int:
+        with CaptureQueriesContext(connection) as queries:
+            request = rf.get("/")
+            request.htmx = False
+            request.session = {}
+            response = list_view(request)
+            response.render()
+        assert response.status_code == 200
+        return len(queries.captured_queries)
+
+    _create_books(3)
+    small_page_queries = count_queries()
+    _create_books(9, start=3)
+
+    assert count_queries() == small_page_queries, (
+        "Projected rows should render properties from their declared dependencies."
+    )
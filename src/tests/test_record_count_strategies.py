@@ -0,0 +1,186 @@
+"""Tests for the pluggable list record-count strategies."""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.http import Http404
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from neapolitan.views import CRUDView, Role
+
+from powercrud.mixins import PowerCRUDMixin
+from sample.models import Author, Book
+
+
+class CountedBookView(PowerCRUDMixin, CRUDView):
+    model = Book
+    namespace = "sample"
+    url_base = "bigbook"
+    base_template_path = "sample/base.html"
+    fields = ["title", "pages"]
+    filterset_fields = ["title"]
+    paginate_by = 3
+    show_record_count = True
+
+
+def _create_books(count: int) -> None:
+    """Create ``count`` books for one author."""
+    author = Author.objects.create(name="Counter")
+    Book.objects.bulk_create(
+        Book(
+            title=f"Counted {index}",
+            author=author,
+            published_date="2024-01-01",
+            isbn=f"973{index:010d}",
+            pages=index,
+        )
+        for index in range(count)
+    )
+
+
+def _render(query: str = "", **initkwargs) -> tuple[str, list[str]]:
+    """Render the list for ``query`` and return its text and captured SQL."""
+    request = RequestFactory().get(f"/?{query}")
+    request.htmx = False
+    request.session = {}
+    request.user = AnonymousUser()
+    with CaptureQueriesContext(connection) as queries:
+        response = CountedBookView.as_view(role=Role.LIST, **initkwargs)(request)
+        response.render()
+    assert response.status_code == 200
+    text = " ".join(response.content.decode().split())
+    return text, [query["sql"] for query in queries.captured_queries]
+
+
+def _count_queries(sql: list[str]) -> list[str]:
+    """Return the COUNT queries from captured SQL."""
+    return [statement for statement in sql if "COUNT(" in statement.upper()]
+
+
+@pytest.mark.django_db
+def test_exact_strategy_keeps_counting_every_request():
+    """The default strategy should count the filtered list on every request."""
+    _create_books(5)
+
+    text, sql = _render()
+
+    assert "Showing 1-3 of 5 total records" in text
+    assert len(_count_queries(sql)) == 1
+
+
+@pytest.mark.django_db
+def test_cached_strategy_reuses_count_per_filter_state():
+    """Cached counts are reused for the same filters and recomputed for new ones."""
+    _create_books(5)
+
+    _render(record_count_strategy="cached")
+    Book.objects.filter(pages=4).delete()
+    text, sql = _render("sort=-pages&page=2", record_count_strategy="cached")
+    filtered_text, filtered_sql = _render(
+        "title=Counted", record_count_strategy="cached"
+    )
+
+    assert _count_queries(sql) == [], "Sorting and paging should reuse the count."
+    assert "of 5 total records" in text, "The cached total is served until it expires."
+    assert len(_count_queries(filtered_sql)) == 1, "New filters need a new count."
+    assert "of 4 matching records" in filtered_text
+
+
+@pytest.mark.django_db
+def test_cached_strategy_serves_rows_past_a_stale_count():
+    """Rows added after the count was cached should still be reachable."""
+    _create_books(6)
+    _render(record_count_strategy="cached")
+    Book.objects.bulk_create(
+        Book(
+            title=f"Late {index}",
+            author=Author.objects.get(),
+            published_date="2024-01-01",
+            isbn=f"974{index:010d}",
+            pages=100 + index,
+        )
+        for index in range(4)
+    )
+
+    second_text, _ = _render("sort=pages&page=2", record_count_strategy="cached")
+    third_text, _ = _render("sort=pages&page=3", record_count_strategy="cached")
+    fourth_text, _ = _render("sort=pages&page=4", record_count_strategy="cached")
+
+    assert 'href="?page=3' in second_text, (
+        "The counted last page should link on when more rows exist."
+    )
+    assert "Showing 7-9 of 6 total records" in third_text, (
+        "The page past the stale count should hold the new rows."
+    )
+    assert "Late 0" in third_text and "Late 2" in third_text
+    assert "Showing 10-10 of 6 total records" in fourth_text, (
+        "The last row should be reachable on the following page."
+    )
+
+
+@pytest.mark.django_db
+def test_cached_count_key_includes_queryset_scope():
+    """Views scoping get_queryset() differently should not share cached counts."""
+    _create_books(5)
+    view = CountedBookView(role=Role.LIST)
+    view.request = RequestFactory().get("/")
+
+    all_books = view.get_record_count_cache_key(Book.objects.all())
+    some_books = view.get_record_count_cache_key(Book.objects.filter(pages__lt=2))
+
+    assert all_books != some_books
+    assert view.get_record_count_cache_key(Book.objects.none()) is None
+
+
+@pytest.mark.django_db
+def test_estimated_strategy_labels_planner_estimates(monkeypatch):
+    """Large planner estimates replace COUNT and are labelled as approximate."""
+    _create_books(5)
+    monkeypatch.setattr(
+        CountedBookView, "estimate_queryset_record_count", lambda self, qs: 12000
+    )
+
+    text, sql = _render("page=2", record_count_strategy="estimated")
+
+    assert _count_queries(sql) == []
+    assert "Showing 4-5 of about 12000 total records" in text, (
+        "Page indexes should follow the rows that exist, not the estimate."
+    )
+
+
+@pytest.mark.django_db
+def test_estimated_strategy_counts_exactly_without_an_estimate():
+    """Databases without planner estimates (SQLite here) use an exact count."""
+    _create_books(5)
+
+    text, sql = _render(record_count_strategy="estimated")
+
+    assert "Showing 1-3 of 5 total records" in text
+    assert len(_count_queries(sql)) == 1
+
+
+@pytest.mark.django_db
+def test_has_more_strategy_skips_count_and_uses_next_link():
+    """has_more pages read one extra row instead of counting the list."""
+    _create_books(5)
+
+    first_text, first_sql = _render(record_count_strategy="has_more")
+    last_text, _ = _render("page=2", record_count_strategy="has_more")
+
+    assert _count_queries(first_sql) == []
+    assert "Showing 1-3 of more than 3 total records" in first_text
+    assert 'data-powercrud-pagination-mode="has_more"' in first_text
+    assert "Showing 4-5 of 5 total records" in last_text, (
+        "The last page knows the exact total."
+    )
+
+
+@pytest.mark.django_db
+def test_has_more_strategy_rejects_pages_past_the_end():
+    """Empty pages beyond the first should 404 like Django's paginator."""
+    _create_books(2)
+
+    with pytest.raises(Http404):
+        _render("page=5", record_count_strategy="has_more")
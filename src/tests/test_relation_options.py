@@ -0,0 +1,272 @@
+"""Tests for the remote, paginated relation options endpoint."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.http import QueryDict
+from django.test import RequestFactory
+from django.urls import include, path
+from neapolitan.views import CRUDView, Role
+
+from powercrud import frontend_capabilities
+from powercrud.frontend_capabilities import REMOTE_RELATION_OPTIONS
+from powercrud.mixins import PowerCRUDMixin
+from powercrud.mixins.relation_options_mixin import (
+    REMOTE_OPTIONS_DEPENDS_ON_ATTR,
+    REMOTE_OPTIONS_URL_ATTR,
+)
+from sample.models import Author, Book, Genre
+
+
+class RemoteBookView(PowerCRUDMixin, CRUDView):
+    model = Book
+    namespace = "sample"
+    url_base = "remotebook"
+    base_template_path = "sample/base.html"
+    fields = ["title", "author", "genres", "published_date", "isbn"]
+    filterset_fields = ["author", "genres"]
+    bulk_fields = ["author"]
+    use_htmx = True
+    use_modal = True
+    remote_relation_options = True
+    relation_options_page_size = 2
+
+
+class LocalBookView(RemoteBookView):
+    url_base = "localbook"
+    remote_relation_options = False
+
+
+urlpatterns = [
+    path(
+        "",
+        include(
+            (RemoteBookView.get_urls() + LocalBookView.get_urls(), "sample"),
+            namespace="sample",
+        ),
+    ),
+]
+
+pytestmark = pytest.mark.urls(__name__)
+
+
+@pytest.fixture(autouse=True)
+def remote_options_runtime(settings):
+    """Declare a frontend runtime that can fetch remote options."""
+    settings.POWERCRUD_SETTINGS = {"FRONTEND_CAPABILITIES": [REMOTE_RELATION_OPTIONS]}
+
+
+def _request(query: str = ""):
+    """Return an anonymous GET request for ``query``."""
+    request = RequestFactory().get(f"/?{query}")
+    request.htmx = False
+    request.session = {}
+    request.user = AnonymousUser()
+    return request
+
+
+def _fetch(field_name: str, query: str, view_class=RemoteBookView):
+    """Call the relation options endpoint and return the response."""
+    view = view_class.as_view(role=Role.LIST, relation_options_action="options")
+    return view(_request(query), field_name=field_name)
+
+
+def _authors(*names: str) -> list[Author]:
+    """Create one author per name."""
+    return [Author.objects.create(name=name) for name in names]
+
+
+@pytest.mark.django_db
+def test_filter_options_are_paged_in_label_order():
+    """Filter options should page through the label-ordered option index."""
+    _authors("delta", "Alpha", "charlie", "bravo", "echo")
+
+    first = json.loads(_fetch("author", "surface=filter").content)
+    last = json.loads(_fetch("author", "surface=filter&page=3").content)
+
+    assert [option["label"] for option in first["results"]] == ["Alpha", "bravo"]
+    assert first["has_more"] is True
+    assert [option["label"] for option in last["results"]] == ["echo"]
+    assert last["has_more"] is False, "The last page should stop infinite scroll."
+
+
+@pytest.mark.django_db
+def test_search_term_narrows_options_on_each_surface():
+    """The q parameter should filter options for filter, form, and bulk selects."""
+    _authors("Anne", "Annabel", "Bob")
+
+    for surface in ("filter", "form", "bulk"):
+        payload = json.loads(_fetch("author", f"surface={surface}&q=ann").content)
+        labels = sorted(option["label"] for option in payload["results"])
+        assert labels == ["Annabel", "Anne"], f"{surface} should match the search."
+
+
+@pytest.mark.django_db
+def test_ordered_option_querysets_are_sliced_in_the_database():
+    """Ordered querysets should keep database order and report has_more."""
+    _authors("Alan", "Betty", "Chris")
+
+    class OrderedView(RemoteBookView):
+        def get_bulk_choices_for_field(self, field_name, field):
+            return Author.objects.order_by("-name")
+
+    payload = json.loads(_fetch("author", "surface=bulk", OrderedView).content)
+
+    assert [option["label"] for option in payload["results"]] == ["Chris", "Betty"]
+    assert payload["has_more"] is True
+
+
+@pytest.mark.django_db
+def test_form_options_respect_field_queryset_dependencies():
+    """Parent values passed to the endpoint should scope dependent options."""
+    fiction, poetry = (
+        Genre.objects.create(name="Fiction"),
+        Genre.objects.create(name="Poetry"),
+    )
+    novelist, poet = _authors("Novelist", "Poet")
+    novelist.genres.add(fiction)
+    poet.genres.add(poetry)
+
+    class DependentView(RemoteBookView):
+        field_queryset_dependencies = {
+            "author": {
+                "depends_on": ["genres"],
+                "filter_by": {"genres__in": "genres"},
+            }
+        }
+
+    payload = json.loads(
+        _fetch("author", f"surface=form&genres={poetry.pk}", DependentView).content
+    )
+
+    assert [option["label"] for option in payload["results"]] == ["Poet"]
+
+
+@pytest.mark.django_db
+def test_endpoint_returns_404_when_remote_options_are_off():
+    """Fields without remote options enabled should not be served."""
+    _authors("Alan")
+
+    response = _fetch("author", "surface=filter", LocalBookView)
+    unknown_surface = _fetch("author", "surface=detail")
+
+    assert response.status_code == 404
+    assert unknown_surface.status_code == 404
+
+
+@pytest.mark.django_db
+def test_bulk_surface_only_serves_editable_bulk_fields():
+    """Bulk options should 404 for fields bulk edit cannot change."""
+    _authors("Alan")
+
+    class TitleOnlyBulkView(RemoteBookView):
+        bulk_fields = ["title"]
+
+    class NoBulkView(RemoteBookView):
+        bulk_fields = []
+
+    assert _fetch("author", "surface=bulk").status_code == 200
+    assert _fetch("author", "surface=bulk", TitleOnlyBulkView).status_code == 404, (
+        "Fields outside bulk_fields must not be served on the bulk surface."
+    )
+    assert _fetch("author", "surface=bulk", NoBulkView).status_code == 404, (
+        "The bulk surface must not be served when bulk edit is off."
+    )
+
+
+@pytest.mark.django_db
+def test_remote_widgets_render_only_selected_options():
+    """Remote selects should preload the selected value and point at the endpoint."""
+    alan, _betty = _authors("Alan", "Betty")
+    view = RemoteBookView(role=Role.LIST)
+    view.setup(_request(f"author={alan.pk}"))
+
+    filterset = view.get_filterset(view.get_queryset())
+    widget = filterset.form.fields["author"].widget
+    values = [str(value) for value, _label in widget.choices if value != ""]
+
+    assert str(alan.pk) in values
+    assert len([value for value in values if value.isdigit()]) == 1, (
+        "Unselected authors should be loaded from the endpoint instead."
+    )
+    assert widget.attrs[REMOTE_OPTIONS_URL_ATTR] == (
+        "/remotebook/relation-options/author/?surface=filter"
+    )
+
+
+@pytest.mark.django_db
+def test_remote_form_widgets_declare_their_parent_fields():
+    """Dependent form selects should tell the client which parents to send."""
+    _authors("Alan")
+
+    class DependentView(RemoteBookView):
+        field_queryset_dependencies = {
+            "author": {
+                "depends_on": ["genres"],
+                "filter_by": {"genres__in": "genres"},
+            }
+        }
+
+    view = DependentView(role=Role.CREATE)
+    view.setup(_request())
+    view.object = None
+    form = view.get_form(data=QueryDict(""))
+
+    attrs = form.fields["author"].widget.attrs
+    assert attrs[REMOTE_OPTIONS_URL_ATTR] == (
+        "/remotebook/relation-options/author/?surface=form"
+    )
+    assert attrs[REMOTE_OPTIONS_DEPENDS_ON_ATTR] == "genres"
+
+
+def test_endpoint_url_is_registered_only_when_enabled():
+    """get_urls() should add the options route only for opted-in views."""
+    remote_names = {pattern.name for pattern in RemoteBookView.get_urls()}
+    local_names = {pattern.name for pattern in LocalBookView.get_urls()}
+
+    assert "remotebook-relation-options" in remote_names
+    assert not any(name.endswith("relation-options") for name in local_names)
+
+
+@pytest.mark.django_db
+def test_widgets_keep_every_option_without_runtime_support(
+    settings, monkeypatch, tmp_path
+):
+    """A bundle without remote-options support should get full dropdowns."""
+    _authors("Alan", "Betty")
+    (tmp_path / "powercrud-stale.js").write_text("console.log('no remote options');")
+    monkeypatch.setattr(frontend_capabilities, "PACKAGED_BUNDLE_DIR", tmp_path)
+    frontend_capabilities.get_packaged_bundle_capabilities.cache_clear()
+    settings.POWERCRUD_SETTINGS = {}
+    view = RemoteBookView(role=Role.LIST)
+    view.setup(_request())
+
+    try:
+        widget = view.get_filterset(view.get_queryset()).form.fields["author"].widget
+        labels = [str(label) for value, label in widget.choices if value != ""]
+    finally:
+        frontend_capabilities.get_packaged_bundle_capabilities.cache_clear()
+
+    assert labels == ["Alan", "Betty"], (
+        "Options must not be stripped when the runtime cannot fetch them."
+    )
+    assert REMOTE_OPTIONS_URL_ATTR not in widget.attrs
+
+
+def test_packaged_bundle_capabilities_are_detected_from_markers(monkeypatch, tmp_path):
+    """A bundle carrying the runtime marker should enable the capability."""
+    (tmp_path / "powercrud-fresh.js").write_text(
+        "const attr = 'data-powercrud-options-url';"
+    )
+    monkeypatch.setattr(frontend_capabilities, "PACKAGED_BUNDLE_DIR", tmp_path)
+    frontend_capabilities.get_packaged_bundle_capabilities.cache_clear()
+
+    try:
+        capabilities = frontend_capabilities.get_packaged_bundle_capabilities()
+    finally:
+        frontend_capabilities.get_packaged_bundle_capabilities.cache_clear()
+
+    assert capabilities == {REMOTE_RELATION_OPTIONS}
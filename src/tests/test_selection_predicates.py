@@ -0,0 +1,361 @@
+"""Tests for select-all-matching selections stored as filter predicates."""
+
+from __future__ import annotations
+
+import json
+import uuid
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+from django.urls import reverse
+
+from powercrud import tasks
+from powercrud.async_manager import AsyncManager
+from powercrud.selection_store import (
+    SELECTION_PREDICATE_SESSION_KEY,
+    SelectionPredicate,
+    resolve_selection_queryset,
+)
+from sample.models import Author
+from sample.views import AuthorCRUDView
+
+STORAGE_KEY = "powercrud_bulk_author_"
+
+
+class _Session(dict):
+    """Dict-backed session with a fixed key, like a saved Django session."""
+
+    session_key = "test-session"
+    modified = False
+
+
+@pytest.fixture
+def predicate_view(monkeypatch):
+    """Return a factory for author views with predicate selections enabled."""
+    monkeypatch.setattr(
+        AuthorCRUDView, "bulk_select_all_predicate", True, raising=False
+    )
+    session = _Session()
+
+    def build(query: dict | None = None):
+        request = RequestFactory().get("/", query or {})
+        request.user = AnonymousUser()
+        request.session = session
+        view = AuthorCRUDView()
+        view.setup(request)
+        return view, request
+
+    return build
+
+
+@pytest.fixture
+def authors():
+    """Create two authors matching ``name=Ali`` and one that does not."""
+    return [
+        Author.objects.create(name="Alice Example"),
+        Author.objects.create(name="Alicia Example"),
+        Author.objects.create(name="Bob Example"),
+    ]
+
+
+def _select_all(build, query: dict) -> None:
+    """Run select-all-matching for ``query`` through a fresh view."""
+    view, request = build(query)
+    view.select_all_matching_predicate(request, view.get_filtered_selection_queryset())
+
+
+def test_selection_predicate_payload_round_trips():
+    """Predicates should survive a JSON round trip with sorted filters."""
+    predicate = SelectionPredicate.from_params(
+        {"name": ["Ali"], "genres": ["2", "1"]}, max_pk=40
+    )
+
+    restored = SelectionPredicate.from_payload(
+        json.loads(json.dumps(predicate.to_payload()))
+    )
+
+    assert restored == predicate, "The payload should restore the same predicate"
+    assert restored.filters[0][0] == "genres", "Filters should be stored sorted"
+
+
+@pytest.mark.django_db
+def test_select_all_matching_endpoint_stores_predicate_not_ids(
+    client, monkeypatch, authors
+):
+    """The endpoint should save the filter, not one entry per matching id."""
+    monkeypatch.setattr(
+        AuthorCRUDView, "bulk_select_all_predicate", True, raising=False
+    )
+
+    response = client.post(
+        f"{reverse('sample:author-select-all-matching')}?name=Ali",
+        HTTP_HX_REQUEST="true",
+    )
+
+    [stored] = client.session[SELECTION_PREDICATE_SESSION_KEY][STORAGE_KEY]["p"]
+    assert response.status_code == 200, "The endpoint should accept the filter"
+    assert stored["q"] == {"name": ["Ali"]}, "Only filter params should be kept"
+    assert STORAGE_KEY not in client.session.get("powercrud_selections", {}), (
+        "No explicit id list should be written for the matched records"
+    )
+    assert 'id="selected-items-counter">2<' in response.content.decode(), (
+        "The toolbar count should include the predicate's matches"
+    )
+
+
+@pytest.mark.django_db
+def test_predicate_selection_ignores_records_created_later(predicate_view, authors):
+    """The max-pk snapshot should keep new matching records out."""
+    _select_all(predicate_view, {"name": "Ali"})
+    Author.objects.create(name="Alina Example")
+
+    view, request = predicate_view()
+
+    assert view.get_selected_ids_from_session(request) == [
+        str(authors[0].pk),
+        str(authors[1].pk),
+    ], "Only records that matched at select time should be selected"
+
+
+@pytest.mark.django_db
+def test_deselecting_a_matched_record_records_an_exclusion(predicate_view, authors):
+    """Toggling off a predicate match should exclude it, not drop the predicate."""
+    _select_all(predicate_view, {"name": "Ali"})
+
+    view, request = predicate_view()
+    view.toggle_selection_in_session(request, authors[0].pk)
+
+    view, request = predicate_view()
+    store = view.get_selection_store(request)
+    assert store.excluded == {str(authors[0].pk)}, "The match should be excluded"
+    assert view.get_selected_ids_from_session(request) == [str(authors[1].pk)], (
+        "The excluded record should leave the selection"
+    )
+
+
+@pytest.mark.django_db
+def test_selected_queryset_uses_a_subquery(predicate_view, authors):
+    """Predicate selections should query by subquery rather than literal ids."""
+    _select_all(predicate_view, {"name": "Ali"})
+    view, request = predicate_view()
+
+    sql = str(view.get_selected_queryset(request).query)
+
+    assert "IN (SELECT" in sql, "The predicate should become a pk subquery"
+    assert "LIKE" in sql, "The saved name filter should be applied in SQL"
+
+
+@pytest.mark.django_db
+def test_resolve_selection_queryset_rebuilds_the_payload(predicate_view, authors):
+    """Workers should rebuild the same selection from the JSON payload."""
+    _select_all(predicate_view, {"name": "Ali"})
+    view, request = predicate_view()
+    payload = json.loads(json.dumps(view.get_selection_payload(request)))
+
+    queryset = resolve_selection_queryset(payload)
+
+    assert set(queryset.values_list("pk", flat=True)) == {
+        authors[0].pk,
+        authors[1].pk,
+    }, "The rebuilt queryset should hold the predicate's matches"
+
+
+def _run_delete_task(monkeypatch, payload, manager, task_name):
+    """Run the async delete worker with ``manager`` for a predicate payload."""
+    monkeypatch.setattr(
+        tasks.AsyncManager,
+        "resolve_manager",
+        classmethod(lambda cls, manager_class_path=None, config=None: manager),
+    )
+    return tasks.bulk_delete_task(
+        "sample.Author", [], None, task_key=task_name, selection=payload
+    )
+
+
+@pytest.mark.django_db
+def test_bulk_delete_task_runs_on_the_locked_selection(
+    monkeypatch, predicate_view, authors
+):
+    """The worker should rebuild the locked predicate, bounded by ``max_pk``."""
+    _select_all(predicate_view, {"name": "Alicia"})
+    view, request = predicate_view()
+    payload = view.get_selection_payload(request)
+    manager = AsyncManager()
+    task_name = f"predicate-{uuid.uuid4()}"
+    manager.add_conflict_selections(task_name, {"sample.author": payload})
+    Author.objects.create(name="Alicia Later")
+
+    try:
+        result = _run_delete_task(monkeypatch, payload, manager, task_name)
+    finally:
+        manager.remove_conflict_ids(task_name)
+
+    assert result is True, "The delete task should succeed"
+    assert set(Author.objects.values_list("name", flat=True)) == {
+        "Alice Example",
+        "Bob Example",
+        "Alicia Later",
+    }, "Only rows the predicate matched when queued should be deleted"
+
+
+@pytest.mark.django_db
+def test_selection_locks_block_overlapping_work_until_released(predicate_view, authors):
+    """A locked predicate should conflict with edits to the rows it matches."""
+    _select_all(predicate_view, {"name": "Alicia"})
+    view, request = predicate_view()
+    payload = view.get_selection_payload(request)
+    manager = AsyncManager()
+    task_name = f"predicate-{uuid.uuid4()}"
+    view.get_bulk_async_enabled = lambda: True
+    view.get_async_manager = lambda: manager
+
+    assert manager.add_conflict_selections(task_name, {"sample.author": payload}), (
+        "The first job should lock the selection"
+    )
+    try:
+        assert not manager.add_conflict_selections(
+            f"predicate-{uuid.uuid4()}", {"sample.author": payload}
+        ), "The same selection should not be locked twice"
+        assert view._check_for_conflicts([authors[1].pk]), (
+            "A matched row should be reported as locked"
+        )
+        assert not view._check_for_conflicts([authors[0].pk]), (
+            "Rows outside the predicate should stay free"
+        )
+        _select_all(predicate_view, {"name": "Ali"})
+        other_view, other_request = predicate_view()
+        other_view.get_bulk_async_enabled = lambda: True
+        other_view.get_async_manager = lambda: manager
+        assert other_view._check_for_selection_conflicts(
+            other_view.get_selection_payload(other_request)
+        ), "An overlapping predicate should be reported as a conflict"
+    finally:
+        manager.remove_conflict_ids(task_name)
+
+    assert manager.get_active_selections("sample.author") == {}, (
+        "Releasing the task should drop its selection"
+    )
+    assert not view._check_for_conflicts([authors[1].pk]), (
+        "Rows should be free once the task is released"
+    )
+
+
+@pytest.mark.django_db
+def test_bulk_edit_queues_a_predicate_selection_without_reading_ids(
+    monkeypatch, predicate_view, authors, django_user_model
+):
+    """Queueing a predicate job should count the selection and lock its payload."""
+    _select_all(predicate_view, {"name": "Ali"})
+    view, request = predicate_view()
+    post = RequestFactory().post("/", {"bulk_submit": "1", "delete_selected": "1"})
+    post.user = django_user_model.objects.create_user("queuer")
+    post.session = request.session
+    post.htmx = True
+    payload = view.get_selection_payload(post)
+    launched = {}
+
+    class RecordingManager(AsyncManager):
+        def launch_async_task(self, func, *args, **kwargs):
+            launched.update(args=args, kwargs=kwargs)
+            return args[-1]
+
+    monkeypatch.setattr(
+        view,
+        "get_selected_ids_from_session",
+        lambda request: pytest.fail("Predicate ids should not be read"),
+    )
+    monkeypatch.setattr(
+        view,
+        "_get_resolved_selection",
+        lambda store: pytest.fail("The whole selection should not be resolved"),
+    )
+    monkeypatch.setattr(view, "get_bulk_async_enabled", lambda: True)
+    monkeypatch.setattr(view, "get_conflict_checking_enabled", lambda: True)
+    monkeypatch.setattr(view, "get_bulk_min_async_records", lambda: 2)
+    monkeypatch.setattr(view, "get_bulk_delete_enabled", lambda: True)
+    monkeypatch.setattr(view, "get_bulk_delete_configured", lambda: True)
+    monkeypatch.setattr(view, "get_async_manager", RecordingManager)
+
+    response = view.bulk_edit(post)
+
+    assert response.status_code == 200, "The job should be queued"
+    assert launched["args"][1] == [], "No ids should be sent to the worker"
+    assert launched["kwargs"]["conflict_ids"] is None, "No per-row locks are taken"
+    assert launched["kwargs"]["conflict_selections"] == {"sample.author": payload}, (
+        "The predicate payload itself should be locked"
+    )
+    assert launched["kwargs"]["affected_objects"].startswith("2 "), (
+        "The counted selection should describe the job"
+    )
+
+
+@pytest.mark.django_db
+def test_bulk_delete_task_refuses_to_run_without_locks(
+    monkeypatch, predicate_view, authors
+):
+    """A predicate job whose locks expired should fail rather than run unlocked."""
+    _select_all(predicate_view, {"name": "Ali"})
+    view, request = predicate_view()
+    manager = AsyncManager()
+
+    result = _run_delete_task(
+        monkeypatch,
+        view.get_selection_payload(request),
+        manager,
+        f"predicate-{uuid.uuid4()}",
+    )
+
+    assert result is False, "The task should fail without its locks"
+    assert Author.objects.count() == 3, "No rows should be deleted"
+
+
+@pytest.mark.django_db
+def test_list_render_counts_predicate_selection_without_reading_ids(
+    monkeypatch, predicate_view, authors
+):
+    """The list and toolbar should count the predicate and check only the page."""
+    _select_all(predicate_view, {"name": "Ali"})
+    view, request = predicate_view()
+    monkeypatch.setattr(
+        view,
+        "_get_resolved_selection",
+        lambda store: pytest.fail("The whole selection should not be resolved"),
+    )
+
+    assert view.get_selected_count(request) == 2, "COUNT should size the selection"
+    assert view.get_selected_ids_among(request, [authors[1].pk, authors[2].pk]) == {
+        str(authors[1].pk)
+    }, "Only the given rows should be checked"
+    assert view.get_selection_status_context(request)["selected_count"] == 2, (
+        "The toolbar should show the counted selection"
+    )
+
+
+@pytest.mark.django_db
+def test_toggle_endpoint_deselects_a_predicate_row_without_resolving(
+    client, monkeypatch, authors
+):
+    """Toggling a matched row should record an exclusion and recount."""
+    monkeypatch.setattr(
+        AuthorCRUDView, "bulk_select_all_predicate", True, raising=False
+    )
+    client.post(
+        f"{reverse('sample:author-select-all-matching')}?name=Ali",
+        HTTP_HX_REQUEST="true",
+    )
+    monkeypatch.setattr(
+        AuthorCRUDView,
+        "_get_resolved_selection",
+        lambda self, store: pytest.fail("The toggle should not resolve every id"),
+    )
+
+    response = client.post(
+        reverse("sample:author-toggle-selection", kwargs={"pk": authors[0].pk}),
+        HTTP_HX_REQUEST="true",
+    )
+
+    stored = client.session[SELECTION_PREDICATE_SESSION_KEY][STORAGE_KEY]
+    assert response.status_code == 200, "The toggle should succeed"
+    assert stored["x"], "The matched row should be excluded"
+    assert response.context["selected_count"] == 1, "One matched row should remain"
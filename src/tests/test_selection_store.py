@@ -0,0 +1,243 @@
+"""Tests for the pluggable, compactly encoded bulk-selection stores."""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from powercrud.models import BulkSelectionEntry
+from powercrud.selection_store import (
+    CacheSelectionStore,
+    DatabaseSelectionStore,
+    SessionSelectionStore,
+    cleanup_expired_selections,
+    decode_selection,
+    encode_selection,
+    get_selection_store_class,
+)
+from sample.views import AuthorCRUDView
+
+STORAGE_KEY = "powercrud_bulk_author_"
+
+
+class _Session(dict):
+    """Dict-backed session with a fixed key, like a saved Django session."""
+
+    session_key = "test-session"
+    modified = False
+
+
+def _request():
+    """Return a GET request with an anonymous user and an empty session."""
+    request = RequestFactory().get("/")
+    request.user = AnonymousUser()
+    request.session = _Session()
+    return request
+
+
+@pytest.mark.parametrize(
+    ("ids", "expected_format"),
+    [
+        (range(1, 1001), "r"),
+        ([1, 5, 9, 400, 70000], "r"),
+        (range(1, 100_000, 2), "b"),
+        (["a1b2", "c3d4"], "s"),
+        (["007", "8"], "s"),
+    ],
+)
+def test_encode_selection_round_trips_each_format(ids, expected_format):
+    """Every encoding should decode back to the same string ids."""
+    payload = encode_selection(ids)
+
+    assert payload["f"] == expected_format, "The shorter compact format should win"
+    assert decode_selection(json.loads(json.dumps(payload))) == {
+        str(value) for value in ids
+    }, "Decoding a JSON round-trip should restore the selection"
+
+
+def test_encode_selection_keeps_large_selections_small():
+    """A 100k-record selection should serialise to a few kilobytes."""
+    contiguous = json.dumps(encode_selection(range(1, 100_001)))
+    alternating = json.dumps(encode_selection(range(1, 200_001, 2)))
+
+    assert len(contiguous) < 100, "Contiguous ids should collapse to one range"
+    assert len(alternating) < 40_000, "Dense ids should fall back to a bitmap"
+
+
+def test_decode_selection_reads_legacy_lists():
+    """Selections saved as plain lists before the compact encoding still load."""
+    assert decode_selection(["3", "1"]) == {"1", "3"}, "Legacy lists should load"
+    assert decode_selection(None) == set(), "Missing selections should be empty"
+
+
+def test_session_store_toggles_and_removes_empty_selections():
+    """The session store should encode on save and drop empty selections."""
+    request = _request()
+    store = SessionSelectionStore(request, STORAGE_KEY)
+
+    assert store.toggle(3) is True, "Toggling an unselected id should select it"
+    store.add([1, 2])
+    assert request.session["powercrud_selections"][STORAGE_KEY] == {
+        "f": "r",
+        "d": [1, 3],
+    }, "The session should hold the compact range payload"
+    assert store.get_ids() == ["1", "2", "3"], "Ids should read back in order"
+
+    store.remove([1, 2, 3])
+    assert STORAGE_KEY not in request.session["powercrud_selections"], (
+        "An empty selection should be removed from the session"
+    )
+
+
+def test_store_apply_adds_and_removes_with_one_save(monkeypatch):
+    """A batch of changes should persist the selection once."""
+    request = _request()
+    store = SessionSelectionStore(request, STORAGE_KEY)
+    store.add([1, 2, 3])
+    saves = []
+    monkeypatch.setattr(store, "save", saves.append)
+
+    store.apply(added=[4, 5, 1], removed=[2, 9])
+
+    assert store.get_ids() == ["1", "3", "4", "5"], "Both deltas should apply"
+    assert len(saves) == 1, "The whole batch should be saved once"
+
+
+@pytest.mark.django_db
+def test_database_store_apply_touches_only_the_changed_rows():
+    """Database batches should insert and delete rows without a full rewrite."""
+    request = _request()
+    DatabaseSelectionStore(request, STORAGE_KEY).add(range(1, 101))
+
+    store = DatabaseSelectionStore(request, STORAGE_KEY)
+    with CaptureQueriesContext(connection) as queries:
+        store.apply(added=[500, 501], removed=[1, 2, 3])
+
+    deletes = [
+        query["sql"]
+        for query in queries.captured_queries
+        if query["sql"].startswith("DELETE")
+    ]
+    assert deletes and all('"object_id" IN' in sql for sql in deletes), (
+        "The batch should delete only the removed rows"
+    )
+    assert store.count() == 99, "The count should reflect the whole batch"
+
+
+@pytest.mark.django_db
+def test_cache_store_keeps_selection_out_of_the_session():
+    """The cache store should persist per session without touching it."""
+    request = _request()
+    CacheSelectionStore(request, STORAGE_KEY).add([4, 5])
+
+    assert "powercrud_selections" not in request.session, (
+        "The cache store should not write to the session"
+    )
+    assert CacheSelectionStore(request, STORAGE_KEY).get_ids() == ["4", "5"], (
+        "A new store for the same owner should read the cached selection"
+    )
+    CacheSelectionStore(request, STORAGE_KEY).clear()
+    assert CacheSelectionStore(request, STORAGE_KEY).count() == 0, (
+        "Clearing should delete the cached selection"
+    )
+
+
+@pytest.mark.django_db
+def test_database_store_toggles_one_row_without_loading_the_selection():
+    """Database toggles should insert or delete one row, not rewrite them all."""
+    request = _request()
+    DatabaseSelectionStore(request, STORAGE_KEY).add(range(1, 501))
+
+    store = DatabaseSelectionStore(request, STORAGE_KEY)
+    with CaptureQueriesContext(connection) as queries:
+        assert store.toggle(250) is False, "A selected id should be deselected"
+        assert store.toggle(9999) is True, "An unselected id should be selected"
+
+    assert len(queries) <= 5, "Each toggle should run a few small queries"
+    assert all(
+        "object_id" in query["sql"]
+        or "LIMIT 1" in query["sql"]
+        or '"id" = ' in query["sql"]
+        for query in queries.captured_queries
+    ), "Toggles should only touch the toggled rows and one expiry stamp"
+    assert store.count() == 500, "The count should reflect both toggles"
+    assert BulkSelectionEntry.objects.filter(object_id="9999").exists(), (
+        "The new selection row should be stored"
+    )
+
+
+@pytest.mark.django_db
+@override_settings(POWERCRUD_SETTINGS={"BULK_SELECTION_STORE": "database"})
+def test_selection_mixin_uses_configured_store_once_per_request():
+    """The mixin should build one configured store per request and storage key."""
+    request = _request()
+    view = AuthorCRUDView()
+    view.request = request
+
+    store = view.get_selection_store(request)
+    view.toggle_selection_in_session(request, 7)
+
+    assert isinstance(store, DatabaseSelectionStore), (
+        "BULK_SELECTION_STORE should pick the database store"
+    )
+    assert view.get_selection_store(request) is store, (
+        "Later reads in the same request should reuse the decoded store"
+    )
+    assert view.get_selected_ids_from_session(request) == ["7"], (
+        "The mixin should read the selection through the store"
+    )
+
+
+def test_get_selection_store_class_accepts_dotted_paths():
+    """Custom stores can be configured by dotted path."""
+    assert (
+        get_selection_store_class("powercrud.selection_store.CacheSelectionStore")
+        is CacheSelectionStore
+    ), "Dotted paths should import the store class"
+    assert get_selection_store_class() is SessionSelectionStore, (
+        "The session store should stay the default"
+    )
+
+
+@pytest.mark.django_db
+def test_cleanup_expires_only_selections_left_unchanged():
+    """Cleanup should drop stale selections whole and keep ones still in use."""
+    stale, active = _request(), _request()
+    active.session.session_key = "active-session"
+    DatabaseSelectionStore(stale, STORAGE_KEY).add([1, 2, 3])
+    DatabaseSelectionStore(active, STORAGE_KEY).add([4, 5])
+    BulkSelectionEntry.objects.update(
+        updated_at=timezone.now() - timedelta(seconds=120)
+    )
+    DatabaseSelectionStore(active, STORAGE_KEY).remove([5])
+
+    assert cleanup_expired_selections(ttl=60) == 3, (
+        "Only the stale selection's rows should be deleted"
+    )
+    assert DatabaseSelectionStore(active, STORAGE_KEY).get_ids() == ["4"], (
+        "A deselection should keep the rest of the selection alive"
+    )
+
+
+@pytest.mark.django_db
+def test_cleanup_selections_command_uses_the_selection_ttl():
+    """The command should expire selections older than BULK_SELECTION_TTL."""
+    DatabaseSelectionStore(_request(), STORAGE_KEY).add([1, 2])
+    BulkSelectionEntry.objects.update(updated_at=timezone.now() - timedelta(days=2))
+    stdout = StringIO()
+
+    call_command("pcrud_cleanup_selections", "--json", stdout=stdout)
+
+    assert json.loads(stdout.getvalue())["deleted_entries"] == 2, (
+        "Selections older than the default one-day TTL should be deleted"
+    )
+    assert not BulkSelectionEntry.objects.exists(), "No expired rows should remain"
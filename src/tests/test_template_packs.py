@@ -24,14 +24,17 @@ from powercrud.template_packs import (
     TEMPLATE_PACK_CONTRACT_VERSION,
     TemplatePack,
     WidgetPolicyContext,
+    clear_template_pack_cache,
     get_configured_template_pack,
     get_template_pack_copy_destination,
     get_selected_template_pack,
+    get_template_pack_server_adapter,
     get_template_pack_style_key,
     get_template_pack_styles,
     get_template_pack_template_namespace,
     resolve_template_pack,
 )
+from powercrud import template_packs as template_packs_module
 
 
 FIXTURE_SELECTOR = "tests.template_pack_fixtures:template_pack"
@@ -416,8 +419,8 @@ def test_pack_without_legacy_copy_destination_uses_its_safe_identity():
         )
 
 
-def test_selector_and_module_attribute_are_read_without_caching(monkeypatch):
-    """Settings and declarations can change between calls during a running process."""
+def test_cached_resolution_follows_selector_and_declaration_changes(monkeypatch):
+    """The cached pack is dropped when the setting or declaration changes identity."""
     fixture_module = import_module("tests.template_pack_fixtures")
     first = fixture_module.template_pack
     second = replace(first, identity="fixture-pack-second")
@@ -428,7 +431,7 @@ def test_selector_and_module_attribute_are_read_without_caching(monkeypatch):
         )
         monkeypatch.setattr(fixture_module, "template_pack", second)
         assert get_selected_template_pack() is second, (
-            "The resolver must not cache a declaration after the first lookup."
+            "A replaced module attribute should invalidate the cached declaration."
         )
     with override_settings(POWERCRUD_SETTINGS={}):
         assert get_selected_template_pack().identity == "daisyui", (
@@ -436,6 +439,61 @@ def test_selector_and_module_attribute_are_read_without_caching(monkeypatch):
         )
 
 
+def test_repeated_resolution_reuses_the_validated_declaration(monkeypatch):
+    """A warm selector should skip import and validation on later lookups."""
+    clear_template_pack_cache()
+    validations = []
+    original_validate = template_packs_module._validate_resolved_template_pack
+
+    def counting_validate(template_pack, selector):
+        validations.append(selector)
+        original_validate(template_pack, selector)
+
+    monkeypatch.setattr(
+        template_packs_module, "_validate_resolved_template_pack", counting_validate
+    )
+
+    first = resolve_template_pack(FIXTURE_SELECTOR)
+    second = resolve_template_pack(FIXTURE_SELECTOR)
+
+    assert first is second, "The cached declaration should be returned unchanged."
+    assert validations == [FIXTURE_SELECTOR], (
+        "Validation should run once per selector while the declaration is unchanged."
+    )
+
+
+def test_server_adapter_is_cached_per_declared_path(monkeypatch):
+    """The validated server adapter should be reused until its module attribute changes."""
+    clear_template_pack_cache()
+    with override_settings(POWERCRUD_SETTINGS={"POWERCRUD_TEMPLATE_PACK": "daisyui"}):
+        first = get_template_pack_server_adapter()
+        loads = []
+        original_load = template_packs_module._load_template_pack
+
+        def counting_load(declaration_path, selector):
+            loads.append(declaration_path)
+            return original_load(declaration_path, selector)
+
+        monkeypatch.setattr(template_packs_module, "_load_template_pack", counting_load)
+
+        assert get_template_pack_server_adapter() is first, (
+            "The validated adapter should be served from the cache."
+        )
+        assert loads == [], "A warm adapter lookup should not reload any declaration."
+
+
+def test_setting_changed_clears_resolved_template_packs():
+    """Overriding PowerCRUD settings should drop cached declarations and adapters."""
+    resolve_template_pack("daisyui")
+    assert template_packs_module._RESOLVED_TEMPLATE_PACKS, "Resolution should populate the cache."
+
+    with override_settings(POWERCRUD_SETTINGS={}):
+        assert template_packs_module._RESOLVED_TEMPLATE_PACKS == {}, (
+            "setting_changed for POWERCRUD_SETTINGS should clear the resolved-pack cache."
+        )
+        assert template_packs_module._RESOLVED_SERVER_ADAPTERS == {}
+
+
 @pytest.mark.parametrize(
     ("selector", "message"),
     [
@@ -3424,3 +3424,190 @@ def test_get_powercrud_session_data_returns_value():
 
     value = powercrud.get_powercrud_session_data(context, "original_template")
     assert value == "custom.html"
+
+
+@pytest.mark.django_db
+def test_object_list_resolves_column_options_once_per_render(monkeypatch):
+    """Column labels and links should be compiled per column, not per cell."""
+    author = Author.objects.create(name="Plan Author")
+    books = [
+        Book.objects.create(
+            title=f"Plan Book {index}",
+            author=author,
+            published_date=date(2024, 5, index + 1),
+            bestseller=bool(index % 2),
+            isbn=f"97812345600{index:02d}",
+            pages=100 + index,
+        )
+        for index in range(3)
+    ]
+    request = apply_session(RequestFactory().get("/"))
+    view = TemplateViewStub(request)
+    view.link_fields = {"title": "sample:book-detail"}
+    label_calls = []
+    original_resolve_field_label = powercrud.resolve_field_label
+
+    def counting_resolve_field_label(view, field_name, field):
+        label_calls.append(field_name)
+        return original_resolve_field_label(view, field_name, field)
+
+    monkeypatch.setattr(powercrud, "resolve_field_label", counting_resolve_field_label)
+    context = {
+        "request": request,
+        "use_htmx": True,
+        "original_target": "#content",
+        "htmx_target": "#content",
+    }
+
+    result = powercrud.object_list(context, books, view)
+
+    assert sorted(label_calls) == sorted(view.fields), (
+        "Each field label should be resolved once for the whole table."
+    )
+    links = [
+        {cell["name"]: cell for cell in row["cells"]}["title"]["link"]["url"]
+        for row in result["object_list"]
+    ]
+    assert links == [f"/sample:book-detail/{book.pk}" for book in books], (
+        "The compiled link spec should still resolve each row's own pk."
+    )
+    assert any(
+        key[0] is Book and key[1] == "bestseller"
+        for key in powercrud._LIST_COLUMN_FIELD_CACHE
+    ), "Model-field metadata should be cached for later renders."
+
+
+@pytest.mark.django_db
+def test_object_list_uses_batch_row_state_hooks_once_per_page():
+    """Batch hooks should replace per-row permission and extra-action checks."""
+    author = Author.objects.create(name="Batch Author")
+    books = [
+        Book.objects.create(
+            title=f"Batch Book {index}",
+            author=author,
+            published_date=date(2024, 6, index + 1),
+            bestseller=False,
+            isbn=f"97812345700{index:02d}",
+            pages=10 + index,
+            description="Has description",
+        )
+        for index in range(3)
+    ]
+    request = apply_session(RequestFactory().get("/"))
+    view = TemplateViewStub(request)
+    view.extra_actions_mode = "buttons"
+    batch_calls = []
+    per_row_calls = []
+
+    def get_row_permission_states(objects, request):
+        batch_calls.append("rows")
+        return {
+            books[0].pk: {"delete_permission": False},
+            books[1].pk: {
+                "can_update": False,
+                "update_disabled_reason": "Closed for edits.",
+            },
+        }
+
+    def get_extra_action_states(objects, request):
+        batch_calls.append("extra")
+        return {
+            books[2].pk: {
+                0: {"hidden": False, "disabled": True, "reason": "Batch says no."}
+            }
+        }
+
+    def has_power_delete_permission(request, obj):
+        per_row_calls.append(obj.pk)
+        return True
+
+    view.get_row_permission_states = get_row_permission_states
+    view.get_extra_action_states = get_extra_action_states
+    view.has_power_delete_permission = has_power_delete_permission
+    context = {
+        "request": request,
+        "use_htmx": True,
+        "original_target": "#content",
+        "htmx_target": "#content",
+    }
+
+    rows = powercrud.object_list(context, books, view)["object_list"]
+
+    assert batch_calls == ["rows", "extra"], "Each batch hook should run once per page."
+    assert f"/sample:book-delete/{books[0].pk}" not in rows[0]["actions"], (
+        "A batched delete_permission=False should hide the Delete action."
+    )
+    assert sorted(per_row_calls) == sorted([books[1].pk, books[2].pk]), (
+        "Rows without a batched value should fall back to the per-row hook."
+    )
+    assert "Closed for edits." in rows[1]["actions"], (
+        "The batched update reason should render on the disabled Edit action."
+    )
+    assert "Batch says no." in rows[2]["actions"], (
+        "Batched extra-action state should replace the per-row disabled_if hook."
+    )
+    assert "Batch says no." not in rows[0]["actions"], (
+        "Rows without batched extra-action state should use the per-row hooks."
+    )
+
+
+@pytest.mark.django_db
+def test_object_list_falls_back_when_batch_hook_raises():
+    """A failing batch hook should leave the per-row hooks in charge."""
+    author = Author.objects.create(name="Failing Batch Author")
+    book = Book.objects.create(
+        title="Failing Batch Book",
+        author=author,
+        published_date=date(2024, 6, 10),
+        bestseller=False,
+        isbn="9781234571000",
+        pages=12,
+    )
+    request = apply_session(RequestFactory().get("/"))
+    view = TemplateViewStub(request)
+    view.delete_permission_allowed = False
+
+    def get_row_permission_states(objects, request):
+        raise RuntimeError("backend unavailable")
+
+    view.get_row_permission_states = get_row_permission_states
+    context = {"request": request, "use_htmx": True}
+
+    row = powercrud.object_list(context, [book], view)["object_list"][0]
+
+    assert f"/sample:book-delete/{book.pk}" not in row["actions"], (
+        "The per-row delete permission hook should still apply."
+    )
+
+
+def test_list_column_field_cache_keys_annotation_output_options():
+    """Annotations with differing output-field options get separate metadata."""
+    from django.db.models import DecimalField
+
+    fields = {
+        "one_place": DecimalField(max_digits=8, decimal_places=1),
+        "two_places": DecimalField(max_digits=8, decimal_places=2),
+    }
+
+    def build_view(output_field):
+        return SimpleNamespace(
+            model=Book,
+            _get_queryset_annotation_output_field=(
+                lambda name, queryset=None: output_field
+            ),
+        )
+
+    _field, first = powercrud._get_list_column_field(
+        build_view(fields["one_place"]), "average_score", is_property=False
+    )
+    live_field, second = powercrud._get_list_column_field(
+        build_view(fields["two_places"]), "average_score", is_property=False
+    )
+
+    assert live_field is fields["two_places"], "The live output field is returned"
+    assert second is not first, (
+        "Different decimal_places should not share cached column metadata."
+    )
+    assert second.field.decimal_places == 2, (
+        "The cached metadata should describe the matching output field."
+    )
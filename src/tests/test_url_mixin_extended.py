@@ -352,6 +352,9 @@ def test_get_urls_generates_selection_endpoints_for_selection_extra_buttons(monk
     assert "selection-book-select-all-matching" in names, (
         "Selection-aware extra buttons should register filtered-selection metadata URLs."
     )
+    assert "selection-book-apply-selection" in names, (
+        "Selection-aware extra buttons should register batched row-selection URLs."
+    )
 
 
 def test_get_urls_respects_extra_button_selection_controls_opt_out(monkeypatch):
@@ -475,3 +478,58 @@ def test_legacy_inline_edit_enabled_still_generates_inline_urls(monkeypatch):
     assert (
         "legacy-book-inline-dependency" in names
     ), "Legacy inline_edit_enabled=True should still register inline dependency URLs during the compatibility window."
+
+
+def test_safe_reverse_formats_row_urls_from_one_reverse(monkeypatch):
+    """Row URLs should reuse a per-request template instead of reversing per pk."""
+    view = UrlViewHarness(RequestFactory().get("/"), SimpleNamespace(pk=1))
+    calls = []
+
+    def fake_reverse(name, kwargs=None):
+        calls.append(kwargs)
+        return f"/books/{kwargs['pk']}/cell/{kwargs['field_name']}/"
+
+    monkeypatch.setattr(url_module, "reverse", fake_reverse)
+
+    urls = [
+        view.safe_reverse("sample:book-tooltip", kwargs={"pk": pk, "field_name": "title"})
+        for pk in range(1, 6)
+    ]
+
+    assert urls == [f"/books/{pk}/cell/title/" for pk in range(1, 6)]
+    assert len(calls) == 2, (
+        "Only the sentinel reverse and one verification reverse should run."
+    )
+
+
+def test_safe_reverse_falls_back_for_converters_that_rewrite_values(monkeypatch):
+    """Converters whose to_url() changes the value must keep using reverse()."""
+    view = UrlViewHarness(RequestFactory().get("/"), SimpleNamespace(pk=1))
+    calls = []
+
+    def encoding_reverse(name, kwargs=None):
+        calls.append(kwargs)
+        return f"/books/h{kwargs['pk'] * 7}/"
+
+    monkeypatch.setattr(url_module, "reverse", encoding_reverse)
+
+    urls = [view.safe_reverse("sample:book-detail", kwargs={"pk": pk}) for pk in (1, 2, 3)]
+
+    assert urls == ["/books/h7/", "/books/h14/", "/books/h21/"]
+    assert len(calls) == 5, "After the failed template check every pk is reversed."
+
+
+@pytest.mark.django_db
+def test_safe_reverse_templates_match_real_reverse():
+    """Templated URLs should equal Django's reverse() for the sample routes."""
+    from django.urls import reverse
+
+    view = UrlViewHarness(RequestFactory().get("/"), SimpleNamespace(pk=1))
+
+    for pk in (3, 40, 512):
+        assert view.safe_reverse("sample:bigbook-update", kwargs={"pk": pk}) == (
+            reverse("sample:bigbook-update", kwargs={"pk": pk})
+        )
+    assert view.safe_reverse("sample:bigbook-update", kwargs={"pk": "abc"}) is None, (
+        "String values are reversed normally and still honour the int converter."
+    )